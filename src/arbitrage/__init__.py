@@ -1,6 +1,7 @@
 # Core arbitrage detection and execution
 from .detector import ArbitrageDetector, Opportunity, CrossPlatformScanner
 from .executor import TradeExecutor
+from .leg_coordinator import LegCoordinator, LegOrder, LegExecution
 from .single_platform_scanner import (
     SinglePlatformScanner,
     SinglePlatformOpportunity,
@@ -11,6 +12,9 @@ __all__ = [
     'ArbitrageDetector',
     'Opportunity',
     'TradeExecutor',
+    'LegCoordinator',
+    'LegOrder',
+    'LegExecution',
     'CrossPlatformScanner',
     'SinglePlatformScanner',
     'SinglePlatformOpportunity',
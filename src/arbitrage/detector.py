@@ -13,6 +13,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 
+from src.utils.metrics import httpx_event_hooks, pipeline_latency, scan_duration
+
 logger = logging.getLogger(__name__)
 
 
@@ -549,7 +551,9 @@ class CrossPlatformScanner:
         """Get or create HTTP client."""
         if self._http_client is None:
             import httpx
-            self._http_client = httpx.AsyncClient(timeout=30.0)
+            self._http_client = httpx.AsyncClient(
+                timeout=30.0, event_hooks=httpx_event_hooks()
+            )
         return self._http_client
 
     async def fetch_polymarket_markets(self) -> List[Dict]:
@@ -932,6 +936,7 @@ class CrossPlatformScanner:
             self.fetch_polymarket_markets(),
             self.fetch_kalshi_markets(),
         )
+        books_at = time.perf_counter()
 
         if not poly_markets or not kalshi_markets:
             logger.warning("Missing market data - cannot scan for opportunities")
@@ -962,6 +967,9 @@ class CrossPlatformScanner:
             elif isinstance(result, Opportunity):
                 # Found a qualifying opportunity!
                 opportunities.append(result)
+                pipeline_latency.labels(
+                    strategy="cross_platform", stage="book_to_detection"
+                ).observe(time.perf_counter() - books_at)
                 # Log to database
                 await self._log_market_scan(
                     poly_market=match["polymarket"],
@@ -1005,7 +1013,8 @@ class CrossPlatformScanner:
 
         while self._running:
             try:
-                opportunities = await self.scan_for_opportunities()
+                with scan_duration.labels(scanner="cross_platform").time():
+                    opportunities = await self.scan_for_opportunities()
 
                 if opportunities:
                     logger.info(f"🎯 Found {len(opportunities)} cross-platform opportunities!")
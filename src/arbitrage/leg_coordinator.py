@@ -0,0 +1,318 @@
+"""
+Leg Coordinator - submit both legs of an arbitrage trade at once.
+
+Sequential submission (buy, wait for the venue, then sell) leaves a full
+round trip between legs in which the spread can vanish or we end up
+holding one side. The coordinator:
+
+- Submits all legs concurrently, each with its own deadline
+- Reconciles fills by time-in-force: FOK legs are all-or-nothing, IOC legs
+  may fill partially, GTC legs have any resting remainder cancelled
+- Unwinds any unmatched quantity (one leg filled more than the other),
+  including fills that arrive after a leg's deadline
+- Records inter-leg skew and end-to-end latency per trade
+
+Venue clients that do blocking I/O inside their coroutines (the Kalshi and
+Polymarket REST clients) are run on worker threads (LegOrder.blocking) so
+the legs really are in flight at the same time.
+
+Usage:
+    coordinator = LegCoordinator(strategy="cross_platform")
+    result = await coordinator.execute([
+        LegOrder("buy", "polymarket", token_id, "buy", 0.45, 100, submit=..., unwind=...),
+        LegOrder("sell", "kalshi", ticker, "sell", 0.55, 100, submit=..., unwind=...),
+    ])
+    if result.status == "filled": ...
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from src.utils.metrics import leg_skew, trade_latency
+
+logger = logging.getLogger(__name__)
+
+TIME_IN_FORCE = ("IOC", "FOK", "GTC")
+
+
+@dataclass
+class LegOrder:
+    """One leg of a multi-venue trade."""
+    name: str                      # "buy" / "sell"
+    platform: str
+    market_id: str
+    side: str                      # "buy" or "sell"
+    price: float
+    quantity: float                # Contracts/shares
+    # submit(leg, time_in_force) -> place_order-style dict
+    submit: Callable[["LegOrder", str], Awaitable[Dict[str, Any]]]
+    # unwind(leg, quantity) -> place_order-style dict (offsetting order)
+    unwind: Optional[Callable[["LegOrder", float], Awaitable[Dict[str, Any]]]] = None
+    # cancel(leg, order_id) -> dict; used for GTC remainders
+    cancel: Optional[Callable[["LegOrder", str], Awaitable[Dict[str, Any]]]] = None
+    deadline_sec: Optional[float] = None   # Default: coordinator's leg_deadline_sec
+    blocking: bool = False                 # Run submit/unwind/cancel on a worker thread
+
+
+@dataclass
+class LegResult:
+    """Outcome of one leg after reconciliation."""
+    name: str
+    platform: str
+    requested: float
+    filled: float = 0.0
+    order_id: Optional[str] = None
+    status: str = "pending"        # filled | partial | unfilled | failed | timeout
+    error: Optional[str] = None
+    submitted_at: float = 0.0      # time.monotonic()
+    acked_at: Optional[float] = None
+    unwound: float = 0.0
+
+    @property
+    def latency_sec(self) -> Optional[float]:
+        return None if self.acked_at is None else self.acked_at - self.submitted_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "platform": self.platform,
+            "requested": self.requested,
+            "filled": self.filled,
+            "order_id": self.order_id,
+            "status": self.status,
+            "error": self.error,
+            "unwound": self.unwound,
+            "latency_ms": None if self.latency_sec is None else round(self.latency_sec * 1000, 1),
+        }
+
+
+@dataclass
+class LegExecution:
+    """Result of a coordinated multi-leg trade."""
+    legs: List[LegResult]
+    matched: float = 0.0           # Quantity filled on every leg
+    status: str = "failed"         # filled | partial | failed
+    skew_sec: Optional[float] = None     # Spread of leg acknowledgement times
+    latency_sec: float = 0.0       # First submit -> reconciled
+    unwind_errors: List[str] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return self.matched > 0
+
+    def leg(self, name: str) -> Optional[LegResult]:
+        return next((leg for leg in self.legs if leg.name == name), None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "matched": self.matched,
+            "skew_ms": None if self.skew_sec is None else round(self.skew_sec * 1000, 1),
+            "latency_ms": round(self.latency_sec * 1000, 1),
+            "legs": [leg.to_dict() for leg in self.legs],
+            "unwind_errors": list(self.unwind_errors),
+        }
+
+
+def filled_quantity(result: Dict[str, Any], time_in_force: str, requested: float) -> float:
+    """Filled quantity from a Polymarket/Kalshi place_order result."""
+    if not result or not result.get("success"):
+        return 0.0
+    filled = result.get("filled_size", result.get("filled_count", 0.0))
+    filled = min(float(filled or 0.0), requested)
+    if time_in_force == "FOK" and filled < requested:
+        return 0.0  # Fill-or-kill never leaves a partial position
+    return filled
+
+
+async def _call(blocking: bool, func: Callable[..., Awaitable[Any]], *args) -> Any:
+    if blocking:
+        return await asyncio.to_thread(asyncio.run, func(*args))
+    return await func(*args)
+
+
+class LegCoordinator:
+    """Concurrent multi-leg submission with reconciliation and unwind."""
+
+    def __init__(
+        self,
+        strategy: str = "cross_platform",
+        time_in_force: str = "IOC",
+        leg_deadline_sec: float = 5.0,
+    ):
+        """
+        Args:
+            strategy: Label for the skew/latency metrics
+            time_in_force: IOC, FOK or GTC for every leg
+            leg_deadline_sec: Default per-leg acknowledgement deadline
+        """
+        time_in_force = time_in_force.upper()
+        if time_in_force not in TIME_IN_FORCE:
+            raise ValueError(f"time_in_force must be one of {TIME_IN_FORCE}, got {time_in_force!r}")
+        self.strategy = strategy
+        self.time_in_force = time_in_force
+        self.leg_deadline_sec = leg_deadline_sec
+        self._late: Set[asyncio.Task] = set()
+
+        # Stats
+        self.trades = 0
+        self.partial_trades = 0
+        self.failed_trades = 0
+        self.unwinds = 0
+        self.late_fills = 0
+
+    async def execute(self, legs: List[LegOrder]) -> LegExecution:
+        """Submit every leg at once, reconcile fills and unwind any excess."""
+        if len(legs) < 2:
+            raise ValueError("A coordinated trade needs at least two legs")
+
+        started = time.monotonic()
+        results = [LegResult(leg.name, leg.platform, leg.quantity) for leg in legs]
+        tasks = []
+        for leg, result in zip(legs, results):
+            result.submitted_at = time.monotonic()
+            tasks.append(asyncio.create_task(
+                _call(leg.blocking, leg.submit, leg, self.time_in_force),
+                name=f"leg:{leg.name}",
+            ))
+
+        await asyncio.gather(*(
+            self._await_leg(leg, result, task) for leg, result, task in zip(legs, results, tasks)
+        ))
+
+        execution = LegExecution(legs=results)
+        acked = [r.acked_at for r in results if r.acked_at is not None]
+        if len(acked) == len(results):
+            execution.skew_sec = max(acked) - min(acked)
+            leg_skew.labels(strategy=self.strategy).observe(execution.skew_sec)
+
+        await self._reconcile(legs, execution)
+
+        execution.latency_sec = time.monotonic() - started
+        trade_latency.labels(strategy=self.strategy).observe(execution.latency_sec)
+        self.trades += 1
+        if execution.status == "partial":
+            self.partial_trades += 1
+        elif execution.status == "failed":
+            self.failed_trades += 1
+
+        skew = "n/a" if execution.skew_sec is None else f"{execution.skew_sec * 1000:.0f}ms"
+        logger.info(
+            f"🦵 {self.strategy} legs {execution.status}: matched {execution.matched:g} | "
+            f"skew {skew} | total {execution.latency_sec * 1000:.0f}ms"
+        )
+        return execution
+
+    async def _await_leg(self, leg: LegOrder, result: LegResult, task: asyncio.Task) -> None:
+        deadline = leg.deadline_sec if leg.deadline_sec is not None else self.leg_deadline_sec
+        done, _ = await asyncio.wait({task}, timeout=deadline)
+        if not done:
+            # The request may still reach the venue; anything it fills is unwound
+            result.status = "timeout"
+            result.error = f"No acknowledgement within {deadline}s"
+            logger.warning(f"⏱️ {leg.name} leg on {leg.platform} missed its {deadline}s deadline")
+            self._watch_late_fill(leg, task)
+            return
+
+        result.acked_at = time.monotonic()
+        try:
+            response = task.result()
+        except Exception as e:
+            result.status, result.error = "failed", str(e)
+            return
+        self._apply_response(leg, result, response)
+
+        if self.time_in_force == "GTC" and result.order_id and result.filled < leg.quantity and leg.cancel:
+            # Arb legs must not rest: cancel the remainder and keep what filled
+            try:
+                await _call(leg.blocking, leg.cancel, leg, result.order_id)
+            except Exception as e:
+                logger.error(f"Failed to cancel {leg.name} remainder {result.order_id}: {e}")
+
+    def _apply_response(self, leg: LegOrder, result: LegResult, response: Dict[str, Any]) -> None:
+        result.order_id = (response or {}).get("order_id")
+        result.filled = filled_quantity(response, self.time_in_force, leg.quantity)
+        if not response or not response.get("success"):
+            result.status = "failed"
+            result.error = (response or {}).get("error") or "Order rejected"
+        elif result.filled >= leg.quantity:
+            result.status = "filled"
+        elif result.filled > 0:
+            result.status = "partial"
+        else:
+            result.status = "unfilled"
+
+    async def _reconcile(self, legs: List[LegOrder], execution: LegExecution) -> None:
+        execution.matched = min(r.filled for r in execution.legs)
+        for leg, result in zip(legs, execution.legs):
+            excess = result.filled - execution.matched
+            if excess > 0:
+                await self._unwind(leg, result, excess, execution.unwind_errors)
+
+        if execution.matched <= 0:
+            execution.status = "failed"
+        elif all(r.filled >= r.requested for r in execution.legs):
+            execution.status = "filled"
+        else:
+            execution.status = "partial"
+
+    async def _unwind(
+        self, leg: LegOrder, result: LegResult, quantity: float, errors: List[str]
+    ) -> None:
+        if not leg.unwind:
+            errors.append(f"{leg.name}: no unwind path for {quantity:g}")
+            logger.error(f"🚨 {leg.name} leg on {leg.platform} holds {quantity:g} unmatched - no unwind path")
+            return
+
+        logger.warning(f"↩️ Unwinding {quantity:g} on {leg.name} leg ({leg.platform})")
+        self.unwinds += 1
+        try:
+            response = await _call(leg.blocking, leg.unwind, leg, quantity)
+        except Exception as e:
+            response = {"success": False, "error": str(e)}
+
+        unwound = filled_quantity(response, "IOC", quantity)
+        result.unwound += unwound
+        if unwound < quantity:
+            error = (response or {}).get("error") or "partial unwind"
+            errors.append(f"{leg.name}: unwound {unwound:g}/{quantity:g} ({error})")
+            logger.error(
+                f"🚨 Unwind incomplete on {leg.platform}: {unwound:g}/{quantity:g} - {error}"
+            )
+
+    def _watch_late_fill(self, leg: LegOrder, task: asyncio.Task) -> None:
+        """Unwind whatever a timed-out leg fills once its request completes."""
+
+        async def settle():
+            try:
+                response = await task
+            except Exception:
+                return
+            result = LegResult(leg.name, leg.platform, leg.quantity)
+            self._apply_response(leg, result, response)
+            if result.filled > 0:
+                self.late_fills += 1
+                logger.warning(f"⏱️ Late fill of {result.filled:g} on {leg.name} leg ({leg.platform})")
+                await self._unwind(leg, result, result.filled, [])
+
+        late = asyncio.create_task(settle(), name=f"late:{leg.name}")
+        self._late.add(late)
+        late.add_done_callback(self._late.discard)
+
+    async def drain(self) -> None:
+        """Wait for pending late-fill unwinds (call on shutdown)."""
+        if self._late:
+            await asyncio.gather(*self._late, return_exceptions=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "trades": self.trades,
+            "partial_trades": self.partial_trades,
+            "failed_trades": self.failed_trades,
+            "unwinds": self.unwinds,
+            "late_fills": self.late_fills,
+            "pending_late_legs": len(self._late),
+        }
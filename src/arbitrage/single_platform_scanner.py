@@ -16,6 +16,7 @@ Two types of single-platform arbitrage:
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
@@ -23,6 +24,8 @@ from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
 import aiohttp
 
+from src.utils.metrics import aiohttp_trace_config, pipeline_latency, scan_duration
+
 logger = logging.getLogger(__name__)
 
 
@@ -255,7 +258,7 @@ class SinglePlatformScanner:
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            self._session = aiohttp.ClientSession(trace_configs=[aiohttp_trace_config()])
         return self._session
 
     async def close(self):
@@ -829,24 +832,28 @@ class SinglePlatformScanner:
 
         # === SCAN EVENTS (Multi-outcome markets - where $40M was extracted!) ===
         events = await self.fetch_polymarket_events()
+        books_at = time.perf_counter()
         logger.info(f"📊 Scanning {len(events)} Polymarket EVENTS (multi-outcome)...")
 
         for event in events:
             opp = await self.analyze_polymarket_event(event)
             if opp:
                 opportunities.append(opp)
+                self._observe_detection("polymarket_single", books_at)
                 self.stats[ArbitrageType.POLYMARKET_SINGLE]["opportunities_found"] += 1
 
         self.stats[ArbitrageType.POLYMARKET_SINGLE]["markets_checked"] += len(events)
 
         # === SCAN BINARY MARKETS (less likely to have arb, but check anyway) ===
         markets = await self.fetch_polymarket_markets()
+        books_at = time.perf_counter()
         logger.info(f"📊 Scanning {len(markets)} Polymarket binary markets...")
 
         for market in markets:
             opp = await self.analyze_polymarket_multi_condition(market)
             if opp:
                 opportunities.append(opp)
+                self._observe_detection("polymarket_single", books_at)
                 self.stats[ArbitrageType.POLYMARKET_SINGLE]["opportunities_found"] += 1
 
         self.stats[ArbitrageType.POLYMARKET_SINGLE]["markets_checked"] += len(markets)
@@ -1145,6 +1152,7 @@ class SinglePlatformScanner:
         self.stats[ArbitrageType.KALSHI_SINGLE]["scans"] += 1
 
         markets = await self.fetch_kalshi_markets()
+        books_at = time.perf_counter()
         checked = len(markets)
         self.stats[ArbitrageType.KALSHI_SINGLE]["markets_checked"] += checked
 
@@ -1154,6 +1162,7 @@ class SinglePlatformScanner:
             opp = await self.analyze_kalshi_market(market)
             if opp:
                 opportunities.append(opp)
+                self._observe_detection("kalshi_single", books_at)
                 self.stats[ArbitrageType.KALSHI_SINGLE]["opportunities_found"] += 1
 
         return opportunities
@@ -1162,6 +1171,18 @@ class SinglePlatformScanner:
     # MAIN SCANNING LOOP
     # =========================================================================
 
+    @staticmethod
+    async def _timed_scan(scanner: str, scan):
+        with scan_duration.labels(scanner=scanner).time():
+            return await scan
+
+    @staticmethod
+    def _observe_detection(strategy: str, books_at: float) -> None:
+        """Record time from the market data fetch to this detection."""
+        pipeline_latency.labels(strategy=strategy, stage="book_to_detection").observe(
+            time.perf_counter() - books_at
+        )
+
     async def scan_all(
         self,
         enable_polymarket: bool = True,
@@ -1181,9 +1202,9 @@ class SinglePlatformScanner:
 
         tasks = []
         if enable_polymarket:
-            tasks.append(("polymarket", self.scan_polymarket()))
+            tasks.append(("polymarket", self._timed_scan("polymarket_single", self.scan_polymarket())))
         if enable_kalshi:
-            tasks.append(("kalshi", self.scan_kalshi()))
+            tasks.append(("kalshi", self._timed_scan("kalshi_single", self.scan_kalshi())))
 
         if not tasks:
             return []
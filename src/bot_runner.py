@@ -43,13 +43,17 @@ RECOMMENDED PRODUCTION CONFIGURATION:
    - Pairs Trading: LINK-UNI, ATOM-DOT (DeFi/L1 pairs)
 """
 
+from __future__ import annotations
+
 import asyncio
+import functools
+import json
 import logging
 import signal
 import sys
 import os
-from datetime import datetime
-from typing import Optional, Dict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional, Dict, List
 
 # Add src to path for imports when running as module
 src_dir = os.path.dirname(os.path.abspath(__file__))
@@ -62,9 +66,11 @@ from src.features.overlapping_arb import OverlappingArbDetector, OverlapOpportun
 from src.features.position_manager import PositionManager, ClaimResult, PortfolioSummary
 from src.features.news_sentiment import NewsSentimentEngine, MarketAlert
 from src.clients.polymarket_client import PolymarketClient
+from src.clients.clob_pool import ClobClientPool
 from src.clients.kalshi_client import KalshiClient
 from src.simulation.paper_trader_realistic import RealisticPaperTrader
 from src.arbitrage.detector import ArbitrageDetector, CrossPlatformScanner, Opportunity
+from src.arbitrage.leg_coordinator import LegCoordinator, LegOrder, filled_quantity
 from src.arbitrage.single_platform_scanner import (
     SinglePlatformScanner,
     SinglePlatformOpportunity,
@@ -75,67 +81,58 @@ from src.analytics.arbitrage_analytics import (
     get_analytics,
     reset_analytics,
 )
-from src.strategies import (
-    MarketMakerStrategy,
-    NewsArbitrageStrategy,
-    FundingRateArbStrategy,
-    GridTradingStrategy,
-    PairsTradingStrategy,
-    StockMeanReversionStrategy,
-    StockMomentumStrategy,
-    # Advanced Framework (Phase 1)
-    KellyPositionSizer,
-    RegimeDetector,
-    CircuitBreaker,
-    get_kelly_sizer,
-    get_regime_detector,
-    get_circuit_breaker,
-    # Strategy Enhancements (Phase 2)
-    TimeDecayAnalyzer,
-    DepegDetector,
-    CorrelationTracker,
-    get_time_decay_analyzer,
-    get_depeg_detector,
-    get_correlation_tracker,
-    # Twitter-Derived Strategies (2024)
-    BTCBracketArbStrategy,
-    BracketCompressionStrategy,
-    KalshiMentionSnipeStrategy,
-    WhaleCopyTradingStrategy,
-    MacroBoardStrategy,
-    FearPremiumContrarianStrategy,
-)
-from src.strategies.congressional_tracker import CongressionalTrackerStrategy
-from src.strategies.political_event import PoliticalEventStrategy
-from src.strategies.crypto_15min_scalping import Crypto15MinScalpingStrategy
-from src.strategies.cross_exchange_arb import CrossExchangeArbStrategy
-from src.strategies.liquidation import PolymarketLiquidationStrategy
-from src.strategies.ibkr_futures_momentum import IBKRFuturesMomentumStrategy
-from src.strategies.selective_whale_copy import SelectiveWhaleCopyStrategy
-from src.strategies.ai_superforecasting import AISuperforecastingStrategy, AIForecast
-from src.strategies.news_arbitrage import NewsArbitrageStrategy, NewsArbOpportunity
-from src.strategies.high_conviction import HighConvictionStrategy, Signal
-from src.strategies.spike_hunter import SpikeHunterStrategy, SpikeOpportunity, create_spike_hunter_from_config
-# Stock strategies (require Alpaca)
-from src.strategies.sector_rotation import SectorRotationStrategy
-from src.strategies.dividend_growth import DividendGrowthStrategy
-from src.strategies.earnings_momentum import EarningsMomentumStrategy
-# Options strategies (require IBKR)
-from src.strategies.options_strategies import (
-    CoveredCallStrategy,
-    CashSecuredPutStrategy,
-    IronCondorStrategy,
-    WheelStrategy,
-)
-from src.exchanges.ccxt_client import CCXTClient
-from src.exchanges.alpaca_client import AlpacaClient
-from src.exchanges.ibkr_client import IBKRClient
-from src.exchanges.ibkr_web_client import IBKRWebClient
+from src.strategies.registry import StrategyRegistry
 from src.notifications import Notifier, NotificationConfig
 from src.logging_handler import setup_database_logging
 from src.services.balance_aggregator import BalanceAggregator
+from src.services.balance_ledger import BalanceLedger
+from src.services.opportunity_bus import OpportunityBus
+from src.services.strategy_workers import StrategyWorkerPool, WorkerGroup
+from src.utils.rate_limiter import get_rate_limiter
+from src.utils.lazy_import import format_import_report
+from src.utils.metrics import (
+    PROMETHEUS_CONTENT_TYPE, get_metrics, pipeline_latency,
+)
+from src.utils.stall_watchdog import get_stall_watchdog
+from src.utils.profiling import ProfilerBusy, SamplingProfiler, memory_diff
+from src.utils.scheduler import JobPriority, Scheduler
 from decimal import Decimal
 
+if TYPE_CHECKING:
+    # Strategies and exchange SDKs are imported on demand (StrategyRegistry)
+    from src.strategies import (
+        MarketMakerStrategy,
+        NewsArbitrageStrategy,
+        FundingRateArbStrategy,
+        GridTradingStrategy,
+        PairsTradingStrategy,
+        StockMeanReversionStrategy,
+        StockMomentumStrategy,
+        KellyPositionSizer,
+        RegimeDetector,
+        CircuitBreaker,
+        TimeDecayAnalyzer,
+        DepegDetector,
+        CorrelationTracker,
+        BTCBracketArbStrategy,
+        BracketCompressionStrategy,
+        KalshiMentionSnipeStrategy,
+        WhaleCopyTradingStrategy,
+        MacroBoardStrategy,
+        FearPremiumContrarianStrategy,
+    )
+    from src.strategies.congressional_tracker import CongressionalTrackerStrategy
+    from src.strategies.political_event import PoliticalEventStrategy
+    from src.strategies.crypto_15min_scalping import Crypto15MinScalpingStrategy
+    from src.strategies.selective_whale_copy import SelectiveWhaleCopyStrategy
+    from src.strategies.ai_superforecasting import AISuperforecastingStrategy, AIForecast
+    from src.strategies.news_arbitrage import NewsArbOpportunity
+    from src.strategies.high_conviction import HighConvictionStrategy
+    from src.strategies.spike_hunter import SpikeHunterStrategy, SpikeOpportunity
+    from src.exchanges.ccxt_client import CCXTClient
+    from src.exchanges.alpaca_client import AlpacaClient
+    from src.exchanges.ibkr_client import IBKRClient
+
 logger = logging.getLogger(__name__)
 
 # NOTE: Database logging (setup_database_logging) is now called AFTER
@@ -148,6 +145,16 @@ class PolybotRunner:
     Unified runner that orchestrates all bot features.
     """
 
+    # Strategy groups that can run in worker processes (enable_strategy_workers)
+    WORKER_GROUPS = frozenset({"cross_platform_scanner", "single_platform_scanner"})
+
+    # LegCoordinator time-in-force -> Kalshi order time_in_force
+    KALSHI_TIME_IN_FORCE = {
+        "IOC": "immediate_or_cancel",
+        "FOK": "fill_or_kill",
+        "GTC": "good_till_canceled",
+    }
+
     def __init__(
         self,
         wallet_address: Optional[str] = None,
@@ -197,6 +204,24 @@ class PolybotRunner:
         from src.config import Config
         self.config = Config(db_client=self.db)
 
+        # Strategies are imported and built only when their enable_* flag is on
+        self.strategies = StrategyRegistry(self.config)
+
+        # Submits both legs of live cross-platform trades concurrently
+        self.leg_coordinator = LegCoordinator(
+            strategy="cross_platform",
+            time_in_force=self.config.trading.cross_platform_leg_time_in_force,
+            leg_deadline_sec=self.config.trading.cross_platform_leg_deadline_sec,
+        )
+
+        # Warm Polymarket order clients (created in live mode)
+        self.clob_pool: Optional[ClobClientPool] = None
+
+        # Local cash/positions for pre-trade checks (reconciled in background)
+        self.balance_ledger = BalanceLedger(
+            max_age_sec=self.config.trading.balance_ledger_max_age_sec,
+        )
+
         # Blacklisted markets (fetched from Supabase)
         self.blacklisted_markets: set = set()
 
@@ -331,6 +356,107 @@ class PolybotRunner:
         self._running = False
         self._tasks = []
 
+        # Owns all periodic jobs (priorities, jitter, API budgets, backoff)
+        self.scheduler = Scheduler(rate_limiter=get_rate_limiter())
+        self._heartbeat_errors = 0
+
+        # CPU-heavy groups moved to worker processes (see _start_strategy_workers)
+        self.strategy_workers: Optional[StrategyWorkerPool] = None
+        self._worker_groups: set = set()
+
+        # Detectors publish here; a fixed pool of executors runs the handlers
+        self.opportunity_bus = OpportunityBus(
+            max_size=self.config.trading.opportunity_bus_max_size,
+            workers=self.config.trading.opportunity_bus_workers,
+            dedup_window_sec=self.config.trading.opportunity_dedup_window_sec,
+            ttl_sec=self.config.trading.opportunity_ttl_sec,
+        )
+        self._register_opportunity_kinds()
+
+    def _register_opportunity_kinds(self) -> None:
+        """Handlers, (venue, market) keys and expected edge for each detector."""
+        bus = self.opportunity_bus
+        bus.on(
+            "cross_platform", self.on_cross_platform_opportunity,
+            markets=lambda o: [(o.buy_platform, o.buy_market_id), (o.sell_platform, o.sell_market_id)],
+            edge=lambda o: o.profit_percent,
+        )
+        bus.on(
+            "single_platform", self.on_single_platform_opportunity,
+            markets=lambda o: [(o.platform, o.market_id)],
+            edge=lambda o: float(o.profit_pct),
+        )
+        bus.on(
+            "overlap", self.on_arb_opportunity,
+            markets=lambda o: [
+                ("polymarket", o.market_a.condition_id), ("polymarket", o.market_b.condition_id)
+            ],
+            edge=lambda o: o.deviation,
+        )
+        bus.on(
+            "spike", self._handle_spike_opportunity,
+            markets=lambda o: [(o.platform, o.market_id)],
+            edge=lambda o: o.expected_profit_pct,
+        )
+        # News only feeds High Conviction signals - keyed apart from tradable markets
+        bus.on(
+            "news", self._handle_news_opportunity,
+            markets=lambda o: [("news", o.event.keywords[0] if o.event.keywords else o.event.headline)],
+            edge=lambda o: float(o.expected_profit_pct),
+            latency_sec=0.01,
+        )
+
+    def _cross_platform_scanner_kwargs(self) -> dict:
+        """CrossPlatformScanner settings (picklable, shared with worker processes)."""
+        return dict(
+            min_profit_percent=3.0,  # 3% minimum for Poly buy, 5% for Kalshi buy
+            scan_interval=120,  # Scan every 2 minutes
+        )
+
+    def _single_platform_scanner_kwargs(self) -> dict:
+        """SinglePlatformScanner settings (picklable, shared with worker processes)."""
+        return dict(
+            min_profit_pct=0.5,  # Default fallback
+            scan_interval_seconds=60,  # Scan every minute
+            # Per-platform thresholds from Supabase config
+            poly_min_profit_pct=self.config.trading.poly_single_min_profit_pct,
+            poly_max_spread_pct=self.config.trading.poly_single_max_spread_pct,
+            poly_max_position_usd=self.config.trading.poly_single_max_position_usd,
+            kalshi_min_profit_pct=self.config.trading.kalshi_single_min_profit_pct,
+            kalshi_max_spread_pct=self.config.trading.kalshi_single_max_spread_pct,
+            kalshi_max_position_usd=self.config.trading.kalshi_single_max_position_usd,
+            # CRITICAL: Filter out long-dated markets (prevents year-long bets!)
+            max_days_to_expiration=self.config.trading.max_days_to_expiration,
+        )
+
+    async def _start_strategy_workers(self) -> None:
+        """
+        Run selected strategy groups in worker processes (enable_strategy_workers).
+
+        Workers only scan; their opportunities are handled here one at a time,
+        so risk state and execution stay in this process.
+        """
+        groups = {
+            g.strip() for g in self.config.trading.strategy_worker_groups.split(",") if g.strip()
+        }
+        unknown = groups - self.WORKER_GROUPS
+        if unknown:
+            logger.warning(f"Ignoring unknown strategy worker groups: {sorted(unknown)}")
+        groups &= self.WORKER_GROUPS
+        if not groups:
+            return
+
+        self.strategy_workers = StrategyWorkerPool()
+        self.strategy_workers.on(
+            "cross_platform_opportunity", self.opportunity_bus.publisher("cross_platform")
+        )
+        self.strategy_workers.on(
+            "single_platform_opportunity", self.opportunity_bus.publisher("single_platform")
+        )
+        await self.strategy_workers.start()
+        self._worker_groups = groups
+        logger.info(f"🧵 Strategy worker processes: {', '.join(sorted(groups))}")
+
     async def _resilient_task(self, task_name: str, coro_func, *args, **kwargs):
         """
         Wrapper that makes any async task resilient by auto-restarting on failure.
@@ -373,6 +499,7 @@ class PolybotRunner:
             try:
                 pm_balance = self.polymarket_client.get_balance(self.wallet_address)
                 balances["polymarket"] = pm_balance
+                self._reconcile_ledger("polymarket", pm_balance)
                 logger.info(
                     f"💰 Polymarket: ${pm_balance.get('total_value', 0):.2f} "
                     f"({pm_balance.get('position_count', 0)} positions)"
@@ -385,6 +512,7 @@ class PolybotRunner:
             try:
                 k_balance = self.kalshi_client.get_balance()
                 balances["kalshi"] = k_balance
+                self._reconcile_ledger("kalshi", k_balance)
                 logger.info(
                     f"💰 Kalshi: ${k_balance.get('total_value', 0):.2f} "
                     f"(${k_balance.get('balance', 0):.2f} cash, "
@@ -402,6 +530,41 @@ class PolybotRunner:
 
         return balances
 
+    def _fetch_venue_balance(self, platform: str) -> Optional[dict]:
+        """Blocking REST balance for one prediction market venue."""
+        if platform == "kalshi" and self.kalshi_client:
+            return self.kalshi_client.get_balance()
+        if platform == "polymarket" and self.polymarket_client and self.wallet_address:
+            return self.polymarket_client.get_balance(self.wallet_address)
+        return None
+
+    def _reconcile_ledger(self, platform: str, balance: Optional[dict]) -> None:
+        """Reset the ledger from a REST balance; errors leave it untrusted."""
+        if not balance or balance.get("error"):
+            self.balance_ledger.invalidate(platform)
+            return
+        cash = float(balance.get("balance", balance.get("usdc_balance", 0)) or 0)
+        positions = None
+        if platform == "kalshi":
+            positions = {
+                p["ticker"]: p.get("quantity", 0)
+                for p in balance.get("positions", []) if p.get("ticker")
+            }
+        self.balance_ledger.reconcile(platform, cash, positions)
+
+    async def _reconcile_venue(self, platform: str) -> None:
+        balance = await asyncio.to_thread(self._fetch_venue_balance, platform)
+        self._reconcile_ledger(platform, balance)
+
+    async def _available_balance(self, platform: str) -> float:
+        """Pre-trade cash from the ledger; REST only when it is stale or unknown."""
+        platform = platform.lower()
+        available = self.balance_ledger.available(platform)
+        if available is None:
+            await self._reconcile_venue(platform)
+            available = self.balance_ledger.available(platform)
+        return available or 0.0
+
     async def refresh_blacklist(self):
         """Fetch blacklisted markets from Supabase."""
         try:
@@ -651,42 +814,35 @@ class PolybotRunner:
         logger.info("✓ Cross-Platform Arbitrage Detector initialized")
 
         # Initialize cross-platform scanner (the REAL arbitrage finder)
-        self.cross_platform_scanner = CrossPlatformScanner(
-            min_profit_percent=3.0,  # 3% minimum for Poly buy, 5% for Kalshi buy
-            scan_interval=120,  # Scan every 2 minutes
+        self.cross_platform_scanner = self.strategies.create(
+            "cross_platform_scanner",
+            **self._cross_platform_scanner_kwargs(),
             db_client=self.db,  # Log ALL cross-platform scans to Supabase
         )
-        logger.info("✓ Cross-Platform Scanner initialized (Polymarket↔Kalshi)")
-        logger.info("  📝 Logging ALL cross-platform scans to polybot_market_scans")
+        if self.cross_platform_scanner:
+            logger.info("✓ Cross-Platform Scanner initialized (Polymarket↔Kalshi)")
+            logger.info("  📝 Logging ALL cross-platform scans to polybot_market_scans")
 
         # Initialize single-platform scanner (where the REAL money is!)
         # Academic research shows $40M extracted from Polymarket in 1 year
         # Pass db_client so ALL scans get logged (not just qualifying ones)
         # Use per-strategy config from Supabase (different thresholds for each platform)
-        self.single_platform_scanner = SinglePlatformScanner(
-            min_profit_pct=0.5,  # Default fallback
-            scan_interval_seconds=60,  # Scan every minute
-            on_opportunity=self.on_single_platform_opportunity,
+        self.single_platform_scanner = self.strategies.create(
+            "single_platform_scanner",
+            **self._single_platform_scanner_kwargs(),
+            on_opportunity=self.opportunity_bus.publisher("single_platform"),
             db_client=self.db,  # Log ALL market scans to Supabase
-            # Per-platform thresholds from Supabase config
-            poly_min_profit_pct=self.config.trading.poly_single_min_profit_pct,
-            poly_max_spread_pct=self.config.trading.poly_single_max_spread_pct,
-            poly_max_position_usd=self.config.trading.poly_single_max_position_usd,
-            kalshi_min_profit_pct=self.config.trading.kalshi_single_min_profit_pct,
-            kalshi_max_spread_pct=self.config.trading.kalshi_single_max_spread_pct,
-            kalshi_max_position_usd=self.config.trading.kalshi_single_max_position_usd,
-            # CRITICAL: Filter out long-dated markets (prevents year-long bets!)
-            max_days_to_expiration=self.config.trading.max_days_to_expiration,
-        )
-        logger.info("✓ Single-Platform Scanner initialized (intra-market arb)")
-        logger.info("  📝 Logging ALL market scans to polybot_market_scans")
-        logger.info(
-            f"  📊 Poly min: {self.config.trading.poly_single_min_profit_pct}% | "
-            f"Kalshi min: {self.config.trading.kalshi_single_min_profit_pct}%"
-        )
-        logger.info(
-            f"  📅 Max days to expiration: {self.config.trading.max_days_to_expiration}"
         )
+        if self.single_platform_scanner:
+            logger.info("✓ Single-Platform Scanner initialized (intra-market arb)")
+            logger.info("  📝 Logging ALL market scans to polybot_market_scans")
+            logger.info(
+                f"  📊 Poly min: {self.config.trading.poly_single_min_profit_pct}% | "
+                f"Kalshi min: {self.config.trading.kalshi_single_min_profit_pct}%"
+            )
+            logger.info(
+                f"  📅 Max days to expiration: {self.config.trading.max_days_to_expiration}"
+            )
 
         # Log arbitrage strategy configuration (from Supabase)
         poly_single = self.config.trading.enable_polymarket_single_arb
@@ -705,7 +861,8 @@ class PolybotRunner:
 
         # Initialize Market Making Strategy (if enabled)
         if self.config.trading.enable_market_making:
-            self.market_maker = MarketMakerStrategy(
+            self.market_maker = self.strategies.create(
+                "market_maker",
                 polymarket_client=self.polymarket_client,
                 db_client=self.db,
                 target_spread_bps=self.config.trading.mm_target_spread_bps,
@@ -732,7 +889,8 @@ class PolybotRunner:
             keywords_str = self.config.trading.news_keywords
             keywords = set(k.strip().lower() for k in keywords_str.split(","))
 
-            self.news_arbitrage = NewsArbitrageStrategy(
+            self.news_arbitrage = self.strategies.create(
+                "news_arbitrage",
                 polymarket_client=self.polymarket_client,
                 kalshi_client=self.kalshi_client,
                 db_client=self.db,
@@ -741,7 +899,7 @@ class PolybotRunner:
                 position_size_usd=self.config.trading.news_position_size_usd,
                 scan_interval_sec=self.config.trading.news_scan_interval_sec,
                 keywords=keywords,
-                on_opportunity=self._handle_news_opportunity,
+                on_opportunity=self.opportunity_bus.publisher("news"),
                 # Pass news API keys for enhanced coverage
                 news_api_key=self.news_api_key,
                 finnhub_api_key=self.finnhub_api_key,
@@ -774,6 +932,8 @@ class PolybotRunner:
         )
 
         if any_crypto_enabled:
+            from src.exchanges.ccxt_client import CCXTClient
+
             # Check which exchanges are enabled
             enabled_exchanges = []
             if self.config.trading.enable_binance:
@@ -886,7 +1046,8 @@ class PolybotRunner:
             has_futures = self.ccxt_client.exchange.has.get('fetchFundingRate', False)
 
         if self.config.trading.enable_funding_rate_arb and self.ccxt_client and has_futures:
-            self.funding_rate_arb = FundingRateArbStrategy(
+            self.funding_rate_arb = self.strategies.create(
+                "funding_rate_arb",
                 ccxt_client=self.ccxt_client,
                 db_client=self.db,
                 min_funding_rate_pct=self.config.trading.funding_min_rate_pct,
@@ -912,7 +1073,8 @@ class PolybotRunner:
 
         # Initialize Grid Trading Strategy (75% CONFIDENCE - 20-60% APY)
         if self.config.trading.enable_grid_trading and self.ccxt_client:
-            self.grid_trading = GridTradingStrategy(
+            self.grid_trading = self.strategies.create(
+                "grid_trading",
                 ccxt_client=self.ccxt_client,
                 db_client=self.db,
                 default_range_pct=self.config.trading.grid_default_range_pct,
@@ -969,7 +1131,8 @@ class PolybotRunner:
             if not custom_pairs:
                 logger.info("⏸️ Pairs Trading DISABLED (no valid pairs on exchange)")
             else:
-                self.pairs_trading = PairsTradingStrategy(
+                self.pairs_trading = self.strategies.create(
+                    "pairs_trading",
                     ccxt_client=self.ccxt_client,
                     db_client=self.db,
                     entry_zscore=self.config.trading.pairs_entry_zscore,
@@ -998,6 +1161,8 @@ class PolybotRunner:
         # =====================================================================
 
         if self.config.trading.enable_alpaca:
+            from src.exchanges.alpaca_client import AlpacaClient
+
             # Try multi-tenant approach first (per-user credentials)
             if self.user_id:
                 self.alpaca_client = await AlpacaClient.create_for_user(
@@ -1045,6 +1210,9 @@ class PolybotRunner:
         # Uses IBKRWebClient for cloud deployment (no gateway container needed)
         # Falls back to IBKRClient if user has local IB Gateway running
         if self.config.trading.enable_ibkr:
+            from src.exchanges.ibkr_client import IBKRClient
+            from src.exchanges.ibkr_web_client import IBKRWebClient
+
             logger.info("Initializing IBKR integration...")
 
             # Try Web API first (works without gateway container)
@@ -1128,7 +1296,8 @@ class PolybotRunner:
         # Initialize IBKR Futures Momentum
         ibkr_futures_enabled = getattr(self.config.trading, 'enable_ibkr_futures_momentum', False)
         if ibkr_futures_enabled and self.ibkr_client:
-             self.ibkr_futures_momentum = IBKRFuturesMomentumStrategy(
+             self.ibkr_futures_momentum = self.strategies.create(
+                 "ibkr_futures_momentum",
                  ibkr_client=self.ibkr_client,
                  db_client=self.db,
                  symbol=getattr(self.config.trading, 'ibkr_futures_symbol', 'ES')
@@ -1142,7 +1311,8 @@ class PolybotRunner:
         # Initialize Stock Mean Reversion Strategy (70% CONFIDENCE - 15-30% APY)
         if self.config.trading.enable_stock_mean_reversion and self.alpaca_client:
             watchlist = self.config.trading.stock_mr_watchlist.split(",")
-            self.stock_mean_reversion = StockMeanReversionStrategy(
+            self.stock_mean_reversion = self.strategies.create(
+                "stock_mean_reversion",
                 alpaca_client=self.alpaca_client,
                 db_client=self.db,
                 watchlist=watchlist,
@@ -1168,7 +1338,8 @@ class PolybotRunner:
         # Initialize Stock Momentum Strategy (70% CONFIDENCE - 20-40% APY)
         if self.config.trading.enable_stock_momentum and self.alpaca_client:
             universe = self.config.trading.stock_mom_watchlist.split(",")
-            self.stock_momentum = StockMomentumStrategy(
+            self.stock_momentum = self.strategies.create(
+                "stock_momentum",
                 alpaca_client=self.alpaca_client,
                 db_client=self.db,
                 universe=universe,
@@ -1195,7 +1366,8 @@ class PolybotRunner:
             self.config.trading, 'enable_sector_rotation', False
         )
         if sector_rotation_enabled and self.alpaca_client:
-            self.sector_rotation = SectorRotationStrategy(
+            self.sector_rotation = self.strategies.create(
+                "sector_rotation",
                 alpaca_client=self.alpaca_client,
                 db_client=self.db,
                 dry_run=self.simulation_mode,
@@ -1212,7 +1384,8 @@ class PolybotRunner:
             self.config.trading, 'enable_dividend_growth', False
         )
         if dividend_growth_enabled and self.alpaca_client:
-            self.dividend_growth = DividendGrowthStrategy(
+            self.dividend_growth = self.strategies.create(
+                "dividend_growth",
                 alpaca_client=self.alpaca_client,
                 db_client=self.db,
                 dry_run=self.simulation_mode,
@@ -1229,7 +1402,8 @@ class PolybotRunner:
             self.config.trading, 'enable_earnings_momentum', False
         )
         if earnings_momentum_enabled and self.alpaca_client:
-            self.earnings_momentum = EarningsMomentumStrategy(
+            self.earnings_momentum = self.strategies.create(
+                "earnings_momentum",
                 alpaca_client=self.alpaca_client,
                 db_client=self.db,
                 dry_run=self.simulation_mode,
@@ -1250,7 +1424,8 @@ class PolybotRunner:
             self.config.trading, 'enable_covered_calls', False
         )
         if covered_call_enabled and self.ibkr_client:
-            self.covered_call = CoveredCallStrategy(
+            self.covered_call = self.strategies.create(
+                "covered_call",
                 ibkr_client=self.ibkr_client,
                 db_client=self.db,
                 dry_run=self.simulation_mode,
@@ -1267,7 +1442,8 @@ class PolybotRunner:
             self.config.trading, 'enable_cash_secured_puts', False
         )
         if csp_enabled and self.ibkr_client:
-            self.cash_secured_put = CashSecuredPutStrategy(
+            self.cash_secured_put = self.strategies.create(
+                "cash_secured_put",
                 ibkr_client=self.ibkr_client,
                 db_client=self.db,
                 dry_run=self.simulation_mode,
@@ -1284,7 +1460,8 @@ class PolybotRunner:
             self.config.trading, 'enable_iron_condor', False
         )
         if iron_condor_enabled and self.ibkr_client:
-            self.iron_condor = IronCondorStrategy(
+            self.iron_condor = self.strategies.create(
+                "iron_condor",
                 ibkr_client=self.ibkr_client,
                 db_client=self.db,
                 dry_run=self.simulation_mode,
@@ -1301,7 +1478,8 @@ class PolybotRunner:
             self.config.trading, 'enable_wheel_strategy', False
         )
         if wheel_enabled and self.ibkr_client:
-            self.wheel_strategy = WheelStrategy(
+            self.wheel_strategy = self.strategies.create(
+                "wheel_strategy",
                 ibkr_client=self.ibkr_client,
                 db_client=self.db,
                 dry_run=self.simulation_mode,
@@ -1321,7 +1499,8 @@ class PolybotRunner:
         # Initialize BTC Bracket Arbitrage (85% CONFIDENCE - $20K-200K/month)
         btc_bracket_enabled = getattr(self.config.trading, 'enable_btc_bracket_arb', False)
         if btc_bracket_enabled:
-            self.btc_bracket_arb = BTCBracketArbStrategy(
+            self.btc_bracket_arb = self.strategies.create(
+                "btc_bracket_arb",
                 db_client=self.db,
                 min_profit_pct=getattr(
                     self.config.trading, 'btc_bracket_min_discount_pct', 0.5
@@ -1343,7 +1522,8 @@ class PolybotRunner:
             self.config.trading, 'enable_bracket_compression', False
         )
         if bracket_compression_enabled:
-            self.bracket_compression = BracketCompressionStrategy(
+            self.bracket_compression = self.strategies.create(
+                "bracket_compression",
                 db_client=self.db,
                 # Config has 'bracket_max_imbalance_threshold', map to strategy's 'entry_z_score'
                 entry_z_score=getattr(
@@ -1369,7 +1549,8 @@ class PolybotRunner:
             self.config.trading, 'enable_kalshi_mention_snipe', False
         )
         if kalshi_snipe_enabled and self.kalshi_api_key:
-            self.kalshi_mention_sniper = KalshiMentionSnipeStrategy(
+            self.kalshi_mention_sniper = self.strategies.create(
+                "kalshi_mention_sniper",
                 db_client=self.db,
                 # Config has 'kalshi_snipe_min_profit_cents', convert to pct
                 min_profit_pct=getattr(
@@ -1394,7 +1575,8 @@ class PolybotRunner:
             self.config.trading, 'enable_whale_copy_trading', False
         )
         if whale_copy_enabled:
-            self.whale_copy_trading = WhaleCopyTradingStrategy(
+            self.whale_copy_trading = self.strategies.create(
+                "whale_copy_trading",
                 db_client=self.db,
                 min_win_rate=getattr(
                     self.config.trading, 'whale_copy_min_win_rate', 70.0
@@ -1405,6 +1587,9 @@ class PolybotRunner:
                 max_copy_size_usd=getattr(
                     self.config.trading, 'whale_copy_max_size_usd', 100.0
                 ),
+                activity_concurrency=getattr(
+                    self.config.trading, 'whale_activity_concurrency', 16
+                ),
             )
             logger.info("✓ Whale Copy Trading initialized (75% CONFIDENCE)")
             logger.info("  🐋 Track and copy 80%+ win rate wallets")
@@ -1416,7 +1601,8 @@ class PolybotRunner:
             self.config.trading, 'enable_macro_board', False
         )
         if macro_board_enabled:
-            self.macro_board = MacroBoardStrategy(
+            self.macro_board = self.strategies.create(
+                "macro_board",
                 db_client=self.db,
                 max_total_exposure_usd=getattr(
                     self.config.trading, 'macro_max_exposure_usd', 50000.0
@@ -1440,7 +1626,8 @@ class PolybotRunner:
             self.config.trading, 'enable_fear_premium_contrarian', False
         )
         if fear_premium_enabled:
-            self.fear_premium_contrarian = FearPremiumContrarianStrategy(
+            self.fear_premium_contrarian = self.strategies.create(
+                "fear_premium_contrarian",
                 db_client=self.db,
                 extreme_low_threshold=getattr(
                     self.config.trading, 'fear_extreme_low_threshold', 0.15
@@ -1481,7 +1668,8 @@ class PolybotRunner:
             from src.strategies.congressional_tracker import Chamber
             chambers = Chamber(chambers_str) if chambers_str else Chamber.BOTH
 
-            self.congressional_tracker = CongressionalTrackerStrategy(
+            self.congressional_tracker = self.strategies.create(
+                "congressional_tracker",
                 tracked_politicians=tracked_list,
                 chambers=chambers,
                 copy_scale_pct=getattr(
@@ -1500,6 +1688,9 @@ class PolybotRunner:
                     self.config.trading, 'congress_scan_interval_hours', 6
                 ) * 3600,
                 db_client=self.db,
+                cache_path=getattr(
+                    self.config.trading, 'congress_cache_path', ''
+                ) or None,
             )
             logger.info("✓ Congressional Tracker initialized (70% CONFIDENCE)")
             logger.info(f"  🏛️ Tracking: {', '.join(tracked_list or ['ALL'])}")
@@ -1531,7 +1722,8 @@ class PolybotRunner:
                 "political_event_lookback_hours": getattr(self.config.trading, 'political_lead_time_hours', 48)
             }
 
-            self.political_event_strategy = PoliticalEventStrategy(
+            self.political_event_strategy = self.strategies.create(
+                "political_event_strategy",
                 db_client=self.db,
                 config=political_config
             )
@@ -1556,7 +1748,8 @@ class PolybotRunner:
                 "high_conviction_kelly_fraction": getattr(self.config.trading, 'high_conviction_kelly_fraction', 0.25)
             }
 
-            self.high_conviction_strategy = HighConvictionStrategy(
+            self.high_conviction_strategy = self.strategies.create(
+                "high_conviction_strategy",
                 config=high_conviction_config
             )
             # Inject DB client if needed by strategy (though init didn't ask for it, maybe set it after?)
@@ -1586,7 +1779,8 @@ class PolybotRunner:
                 "swc_max_concurrent_copies": 5
             }
 
-            self.selective_whale_copy = SelectiveWhaleCopyStrategy(
+            self.selective_whale_copy = self.strategies.create(
+                "selective_whale_copy",
                 db_client=self.db,
                 config=whale_config
             )
@@ -1600,7 +1794,8 @@ class PolybotRunner:
             self.config.trading, 'enable_15min_crypto_scalping', False
         )
         if crypto_scalp_enabled:
-            self.crypto_15min_scalping = Crypto15MinScalpingStrategy(
+            self.crypto_15min_scalping = self.strategies.create(
+                "crypto_15min_scalping",
                 entry_threshold=getattr(
                     self.config.trading, 'crypto_scalp_entry_threshold', 0.45
                 ),
@@ -1639,7 +1834,8 @@ class PolybotRunner:
                 os.getenv("GEMINI_API_KEY")
             )
             if gemini_api_key:
-                self.ai_superforecasting = AISuperforecastingStrategy(
+                self.ai_superforecasting = self.strategies.create(
+                    "ai_superforecasting",
                     api_key=gemini_api_key,
                     model=getattr(
                         self.config.trading, 'ai_model', 'gemini-2.5-flash'
@@ -1689,7 +1885,8 @@ class PolybotRunner:
             self.config.trading, 'enable_cross_exchange_arb', False
         )
         if cross_arb_enabled:
-            self.cross_exchange_arb = CrossExchangeArbStrategy(
+            self.cross_exchange_arb = self.strategies.create(
+                "cross_exchange_arb",
                 db_client=self.db
             )
             logger.info("✓ Cross-Exchange Arb initialized")
@@ -1702,7 +1899,8 @@ class PolybotRunner:
             self.config.trading, 'enable_polymarket_liquidation', False
         )
         if poly_liq_enabled and self.polymarket_client:
-            self.polymarket_liquidation = PolymarketLiquidationStrategy(
+            self.polymarket_liquidation = self.strategies.create(
+                "polymarket_liquidation",
                 polymarket_client=self.polymarket_client,
                 db_client=self.db,
                 min_price=getattr(
@@ -1723,12 +1921,13 @@ class PolybotRunner:
             self.config.trading, 'enable_spike_hunter', True
         )
         if spike_hunter_enabled and self.polymarket_client:
-            self.spike_hunter = await create_spike_hunter_from_config(
-                self.config.trading
+            self.spike_hunter = await self.strategies.create(
+                "spike_hunter", self.config.trading
             )
             # Set the opportunity callback to handle detected spikes
+            # (spike hunter calls it synchronously - publish() doesn't block)
             self.spike_hunter.set_opportunity_callback(
-                self._handle_spike_opportunity
+                functools.partial(self.opportunity_bus.publish, "spike")
             )
             logger.info("✓ Spike Hunter initialized (HIGH PRIORITY)")
             logger.info(
@@ -1762,15 +1961,17 @@ class PolybotRunner:
             logger.warning("Real money will be used for trades!")
             logger.warning("=" * 60)
 
-            # Initialize Polymarket ClobClient for live order execution
+            # Initialize Polymarket ClobClient for live order execution:
+            # built, authenticated and health-checked now, kept warm by
+            # the clob_keepalive job
             if self.private_key:
-                self._polymarket_clob_client = (
-                    self.polymarket_client.create_clob_client(
-                        private_key=self.private_key,
-                        chain_id=137,  # Polygon mainnet
-                    )
+                self.clob_pool = ClobClientPool(self.polymarket_client)
+                self._polymarket_clob_client = self.clob_pool.add_wallet(
+                    private_key=self.private_key,
+                    chain_id=137,  # Polygon mainnet
                 )
                 if self._polymarket_clob_client:
+                    self.polymarket_client.clob_pool = self.clob_pool
                     logger.info("✓ Polymarket LIVE trading client initialized")
                 else:
                     logger.warning(
@@ -1815,6 +2016,7 @@ class PolybotRunner:
         # Initialize Kelly Criterion Position Sizer
         kelly_enabled = getattr(self.config.trading, 'kelly_sizing_enabled', False)
         if kelly_enabled:
+            from src.strategies.position_sizing import get_kelly_sizer
             self.kelly_sizer = get_kelly_sizer()
             self.kelly_sizer.kelly_fraction = getattr(
                 self.config.trading, 'kelly_fraction_cap', 0.25
@@ -1833,6 +2035,7 @@ class PolybotRunner:
         # Initialize Market Regime Detector
         regime_enabled = getattr(self.config.trading, 'regime_detection_enabled', True)
         if regime_enabled:
+            from src.strategies.regime_detection import get_regime_detector
             self.regime_detector = get_regime_detector()
             self.regime_detector.vix_low = getattr(
                 self.config.trading, 'regime_vix_low_threshold', 15.0
@@ -1855,6 +2058,7 @@ class PolybotRunner:
         # Initialize Circuit Breaker System
         cb_enabled = getattr(self.config.trading, 'circuit_breaker_enabled', True)
         if cb_enabled:
+            from src.strategies.circuit_breaker import get_circuit_breaker
             self.circuit_breaker = get_circuit_breaker()
             # Update level thresholds from config
             level1_pct = getattr(self.config.trading, 'circuit_breaker_level1_pct', 5.0)
@@ -1879,6 +2083,7 @@ class PolybotRunner:
         # Initialize Time Decay Analyzer (Prediction Markets)
         td_enabled = getattr(self.config.trading, 'time_decay_enabled', True)
         if td_enabled:
+            from src.strategies.time_decay import get_time_decay_analyzer
             self.time_decay_analyzer = get_time_decay_analyzer()
             self.time_decay_analyzer.critical_days = getattr(
                 self.config.trading, 'time_decay_critical_days', 7
@@ -1897,6 +2102,7 @@ class PolybotRunner:
         # Initialize Stablecoin Depeg Detector
         depeg_enabled = getattr(self.config.trading, 'depeg_detection_enabled', True)
         if depeg_enabled:
+            from src.strategies.depeg_detection import get_depeg_detector
             self.depeg_detector = get_depeg_detector()
             self.depeg_detector.alert_threshold = getattr(
                 self.config.trading, 'depeg_alert_threshold_pct', 0.3
@@ -1915,6 +2121,7 @@ class PolybotRunner:
         # Initialize Correlation Position Limiter
         corr_enabled = getattr(self.config.trading, 'correlation_limits_enabled', True)
         if corr_enabled:
+            from src.strategies.correlation_limits import get_correlation_tracker
             self.correlation_tracker = get_correlation_tracker()
             self.correlation_tracker.max_cluster_pct = getattr(
                 self.config.trading, 'correlation_max_cluster_pct', 30.0
@@ -1930,6 +2137,10 @@ class PolybotRunner:
         else:
             logger.info("⏸️ Correlation Limits DISABLED")
 
+        enabled = self.strategies.enabled()
+        logger.info(f"📦 {len(enabled)}/{len(self.strategies.entries)} strategies enabled: {', '.join(enabled)}")
+        logger.info(format_import_report())
+
         logger.info("All features initialized!")
 
     async def on_copy_signal(self, signal: CopySignal):
@@ -2179,6 +2390,14 @@ class PolybotRunner:
         )
         logger.info(f"   Market: {opp.buy_market_name[:60]}...")
 
+        # Sign the Polymarket leg on a worker thread while the opportunity
+        # is being logged (submitted now - the logging below doesn't yield)
+        presign = None
+        if not self.simulation_mode and self.clob_pool:
+            presign = asyncio.get_running_loop().run_in_executor(
+                None, self._presign_cross_platform, opp
+            )
+
         # Send notification for opportunity
         self.notifier.send_opportunity(
             buy_platform=opp.buy_platform,
@@ -2225,6 +2444,7 @@ class PolybotRunner:
         # Paper trade if in simulation mode
         if self.simulation_mode and self.paper_trader:
             try:
+                self._observe_submission("cross_platform", opp.detected_at)
                 trade = await self.paper_trader.simulate_opportunity(
                     market_a_id=opp.buy_market_id,
                     market_a_title=opp.buy_market_name[:200],
@@ -2283,6 +2503,8 @@ class PolybotRunner:
                 )
         else:
             # LIVE TRADING MODE - Execute real trades
+            if presign:
+                await asyncio.gather(presign, return_exceptions=True)
             await self._execute_live_cross_platform_trade(opp, opp_id)
 
     async def on_single_platform_opportunity(
@@ -2302,6 +2524,10 @@ class PolybotRunner:
         # Mark as traded IMMEDIATELY to prevent duplicate trades
         if self.single_platform_scanner:
             self.single_platform_scanner.mark_traded(opp.market_id, opp.platform)
+        if self.strategy_workers:
+            self.strategy_workers.publish(
+                "single_platform.traded", (opp.market_id, opp.platform)
+            )
 
         # Track in analytics
         self.analytics.record_opportunity(arb_type)
@@ -2349,6 +2575,7 @@ class PolybotRunner:
             try:
                 # For single-platform, we buy ALL outcomes
                 arb_type_str = arb_type.value  # "polymarket_single" or "kalshi_single"
+                self._observe_submission(arb_type_str, opp.detected_at)
                 trade = await self.paper_trader.simulate_opportunity(
                     market_a_id=opp.market_id,
                     market_a_title=opp.market_title[:200],
@@ -2412,6 +2639,14 @@ class PolybotRunner:
             # =========================================================
             await self._execute_live_single_platform_trade(opp, opp_id, arb_type)
 
+    @staticmethod
+    def _observe_submission(strategy: str, detected_at: datetime) -> None:
+        """Record detection -> order submission latency for /metrics."""
+        now = datetime.now(timezone.utc) if detected_at.tzinfo else datetime.utcnow()
+        pipeline_latency.labels(strategy=strategy, stage="detection_to_submission").observe(
+            max(0.0, (now - detected_at).total_seconds())
+        )
+
     async def on_position_claim(self, result: ClaimResult):
         """Handle position claim results."""
         if result.success:
@@ -2453,19 +2688,8 @@ class PolybotRunner:
         MIN_BALANCE_REQUIRED = 1.0  # Minimum $1 required to trade
         
         try:
-            if opp.platform == "kalshi":
-                balance_data = self.kalshi_client.get_balance()
-                available_balance = float(balance_data.get("balance", 0))
-                logger.info(f"💰 Kalshi balance check: ${available_balance:.2f}")
-            elif opp.platform == "polymarket":
-                if self.polymarket_client and self.wallet_address:
-                    balance_data = self.polymarket_client.get_balance(self.wallet_address)
-                    available_balance = float(balance_data.get("balance", 0))
-                else:
-                    available_balance = 0.0
-                logger.info(f"💰 Polymarket balance check: ${available_balance:.2f}")
-            else:
-                available_balance = 0.0
+            available_balance = await self._available_balance(opp.platform)
+            logger.info(f"💰 {opp.platform} balance check: ${available_balance:.2f}")
             
             if available_balance <= 0:
                 logger.error(f"🚫 REFUSING TRADE: No balance on {opp.platform} (${available_balance:.2f})")
@@ -2508,18 +2732,33 @@ class PolybotRunner:
                 max_size = min(max_size, 10.0)  # $10 max for Kalshi
             position_size = min(max_size, available_balance * 0.95)
 
-            if opp.platform == "polymarket":
-                result = await self._execute_polymarket_live_trade(
-                    opp, position_size
-                )
-            elif opp.platform == "kalshi":
-                result = await self._execute_kalshi_live_trade(
-                    opp, position_size
-                )
+            # Hold the cash while orders are in flight
+            self.balance_ledger.reserve(opp.platform, opp_id, position_size)
+            try:
+                if opp.platform == "polymarket":
+                    result = await self._execute_polymarket_live_trade(
+                        opp, position_size
+                    )
+                elif opp.platform == "kalshi":
+                    result = await self._execute_kalshi_live_trade(
+                        opp, position_size
+                    )
+                else:
+                    result = {
+                        "success": False, "error": f"Unknown platform: {opp.platform}"
+                    }
+            except Exception:
+                self.balance_ledger.release(opp_id)
+                self.balance_ledger.invalidate(opp.platform)
+                raise
+
+            if result.get("success"):
+                self.balance_ledger.debit(opp.platform, position_size, key=opp_id)
             else:
-                result = {
-                    "success": False, "error": f"Unknown platform: {opp.platform}"
-                }
+                self.balance_ledger.release(opp_id)
+                if result.get("partial_order_ids") or result.get("cancelled_order_ids"):
+                    # Some orders went through - trust REST until reconciled
+                    self.balance_ledger.invalidate(opp.platform)
 
             # Update database with result
             if result.get("success"):
@@ -2634,6 +2873,7 @@ class PolybotRunner:
             order_ids = []
 
             # Buy YES tokens
+            self._observe_submission("polymarket_single", opp.detected_at)
             yes_result = await self.polymarket_client.place_order(
                 clob_client=clob_client,
                 token_id=yes_token_id,
@@ -2699,6 +2939,7 @@ class PolybotRunner:
         try:
             order_ids = []
             per_condition_size = position_size / len(opp.conditions)
+            self._observe_submission("polymarket_single", opp.detected_at)
 
             for cond in opp.conditions:
                 token_id = cond.get("token_id") or cond.get("condition_id")
@@ -2819,6 +3060,7 @@ class PolybotRunner:
             order_ids = []
 
             # Buy YES contracts
+            self._observe_submission("kalshi_single", opp.detected_at)
             yes_result = await self.kalshi_client.place_order(
                 ticker=ticker,
                 side="yes",
@@ -2913,19 +3155,7 @@ class PolybotRunner:
         MIN_BALANCE_REQUIRED = 1.0
         
         try:
-            if opp.buy_platform.lower() == "kalshi":
-                balance_data = self.kalshi_client.get_balance()
-                available_balance = float(balance_data.get("balance", 0))
-            elif opp.buy_platform.lower() == "polymarket":
-                if self.polymarket_client and self.wallet_address:
-                    balance_data = self.polymarket_client.get_balance(
-                        self.wallet_address
-                    )
-                    available_balance = float(balance_data.get("balance", 0))
-                else:
-                    available_balance = 0.0
-            else:
-                available_balance = 0.0
+            available_balance = await self._available_balance(opp.buy_platform)
             
             logger.info(
                 f"💰 {opp.buy_platform} balance: ${available_balance:.2f}"
@@ -2960,71 +3190,61 @@ class PolybotRunner:
         )
 
         try:
-            max_size = self.config.trading.max_trade_size
-            position_size = min(max_size, 100, available_balance * 0.95)
-
-            # Execute buy leg first
-            buy_result = await self._execute_cross_platform_leg(
-                platform=opp.buy_platform,
-                market_id=opp.buy_market_id,
-                side="buy",
-                price=opp.buy_price,
-                position_size=position_size,
+            contracts = self._cross_platform_contracts(opp, available_balance)
+
+            # Submit both legs at once; unmatched fills are unwound
+            self._observe_submission("cross_platform", opp.detected_at)
+            execution = await self.leg_coordinator.execute(
+                self._cross_platform_legs(opp, contracts)
             )
+            buy_result = execution.leg("buy")
+            sell_result = execution.leg("sell")
 
-            if not buy_result.get("success"):
-                logger.error(
-                    f"Buy leg failed: {buy_result.get('error')}"
+            if execution.unwind_errors:
+                # Alert for manual intervention - use trade_failed notification
+                self.notifier.send_trade_failed(
+                    platform=f"{opp.buy_platform}/{opp.sell_platform}",
+                    reason=(
+                        f"⚠️ UNHEDGED LEG: unwind incomplete - "
+                        f"{'; '.join(execution.unwind_errors)}"
+                    )
+                )
+
+            if not execution.success:
+                errors = "; ".join(
+                    f"{leg.name} {leg.status}: {leg.error or 'no fill'}" for leg in execution.legs
                 )
+                logger.error(f"Cross-platform legs failed: {errors}")
                 self.db.update_opportunity_status(
                     opportunity_id=opp_id,
                     status="failed",
-                    skip_reason=f"Buy leg failed: {buy_result.get('error')}"
+                    skip_reason=f"Legs failed: {errors}"[:500]
                 )
                 return
 
-            # Execute sell leg
-            sell_result = await self._execute_cross_platform_leg(
-                platform=opp.sell_platform,
-                market_id=opp.sell_market_id,
-                side="sell",
-                price=opp.sell_price,
-                position_size=position_size,
-            )
-
-            if not sell_result.get("success"):
-                logger.error(
-                    f"Sell leg failed (buy leg succeeded!): "
-                    f"{sell_result.get('error')}"
-                )
-                self.db.update_opportunity_status(
-                    opportunity_id=opp_id,
-                    status="partial",
-                    skip_reason=f"Sell leg failed: {sell_result.get('error')}",
-                    execution_result="partial_buy_only"
-                )
-                # Alert for manual intervention - use trade_failed notification
-                self.notifier.send_trade_failed(
-                    platform=opp.buy_platform,
-                    reason=(
-                        f"⚠️ PARTIAL EXECUTION: Buy succeeded on "
-                        f"{opp.buy_platform}, sell failed on {opp.sell_platform}"
-                    )
+            position_size = execution.matched * opp.buy_price
+            if execution.status == "partial":
+                logger.warning(
+                    f"Cross-platform trade partially filled: "
+                    f"{execution.matched:g}/{contracts} contracts matched"
                 )
-                return
 
-            # Both legs succeeded
+            # Both legs filled (at least the matched quantity)
+            timing = execution.to_dict()
             logger.info(
                 f"✅ Cross-platform trade executed: "
-                f"Buy {buy_result.get('order_id')}, "
-                f"Sell {sell_result.get('order_id')}"
+                f"Buy {buy_result.order_id}, "
+                f"Sell {sell_result.order_id} | "
+                f"leg skew {timing['skew_ms']}ms, total {timing['latency_ms']}ms"
             )
 
             self.db.update_opportunity_status(
                 opportunity_id=opp_id,
                 status="executed",
                 executed_at=datetime.utcnow(),
-                execution_result="pending_resolution"
+                execution_result=(
+                    "pending_resolution" if execution.status == "filled" else "partial_fill"
+                )
             )
 
             self.analytics.record_opportunity(ArbitrageType.CROSS_PLATFORM)
@@ -3037,10 +3257,10 @@ class PolybotRunner:
                 "position_size_usd": position_size,
                 "expected_profit_pct": float(opp.profit_percent),
                 "order_ids": [
-                    buy_result.get("order_id"),
-                    sell_result.get("order_id")
+                    buy_result.order_id,
+                    sell_result.order_id
                 ],
-                "status": "open",
+                "status": "open" if execution.status == "filled" else "partial",
             })
 
         except Exception as e:
@@ -3051,26 +3271,133 @@ class PolybotRunner:
                 skip_reason=str(e)
             )
 
+    def _cross_platform_contracts(self, opp: Opportunity, available_balance: float) -> int:
+        """Same quantity on both legs so the position is fully hedged."""
+        max_size = self.config.trading.max_trade_size
+        position_size = min(max_size, 100, available_balance * 0.95)
+        return int(position_size / opp.buy_price)
+
+    def _presign_cross_platform(self, opp: Opportunity) -> None:
+        """Presign Polymarket legs at the prices and size the live path will use."""
+        available = self.balance_ledger.available(opp.buy_platform.lower())
+        clob_client = getattr(self, '_polymarket_clob_client', None)
+        if not available or not clob_client:
+            return
+        contracts = self._cross_platform_contracts(opp, available)
+        if contracts <= 0:
+            return
+        for leg in self._cross_platform_legs(opp, contracts):
+            if leg.platform == "polymarket":
+                self.clob_pool.presign(
+                    clob_client, leg.market_id, leg.side.upper(), leg.price, leg.quantity
+                )
+
+    def _cross_platform_legs(self, opp: Opportunity, contracts: int) -> List[LegOrder]:
+        """Buy and sell legs for the LegCoordinator (REST clients block, so threaded)."""
+        return [
+            LegOrder(
+                name=side,
+                platform=platform.lower(),
+                market_id=market_id,
+                side=side,
+                price=price,
+                quantity=contracts,
+                submit=self._submit_cross_platform_leg,
+                unwind=self._unwind_cross_platform_leg,
+                cancel=self._cancel_cross_platform_leg,
+                blocking=True,
+            )
+            for side, platform, market_id, price in (
+                ("buy", opp.buy_platform, opp.buy_market_id, opp.buy_price),
+                ("sell", opp.sell_platform, opp.sell_market_id, opp.sell_price),
+            )
+        ]
+
+    async def _submit_cross_platform_leg(self, leg: LegOrder, time_in_force: str) -> dict:
+        return await self._execute_cross_platform_leg(
+            platform=leg.platform,
+            market_id=leg.market_id,
+            side=leg.side,
+            price=leg.price,
+            contracts=leg.quantity,
+            time_in_force=time_in_force,
+        )
+
+    async def _unwind_cross_platform_leg(self, leg: LegOrder, quantity: float) -> dict:
+        """Offset an unmatched fill with an IOC order, conceding some price to get out."""
+        slippage = self.config.trading.cross_platform_unwind_slippage
+        if leg.side == "buy":
+            side, price = "sell", leg.price - slippage
+        else:
+            side, price = "buy", leg.price + slippage
+        return await self._execute_cross_platform_leg(
+            platform=leg.platform,
+            market_id=leg.market_id,
+            side=side,
+            price=min(max(price, 0.01), 0.99),
+            contracts=quantity,
+            time_in_force="IOC",
+        )
+
+    async def _cancel_cross_platform_leg(self, leg: LegOrder, order_id: str) -> dict:
+        if leg.platform == "polymarket":
+            return await self.polymarket_client.cancel_order(
+                clob_client=getattr(self, '_polymarket_clob_client', None),
+                order_id=order_id,
+            )
+        return await self.kalshi_client.cancel_order(order_id)
+
     async def _execute_cross_platform_leg(
         self,
         platform: str,
         market_id: str,
         side: str,
         price: float,
-        position_size: float,
+        contracts: float,
+        time_in_force: str = "GTC",
+    ) -> dict:
+        """
+        Execute a single leg of a cross-platform trade, keeping the balance
+        ledger in step: buys reserve their cost and fills are applied.
+        """
+        key = f"leg:{platform}:{market_id}:{side}:{id(asyncio.current_task())}"
+        if side == "buy":
+            self.balance_ledger.reserve(platform, key, contracts * price)
+        try:
+            result = await self._place_cross_platform_leg(
+                platform, market_id, side, price, contracts, time_in_force
+            )
+        except Exception:
+            self.balance_ledger.invalidate(platform)
+            raise
+        finally:
+            self.balance_ledger.release(key)
+
+        filled = filled_quantity(result, time_in_force, contracts)
+        if filled > 0:
+            self.balance_ledger.record_fill(platform, market_id, side, filled, price)
+        return result
+
+    async def _place_cross_platform_leg(
+        self,
+        platform: str,
+        market_id: str,
+        side: str,
+        price: float,
+        contracts: float,
+        time_in_force: str = "GTC",
     ) -> dict:
         """
-        Execute a single leg of a cross-platform trade.
+        Place a single leg of a cross-platform trade.
 
         Args:
             platform: "polymarket" or "kalshi"
             market_id: Market/ticker ID
             side: "buy" or "sell"
             price: Price to trade at
-            position_size: USD amount to trade
+            contracts: Number of contracts/shares
+            time_in_force: "IOC", "FOK" or "GTC"
         """
-        contracts = int(position_size / price)
-
         if platform == "polymarket":
             clob_client = getattr(self, '_polymarket_clob_client', None)
             if not clob_client:
@@ -3085,7 +3412,7 @@ class PolybotRunner:
                 side=side.upper(),
                 price=price,
                 size=contracts,
-                order_type="GTC",
+                order_type=time_in_force,
             )
 
         elif platform == "kalshi":
@@ -3108,9 +3435,10 @@ class PolybotRunner:
                 ticker=market_id,
                 side="yes",
                 action=action,
-                count=contracts,
+                count=int(contracts),
                 price_cents=price_cents,
                 order_type="limit",
+                time_in_force=self.KALSHI_TIME_IN_FORCE[time_in_force],
             )
         else:
             return {
@@ -3357,7 +3685,7 @@ class PolybotRunner:
             return
             
         if self.arb_detector:
-            await self.arb_detector.run(callback=self.on_arb_opportunity)
+            await self.arb_detector.run(callback=self.opportunity_bus.publisher("overlap"))
 
     async def run_cross_platform_scanner(self):
         """Run cross-platform arbitrage scanner (Polymarket↔Kalshi)."""
@@ -3381,10 +3709,17 @@ class PolybotRunner:
             )
             return
 
-        if self.cross_platform_scanner:
+        if "cross_platform_scanner" in self._worker_groups:
+            logger.info("▶️ Starting Cross-Platform Scanner in worker process...")
+            await self.strategy_workers.run_group(WorkerGroup(
+                "cross_platform_scanner",
+                "src.services.strategy_workers:cross_platform_scanner_worker",
+                dict(self._cross_platform_scanner_kwargs(), user_id=self.user_id),
+            ))
+        elif self.cross_platform_scanner:
             logger.info("▶️ Starting Cross-Platform Scanner...")
             await self.cross_platform_scanner.run(
-                callback=self.on_cross_platform_opportunity
+                callback=self.opportunity_bus.publisher("cross_platform")
             )
 
     async def run_single_platform_scanner(self):
@@ -3417,7 +3752,19 @@ class PolybotRunner:
             logger.info("⏸️ Single-platform arb DISABLED (both platforms)")
             return
 
-        if self.single_platform_scanner:
+        if "single_platform_scanner" in self._worker_groups:
+            logger.info("▶️ Starting Single-Platform Scanner in worker process...")
+            await self.strategy_workers.run_group(WorkerGroup(
+                "single_platform_scanner",
+                "src.services.strategy_workers:single_platform_scanner_worker",
+                dict(
+                    self._single_platform_scanner_kwargs(),
+                    user_id=self.user_id,
+                    enable_polymarket=enable_poly,
+                    enable_kalshi=enable_kalshi,
+                ),
+            ))
+        elif self.single_platform_scanner:
             logger.info(
                 f"▶️ Starting Single-Platform Scanner | "
                 f"Polymarket={'ON' if enable_poly else 'OFF'} | "
@@ -3548,8 +3895,8 @@ class PolybotRunner:
                     logger.error(f"Pairs trading error: {e}")
                     await asyncio.sleep(60)  # Wait before restart
 
-    async def run_stock_mean_reversion(self):
-        """Run stock mean reversion strategy (70% CONFIDENCE - 15-30% APY)."""
+    def schedule_stock_mean_reversion(self):
+        """Schedule stock mean reversion strategy (70% CONFIDENCE - 15-30% APY)."""
         if not self.config.trading.enable_stock_mean_reversion:
             logger.info("⏸️ Stock Mean Reversion DISABLED")
             return
@@ -3557,18 +3904,15 @@ class PolybotRunner:
         if self.stock_mean_reversion:
             logger.info("▶️ Starting Stock Mean Reversion Strategy...")
             logger.info("  📉 Buy oversold stocks reverting to mean")
-            scan_interval = self.config.trading.stock_mr_scan_interval_sec
-            # Run indefinitely until stopped
-            while self._running:
-                try:
-                    await self.stock_mean_reversion.run_cycle()
-                    await asyncio.sleep(scan_interval)
-                except Exception as e:
-                    logger.error(f"Stock mean reversion error: {e}")
-                    await asyncio.sleep(60)  # Wait before restart
+            self.scheduler.add_job(
+                "stock_mean_reversion", self.stock_mean_reversion.run_cycle,
+                interval_sec=self.config.trading.stock_mr_scan_interval_sec,
+                priority=JobPriority.BULK, apis=("alpaca",),
+                retry_delay_sec=60,
+            )
 
-    async def run_stock_momentum(self):
-        """Run stock momentum strategy (70% CONFIDENCE - 20-40% APY)."""
+    def schedule_stock_momentum(self):
+        """Schedule stock momentum strategy (70% CONFIDENCE - 20-40% APY)."""
         if not self.config.trading.enable_stock_momentum:
             logger.info("⏸️ Stock Momentum DISABLED")
             return
@@ -3576,134 +3920,117 @@ class PolybotRunner:
         if self.stock_momentum:
             logger.info("▶️ Starting Stock Momentum Strategy...")
             logger.info("  📈 Ride trends in high-momentum stocks")
-            scan_interval = self.config.trading.stock_mom_scan_interval_sec
-            # Run indefinitely until stopped
-            while self._running:
-                try:
-                    await self.stock_momentum.run_cycle()
-                    await asyncio.sleep(scan_interval)
-                except Exception as e:
-                    logger.error(f"Stock momentum error: {e}")
-                    await asyncio.sleep(60)  # Wait before restart
+            self.scheduler.add_job(
+                "stock_momentum", self.stock_momentum.run_cycle,
+                interval_sec=self.config.trading.stock_mom_scan_interval_sec,
+                priority=JobPriority.BULK, apis=("alpaca",),
+                retry_delay_sec=60,
+            )
 
-    async def run_sector_rotation(self):
-        """Run sector rotation strategy (70% CONFIDENCE - 15-25% APY)."""
+    def schedule_sector_rotation(self):
+        """Schedule sector rotation strategy (70% CONFIDENCE - 15-25% APY)."""
         if not getattr(self.config.trading, 'enable_sector_rotation', False):
             return
 
         if self.sector_rotation:
             logger.info("▶️ Starting Sector Rotation Strategy...")
             logger.info("  📊 Rotating into strongest sector ETFs")
-            scan_interval = getattr(self.config.trading, 'sector_rotation_interval_sec', 3600)
-            while self._running:
-                try:
-                    await self.sector_rotation.run_cycle()
-                    await asyncio.sleep(scan_interval)
-                except Exception as e:
-                    logger.error(f"Sector rotation error: {e}")
-                    await asyncio.sleep(300)
+            self.scheduler.add_job(
+                "sector_rotation", self.sector_rotation.run_cycle,
+                interval_sec=getattr(self.config.trading, 'sector_rotation_interval_sec', 3600),
+                priority=JobPriority.BULK, apis=("alpaca",),
+                retry_delay_sec=300,
+            )
 
-    async def run_dividend_growth(self):
-        """Run dividend growth strategy (65% CONFIDENCE - 10-20% APY)."""
+    def schedule_dividend_growth(self):
+        """Schedule dividend growth strategy (65% CONFIDENCE - 10-20% APY)."""
         if not getattr(self.config.trading, 'enable_dividend_growth', False):
             return
 
         if self.dividend_growth:
             logger.info("▶️ Starting Dividend Growth Strategy...")
             logger.info("  💰 Accumulating dividend aristocrats")
-            scan_interval = getattr(self.config.trading, 'dividend_growth_interval_sec', 86400)
-            while self._running:
-                try:
-                    await self.dividend_growth.run_cycle()
-                    await asyncio.sleep(scan_interval)
-                except Exception as e:
-                    logger.error(f"Dividend growth error: {e}")
-                    await asyncio.sleep(300)
+            self.scheduler.add_job(
+                "dividend_growth", self.dividend_growth.run_cycle,
+                interval_sec=getattr(self.config.trading, 'dividend_growth_interval_sec', 86400),
+                priority=JobPriority.BULK, apis=("alpaca",),
+                retry_delay_sec=300,
+            )
 
-    async def run_earnings_momentum(self):
-        """Run earnings momentum strategy (70% CONFIDENCE - 20-40% APY)."""
+    def schedule_earnings_momentum(self):
+        """Schedule earnings momentum strategy (70% CONFIDENCE - 20-40% APY)."""
         if not getattr(self.config.trading, 'enable_earnings_momentum', False):
             return
 
         if self.earnings_momentum:
             logger.info("▶️ Starting Earnings Momentum Strategy...")
             logger.info("  📈 Trading post-earnings drift")
-            scan_interval = getattr(self.config.trading, 'earnings_momentum_interval_sec', 3600)
-            while self._running:
-                try:
-                    await self.earnings_momentum.run_cycle()
-                    await asyncio.sleep(scan_interval)
-                except Exception as e:
-                    logger.error(f"Earnings momentum error: {e}")
-                    await asyncio.sleep(300)
+            self.scheduler.add_job(
+                "earnings_momentum", self.earnings_momentum.run_cycle,
+                interval_sec=getattr(self.config.trading, 'earnings_momentum_interval_sec', 3600),
+                priority=JobPriority.BULK, apis=("alpaca",),
+                retry_delay_sec=300,
+            )
 
-    async def run_covered_calls(self):
-        """Run covered calls strategy (75% CONFIDENCE - 15-25% APY)."""
+    def schedule_covered_calls(self):
+        """Schedule covered calls strategy (75% CONFIDENCE - 15-25% APY)."""
         if not getattr(self.config.trading, 'enable_covered_calls', False):
             return
 
         if self.covered_call:
             logger.info("▶️ Starting Covered Calls Strategy...")
             logger.info("  📝 Selling calls against stock positions")
-            scan_interval = getattr(self.config.trading, 'covered_calls_interval_sec', 3600)
-            while self._running:
-                try:
-                    await self.covered_call.run_cycle()
-                    await asyncio.sleep(scan_interval)
-                except Exception as e:
-                    logger.error(f"Covered calls error: {e}")
-                    await asyncio.sleep(300)
+            self.scheduler.add_job(
+                "covered_calls", self.covered_call.run_cycle,
+                interval_sec=getattr(self.config.trading, 'covered_calls_interval_sec', 3600),
+                priority=JobPriority.BULK, apis=("ibkr",),
+                retry_delay_sec=300,
+            )
 
-    async def run_cash_secured_puts(self):
-        """Run cash secured puts strategy (75% CONFIDENCE - 15-25% APY)."""
+    def schedule_cash_secured_puts(self):
+        """Schedule cash secured puts strategy (75% CONFIDENCE - 15-25% APY)."""
         if not getattr(self.config.trading, 'enable_cash_secured_puts', False):
             return
 
         if self.cash_secured_put:
             logger.info("▶️ Starting Cash Secured Puts Strategy...")
             logger.info("  💵 Selling puts with cash collateral")
-            scan_interval = getattr(self.config.trading, 'csp_interval_sec', 3600)
-            while self._running:
-                try:
-                    await self.cash_secured_put.run_cycle()
-                    await asyncio.sleep(scan_interval)
-                except Exception as e:
-                    logger.error(f"Cash secured puts error: {e}")
-                    await asyncio.sleep(300)
+            self.scheduler.add_job(
+                "cash_secured_puts", self.cash_secured_put.run_cycle,
+                interval_sec=getattr(self.config.trading, 'csp_interval_sec', 3600),
+                priority=JobPriority.BULK, apis=("ibkr",),
+                retry_delay_sec=300,
+            )
 
-    async def run_iron_condor(self):
-        """Run iron condor strategy (70% CONFIDENCE - 20-30% APY)."""
+    def schedule_iron_condor(self):
+        """Schedule iron condor strategy (70% CONFIDENCE - 20-30% APY)."""
         if not getattr(self.config.trading, 'enable_iron_condor', False):
             return
 
         if self.iron_condor:
             logger.info("▶️ Starting Iron Condor Strategy...")
             logger.info("  🦅 Selling OTM call & put spreads")
-            scan_interval = getattr(self.config.trading, 'iron_condor_interval_sec', 3600)
-            while self._running:
-                try:
-                    await self.iron_condor.run_cycle()
-                    await asyncio.sleep(scan_interval)
-                except Exception as e:
-                    logger.error(f"Iron condor error: {e}")
-                    await asyncio.sleep(300)
+            self.scheduler.add_job(
+                "iron_condor", self.iron_condor.run_cycle,
+                interval_sec=getattr(self.config.trading, 'iron_condor_interval_sec', 3600),
+                priority=JobPriority.BULK, apis=("ibkr",),
+                retry_delay_sec=300,
+            )
 
-    async def run_wheel_strategy(self):
-        """Run wheel strategy (80% CONFIDENCE - 20-35% APY)."""
+    def schedule_wheel_strategy(self):
+        """Schedule wheel strategy (80% CONFIDENCE - 20-35% APY)."""
         if not getattr(self.config.trading, 'enable_wheel_strategy', False):
             return
 
         if self.wheel_strategy:
             logger.info("▶️ Starting Wheel Strategy...")
             logger.info("  🎡 CSP → Assignment → CC cycle")
-            scan_interval = getattr(self.config.trading, 'wheel_interval_sec', 3600)
-            while self._running:
-                try:
-                    await self.wheel_strategy.run_cycle()
-                    await asyncio.sleep(scan_interval)
-                except Exception as e:
-                    logger.error(f"Wheel strategy error: {e}")
-                    await asyncio.sleep(300)
+            self.scheduler.add_job(
+                "wheel_strategy", self.wheel_strategy.run_cycle,
+                interval_sec=getattr(self.config.trading, 'wheel_interval_sec', 3600),
+                priority=JobPriority.BULK, apis=("ibkr",),
+                retry_delay_sec=300,
+            )
 
     # =========================================================================
     # TWITTER-DERIVED STRATEGIES (2024)
@@ -3847,12 +4174,12 @@ class PolybotRunner:
             logger.info("  🧠 Gemini-powered market analysis")
             await self.ai_superforecasting.run()
 
-    async def run_spike_hunter(self):
+    def schedule_spike_hunter(self):
         """
-        Run Spike Hunter Strategy (HIGH PRIORITY - $5K-100K/month).
+        Schedule Spike Hunter Strategy (HIGH PRIORITY - $5K-100K/month).
         
-        Continuously polls Polymarket prices and feeds them to the spike detector.
-        When a 2%+ move in <30s is detected, fades the spike for mean reversion.
+        Polls Polymarket prices every 2s (CRITICAL priority) and feeds them to
+        the spike detector. When a 2%+ move in <30s is detected, fades the spike for mean reversion.
         """
         if not getattr(
             self.config.trading, 'enable_spike_hunter', True
@@ -3875,67 +4202,67 @@ class PolybotRunner:
         )
 
         # Price polling interval - fast for spike detection (1-2 seconds)
-        poll_interval = 2.0
+        self.scheduler.add_job(
+            "spike_hunter", self._spike_hunter_cycle,
+            interval_sec=2.0,
+            priority=JobPriority.CRITICAL, apis=("gamma",),
+            jitter_pct=0.0, retry_delay_sec=10, max_retry_delay_sec=10,
+        )
 
-        while self._running:
-            try:
-                # Fetch active markets from Polymarket
-                markets = await self.polymarket_client.get_markets(
-                    limit=100,
-                    active_only=True,
-                    min_liquidity=5000,  # Only liquid markets for spike trading
-                )
+    async def _spike_hunter_cycle(self):
+        """One spike hunter poll: feed prices, then manage open positions."""
+        # Fetch active markets from Polymarket
+        markets = await self.polymarket_client.get_markets(
+            limit=100,
+            active_only=True,
+            min_liquidity=5000,  # Only liquid markets for spike trading
+        )
 
-                # Update spike hunter with current prices
-                for market in markets:
-                    market_id = market.get('conditionId') or market.get('id')
-                    if not market_id:
-                        continue
-
-                    # Get current price (midpoint of best bid/ask, or last trade)
-                    price = None
-                    if 'outcomePrices' in market and market['outcomePrices']:
-                        # Use YES price
-                        try:
-                            price = float(market['outcomePrices'][0])
-                        except (IndexError, ValueError, TypeError):
-                            pass
-
-                    if price is None:
-                        # Try lastTradePrice
-                        price = market.get('lastTradePrice')
-                        if price:
-                            try:
-                                price = float(price)
-                            except (ValueError, TypeError):
-                                price = None
-
-                    if price is not None and 0 < price < 1:
-                        # Get volume for better spike detection
-                        volume = float(market.get('volume24hr', 0) or 0)
-                        
-                        # Feed price to spike hunter
-                        opportunity = self.spike_hunter.update_price(
-                            market_id=market_id,
-                            price=price,
-                            volume=volume,
-                        )
-                        
-                        # If opportunity detected, it's already handled by callback
-                        # But we can also explicitly check here
-                        if opportunity:
-                            logger.debug(
-                                f"Spike opportunity detected: {opportunity.id}"
-                            )
+        # Update spike hunter with current prices
+        for market in markets:
+            market_id = market.get('conditionId') or market.get('id')
+            if not market_id:
+                continue
 
-                # Also manage existing positions (check for exits)
-                await self._manage_spike_positions()
+            # Get current price (midpoint of best bid/ask, or last trade)
+            price = None
+            if 'outcomePrices' in market and market['outcomePrices']:
+                # Use YES price
+                try:
+                    price = float(market['outcomePrices'][0])
+                except (IndexError, ValueError, TypeError):
+                    pass
+
+            if price is None:
+                # Try lastTradePrice
+                price = market.get('lastTradePrice')
+                if price:
+                    try:
+                        price = float(price)
+                    except (ValueError, TypeError):
+                        price = None
+
+            if price is not None and 0 < price < 1:
+                # Get volume for better spike detection
+                volume = float(market.get('volume24hr', 0) or 0)
+                
+                # Feed price to spike hunter
+                opportunity = self.spike_hunter.update_price(
+                    market_id=market_id,
+                    price=price,
+                    volume=volume,
+                )
+                
+                # If opportunity detected, it's already handled by callback
+                # But we can also explicitly check here
+                if opportunity:
+                    logger.debug(
+                        f"Spike opportunity detected: {opportunity.id}"
+                    )
 
-                await asyncio.sleep(poll_interval)
+        # Also manage existing positions (check for exits)
+        await self._manage_spike_positions()
 
-            except Exception as e:
-                logger.error(f"Spike hunter error: {e}")
-                await asyncio.sleep(10)  # Wait before retry
 
     async def _manage_spike_positions(self):
         """Manage open spike positions - check for exits."""
@@ -4010,176 +4337,184 @@ class PolybotRunner:
             )
 
     async def run_balance_tracker(self):
-        """Periodically fetch and save balances to database."""
-        while self._running:
+        """Fetch and save balances to database (scheduled every 5 minutes)."""
+        try:
+            # Use aggregator to fetch from all platforms and save to DB
+            if self.balance_aggregator:
+                balance = await self.balance_aggregator.fetch_all_balances(
+                    force_refresh=True
+                )
+                logger.info(
+                    f"💰 Portfolio: ${float(balance.total_portfolio_usd):,.2f} | "
+                    f"Cash: ${float(balance.total_cash_usd):,.2f} | "
+                    f"Positions: ${float(balance.total_positions_usd):,.2f} | "
+                    f"Platforms: {len(balance.platforms)}"
+                )
+            else:
+                # Fallback to simple balance fetch (no DB save)
+                await self.fetch_balances()
+        except Exception as e:
+            logger.error(f"Error fetching balances: {e}")
+
+
+    async def run_balance_reconcile(self):
+        """Reset the balance ledger from REST (scheduled; live mode only)."""
+        if self.simulation_mode:
+            return
+        interval = self.config.trading.balance_reconcile_interval_sec
+        for platform in ("kalshi", "polymarket"):
+            age = self.balance_ledger.age(platform)
+            if age is not None and age < interval / 2:
+                continue  # Reconciled recently by a pre-trade fallback
             try:
-                # Use aggregator to fetch from all platforms and save to DB
-                if self.balance_aggregator:
-                    balance = await self.balance_aggregator.fetch_all_balances(
-                        force_refresh=True
-                    )
-                    logger.info(
-                        f"💰 Portfolio: ${float(balance.total_portfolio_usd):,.2f} | "
-                        f"Cash: ${float(balance.total_cash_usd):,.2f} | "
-                        f"Positions: ${float(balance.total_positions_usd):,.2f} | "
-                        f"Platforms: {len(balance.platforms)}"
-                    )
-                else:
-                    # Fallback to simple balance fetch (no DB save)
-                    await self.fetch_balances()
+                await self._reconcile_venue(platform)
             except Exception as e:
-                logger.error(f"Error fetching balances: {e}")
+                logger.error(f"Error reconciling {platform} balance: {e}")
+                self.balance_ledger.invalidate(platform)
 
-            # Check every 5 minutes
-            await asyncio.sleep(300)
+    async def run_clob_keepalive(self):
+        """Ping the CLOB clients so the first order doesn't open a connection."""
+        health = await asyncio.to_thread(self.clob_pool.ping)
+        for wallet, healthy in health.items():
+            if not healthy:
+                logger.warning(f"⚠️ Polymarket CLOB client {wallet[:10]}... unhealthy")
 
     async def run_heartbeat(self):
         """
-        Periodically update heartbeat in polybot_status and polybot_heartbeat tables.
+        Update heartbeat in polybot_status and polybot_heartbeat tables.
         This allows the Admin UI to know the bot is alive and monitor detailed metrics.
-        Updates every 60 seconds.
+        Scheduled every 60 seconds.
         """
-        version = get_version()
-        scan_count = 0
-        errors_last_hour = 0
-
-        while self._running:
-            try:
-                # Count active strategies
-                active_strategies = []
-                if self.enable_copy_trading and self.copy_trading:
-                    active_strategies.append("copy_trading")
-                if self.enable_arb_detection and self.arb_detector:
-                    active_strategies.append("arb_detection")
-                if getattr(self, 'cross_platform_scanner', None):
-                    active_strategies.append("cross_platform_arb")
-                if getattr(self, 'single_platform_scanner', None):
-                    active_strategies.append("single_platform_arb")
-                if getattr(self, 'market_maker', None):
-                    active_strategies.append("market_making")
-                if getattr(self, 'news_arbitrage', None):
-                    active_strategies.append("news_arbitrage")
-                if getattr(self, 'funding_rate_arb', None):
-                    active_strategies.append("funding_rate_arb")
-                if getattr(self, 'grid_trading', None):
-                    active_strategies.append("grid_trading")
-                if getattr(self, 'pairs_trading', None):
-                    active_strategies.append("pairs_trading")
-                if getattr(self, 'stock_mean_reversion', None):
-                    active_strategies.append("stock_mean_reversion")
-                if getattr(self, 'stock_momentum', None):
-                    active_strategies.append("stock_momentum")
-                if getattr(self, 'whale_copy_trading', None):
-                    active_strategies.append("whale_copy_trading")
-                if getattr(self, 'congressional_tracker', None):
-                    active_strategies.append("congressional_tracker")
-                if getattr(self, 'spike_hunter', None):
-                    active_strategies.append("spike_hunter")
-
-                # Get trades in last hour from paper trader
-                trades_last_hour = 0
-                if self.paper_trader and hasattr(self.paper_trader, 'stats'):
-                    trades_last_hour = getattr(self.paper_trader.stats, 'opportunities_traded', 0)
-
-                # Get scan count from analytics
-                if self.analytics:
-                    scan_count = getattr(self.analytics, 'total_opportunities', 0)
-
-                self.db.heartbeat(
-                    version=version,
-                    scan_count=scan_count,
-                    active_strategies=active_strategies,
-                    is_dry_run=self.simulation_mode,
-                    errors_last_hour=errors_last_hour,
-                    trades_last_hour=trades_last_hour,
-                    user_id=getattr(self, 'user_id', None),
-                    metadata={
-                        "simulation_mode": self.simulation_mode,
-                        "paper_balance": getattr(self.paper_trader.stats, 'current_balance', 0) if self.paper_trader else 0,
-                    }
-                )
-                logger.debug("💓 Heartbeat sent")
-            except Exception as e:
-                logger.warning(f"Heartbeat failed: {e}")
-                errors_last_hour += 1
-            await asyncio.sleep(60)  # Update every 60 seconds
+        try:
+            # Count active strategies
+            active_strategies = []
+            if self.enable_copy_trading and self.copy_trading:
+                active_strategies.append("copy_trading")
+            if self.enable_arb_detection and self.arb_detector:
+                active_strategies.append("arb_detection")
+            if getattr(self, 'cross_platform_scanner', None):
+                active_strategies.append("cross_platform_arb")
+            if getattr(self, 'single_platform_scanner', None):
+                active_strategies.append("single_platform_arb")
+            if getattr(self, 'market_maker', None):
+                active_strategies.append("market_making")
+            if getattr(self, 'news_arbitrage', None):
+                active_strategies.append("news_arbitrage")
+            if getattr(self, 'funding_rate_arb', None):
+                active_strategies.append("funding_rate_arb")
+            if getattr(self, 'grid_trading', None):
+                active_strategies.append("grid_trading")
+            if getattr(self, 'pairs_trading', None):
+                active_strategies.append("pairs_trading")
+            if getattr(self, 'stock_mean_reversion', None):
+                active_strategies.append("stock_mean_reversion")
+            if getattr(self, 'stock_momentum', None):
+                active_strategies.append("stock_momentum")
+            if getattr(self, 'whale_copy_trading', None):
+                active_strategies.append("whale_copy_trading")
+            if getattr(self, 'congressional_tracker', None):
+                active_strategies.append("congressional_tracker")
+            if getattr(self, 'spike_hunter', None):
+                active_strategies.append("spike_hunter")
+
+            # Get trades in last hour from paper trader
+            trades_last_hour = 0
+            if self.paper_trader and hasattr(self.paper_trader, 'stats'):
+                trades_last_hour = getattr(self.paper_trader.stats, 'opportunities_traded', 0)
+
+            # Get scan count from analytics
+            scan_count = 0
+            if self.analytics:
+                scan_count = getattr(self.analytics, 'total_opportunities', 0)
+
+            self.db.heartbeat(
+                version=get_version(),
+                scan_count=scan_count,
+                active_strategies=active_strategies,
+                is_dry_run=self.simulation_mode,
+                errors_last_hour=self._heartbeat_errors,
+                trades_last_hour=trades_last_hour,
+                user_id=getattr(self, 'user_id', None),
+                metadata={
+                    "simulation_mode": self.simulation_mode,
+                    "paper_balance": getattr(self.paper_trader.stats, 'current_balance', 0) if self.paper_trader else 0,
+                    "scheduler_deadline_misses": self.scheduler.get_stats()["deadline_misses"],
+                }
+            )
+            logger.debug("💓 Heartbeat sent")
+        except Exception as e:
+            logger.warning(f"Heartbeat failed: {e}")
+            self._heartbeat_errors += 1
 
     async def run_mode_checker(self):
         """
-        Periodically check if trading mode has changed in the database.
+        Check if trading mode has changed in the database (scheduled every 30s).
         This enables hot-reloading of live/paper mode without restarting.
         """
-        while self._running:
-            try:
-                # Check every 30 seconds for mode changes
-                new_mode = self.db.get_trading_mode(force_refresh=True)
-                current_mode = 'paper' if self.simulation_mode else 'live'
+        try:
+            new_mode = self.db.get_trading_mode(force_refresh=True)
+            current_mode = 'paper' if self.simulation_mode else 'live'
+            
+            if new_mode != current_mode:
+                # Mode changed!
+                logger.warning(
+                    f"🔄 TRADING MODE CHANGE DETECTED: "
+                    f"{current_mode.upper()} → {new_mode.upper()}"
+                )
+                
+                self.simulation_mode = (new_mode == 'paper')
                 
-                if new_mode != current_mode:
-                    # Mode changed!
+                if new_mode == 'live':
                     logger.warning(
-                        f"🔄 TRADING MODE CHANGE DETECTED: "
-                        f"{current_mode.upper()} → {new_mode.upper()}"
+                        "⚠️ ⚠️ ⚠️  SWITCHING TO LIVE MODE - "
+                        "REAL MONEY AT RISK  ⚠️ ⚠️ ⚠️"
+                    )
+                    self.notifier.send_alert(
+                        "🔴 LIVE MODE ACTIVATED",
+                        "Bot has switched to LIVE trading mode. "
+                        "Real money will be used for trades.",
+                        severity="critical"
+                    )
+                else:
+                    logger.info("📊 Switched to PAPER trading mode")
+                    self.notifier.send_info(
+                        "📊 Paper Mode Activated",
+                        "Bot has switched to paper trading mode. "
+                        "No real money will be used."
                     )
                     
-                    self.simulation_mode = (new_mode == 'paper')
-                    
-                    if new_mode == 'live':
-                        logger.warning(
-                            "⚠️ ⚠️ ⚠️  SWITCHING TO LIVE MODE - "
-                            "REAL MONEY AT RISK  ⚠️ ⚠️ ⚠️"
-                        )
-                        self.notifier.send_alert(
-                            "🔴 LIVE MODE ACTIVATED",
-                            "Bot has switched to LIVE trading mode. "
-                            "Real money will be used for trades.",
-                            severity="critical"
-                        )
-                    else:
-                        logger.info("📊 Switched to PAPER trading mode")
-                        self.notifier.send_info(
-                            "📊 Paper Mode Activated",
-                            "Bot has switched to paper trading mode. "
-                            "No real money will be used."
-                        )
-                        
-            except Exception as e:
-                logger.warning(f"Mode checker error: {e}")
-            
-            await asyncio.sleep(30)  # Check every 30 seconds
+        except Exception as e:
+            logger.warning(f"Mode checker error: {e}")
 
     async def run_paper_trading_stats(self):
-        """Periodically save paper trading stats and print summary."""
-        while self._running:
-            await asyncio.sleep(60)  # Save stats every minute
-
-            if self.paper_trader:
-                try:
-                    # Save stats to database
-                    await self.paper_trader.save_stats_to_db()
-
-                    # Log summary
-                    stats = self.paper_trader.stats
-                    if stats.opportunities_seen > 0:
-                        logger.info(
-                            f"📊 REALISTIC SIM: "
-                            f"Balance: ${stats.current_balance:.2f} | "
-                            f"P&L: ${stats.total_pnl:+.2f} ({stats.roi_pct:+.1f}%) | "
-                            f"Trades: {stats.opportunities_traded} | "
-                            f"Win: {stats.win_rate:.0f}% | "
-                            f"Exec: {stats.execution_success_rate:.0f}%"
-                        )
-                except Exception as e:
-                    logger.error(f"Error saving paper trading stats: {e}")
-
-            # Save per-strategy analytics
+        """Save paper trading stats and print summary (scheduled every minute)."""
+        if self.paper_trader:
             try:
-                await self.analytics.save_to_db(self.db)
-                # Print strategy comparison every 5 minutes
-                if self.analytics.total_opportunities > 0:
-                    logger.info(self.analytics.get_comparison_summary())
+                # Save stats to database
+                await self.paper_trader.save_stats_to_db()
+
+                # Log summary
+                stats = self.paper_trader.stats
+                if stats.opportunities_seen > 0:
+                    logger.info(
+                        f"📊 REALISTIC SIM: "
+                        f"Balance: ${stats.current_balance:.2f} | "
+                        f"P&L: ${stats.total_pnl:+.2f} ({stats.roi_pct:+.1f}%) | "
+                        f"Trades: {stats.opportunities_traded} | "
+                        f"Win: {stats.win_rate:.0f}% | "
+                        f"Exec: {stats.execution_success_rate:.0f}%"
+                    )
             except Exception as e:
-                logger.error(f"Error saving analytics: {e}")
+                logger.error(f"Error saving paper trading stats: {e}")
+
+        # Save per-strategy analytics
+        try:
+            await self.analytics.save_to_db(self.db)
+            # Print strategy comparison every 5 minutes
+            if self.analytics.total_opportunities > 0:
+                logger.info(self.analytics.get_comparison_summary())
+        except Exception as e:
+            logger.error(f"Error saving analytics: {e}")
 
     async def run(self):
         """Run all enabled features concurrently."""
@@ -4307,6 +4642,13 @@ class PolybotRunner:
             max_trade_size=self.config.trading.max_trade_size,
         )
 
+        # Executors for detected opportunities (detectors only publish)
+        await self.opportunity_bus.start()
+
+        # Move CPU-heavy strategy groups off this event loop if configured
+        if self.config.trading.enable_strategy_workers:
+            await self._start_strategy_workers()
+
         # Create tasks for each enabled feature
         tasks = []
 
@@ -4364,11 +4706,11 @@ class PolybotRunner:
 
         # Run Stock Mean Reversion (70% CONFIDENCE - 15-30% APY)
         if smr and self.stock_mean_reversion:
-            tasks.append(asyncio.create_task(self.run_stock_mean_reversion()))
+            self.schedule_stock_mean_reversion()
 
         # Run Stock Momentum (70% CONFIDENCE - 20-40% APY)
         if sm and self.stock_momentum:
-            tasks.append(asyncio.create_task(self.run_stock_momentum()))
+            self.schedule_stock_momentum()
 
         # =====================================================================
         # ADVANCED STOCK STRATEGIES (ALPACA)
@@ -4379,21 +4721,21 @@ class PolybotRunner:
             self.config.trading, 'enable_sector_rotation', False
         )
         if sector_rot and getattr(self, 'sector_rotation', None):
-            tasks.append(asyncio.create_task(self.run_sector_rotation()))
+            self.schedule_sector_rotation()
 
         # Run Dividend Growth (65% CONFIDENCE - 10-20% APY)
         div_growth = getattr(
             self.config.trading, 'enable_dividend_growth', False
         )
         if div_growth and getattr(self, 'dividend_growth', None):
-            tasks.append(asyncio.create_task(self.run_dividend_growth()))
+            self.schedule_dividend_growth()
 
         # Run Earnings Momentum (70% CONFIDENCE - 20-40% APY)
         earn_mom = getattr(
             self.config.trading, 'enable_earnings_momentum', False
         )
         if earn_mom and getattr(self, 'earnings_momentum', None):
-            tasks.append(asyncio.create_task(self.run_earnings_momentum()))
+            self.schedule_earnings_momentum()
 
         # =====================================================================
         # OPTIONS STRATEGIES (IBKR)
@@ -4404,28 +4746,28 @@ class PolybotRunner:
             self.config.trading, 'enable_covered_calls', False
         )
         if cov_calls and getattr(self, 'covered_call', None):
-            tasks.append(asyncio.create_task(self.run_covered_calls()))
+            self.schedule_covered_calls()
 
         # Run Cash Secured Puts (75% CONFIDENCE - 15-25% APY)
         csp = getattr(
             self.config.trading, 'enable_cash_secured_puts', False
         )
         if csp and getattr(self, 'cash_secured_put', None):
-            tasks.append(asyncio.create_task(self.run_cash_secured_puts()))
+            self.schedule_cash_secured_puts()
 
         # Run Iron Condor (70% CONFIDENCE - 20-30% APY)
         iron_cond = getattr(
             self.config.trading, 'enable_iron_condor', False
         )
         if iron_cond and getattr(self, 'iron_condor', None):
-            tasks.append(asyncio.create_task(self.run_iron_condor()))
+            self.schedule_iron_condor()
 
         # Run Wheel Strategy (80% CONFIDENCE - 20-35% APY)
         wheel = getattr(
             self.config.trading, 'enable_wheel_strategy', False
         )
         if wheel and getattr(self, 'wheel_strategy', None):
-            tasks.append(asyncio.create_task(self.run_wheel_strategy()))
+            self.schedule_wheel_strategy()
 
         # =====================================================================
         # TWITTER-DERIVED STRATEGIES (2024)
@@ -4547,7 +4889,7 @@ class PolybotRunner:
             self.config.trading, 'enable_spike_hunter', True
         )
         if spike_enabled and self.spike_hunter and poly_enabled:
-            tasks.append(asyncio.create_task(self.run_spike_hunter()))
+            self.schedule_spike_hunter()
         elif spike_enabled and self.spike_hunter:
             logger.info("⏸️ Spike Hunter SKIPPED (Polymarket disabled)")
 
@@ -4557,24 +4899,49 @@ class PolybotRunner:
         if self.enable_news_sentiment and self.news_engine:
             tasks.append(asyncio.create_task(self.run_news_sentiment()))
 
-        # Always run balance tracker (resilient)
-        tasks.append(asyncio.create_task(
-            self._resilient_task("balance_tracker", self.run_balance_tracker)
-        ))
+        # Always track balances
+        self.scheduler.add_job(
+            "balance_tracker", self.run_balance_tracker,
+            interval_sec=300, priority=JobPriority.NORMAL, initial_delay_sec=0,
+        )
 
-        # Always run heartbeat to update polybot_status (resilient)
-        tasks.append(asyncio.create_task(
-            self._resilient_task("heartbeat", self.run_heartbeat)
-        ))
+        # Reconcile the balance ledger against venue REST balances
+        self.scheduler.add_job(
+            "balance_reconcile", self.run_balance_reconcile,
+            interval_sec=self.config.trading.balance_reconcile_interval_sec,
+            priority=JobPriority.NORMAL, apis=("kalshi", "polymarket"),
+            initial_delay_sec=self.config.trading.balance_reconcile_interval_sec,
+        )
+
+        # Keep the Polymarket order client's connection warm
+        if self.clob_pool:
+            self.scheduler.add_job(
+                "clob_keepalive", self.run_clob_keepalive,
+                interval_sec=self.config.trading.polymarket_clob_ping_interval_sec,
+                priority=JobPriority.HIGH,
+            )
+
+        # Always run heartbeat to update polybot_status
+        self.scheduler.add_job(
+            "heartbeat", self.run_heartbeat,
+            interval_sec=60, priority=JobPriority.HIGH, initial_delay_sec=0,
+        )
 
         # Always run trading mode checker (hot-reload mode changes)
-        tasks.append(asyncio.create_task(
-            self._resilient_task("mode_checker", self.run_mode_checker)
-        ))
+        self.scheduler.add_job(
+            "mode_checker", self.run_mode_checker,
+            interval_sec=30, priority=JobPriority.HIGH, initial_delay_sec=0,
+        )
 
         # Run paper trading stats saver if in simulation mode
         if self.simulation_mode and self.paper_trader:
-            tasks.append(asyncio.create_task(self.run_paper_trading_stats()))
+            self.scheduler.add_job(
+                "paper_trading_stats", self.run_paper_trading_stats,
+                interval_sec=60, priority=JobPriority.NORMAL, initial_delay_sec=60,
+            )
+
+        # All periodic jobs share one scheduler
+        tasks.append(asyncio.create_task(self.scheduler.run(), name="scheduler"))
 
         self._tasks = tasks
 
@@ -4685,13 +5052,23 @@ class PolybotRunner:
             except Exception as e:
                 logger.debug(f"Error closing scanner: {e}")
 
-        # Cancel all running tasks
+        # Stop periodic jobs and worker processes, then cancel all running tasks
+        await self.scheduler.stop()
+        if self.strategy_workers:
+            await self.strategy_workers.stop()
+        await self.opportunity_bus.stop()
         for task in self._tasks:
             task.cancel()
 
         if self._tasks:
             await asyncio.gather(*self._tasks, return_exceptions=True)
 
+        # Give late cross-platform leg fills a chance to be unwound
+        try:
+            await asyncio.wait_for(self.leg_coordinator.drain(), timeout=15)
+        except asyncio.TimeoutError:
+            logger.error("🚨 Late leg unwinds still pending at shutdown - check positions")
+
         logger.info("PolyBot shutdown complete")
 
 
@@ -4889,13 +5266,14 @@ def get_build_number():
     return 17  # Default to current deployment version
 
 
-async def start_health_server(port: int = 8080, bot_runner=None, runner_ref=None):
+async def start_health_server(port: int = 8080, bot_runner=None, runner_ref=None, manager=None):
     """Start a simple HTTP health check server for Lightsail.
 
     Args:
         port: Port to listen on
         bot_runner: Direct reference to PolybotRunner (legacy)
         runner_ref: Dict with 'instance' key that gets updated after init
+        manager: BotManager in multi-tenant mode (health = manager running)
     """
     from aiohttp import web
     import os
@@ -4916,6 +5294,11 @@ async def start_health_server(port: int = 8080, bot_runner=None, runner_ref=None
         Health check that ACTUALLY verifies the bot is running.
         Returns 503 if bot has stopped trading (even if web server is up).
         """
+        if manager is not None:
+            if manager.running:
+                return web.Response(text=f"OK ({len(manager.bots)} tenants)", status=200)
+            return web.Response(text="UNHEALTHY: Manager stopped", status=503)
+
         # Check for initialization failure
         if runner_ref and runner_ref.get('failed'):
             error = runner_ref.get('error', 'Unknown error')
@@ -5108,9 +5491,69 @@ async def start_health_server(port: int = 8080, bot_runner=None, runner_ref=None
                 "traceback": traceback.format_exc()[:500],
             }, status=500)
 
+    async def metrics_handler(request):
+        """Hot-path latency histograms in Prometheus text format."""
+        return web.Response(
+            body=get_metrics().render().encode(),
+            headers={"Content-Type": PROMETHEUS_CONTENT_TYPE},
+        )
+
+    async def stalls_handler(request):
+        """Event loop stalls and the call sites that caused them."""
+        return web.json_response(get_stall_watchdog().get_stats())
+
+    def _query_float(request, name: str, default: float) -> float:
+        try:
+            return float(request.query.get(name, default))
+        except ValueError:
+            raise web.HTTPBadRequest(text=f"{name} must be a number")
+
+    async def profile_handler(request):
+        """
+        Sample the event loop for ?seconds=N (default 10) and return
+        collapsed stacks for a flame graph. ?tenant=<user_id> keeps one
+        tenant's samples; ?threads=1 includes worker threads.
+        """
+        profiler = SamplingProfiler(interval_sec=_query_float(request, "interval_ms", 5) / 1000)
+        try:
+            result = await profiler.profile(
+                _query_float(request, "seconds", 10),
+                tenant=request.query.get("tenant"),
+                all_threads=request.query.get("threads") in ("1", "true"),
+            )
+        except ProfilerBusy as e:
+            return web.Response(text=str(e), status=409)
+        summary = result.summary()
+        logger.info(f"🔬 CPU profile taken: {summary}")
+        return web.Response(
+            text=result.collapsed(),
+            headers={
+                "X-Profile-Samples": str(summary["samples"]),
+                "X-Profile-Tenants": json.dumps(summary["tenants"]),
+            },
+        )
+
+    async def memory_handler(request):
+        """tracemalloc growth by allocation site over ?seconds=N (default 30)."""
+        try:
+            report = await memory_diff(
+                _query_float(request, "seconds", 30),
+                top=int(_query_float(request, "top", 25)),
+                group_by=request.query.get("group_by", "lineno"),
+            )
+        except ProfilerBusy as e:
+            return web.Response(text=str(e), status=409)
+        except ValueError as e:
+            return web.Response(text=str(e), status=400)
+        return web.json_response(report)
+
     app = web.Application()
     app.router.add_get('/health', health_handler)
     app.router.add_get('/status', status_handler)
+    app.router.add_get('/metrics', metrics_handler)
+    app.router.add_get('/debug/stalls', stalls_handler)
+    app.router.add_get('/debug/profile', profile_handler)
+    app.router.add_get('/debug/memory', memory_handler)
     app.router.add_get('/debug/secrets', debug_secrets_handler)
     app.router.add_get('/', health_handler)
 
@@ -5120,11 +5563,16 @@ async def start_health_server(port: int = 8080, bot_runner=None, runner_ref=None
     await site.start()
     logger.info(f"Health server started on port {port} - v{version} (Build #{build})")
 
+    # Event-loop lag is process-wide, so it is sampled here rather than per
+    # runner; the watchdog also records which call site caused each stall
+    lag_task = get_stall_watchdog().start()
+
     # Keep running until cancelled
     try:
         while True:
             await asyncio.sleep(3600)
     except asyncio.CancelledError:
+        lag_task.cancel()
         await runner.cleanup()
 
 
@@ -1,5 +1,10 @@
-# Market clients for Polymarket and Kalshi
-from .polymarket_client import PolymarketClient
-from .kalshi_client import KalshiClient
+# Market clients for Polymarket and Kalshi (imported on first use)
+from src.utils.lazy_import import lazy_exports
 
-__all__ = ['PolymarketClient', 'KalshiClient']
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'PolymarketClient': '.polymarket_client',
+    'KalshiClient': '.kalshi_client',
+    'ClobClientPool': '.clob_pool',
+})
+
+__all__ = ['PolymarketClient', 'KalshiClient', 'ClobClientPool']
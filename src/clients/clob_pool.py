@@ -0,0 +1,291 @@
+"""
+CLOB Client Pool - warm, long-lived Polymarket order clients.
+
+Placing a Polymarket order used to pay, on the trade path, for whatever
+had not happened yet: building the ClobClient, deriving API credentials,
+opening the HTTP/2 connection, and fetching the token's tick size and
+neg-risk flag before the order could be signed. The pool moves all of it
+off the critical path:
+
+- One ClobClient per wallet, created with derived credentials and
+  health-checked at startup
+- ping() (scheduled) keeps the keep-alive connection open and records
+  health and round-trip time
+- Tick size / neg-risk metadata is cached per token with a TTL
+- presign() signs orders for likely prices ahead of time; submit() posts
+  a matching presigned order instead of signing one
+
+py-clob-client signs locally and posts through its own shared HTTP/2
+connection, so a warm pool leaves just the POST on the trade path.
+
+Usage:
+    pool = ClobClientPool(polymarket_client)
+    clob_client = pool.add_wallet(private_key)
+    pool.presign(clob_client, token_id, "BUY", 0.45, 100)
+    response = pool.submit(clob_client, token_id, "BUY", 0.45, 100, "IOC")
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.metrics import observe_http
+
+logger = logging.getLogger(__name__)
+
+CLOB_HOST = "https://clob.polymarket.com"
+
+# Polymarket calls immediate-or-cancel "fill and kill"
+ORDER_TYPES = {"GTC": "GTC", "GTD": "GTD", "FOK": "FOK", "IOC": "FAK", "FAK": "FAK"}
+
+
+@dataclass
+class TokenMeta:
+    """Per-token signing parameters."""
+    tick_size: str
+    neg_risk: bool
+    fetched_at: float              # time.monotonic()
+
+
+@dataclass
+class PooledClient:
+    """One wallet's client and its health."""
+    client: Any
+    wallet: str
+    healthy: bool = False
+    last_ping: Optional[float] = None
+    ping_ms: Optional[float] = None
+    failures: int = 0
+
+
+PresignKey = Tuple[int, str, str, float, float]   # client, token, side, price, size
+
+
+class ClobClientPool:
+    """Long-lived ClobClients with cached metadata and presigned orders."""
+
+    def __init__(
+        self,
+        polymarket_client,
+        host: str = CLOB_HOST,
+        metadata_ttl_sec: float = 300.0,
+        presign_ttl_sec: float = 30.0,
+        max_presigned: int = 256,
+    ):
+        """
+        Args:
+            polymarket_client: PolymarketClient (builds the ClobClients)
+            host: CLOB API host
+            metadata_ttl_sec: How long tick size / neg-risk stay cached
+            presign_ttl_sec: Presigned orders older than this are discarded
+            max_presigned: Cap on presigned orders held at once
+        """
+        self.polymarket_client = polymarket_client
+        self.host = host
+        self.metadata_ttl_sec = metadata_ttl_sec
+        self.presign_ttl_sec = presign_ttl_sec
+        self.max_presigned = max_presigned
+
+        self._clients: Dict[str, PooledClient] = {}
+        self._metadata: Dict[str, TokenMeta] = {}
+        self._presigned: Dict[PresignKey, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self.orders = 0
+        self.presigned_hits = 0
+        self.metadata_hits = 0
+        self.metadata_misses = 0
+
+    # -------------------------------------------------------------------------
+    # Clients
+    # -------------------------------------------------------------------------
+
+    def add_wallet(
+        self,
+        private_key: str,
+        chain_id: int = 137,
+        funder: Optional[str] = None,
+    ) -> Optional[Any]:
+        """Create, authenticate and health-check a client for one wallet."""
+        client = self.polymarket_client.create_clob_client(
+            private_key=private_key, chain_id=chain_id, funder=funder,
+        )
+        if client is None:
+            return None
+
+        try:
+            wallet = client.get_address() or ""
+        except Exception:
+            wallet = ""
+        pooled = PooledClient(client=client, wallet=wallet.lower())
+        with self._lock:
+            self._clients[pooled.wallet] = pooled
+
+        if self._ping(pooled):
+            logger.info(f"✓ CLOB client warm for {wallet[:10]}... ({pooled.ping_ms:.0f}ms)")
+        else:
+            logger.warning(f"⚠️ CLOB health check failed for {wallet[:10]}... - will retry on ping")
+        return client
+
+    def client(self, wallet: Optional[str] = None) -> Optional[Any]:
+        """Client for a wallet (default: the first one added)."""
+        with self._lock:
+            if wallet is not None:
+                pooled = self._clients.get(wallet.lower())
+            else:
+                pooled = next(iter(self._clients.values()), None)
+        return pooled.client if pooled else None
+
+    def _ping(self, pooled: PooledClient) -> bool:
+        start = time.perf_counter()
+        try:
+            pooled.client.get_ok()
+            pooled.healthy = True
+            pooled.failures = 0
+        except Exception as e:
+            pooled.healthy = False
+            pooled.failures += 1
+            logger.debug(f"CLOB ping failed for {pooled.wallet[:10]}: {e}")
+        elapsed = time.perf_counter() - start
+        observe_http(self.host, "GET", elapsed)
+        pooled.last_ping = time.monotonic()
+        pooled.ping_ms = elapsed * 1000
+        return pooled.healthy
+
+    def ping(self) -> Dict[str, bool]:
+        """Ping every client (blocking - schedule on a worker thread)."""
+        with self._lock:
+            clients = list(self._clients.values())
+        health = {pooled.wallet: self._ping(pooled) for pooled in clients}
+        self._expire_presigned()
+        return health
+
+    # -------------------------------------------------------------------------
+    # Token metadata
+    # -------------------------------------------------------------------------
+
+    def token_meta(self, client: Any, token_id: str) -> TokenMeta:
+        """Tick size and neg-risk flag for a token (cached)."""
+        with self._lock:
+            meta = self._metadata.get(token_id)
+        if meta and time.monotonic() - meta.fetched_at < self.metadata_ttl_sec:
+            self.metadata_hits += 1
+            return meta
+
+        self.metadata_misses += 1
+        meta = TokenMeta(
+            tick_size=str(client.get_tick_size(token_id)),
+            neg_risk=bool(client.get_neg_risk(token_id)),
+            fetched_at=time.monotonic(),
+        )
+        with self._lock:
+            self._metadata[token_id] = meta
+        return meta
+
+    def warm_tokens(self, client: Any, token_ids) -> int:
+        """Prefetch metadata for tokens likely to be traded; returns count warmed."""
+        warmed = 0
+        for token_id in token_ids:
+            try:
+                self.token_meta(client, token_id)
+                warmed += 1
+            except Exception as e:
+                logger.debug(f"Could not warm metadata for {token_id[:20]}: {e}")
+        return warmed
+
+    # -------------------------------------------------------------------------
+    # Signing and submission
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _key(client: Any, token_id: str, side: str, price: float, size: float) -> PresignKey:
+        return (id(client), token_id, side.upper(), round(price, 6), round(size, 6))
+
+    def _sign(self, client: Any, token_id: str, side: str, price: float, size: float) -> Any:
+        from py_clob_client.clob_types import OrderArgs, PartialCreateOrderOptions
+
+        meta = self.token_meta(client, token_id)
+        return client.create_order(
+            OrderArgs(token_id=token_id, price=price, size=size, side=side.upper()),
+            PartialCreateOrderOptions(tick_size=meta.tick_size, neg_risk=meta.neg_risk),
+        )
+
+    def presign(self, client: Any, token_id: str, side: str, price: float, size: float) -> bool:
+        """Sign an order now so a matching submit() only has to post it."""
+        key = self._key(client, token_id, side, price, size)
+        with self._lock:
+            if key in self._presigned:
+                return True
+        try:
+            order = self._sign(client, token_id, side, price, size)
+        except Exception as e:
+            logger.debug(f"Presign failed for {token_id[:20]} @ {price}: {e}")
+            return False
+        with self._lock:
+            if len(self._presigned) >= self.max_presigned:
+                oldest = min(self._presigned, key=lambda k: self._presigned[k][1])
+                del self._presigned[oldest]
+            self._presigned[key] = (order, time.monotonic())
+        return True
+
+    def _take_presigned(self, key: PresignKey) -> Optional[Any]:
+        with self._lock:
+            entry = self._presigned.pop(key, None)
+        if entry is None or time.monotonic() - entry[1] > self.presign_ttl_sec:
+            return None
+        return entry[0]
+
+    def _expire_presigned(self) -> None:
+        cutoff = time.monotonic() - self.presign_ttl_sec
+        with self._lock:
+            for key in [k for k, (_, signed_at) in self._presigned.items() if signed_at < cutoff]:
+                del self._presigned[key]
+
+    def submit(
+        self,
+        client: Any,
+        token_id: str,
+        side: str,
+        price: float,
+        size: float,
+        order_type: str = "GTC",
+    ) -> Dict[str, Any]:
+        """Post an order (presigned if available); returns the raw CLOB response."""
+        from py_clob_client.clob_types import OrderType
+
+        order = self._take_presigned(self._key(client, token_id, side, price, size))
+        if order is not None:
+            self.presigned_hits += 1
+        else:
+            order = self._sign(client, token_id, side, price, size)
+
+        self.orders += 1
+        tif = getattr(OrderType, ORDER_TYPES.get(order_type.upper(), "GTC"))
+        start = time.perf_counter()
+        try:
+            return client.post_order(order, tif)
+        finally:
+            observe_http(self.host, "POST", time.perf_counter() - start)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            clients = {
+                pooled.wallet[:10]: {
+                    "healthy": pooled.healthy,
+                    "ping_ms": None if pooled.ping_ms is None else round(pooled.ping_ms, 1),
+                    "failures": pooled.failures,
+                }
+                for pooled in self._clients.values()
+            }
+            return {
+                "clients": clients,
+                "cached_tokens": len(self._metadata),
+                "presigned": len(self._presigned),
+                "orders": self.orders,
+                "presigned_hits": self.presigned_hits,
+                "metadata_hits": self.metadata_hits,
+                "metadata_misses": self.metadata_misses,
+            }
@@ -17,6 +17,8 @@ from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass, field
 import requests
 
+from src.utils.metrics import REQUESTS_HOOKS
+
 # Import rate limiter
 try:
     from src.utils.rate_limiter import get_rate_limiter, RateLimiter
@@ -313,6 +315,7 @@ class KalshiClient:
                 params=params,
                 headers={"accept": "application/json"},
                 timeout=10,
+                hooks=REQUESTS_HOOKS,
             )
 
             # Handle rate limit response
@@ -534,6 +537,7 @@ class KalshiClient:
                 f"{self.api_url}/portfolio/balance",
                 headers=headers,
                 timeout=10,
+                hooks=REQUESTS_HOOKS,
             )
 
             self._handle_rate_limit_response(balance_response.status_code)
@@ -561,6 +565,7 @@ class KalshiClient:
                 f"{self.api_url}/portfolio/positions",
                 headers=headers,
                 timeout=10,
+                hooks=REQUESTS_HOOKS,
             )
 
             self._handle_rate_limit_response(positions_response.status_code)
@@ -723,6 +728,7 @@ class KalshiClient:
                 headers=headers,
                 json=order_payload,
                 timeout=15,
+                hooks=REQUESTS_HOOKS,
             )
 
             # Handle rate limiting
@@ -818,6 +824,7 @@ class KalshiClient:
                 f"{self.api_url}/portfolio/orders/{order_id}",
                 headers=headers,
                 timeout=10,
+                hooks=REQUESTS_HOOKS,
             )
 
             self._handle_rate_limit_response(response.status_code)
@@ -849,6 +856,7 @@ class KalshiClient:
                 headers=headers,
                 params={"status": "resting"},
                 timeout=10,
+                hooks=REQUESTS_HOOKS,
             )
 
             self._handle_rate_limit_response(response.status_code)
@@ -876,6 +884,7 @@ class KalshiClient:
                 f"{self.api_url}/portfolio/orders/{order_id}",
                 headers=headers,
                 timeout=10,
+                hooks=REQUESTS_HOOKS,
             )
 
             self._handle_rate_limit_response(response.status_code)
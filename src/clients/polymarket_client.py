@@ -12,18 +12,16 @@ import time
 import threading
 from typing import Dict, List, Optional, Callable, Any
 from dataclasses import dataclass, field
+import importlib.util
 import websocket
 import requests
 
-# Import py-clob-client for live trading
-try:
-    from py_clob_client.client import ClobClient
-    from py_clob_client.clob_types import OrderArgs, ApiCreds
-    from py_clob_client.constants import POLYGON
-    CLOB_CLIENT_AVAILABLE = True
-except ImportError:
-    CLOB_CLIENT_AVAILABLE = False
-    ClobClient = None
+from src.utils.metrics import REQUESTS_HOOKS
+
+# py-clob-client (live trading) pulls in eth-account and friends, which
+# take over a second to import - only check it is installed here and
+# import it when a ClobClient is actually created
+CLOB_CLIENT_AVAILABLE = importlib.util.find_spec("py_clob_client") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +93,9 @@ class PolymarketClient:
         # Subscribed token IDs
         self._subscribed_tokens: List[str] = []
 
+        # Warm order clients (src.clients.clob_pool); set for live trading
+        self.clob_pool = None
+
     @property
     def is_authenticated(self) -> bool:
         """Check if API credentials are configured."""
@@ -141,6 +142,7 @@ class PolymarketClient:
                 f"{self.gamma_url}/events",
                 params=params,
                 timeout=10,
+                hooks=REQUESTS_HOOKS,
             )
             events_response.raise_for_status()
             events = events_response.json()
@@ -208,9 +210,19 @@ class PolymarketClient:
             logger.error(f"Failed to discover markets: {e}")
             return []
 
-    def subscribe(self, token_ids: List[str]):
-        """Subscribe to order book updates for given token IDs."""
-        self._subscribed_tokens = token_ids
+    def subscribe(self, token_ids: List[str], replace: bool = True):
+        """
+        Subscribe to order book updates for given token IDs.
+
+        With replace=False the tokens are added to the existing
+        subscriptions, so several strategies can share one stream.
+        """
+        if replace:
+            self._subscribed_tokens = list(token_ids)
+        else:
+            self._subscribed_tokens = list(dict.fromkeys(
+                list(self._subscribed_tokens) + list(token_ids)
+            ))
 
         # Initialize order books
         with self._order_books_lock:
@@ -420,6 +432,7 @@ class PolymarketClient:
                 f"https://data-api.polymarket.com/positions",
                 params={"user": wallet_address.lower()},
                 timeout=10,
+                hooks=REQUESTS_HOOKS,
             )
             response.raise_for_status()
             positions = response.json()
@@ -496,12 +509,17 @@ class PolymarketClient:
             return None
 
         try:
+            from py_clob_client.client import ClobClient
+            from py_clob_client.clob_types import ApiCreds
+
             # Create credentials
-            creds = ApiCreds(
-                api_key=self.api_key,
-                api_secret=self.api_secret,
-                api_passphrase="",  # Polymarket doesn't use passphrase
-            )
+            creds = None
+            if self.api_key and self.api_secret:
+                creds = ApiCreds(
+                    api_key=self.api_key,
+                    api_secret=self.api_secret,
+                    api_passphrase="",  # Polymarket doesn't use passphrase
+                )
 
             # Create client
             client = ClobClient(
@@ -512,6 +530,10 @@ class PolymarketClient:
                 funder=funder,
             )
 
+            # Derive L2 credentials from the key now rather than on first order
+            if creds is None:
+                client.set_api_creds(client.create_or_derive_api_creds())
+
             logger.info("✓ Polymarket ClobClient created for live trading")
             return client
 
@@ -581,8 +603,13 @@ class PolymarketClient:
             elif order_type == "IOC":
                 options = {"time_in_force": "IOC"}
 
-            # Submit order
-            result = clob_client.create_and_post_order(order_args, options)
+            # Submit order (the warm pool uses cached metadata/presigned orders)
+            if self.clob_pool is not None:
+                result = self.clob_pool.submit(
+                    clob_client, token_id, side, price, size, order_type
+                )
+            else:
+                result = clob_client.create_and_post_order(order_args, options)
 
             # Parse response
             if result and result.get("success"):
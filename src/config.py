@@ -58,6 +58,32 @@ class TradingConfig:
     # Rare but real - ~$95K in opportunities found historically
     enable_cross_platform_arb: bool = True
 
+    # Cross-platform legs are submitted together; a leg not acknowledged
+    # within the deadline counts as unfilled and any late fill is unwound
+    cross_platform_leg_time_in_force: str = "IOC"  # IOC, FOK or GTC
+    cross_platform_leg_deadline_sec: float = 5.0
+    cross_platform_unwind_slippage: float = 0.05  # Price concession to exit a leg
+
+    # Pre-trade balance checks read the in-memory ledger; REST balances
+    # reconcile it in the background and a stale ledger falls back to REST
+    balance_reconcile_interval_sec: float = 60.0
+    balance_ledger_max_age_sec: float = 300.0
+
+    # Keep the Polymarket order client's connection warm between trades
+    polymarket_clob_ping_interval_sec: float = 20.0
+
+    # Detected opportunities are queued (priority = edge per second of
+    # execution latency) and run by a fixed pool of executors
+    opportunity_bus_workers: int = 4
+    opportunity_bus_max_size: int = 256
+    opportunity_dedup_window_sec: float = 30.0
+    opportunity_ttl_sec: float = 15.0
+
+    # Run CPU-heavy scanners (title matching, market analysis) in worker
+    # processes; opportunities are still executed by the main process
+    enable_strategy_workers: bool = False
+    strategy_worker_groups: str = "cross_platform_scanner,single_platform_scanner"
+
     # =========================================================================
     # MARKET EXPIRATION FILTER (CRITICAL - prevents year-long bets!)
     # Only trade markets that resolve within this many days
@@ -336,6 +362,7 @@ class TradingConfig:
     whale_copy_delay_seconds: int = 30          # Delay before copying
     whale_copy_max_size_usd: float = 50.0       # Max copy size
     whale_copy_max_concurrent: int = 5          # Max concurrent copies
+    whale_activity_concurrency: int = 16        # Whale activity requests in flight
 
     # Macro Board Strategy (65% CONFIDENCE - $62K/month potential)
     # Heavy weighted exposure to macro events
@@ -362,6 +389,7 @@ class TradingConfig:
     congress_max_position_usd: float = 500.0    # Max position size
     congress_copy_delay_hours: int = 24         # Delay after disclosure
     congress_data_source: str = "house_watcher"  # Data source
+    congress_cache_path: str = ".cache/congressional_disclosures.json"  # "" = memory only
 
     # Political Event Strategy (80% CONFIDENCE - 30-60% APY)
     # Trade high-conviction political events (elections, legislation, etc.)
@@ -646,6 +674,44 @@ class Config:
                 "ENABLE_CROSS_PLATFORM_ARB",
                 True
             ),
+            cross_platform_leg_time_in_force=self._get_str(
+                "cross_platform_leg_time_in_force", "CROSS_PLATFORM_LEG_TIME_IN_FORCE", "IOC"
+            ),
+            cross_platform_leg_deadline_sec=self._get_float(
+                "cross_platform_leg_deadline_sec", "CROSS_PLATFORM_LEG_DEADLINE_SEC", 5.0
+            ),
+            cross_platform_unwind_slippage=self._get_float(
+                "cross_platform_unwind_slippage", "CROSS_PLATFORM_UNWIND_SLIPPAGE", 0.05
+            ),
+            balance_reconcile_interval_sec=self._get_float(
+                "balance_reconcile_interval_sec", "BALANCE_RECONCILE_INTERVAL_SEC", 60.0
+            ),
+            balance_ledger_max_age_sec=self._get_float(
+                "balance_ledger_max_age_sec", "BALANCE_LEDGER_MAX_AGE_SEC", 300.0
+            ),
+            polymarket_clob_ping_interval_sec=self._get_float(
+                "polymarket_clob_ping_interval_sec", "POLYMARKET_CLOB_PING_INTERVAL_SEC", 20.0
+            ),
+            opportunity_bus_workers=self._get_int(
+                "opportunity_bus_workers", "OPPORTUNITY_BUS_WORKERS", 4
+            ),
+            opportunity_bus_max_size=self._get_int(
+                "opportunity_bus_max_size", "OPPORTUNITY_BUS_MAX_SIZE", 256
+            ),
+            opportunity_dedup_window_sec=self._get_float(
+                "opportunity_dedup_window_sec", "OPPORTUNITY_DEDUP_WINDOW_SEC", 30.0
+            ),
+            opportunity_ttl_sec=self._get_float(
+                "opportunity_ttl_sec", "OPPORTUNITY_TTL_SEC", 15.0
+            ),
+            enable_strategy_workers=self._get_bool(
+                "enable_strategy_workers", "ENABLE_STRATEGY_WORKERS", False
+            ),
+            strategy_worker_groups=self._get_str(
+                "strategy_worker_groups",
+                "STRATEGY_WORKER_GROUPS",
+                "cross_platform_scanner,single_platform_scanner",
+            ),
             # ============================================================
             # PER-STRATEGY SETTINGS (TUNED 2024-12-26 based on simulation)
             # ============================================================
@@ -1129,6 +1195,9 @@ class Config:
             whale_copy_max_concurrent=self._get_int(
                 "whale_copy_max_concurrent", "WHALE_COPY_MAX_CONCURRENT", 5
             ),
+            whale_activity_concurrency=self._get_int(
+                "whale_activity_concurrency", "WHALE_ACTIVITY_CONCURRENCY", 16
+            ),
             enable_macro_board=self._get_bool(
                 "enable_macro_board", "ENABLE_MACRO_BOARD", False
             ),
@@ -1181,6 +1250,10 @@ class Config:
             congress_data_source=self._get_str(
                 "congress_data_source", "CONGRESS_DATA_SOURCE", "house_watcher"
             ),
+            congress_cache_path=self._get_str(
+                "congress_cache_path", "CONGRESS_CACHE_PATH",
+                ".cache/congressional_disclosures.json"
+            ),
             # Political Event Strategy config
             enable_political_event_strategy=self._get_bool(
                 "enable_political_event_strategy", "ENABLE_POLITICAL_EVENT", False
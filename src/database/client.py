@@ -3,18 +3,98 @@ Supabase database client for PolyBot.
 Handles persistence of opportunities, trades, and bot state.
 """
 
+import asyncio
 import logging
 import os
 import json
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 
 from supabase import create_client
+from src.utils.metrics import db_write_latency
 from src.utils.vault import Vault
 
 logger = logging.getLogger(__name__)
 
 
+_WRITE_OPS = frozenset({"insert", "update", "upsert", "delete"})
+
+# Tables scoped per user: writes get the context's user_id
+MULTI_TENANT_TABLES = frozenset({
+    'polybot_simulated_trades',
+    'polybot_opportunities',
+    'polybot_positions',
+    'polybot_manual_trades',
+    'polybot_disabled_markets',
+    'polybot_simulation_stats',
+    'polybot_tracked_traders',
+    'polybot_copy_signals',
+    'polybot_market_alerts',
+    'polybot_overlap_opportunities',
+})
+
+
+class _TimedQuery:
+    """Query builder proxy that times execute() for db_write_latency."""
+
+    def __init__(self, query, table: str, op: str):
+        self._query = query
+        self._table = table
+        self._op = op
+
+    def execute(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self._query.execute(*args, **kwargs)
+        finally:
+            db_write_latency.labels(table=self._table, op=self._op).observe(
+                time.perf_counter() - start
+            )
+
+    def __getattr__(self, name):
+        attr = getattr(self._query, name)
+        if not callable(attr):
+            return attr
+
+        def chained(*args, **kwargs):
+            # Filters (.eq, .in_, ...) return builders - keep timing them
+            result = attr(*args, **kwargs)
+            return _TimedQuery(result, self._table, self._op) if hasattr(result, "execute") else result
+
+        return chained
+
+
+class _TimedTable:
+    """Table request builder proxy: writes are timed, reads pass through."""
+
+    def __init__(self, builder, table: str):
+        self._builder = builder
+        self._table = table
+
+    def __getattr__(self, name):
+        attr = getattr(self._builder, name)
+        if name not in _WRITE_OPS:
+            return attr
+        return lambda *args, **kwargs: _TimedQuery(attr(*args, **kwargs), self._table, name)
+
+
+class _TimedSupabase:
+    """Supabase client proxy recording per-table write latency."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def table(self, name: str):
+        return _TimedTable(self._client.table(name), name)
+
+    def from_(self, name: str):
+        return _TimedTable(self._client.from_(name), name)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
 # AWS Secrets Manager integration
 _aws_secrets_cache: Dict[str, str] = {}
 _aws_secrets_loaded = False
@@ -116,7 +196,7 @@ class Database:
             return
 
         try:
-            self._client = create_client(self.url, self.key)
+            self._client = _TimedSupabase(create_client(self.url, self.key))
             logger.info("✓ Supabase client initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {e}")
@@ -1206,19 +1286,6 @@ class Database:
 
         try:
             # Multi-tenant tables should include user_id
-            MULTI_TENANT_TABLES = {
-                'polybot_simulated_trades',
-                'polybot_opportunities',
-                'polybot_positions',
-                'polybot_manual_trades',
-                'polybot_disabled_markets',
-                'polybot_simulation_stats',
-                'polybot_tracked_traders',
-                'polybot_copy_signals',
-                'polybot_market_alerts',
-                'polybot_overlap_opportunities',
-            }
-
             insert_data = data.copy()
             if self.user_id and table in MULTI_TENANT_TABLES and 'user_id' not in insert_data:
                 insert_data['user_id'] = self.user_id
@@ -1293,6 +1360,102 @@ class Database:
             logger.error(f"Failed to upsert into {table}: {e}")
             return None
 
+    # ==================== Bulk Writes ====================
+    # One request per chunk instead of per row; the blocking supabase calls
+    # run on a worker thread so callers on the event loop don't stall
+
+    def _tenant_rows(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if not self.user_id or table not in MULTI_TENANT_TABLES:
+            return list(rows)
+        return [row if 'user_id' in row else {**row, 'user_id': self.user_id} for row in rows]
+
+    async def _write_chunks(
+        self,
+        op: str,
+        table: str,
+        rows: List[Dict[str, Any]],
+        chunk_size: int,
+        retries: int,
+        **options: Any,
+    ) -> int:
+        written = 0
+        for start in range(0, len(rows), max(1, chunk_size)):
+            chunk = rows[start:start + max(1, chunk_size)]
+            for attempt in range(retries + 1):
+                try:
+                    builder = getattr(self._client.table(table), op)(chunk, **options)
+                    await asyncio.to_thread(builder.execute)
+                    written += len(chunk)
+                    break
+                except Exception as e:
+                    if attempt == retries:
+                        logger.error(
+                            f"Failed to {op} {len(chunk)} rows into {table} "
+                            f"after {retries + 1} attempts: {e}"
+                        )
+                    else:
+                        logger.debug(f"Bulk {op} into {table} failed (attempt {attempt + 1}): {e}")
+                        await asyncio.sleep(0.5 * 2 ** attempt)
+        return written
+
+    async def insert_many(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        chunk_size: int = 500,
+        retries: int = 2,
+    ) -> int:
+        """
+        Insert rows in chunks of chunk_size (one request per chunk).
+
+        Args:
+            table: Table name
+            rows: Rows to insert (same columns in every row)
+            chunk_size: Rows per request
+            retries: Extra attempts per chunk, with exponential backoff
+
+        Returns:
+            Number of rows written (failed chunks are logged and skipped)
+        """
+        if not self._client or not rows:
+            return 0
+        return await self._write_chunks(
+            "insert", table, self._tenant_rows(table, rows), chunk_size, retries
+        )
+
+    async def upsert_many(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+        on_conflict: Optional[str] = None,
+        chunk_size: int = 500,
+        retries: int = 2,
+    ) -> int:
+        """
+        Upsert rows in chunks of chunk_size (one request per chunk).
+
+        Args:
+            table: Table name
+            rows: Rows to upsert (same columns in every row)
+            on_conflict: Comma-separated conflict columns (default: primary key)
+            chunk_size: Rows per request
+            retries: Extra attempts per chunk, with exponential backoff
+
+        Returns:
+            Number of rows written (failed chunks are logged and skipped)
+        """
+        if not self._client or not rows:
+            return 0
+
+        rows = self._tenant_rows(table, rows)
+        if on_conflict:
+            # Postgres rejects a statement that updates the same row twice:
+            # keep the last row per conflict key
+            keys = [k.strip() for k in on_conflict.split(",")]
+            rows = list({tuple(row.get(k) for k in keys): row for row in rows}.values())
+        options = {"on_conflict": on_conflict} if on_conflict else {}
+        return await self._write_chunks("upsert", table, rows, chunk_size, retries, **options)
+
     async def select(
         self,
         table: str,
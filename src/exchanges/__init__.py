@@ -1,19 +1,37 @@
 """
 Exchange integration layer for PolyBot.
 Provides unified access to crypto and stock exchanges.
+
+Clients are exported lazily so importing one (or just the base types)
+does not load ccxt, alpaca, IBKR and webull SDKs together.
 """
 
-from .ccxt_client import CCXTClient
-from .alpaca_client import AlpacaClient
-from .ibkr_client import IBKRClient
-from .ibkr_web_client import IBKRWebClient
-from .base import BaseExchange
+from src.utils.lazy_import import lazy_exports
+
+_EXPORTS = {
+    'CCXTClient': '.ccxt_client',
+    'AlpacaClient': '.alpaca_client',
+    'IBKRClient': '.ibkr_client',
+    'IBKRWebClient': '.ibkr_web_client',
+    'BaseExchange': '.base',
+    'MarketSnapshot': '.base',
+    'QuoteBoard': '.market_data',
+    'BestQuote': '.market_data',
+}
+
+_lazy_getattr, __dir__ = lazy_exports(__name__, {**_EXPORTS, 'WebullClient': '.webull_client'})
+
+
+def __getattr__(name):
+    # Optional import - webull requires additional dependencies
+    if name == 'WebullClient':
+        try:
+            return _lazy_getattr(name)
+        except ImportError:
+            globals()['WebullClient'] = None  # webull not installed
+            return None
+    return _lazy_getattr(name)
 
-# Optional imports - these require additional dependencies
-try:
-    from .webull_client import WebullClient
-except ImportError:
-    WebullClient = None  # webull not installed
 
 __all__ = [
     'CCXTClient',
@@ -21,5 +39,8 @@ __all__ = [
     'IBKRClient',
     'IBKRWebClient',
     'BaseExchange',
+    'MarketSnapshot',
+    'QuoteBoard',
+    'BestQuote',
     'WebullClient'
 ]
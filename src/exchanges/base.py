@@ -2,12 +2,17 @@
 Base exchange class defining the interface for all exchange integrations.
 """
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional, Dict, List, Any
+from dataclasses import dataclass, field
+from typing import Optional, Dict, AsyncIterator, Iterable, List, Any, Tuple
 from datetime import datetime
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class OrderSide(Enum):
     BUY = "buy"
@@ -85,9 +90,29 @@ class FundingRate:
     annualized_rate: float  # Computed: rate * intervals_per_year
 
 
+@dataclass
+class MarketSnapshot:
+    """Tickers for many symbols captured in one fetch (per strategy cycle)."""
+    tickers: Dict[str, Ticker]
+    fetched_at: float = field(default_factory=time.monotonic)  # time.monotonic()
+
+    def get(self, symbol: str) -> Optional[Ticker]:
+        return self.tickers.get(symbol)
+
+    @property
+    def age_sec(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+    def covers(self, symbols: Iterable[str]) -> bool:
+        return all(s in self.tickers for s in symbols)
+
+
 class BaseExchange(ABC):
     """Abstract base class for exchange integrations."""
 
+    # Polling cadence for stream_tickers() on venues without a push feed
+    poll_interval_sec: float = 1.0
+
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None,
                  sandbox: bool = False):
         self.api_key = api_key
@@ -124,6 +149,40 @@ class BaseExchange(ABC):
         """Get order book for a symbol."""
         pass
 
+    # =========================================================================
+    # Streaming Market Data
+    # =========================================================================
+
+    async def stream_tickers(self, symbols: List[str]) -> AsyncIterator[Ticker]:
+        """
+        Yield ticker updates for symbols as their bid/ask/last change.
+
+        The default implementation polls every poll_interval_sec; exchanges
+        with a WebSocket feed override this to push updates as they arrive.
+        """
+        last_seen: Dict[str, Tuple[float, float, float]] = {}
+        while True:
+            try:
+                tickers = await self._poll_tickers(symbols)
+            except Exception as e:
+                logger.debug(f"Ticker poll failed: {e}")
+                tickers = {}
+
+            for symbol in symbols:
+                ticker = tickers.get(symbol)
+                if ticker is None:
+                    continue
+                key = (ticker.bid, ticker.ask, ticker.last)
+                if last_seen.get(symbol) != key:
+                    last_seen[symbol] = key
+                    yield ticker
+
+            await asyncio.sleep(self.poll_interval_sec)
+
+    async def _poll_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        """One polling round for stream_tickers()."""
+        return await self.get_tickers(symbols)
+
     @abstractmethod
     async def get_ohlcv(self, symbol: str, timeframe: str = '1h',
                         limit: int = 100) -> List[List[float]]:
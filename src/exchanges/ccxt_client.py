@@ -26,7 +26,7 @@ Usage:
 
 import asyncio
 import logging
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, AsyncIterator, Iterable, List, Any, Set
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -37,10 +37,19 @@ except ImportError:
     CCXT_AVAILABLE = False
     ccxt = None
 
+# WebSocket market data (bundled with ccxt >= 4)
+try:
+    import ccxt.pro as ccxtpro
+    CCXT_PRO_AVAILABLE = True
+except ImportError:
+    CCXT_PRO_AVAILABLE = False
+    ccxtpro = None
+
 from .base import (
     BaseExchange, Ticker, Balance, Order, Position, FundingRate,
-    OrderSide, OrderType, PositionSide
+    MarketSnapshot, OrderSide, OrderType, PositionSide
 )
+from src.utils.metrics import aiohttp_trace_config
 
 
 logger = logging.getLogger(__name__)
@@ -128,6 +137,16 @@ class CCXTClient(BaseExchange):
         self.exchange: Optional[ccxt.Exchange] = None
         self._session = None  # aiohttp session for IPv4 connections
 
+        # Per-cycle market snapshot shared by strategies on this client
+        self.snapshot_max_age_sec = 2.0
+        self.snapshot_concurrency = 8  # Parallel fetch_ticker calls without fetchTickers
+        self._snapshot: Optional[MarketSnapshot] = None
+        self._snapshot_symbols: Set[str] = set()
+        self._snapshot_lock = asyncio.Lock()
+
+        # WebSocket exchange instance (ccxt.pro), created on first stream
+        self._ws_exchange = None
+
     @classmethod
     async def create_for_user(
         cls,
@@ -223,7 +242,9 @@ class CCXTClient(BaseExchange):
 
             # Configure exchange with IPv4-only session
             # This fixes Binance US error -71012 "IPv6 not supported"
-            session = aiohttp.ClientSession(connector=ipv4_connector)
+            session = aiohttp.ClientSession(
+                connector=ipv4_connector, trace_configs=[aiohttp_trace_config()]
+            )
 
             config = {
                 'enableRateLimit': True,  # Built-in rate limiting
@@ -266,6 +287,12 @@ class CCXTClient(BaseExchange):
 
     async def close(self) -> None:
         """Close exchange connection."""
+        if self._ws_exchange:
+            try:
+                await self._ws_exchange.close()
+            except Exception:
+                pass
+            self._ws_exchange = None
         if self.exchange:
             await self.exchange.close()
         if hasattr(self, '_session') and self._session:
@@ -276,20 +303,24 @@ class CCXTClient(BaseExchange):
     # Market Data Methods
     # =========================================================================
 
+    @staticmethod
+    def _to_ticker(symbol: str, t: Dict[str, Any]) -> Ticker:
+        return Ticker(
+            symbol=symbol,
+            bid=t.get('bid', 0),
+            ask=t.get('ask', 0),
+            last=t.get('last', 0),
+            volume_24h=t.get('quoteVolume', 0),
+            timestamp=datetime.fromtimestamp(t['timestamp'] / 1000) if t.get('timestamp') else datetime.now()
+        )
+
     async def get_ticker(self, symbol: str) -> Ticker:
         """Get current ticker for a symbol."""
         if not self._initialized:
             raise RuntimeError("Exchange not initialized")
 
         ticker = await self.exchange.fetch_ticker(symbol)
-        return Ticker(
-            symbol=symbol,
-            bid=ticker.get('bid', 0),
-            ask=ticker.get('ask', 0),
-            last=ticker.get('last', 0),
-            volume_24h=ticker.get('quoteVolume', 0),
-            timestamp=datetime.fromtimestamp(ticker['timestamp'] / 1000) if ticker.get('timestamp') else datetime.now()
-        )
+        return self._to_ticker(symbol, ticker)
 
     async def get_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Ticker]:
         """Get tickers for multiple symbols."""
@@ -298,17 +329,188 @@ class CCXTClient(BaseExchange):
 
         tickers = await self.exchange.fetch_tickers(symbols)
         return {
-            symbol: Ticker(
-                symbol=symbol,
-                bid=t.get('bid', 0),
-                ask=t.get('ask', 0),
-                last=t.get('last', 0),
-                volume_24h=t.get('quoteVolume', 0),
-                timestamp=datetime.fromtimestamp(t['timestamp'] / 1000) if t.get('timestamp') else datetime.now()
-            )
+            symbol: self._to_ticker(symbol, t)
             for symbol, t in tickers.items()
         }
 
+    # =========================================================================
+    # Market Snapshot (one round trip per cycle)
+    # =========================================================================
+
+    def watch_symbols(self, symbols: Iterable[str]) -> None:
+        """Register symbols to include in every market snapshot."""
+        self._snapshot_symbols.update(symbols)
+
+    async def get_snapshot(
+        self,
+        symbols: Optional[Iterable[str]] = None,
+        max_age_sec: Optional[float] = None,
+    ) -> MarketSnapshot:
+        """
+        Get tickers for all watched symbols (plus symbols) as one snapshot.
+
+        Strategies sharing this client read from the same snapshot; a new
+        one is fetched only when the current one is older than
+        max_age_sec or is missing a requested symbol. Fetching uses a
+        single fetch_tickers call, or bounded-parallel fetch_ticker calls
+        on exchanges without a bulk endpoint.
+        """
+        if not self._initialized:
+            raise RuntimeError("Exchange not initialized")
+
+        wanted = set(symbols or ())
+        self._snapshot_symbols.update(wanted)
+        max_age = self.snapshot_max_age_sec if max_age_sec is None else max_age_sec
+
+        def fresh() -> bool:
+            snap = self._snapshot
+            return (
+                snap is not None
+                and snap.age_sec <= max_age
+                and snap.covers(wanted)
+            )
+
+        if fresh():
+            return self._snapshot
+
+        # Single flight: concurrent callers wait for one fetch
+        async with self._snapshot_lock:
+            if fresh():
+                return self._snapshot
+
+            all_symbols = [s for s in self._snapshot_symbols if self.has_symbol(s)]
+            tickers = await self._fetch_snapshot_tickers(all_symbols)
+            self._snapshot = MarketSnapshot(tickers=tickers)
+            return self._snapshot
+
+    async def _fetch_snapshot_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        if not symbols:
+            return {}
+
+        tickers: Dict[str, Ticker] = {}
+        if self.exchange.has.get('fetchTickers'):
+            try:
+                tickers = await self.get_tickers(symbols)
+            except Exception as e:
+                logger.debug(f"fetch_tickers failed on {self.exchange_id}, fetching individually: {e}")
+
+        missing = [s for s in symbols if s not in tickers]
+        if missing:
+            semaphore = asyncio.Semaphore(self.snapshot_concurrency)
+
+            async def fetch_one(symbol: str) -> Optional[Ticker]:
+                async with semaphore:
+                    try:
+                        return await self.get_ticker(symbol)
+                    except Exception as e:
+                        logger.debug(f"Snapshot fetch failed for {symbol}: {e}")
+                        return None
+
+            for symbol, ticker in zip(missing, await asyncio.gather(*(fetch_one(s) for s in missing))):
+                if ticker is not None:
+                    tickers[symbol] = ticker
+
+        return {s: tickers[s] for s in symbols if s in tickers}
+
+    # =========================================================================
+    # Streaming Market Data
+    # =========================================================================
+
+    def _get_ws_exchange(self):
+        """ccxt.pro instance for this venue, or None if it has no ticker feed."""
+        if self._ws_exchange is not None:
+            return self._ws_exchange
+        if not CCXT_PRO_AVAILABLE or not hasattr(ccxtpro, self.exchange_id):
+            return None
+
+        config = {
+            'enableRateLimit': True,
+            'options': {
+                'defaultType': (self.exchange.options or {}).get('defaultType', 'spot')
+                if self.exchange else 'spot',
+            },
+        }
+        if self.api_key:
+            config['apiKey'] = self.api_key
+        if self.api_secret:
+            config['secret'] = self.api_secret
+        if self.password:
+            config['password'] = self.password
+
+        ws_exchange = getattr(ccxtpro, self.exchange_id)(config)
+        if not (ws_exchange.has.get('watchTickers') or ws_exchange.has.get('watchTicker')):
+            return None
+        if self.sandbox:
+            ws_exchange.set_sandbox_mode(True)
+        self._ws_exchange = ws_exchange
+        return ws_exchange
+
+    async def stream_tickers(self, symbols: List[str]) -> AsyncIterator[Ticker]:
+        """
+        Yield ticker updates from the venue's WebSocket feed.
+
+        Falls back to polling (bulk fetch_tickers or bounded-parallel
+        fetch_ticker) when the venue has no ticker feed or the feed fails.
+        """
+        if not self._initialized:
+            raise RuntimeError("Exchange not initialized")
+
+        symbols = [s for s in symbols if self.has_symbol(s)]
+        ws_exchange = None
+        try:
+            ws_exchange = self._get_ws_exchange()
+        except Exception as e:
+            logger.debug(f"No WebSocket feed for {self.exchange_id}: {e}")
+
+        if ws_exchange is not None and symbols:
+            try:
+                async for ticker in self._watch_tickers(ws_exchange, symbols):
+                    yield ticker
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"{self.exchange_id} ticker stream failed ({e}) - "
+                    f"falling back to polling every {self.poll_interval_sec}s"
+                )
+
+        async for ticker in super().stream_tickers(symbols):
+            yield ticker
+
+    async def _watch_tickers(self, ws_exchange, symbols: List[str]) -> AsyncIterator[Ticker]:
+        if ws_exchange.has.get('watchTickers'):
+            while True:
+                updates = await ws_exchange.watch_tickers(symbols)
+                for symbol, t in updates.items():
+                    yield self._to_ticker(symbol, t)
+            return
+
+        # No bulk feed: one watch_ticker loop per symbol, merged through a queue
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def watch(symbol: str) -> None:
+            try:
+                while True:
+                    await queue.put(self._to_ticker(symbol, await ws_exchange.watch_ticker(symbol)))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await queue.put(e)
+
+        tasks = [asyncio.create_task(watch(s)) for s in symbols]
+        try:
+            while True:
+                item = await queue.get()
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _poll_tickers(self, symbols: List[str]) -> Dict[str, Ticker]:
+        return await self._fetch_snapshot_tickers(symbols)
+
     async def get_orderbook(self, symbol: str, limit: int = 20) -> Dict[str, Any]:
         """Get order book for a symbol."""
         if not self._initialized:
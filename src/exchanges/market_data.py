@@ -0,0 +1,144 @@
+"""
+Streaming best bid/ask table across exchanges.
+
+QuoteBoard consumes BaseExchange.stream_tickers() for any number of
+exchanges and keeps the latest top of book keyed by (exchange, symbol).
+Listeners are called on every change, so strategies such as
+cross-exchange arbitrage react to each update instead of polling every
+venue on a fixed interval.
+
+Usage:
+    board = QuoteBoard()
+    board.on_update(strategy.on_quote_update)   # (exchange_id, symbol)
+    board.subscribe(binance_client, ["BTC/USDT", "ETH/USDT"])
+    board.subscribe(kraken_client, ["BTC/USDT", "ETH/USDT"])
+    ...
+    await board.stop()
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .base import BaseExchange, Ticker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BestQuote:
+    """Latest top of book for one symbol on one exchange."""
+    exchange_id: str
+    symbol: str
+    bid: float
+    ask: float
+    last: float
+    updated_at: float = field(default_factory=time.monotonic)  # time.monotonic()
+
+    @property
+    def age_sec(self) -> float:
+        return time.monotonic() - self.updated_at
+
+
+QuoteListener = Callable[[str, str], object]  # (exchange_id, symbol), may be async
+
+
+class QuoteBoard:
+    """Best bid/ask table keyed by (exchange_id, symbol)."""
+
+    def __init__(self, reconnect_delay_sec: float = 5.0):
+        self.reconnect_delay_sec = reconnect_delay_sec
+        self._quotes: Dict[Tuple[str, str], BestQuote] = {}
+        self._by_symbol: Dict[str, Dict[str, BestQuote]] = {}
+        self._listeners: List[QuoteListener] = []
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.updates = 0
+
+    def __len__(self) -> int:
+        return len(self._quotes)
+
+    def on_update(self, listener: QuoteListener) -> None:
+        """Register a callback run after every changed quote."""
+        self._listeners.append(listener)
+
+    def update(self, exchange_id: str, ticker: Ticker) -> bool:
+        """Apply a ticker; returns True if the bid/ask/last changed."""
+        key = (exchange_id, ticker.symbol)
+        bid, ask, last = ticker.bid or 0.0, ticker.ask or 0.0, ticker.last or 0.0
+        quote = self._quotes.get(key)
+        if quote is not None:
+            quote.updated_at = time.monotonic()
+            if (quote.bid, quote.ask, quote.last) == (bid, ask, last):
+                return False
+            quote.bid, quote.ask, quote.last = bid, ask, last
+        else:
+            quote = BestQuote(exchange_id, ticker.symbol, bid, ask, last)
+            self._quotes[key] = quote
+            self._by_symbol.setdefault(ticker.symbol, {})[exchange_id] = quote
+        self.updates += 1
+        return True
+
+    def get(self, exchange_id: str, symbol: str) -> Optional[BestQuote]:
+        return self._quotes.get((exchange_id, symbol))
+
+    def quotes_for(
+        self, symbol: str, max_age_sec: Optional[float] = None
+    ) -> Dict[str, BestQuote]:
+        """Quotes for a symbol on every exchange (optionally only fresh ones)."""
+        quotes = self._by_symbol.get(symbol, {})
+        if max_age_sec is None:
+            return dict(quotes)
+        return {ex: q for ex, q in quotes.items() if q.age_sec <= max_age_sec}
+
+    async def _notify(self, exchange_id: str, symbol: str) -> None:
+        for listener in self._listeners:
+            try:
+                result = listener(exchange_id, symbol)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Quote listener error ({exchange_id} {symbol}): {e}")
+
+    async def _consume(
+        self, exchange: BaseExchange, exchange_id: str, symbols: List[str]
+    ) -> None:
+        while True:
+            try:
+                async for ticker in exchange.stream_tickers(symbols):
+                    if self.update(exchange_id, ticker):
+                        await self._notify(exchange_id, ticker.symbol)
+                return  # Stream ended cleanly
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Ticker stream for {exchange_id} failed: {e} - "
+                    f"reconnecting in {self.reconnect_delay_sec}s"
+                )
+                await asyncio.sleep(self.reconnect_delay_sec)
+
+    def subscribe(
+        self,
+        exchange: BaseExchange,
+        symbols: List[str],
+        exchange_id: Optional[str] = None,
+    ) -> asyncio.Task:
+        """Start streaming symbols from an exchange into the board."""
+        exchange_id = exchange_id or getattr(exchange, "exchange_id", type(exchange).__name__)
+        old = self._tasks.pop(exchange_id, None)
+        if old:
+            old.cancel()
+        task = asyncio.create_task(self._consume(exchange, exchange_id, list(symbols)))
+        self._tasks[exchange_id] = task
+        return task
+
+    async def stop(self) -> None:
+        """Cancel all exchange streams."""
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -22,7 +22,7 @@ load_dotenv()
 # Add src to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.bot_runner import PolybotRunner
+from src.bot_runner import PolybotRunner, start_health_server
 from src.manager import BotManager
 from src.logging_handler import setup_database_logging
 from src.utils.cleanup import cleanup_stale_data
@@ -108,7 +108,12 @@ async def main():
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler(sig, signal_handler)
 
-        await manager.run()
+        # Health, metrics and profiling endpoints for all tenants
+        health_task = asyncio.create_task(start_health_server(manager=manager))
+        try:
+            await manager.run()
+        finally:
+            health_task.cancel()
 
     else:
         await run_single_instance(user_id=args.user_id, live_mode=live_mode)
@@ -21,6 +21,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.database.client import Database
 from src.bot_runner import PolybotRunner
 from src.logging_handler import setup_database_logging
+from src.utils.profiling import current_tenant, install_tenant_tracking
 
 # Configure logging
 logging.basicConfig(
@@ -79,6 +80,8 @@ class BotManager:
 
         logger.info(f"🚀 Starting bot for user {user_id}...")
 
+        # Tasks the bot creates are tagged with its tenant (for /debug/profile)
+        token = current_tenant.set(user_id)
         try:
             # Instantiate runner with user context
             bot = PolybotRunner(user_id=user_id)
@@ -103,6 +106,8 @@ class BotManager:
 
         except Exception as e:
             logger.error(f"❌ Failed to start bot for user {user_id}: {e}")
+        finally:
+            current_tenant.reset(token)
 
     async def _run_bot_lifecycle(self, bot: PolybotRunner, user_id: str):
         """Keep the bot instance running."""
@@ -148,6 +153,7 @@ class BotManager:
     async def run(self):
         """Main orchestrator loop."""
         self.running = True
+        install_tenant_tracking()
         logger.info("Manager service started. Monitoring active users...")
 
         while self.running:
@@ -1,5 +1,11 @@
 """Services package for PolyBot."""
 
 from .balance_aggregator import BalanceAggregator, AggregatedBalance, PlatformBalance
+from .balance_ledger import BalanceLedger
+from .strategy_workers import StrategyWorkerPool, WorkerGroup, WorkerContext
 
-__all__ = ['BalanceAggregator', 'AggregatedBalance', 'PlatformBalance']
+__all__ = [
+    'BalanceAggregator', 'AggregatedBalance', 'PlatformBalance',
+    'BalanceLedger',
+    'StrategyWorkerPool', 'WorkerGroup', 'WorkerContext',
+]
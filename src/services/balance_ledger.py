@@ -0,0 +1,200 @@
+"""
+Balance Ledger - in-memory cash and positions per venue.
+
+Live trades used to fetch the venue balance over REST right before
+submitting, putting a blocking round trip on the critical path. The
+ledger keeps a local view instead:
+
+- Reservations are taken when an order is submitted and released when
+  it settles, so concurrent trades cannot spend the same cash
+- Fills adjust cash and positions optimistically
+- A background job reconciles each venue against REST; the drift it
+  finds is logged and the REST values win
+
+Pre-trade checks become a dictionary lookup. A venue that has never been
+reconciled, was invalidated after an ambiguous failure, or has not been
+reconciled within max_age_sec returns None so the caller can fall back
+to REST.
+
+Usage:
+    ledger = BalanceLedger(max_age_sec=300)
+    ledger.reconcile("kalshi", cash=250.0, positions={"KXBTC-24": 10})
+    available = ledger.available("kalshi")       # microseconds, no I/O
+    ledger.reserve("kalshi", "opp-123", 25.0)
+    ledger.record_fill("kalshi", "KXBTC-24", "buy", 50, 0.45, key="opp-123")
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VenueLedger:
+    """Local view of one venue's account."""
+    cash: float = 0.0
+    positions: Dict[str, float] = field(default_factory=dict)
+    reconciled_at: Optional[float] = None   # time.monotonic()
+    valid: bool = False
+    last_drift: float = 0.0
+    fills: int = 0
+
+
+class BalanceLedger:
+    """Thread-safe cash/position ledger (legs submit from worker threads)."""
+
+    def __init__(self, max_age_sec: float = 300.0):
+        """
+        Args:
+            max_age_sec: Balances older than this are treated as unknown
+        """
+        self.max_age_sec = max_age_sec
+        self._venues: Dict[str, VenueLedger] = {}
+        self._reservations: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+
+        # Stats
+        self.lookups = 0
+        self.misses = 0
+        self.reconciliations = 0
+
+    def _venue(self, venue: str) -> VenueLedger:
+        return self._venues.setdefault(venue.lower(), VenueLedger())
+
+    def _reserved(self, venue: str) -> float:
+        return sum(amount for v, amount in self._reservations.values() if v == venue)
+
+    def age(self, venue: str) -> Optional[float]:
+        """Seconds since the venue was last reconciled (None if never)."""
+        state = self._venues.get(venue.lower())
+        if state is None or state.reconciled_at is None:
+            return None
+        return time.monotonic() - state.reconciled_at
+
+    def available(self, venue: str) -> Optional[float]:
+        """Cash not held by open reservations, or None if unknown/stale."""
+        venue = venue.lower()
+        with self._lock:
+            self.lookups += 1
+            state = self._venues.get(venue)
+            age = self.age(venue)
+            if state is None or not state.valid or age is None or age > self.max_age_sec:
+                self.misses += 1
+                return None
+            return state.cash - self._reserved(venue)
+
+    def position(self, venue: str, market_id: str) -> float:
+        with self._lock:
+            state = self._venues.get(venue.lower())
+            return state.positions.get(market_id, 0.0) if state else 0.0
+
+    def reserve(self, venue: str, key: str, amount: float) -> None:
+        """Hold cash for an order in flight (replaces any hold under key)."""
+        with self._lock:
+            self._reservations[key] = (venue.lower(), max(float(amount), 0.0))
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._reservations.pop(key, None)
+
+    def record_fill(
+        self,
+        venue: str,
+        market_id: str,
+        side: str,
+        quantity: float,
+        price: float,
+        fees: float = 0.0,
+        key: Optional[str] = None,
+    ) -> None:
+        """
+        Apply a fill to cash and positions, releasing its reservation.
+
+        Contracts are binary ($1 at resolution): selling more than is held
+        opens the opposite side, which costs 1 - price per contract.
+        """
+        with self._lock:
+            if key is not None:
+                self._reservations.pop(key, None)
+            state = self._venue(venue)
+            held = state.positions.get(market_id, 0.0)
+            if side.lower() == "buy":
+                state.cash -= quantity * price + fees
+                held += quantity
+            else:
+                closing = min(quantity, max(held, 0.0))
+                opening = quantity - closing
+                state.cash += closing * price - opening * (1.0 - price) - fees
+                held -= quantity
+            if held:
+                state.positions[market_id] = held
+            else:
+                state.positions.pop(market_id, None)
+            state.fills += 1
+
+    def debit(self, venue: str, amount: float, key: Optional[str] = None) -> None:
+        """Cash-only spend (e.g. a basket of outcomes), releasing its reservation."""
+        with self._lock:
+            if key is not None:
+                self._reservations.pop(key, None)
+            self._venue(venue).cash -= amount
+
+    def reconcile(
+        self,
+        venue: str,
+        cash: float,
+        positions: Optional[Dict[str, float]] = None,
+    ) -> float:
+        """
+        Replace the local view with REST values.
+
+        Returns:
+            Drift: REST cash minus the ledger's cash before reconciling
+            (0.0 on the first reconciliation)
+        """
+        with self._lock:
+            state = self._venue(venue)
+            drift = cash - state.cash if state.reconciled_at is not None else 0.0
+            state.cash = float(cash)
+            if positions is not None:
+                state.positions = {k: float(v) for k, v in positions.items() if v}
+            state.reconciled_at = time.monotonic()
+            state.valid = True
+            state.last_drift = drift
+            self.reconciliations += 1
+
+        if abs(drift) >= 0.01:
+            logger.info(f"📒 {venue} ledger drift ${drift:+.2f} - reconciled to ${cash:.2f}")
+        return drift
+
+    def invalidate(self, venue: str) -> None:
+        """Distrust the local view until the next reconciliation."""
+        with self._lock:
+            self._venue(venue).valid = False
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            venues = {
+                name: {
+                    "cash": round(state.cash, 2),
+                    "reserved": round(self._reserved(name), 2),
+                    "positions": len(state.positions),
+                    "valid": state.valid,
+                    "age_sec": None if state.reconciled_at is None
+                    else round(time.monotonic() - state.reconciled_at, 1),
+                    "last_drift": round(state.last_drift, 2),
+                    "fills": state.fills,
+                }
+                for name, state in self._venues.items()
+            }
+            return {
+                "venues": venues,
+                "open_reservations": len(self._reservations),
+                "lookups": self.lookups,
+                "misses": self.misses,
+                "reconciliations": self.reconciliations,
+            }
@@ -0,0 +1,242 @@
+"""
+Opportunity Bus - queue detected opportunities for a fixed executor pool.
+
+Detectors used to await the runner's handler directly, so execution ran
+on the detector's own task: a burst of opportunities stalled scanning,
+and two strategies could act on the same market at once. Detectors now
+publish to the bus and return immediately:
+
+- Bounded priority queue ordered by expected edge per second of expected
+  execution latency (learned per kind from handler run times)
+- Dedup by (venue, market): an opportunity touching a market that was
+  accepted within dedup_window_sec is dropped
+- Items older than their TTL when dequeued are discarded as stale
+- When full, a new item evicts the lowest-priority queued item if it
+  ranks higher, otherwise it is dropped (the detector never blocks)
+- A fixed number of workers run the handlers
+
+Queue depth, queue wait and per-outcome counts are exported as metrics.
+
+Usage:
+    bus = OpportunityBus(workers=4)
+    bus.on(
+        "single_platform", runner.on_single_platform_opportunity,
+        markets=lambda o: [(o.platform, o.market_id)],
+        edge=lambda o: float(o.profit_pct),
+    )
+    await bus.start()
+    scanner = SinglePlatformScanner(on_opportunity=bus.publisher("single_platform"))
+    await bus.stop()
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.utils.metrics import opportunities_total, opportunity_queue_depth, opportunity_queue_wait
+
+logger = logging.getLogger(__name__)
+
+MarketKey = Tuple[str, str]     # (venue, market_id)
+
+# Floor for the latency estimate so a handler that returns instantly
+# doesn't get unbounded priority
+_MIN_LATENCY_SEC = 0.01
+# Weight of the newest sample in the per-kind latency average
+_LATENCY_ALPHA = 0.2
+
+
+@dataclass
+class OpportunityKind:
+    """How to handle and rank one type of opportunity."""
+    name: str
+    handler: Callable[[Any], Awaitable[Any]]
+    markets: Callable[[Any], Iterable[MarketKey]]
+    edge: Callable[[Any], float]
+    latency_sec: float = 1.0        # Expected handler time (updated from runs)
+    ttl_sec: Optional[float] = None  # Default: bus ttl_sec
+
+
+@dataclass(order=True)
+class _Item:
+    sort_key: Tuple[float, int]
+    kind: OpportunityKind = field(compare=False)
+    payload: Any = field(compare=False)
+    queued_at: float = field(compare=False, default=0.0)
+    expires_at: float = field(compare=False, default=0.0)
+
+    @property
+    def priority(self) -> float:
+        return -self.sort_key[0]
+
+
+class OpportunityBus:
+    """Bounded, deduplicating priority queue with an executor pool."""
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        workers: int = 4,
+        dedup_window_sec: float = 30.0,
+        ttl_sec: float = 15.0,
+    ):
+        """
+        Args:
+            max_size: Queue capacity (lowest priority is evicted beyond it)
+            workers: Concurrent executions
+            dedup_window_sec: Ignore a (venue, market) seen this recently
+            ttl_sec: Default age after which a queued item is stale
+        """
+        self.max_size = max_size
+        self.workers = workers
+        self.dedup_window_sec = dedup_window_sec
+        self.ttl_sec = ttl_sec
+
+        self._kinds: Dict[str, OpportunityKind] = {}
+        self._heap: List[_Item] = []
+        self._seq = itertools.count()
+        self._seen: Dict[MarketKey, float] = {}
+        self._ready = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+        # Stats
+        self.counts: Dict[str, Dict[str, int]] = {}
+
+    def on(
+        self,
+        kind: str,
+        handler: Callable[[Any], Awaitable[Any]],
+        markets: Callable[[Any], Iterable[MarketKey]],
+        edge: Callable[[Any], float],
+        latency_sec: float = 1.0,
+        ttl_sec: Optional[float] = None,
+    ) -> None:
+        """Register the handler and ranking functions for a kind."""
+        self._kinds[kind] = OpportunityKind(kind, handler, markets, edge, latency_sec, ttl_sec)
+
+    def publisher(self, kind: str) -> Callable[[Any], Awaitable[bool]]:
+        """Async callback for detectors: `on_opportunity=bus.publisher("spike")`."""
+        if kind not in self._kinds:
+            raise KeyError(f"Unknown opportunity kind: {kind}")
+
+        async def publish(opportunity: Any) -> bool:
+            return self.publish(kind, opportunity)
+
+        return publish
+
+    def _count(self, kind: str, outcome: str) -> None:
+        per_kind = self.counts.setdefault(kind, {})
+        per_kind[outcome] = per_kind.get(outcome, 0) + 1
+        opportunities_total.labels(kind=kind, outcome=outcome).inc()
+
+    def _is_duplicate(self, markets: List[MarketKey], now: float) -> bool:
+        cutoff = now - self.dedup_window_sec
+        if len(self._seen) > 4 * self.max_size:
+            self._seen = {k: t for k, t in self._seen.items() if t >= cutoff}
+        return any(self._seen.get(m, -1.0) >= cutoff for m in markets)
+
+    def publish(self, kind: str, opportunity: Any) -> bool:
+        """Queue an opportunity; returns False if deduplicated or dropped."""
+        spec = self._kinds[kind]
+        now = time.monotonic()
+        try:
+            markets = [(str(v).lower(), str(m)) for v, m in spec.markets(opportunity)]
+            priority = float(spec.edge(opportunity)) / max(spec.latency_sec, _MIN_LATENCY_SEC)
+        except Exception as e:
+            logger.error(f"Cannot rank {kind} opportunity: {e}")
+            self._count(kind, "dropped")
+            return False
+
+        if self._is_duplicate(markets, now):
+            self._count(kind, "deduplicated")
+            return False
+
+        ttl = spec.ttl_sec if spec.ttl_sec is not None else self.ttl_sec
+        item = _Item((-priority, next(self._seq)), spec, opportunity, now, now + ttl)
+
+        if len(self._heap) >= self.max_size:
+            self._purge_expired(now)
+        if len(self._heap) >= self.max_size:
+            lowest = max(self._heap)
+            if lowest.priority >= priority:
+                self._count(kind, "dropped")
+                logger.warning(f"📭 Opportunity bus full - dropped {kind} (priority {priority:.2f})")
+                return False
+            self._heap.remove(lowest)
+            heapq.heapify(self._heap)
+            self._count(lowest.kind.name, "dropped")
+
+        for market in markets:
+            self._seen[market] = now
+        heapq.heappush(self._heap, item)
+        opportunity_queue_depth.set(len(self._heap))
+        self._ready.set()
+        return True
+
+    def _purge_expired(self, now: float) -> None:
+        live = [item for item in self._heap if item.expires_at >= now]
+        for item in self._heap:
+            if item.expires_at < now:
+                self._count(item.kind.name, "expired")
+        self._heap = live
+        heapq.heapify(self._heap)
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"opportunity_worker:{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"📬 Opportunity bus started ({self.workers} executors, max {self.max_size} queued)")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _next(self) -> _Item:
+        while True:
+            now = time.monotonic()
+            while self._heap:
+                item = heapq.heappop(self._heap)
+                opportunity_queue_depth.set(len(self._heap))
+                if item.expires_at >= now:
+                    return item
+                self._count(item.kind.name, "expired")
+            self._ready.clear()
+            await self._ready.wait()
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._next()
+            kind = item.kind
+            started = time.monotonic()
+            opportunity_queue_wait.labels(kind=kind.name).observe(started - item.queued_at)
+            try:
+                await kind.handler(item.payload)
+                self._count(kind.name, "executed")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._count(kind.name, "failed")
+                logger.error(f"Error handling {kind.name} opportunity: {e}")
+            elapsed = time.monotonic() - started
+            kind.latency_sec += _LATENCY_ALPHA * (elapsed - kind.latency_sec)
+
+    @property
+    def depth(self) -> int:
+        return len(self._heap)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self._heap),
+            "workers": len(self._tasks),
+            "latency_sec": {name: round(k.latency_sec, 3) for name, k in self._kinds.items()},
+            "counts": {kind: dict(c) for kind, c in self.counts.items()},
+        }
@@ -0,0 +1,378 @@
+"""
+Strategy Workers - run CPU-heavy strategy groups in worker processes.
+
+Everything in PolybotRunner shares one asyncio loop, so a slow O(N×M)
+title match or indicator pass delays order routing for every other
+strategy. This module moves selected strategy groups into their own
+processes while execution stays in the runner:
+
+- Each group runs in a spawned process with its own event loop. Its
+  entrypoint is an `async def entry(ctx, **kwargs)` given as
+  "module:function" so it can be imported in the child.
+- Market data and control messages fan out from the runner over a local
+  message bus (one inbox queue per worker). Workers keep the latest value
+  per topic, so a slow worker conflates instead of falling behind.
+- Opportunities come back over a single result queue and are handled one
+  at a time in the runner, which keeps risk state and serialized execution.
+
+Usage:
+    pool = StrategyWorkerPool()
+    pool.on("cross_platform_opportunity", runner.on_cross_platform_opportunity)
+    await pool.start()
+    await pool.run_group(WorkerGroup(
+        "cross_platform_scanner",
+        "src.services.strategy_workers:cross_platform_scanner_worker",
+        {"scan_interval": 120},
+    ))
+    pool.publish("single_platform.traded", ("0xabc", "polymarket"))
+    await pool.stop()
+"""
+
+import asyncio
+import importlib
+import inspect
+import logging
+import multiprocessing
+import queue
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Queue poll timeout; bounds how long stop() waits for reader threads
+_POLL_SEC = 0.5
+
+_STOP = "__stop__"
+_ERROR = "__error__"
+
+
+@dataclass
+class WorkerGroup:
+    """A strategy group to run in its own process."""
+    name: str
+    entrypoint: str                 # "package.module:async_function"
+    kwargs: Dict[str, Any] = field(default_factory=dict)  # Must be picklable
+
+
+@dataclass
+class WorkerStats:
+    """Runner-side counters for a worker group."""
+    pid: Optional[int] = None
+    started_at: float = 0.0
+    starts: int = 0
+    messages: int = 0
+    errors: int = 0
+    last_error: Optional[str] = None
+
+
+def resolve_entrypoint(path: str) -> Callable[..., Awaitable[Any]]:
+    """Import "module:function" and check it is a coroutine function."""
+    module_name, _, attr = path.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Entrypoint must look like 'module:function', got {path!r}")
+    func = getattr(importlib.import_module(module_name), attr)
+    if not inspect.iscoroutinefunction(func):
+        raise TypeError(f"Entrypoint {path} must be an async function")
+    return func
+
+
+# =============================================================================
+# Worker process side
+# =============================================================================
+
+class WorkerContext:
+    """Handle passed to a worker entrypoint for talking to the runner."""
+
+    def __init__(self, group: str, inbox, outbox):
+        self.group = group
+        self._inbox = inbox
+        self._outbox = outbox
+        self._latest: Dict[str, Any] = {}
+        self._subscribers: Dict[str, List[Callable[[Any], Any]]] = {}
+        self._stopping = False
+
+    def emit(self, kind: str, payload: Any) -> None:
+        """Send a result (e.g. an opportunity) to the runner's handler for kind."""
+        self._outbox.put((self.group, kind, payload))
+
+    def subscribe(self, topic: str, callback: Callable[[Any], Any]) -> None:
+        """Call callback (sync or async) for every message published on topic."""
+        self._subscribers.setdefault(topic, []).append(callback)
+
+    def latest(self, topic: str, default: Any = None) -> Any:
+        """Most recent payload published on topic."""
+        return self._latest.get(topic, default)
+
+    async def _read_inbox(self) -> None:
+        """Apply bus messages until the runner asks the worker to stop."""
+        loop = asyncio.get_running_loop()
+        while not self._stopping:
+            try:
+                topic, payload = await loop.run_in_executor(
+                    None, self._inbox.get, True, _POLL_SEC
+                )
+            except queue.Empty:
+                continue
+            if topic == _STOP:
+                return
+
+            self._latest[topic] = payload
+            for callback in self._subscribers.get(topic, []):
+                try:
+                    result = callback(payload)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception as e:
+                    logger.error(f"[{self.group}] Subscriber for {topic} failed: {e}")
+
+
+async def _worker_async(group: str, entrypoint: str, kwargs: Dict[str, Any], inbox, outbox) -> None:
+    ctx = WorkerContext(group, inbox, outbox)
+    entry = resolve_entrypoint(entrypoint)
+
+    main = asyncio.create_task(entry(ctx, **kwargs), name=f"{group}:main")
+    reader = asyncio.create_task(ctx._read_inbox(), name=f"{group}:bus")
+    try:
+        await asyncio.wait({main, reader}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        ctx._stopping = True
+        for task in (main, reader):
+            task.cancel()
+        await asyncio.gather(main, reader, return_exceptions=True)
+
+    if not main.cancelled() and main.exception():
+        raise main.exception()
+
+
+def _worker_main(group: str, entrypoint: str, kwargs: Dict[str, Any], inbox, outbox, log_level: int) -> None:
+    """Process target: run the group's entrypoint on a fresh event loop."""
+    logging.basicConfig(
+        level=log_level,
+        format=f"%(asctime)s [{group}] %(name)s %(levelname)s %(message)s",
+    )
+    try:
+        asyncio.run(_worker_async(group, entrypoint, kwargs, inbox, outbox))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        logger.exception(f"[{group}] Worker crashed")
+        outbox.put((group, _ERROR, str(e) or type(e).__name__))
+        raise SystemExit(1)
+
+
+# =============================================================================
+# Runner side
+# =============================================================================
+
+class StrategyWorkerPool:
+    """Spawns worker groups, fans out bus messages and serializes their results."""
+
+    def __init__(self, stop_timeout_sec: float = 5.0, log_level: Optional[int] = None):
+        self.stop_timeout_sec = stop_timeout_sec
+        self.log_level = log_level if log_level is not None else logging.getLogger().getEffectiveLevel()
+
+        # spawn: children must not inherit the runner's loop, threads or sockets
+        self._mp = multiprocessing.get_context("spawn")
+        self._outbox = None
+        self._handlers: Dict[str, Callable[[Any], Any]] = {}
+        self._workers: Dict[str, Tuple[Any, Any]] = {}   # name -> (process, inbox)
+        self._stats: Dict[str, WorkerStats] = {}
+        self._pump: Optional[asyncio.Task] = None
+        self._running = False
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._workers
+
+    def on(self, kind: str, handler: Callable[[Any], Any]) -> None:
+        """Handle results of this kind from any worker (sync or async)."""
+        self._handlers[kind] = handler
+
+    async def start(self) -> None:
+        if self._running:
+            return
+        self._outbox = self._mp.Queue()
+        self._running = True
+        self._pump = asyncio.create_task(self._pump_results(), name="strategy-workers")
+        logger.info("🧵 Strategy worker pool started")
+
+    # -------------------------------------------------------------------------
+    # Groups
+    # -------------------------------------------------------------------------
+
+    def start_group(self, group: WorkerGroup) -> int:
+        """Spawn a worker process for group; returns its pid."""
+        if not self._running:
+            raise RuntimeError("StrategyWorkerPool.start() must be called first")
+        if group.name in self._workers:
+            raise ValueError(f"Worker group {group.name} is already running")
+        # Fail fast in the runner rather than in the child
+        resolve_entrypoint(group.entrypoint)
+
+        inbox = self._mp.Queue()
+        process = self._mp.Process(
+            target=_worker_main,
+            args=(group.name, group.entrypoint, group.kwargs, inbox, self._outbox, self.log_level),
+            name=f"polybot-{group.name}",
+            daemon=True,
+        )
+        process.start()
+        self._workers[group.name] = (process, inbox)
+
+        stats = self._stats.setdefault(group.name, WorkerStats())
+        stats.pid = process.pid
+        stats.started_at = time.time()
+        stats.starts += 1
+        logger.info(f"🧵 Started worker {group.name} (pid {process.pid})")
+        return process.pid
+
+    async def run_group(self, group: WorkerGroup) -> None:
+        """
+        Run group in a worker process until it exits.
+
+        Raises RuntimeError if the worker dies with a non-zero exit code so
+        callers can restart it with their usual backoff. Cancelling stops it.
+        """
+        self.start_group(group)
+        process, _ = self._workers[group.name]
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, process.join)
+        except asyncio.CancelledError:
+            await self.stop_group(group.name)
+            raise
+
+        self._workers.pop(group.name, None)
+        if process.exitcode not in (0, None):
+            raise RuntimeError(f"Worker {group.name} exited with code {process.exitcode}")
+
+    async def stop_group(self, name: str) -> None:
+        """Ask a worker to stop, then terminate it if it does not exit in time."""
+        worker = self._workers.pop(name, None)
+        if not worker:
+            return
+        process, inbox = worker
+        try:
+            inbox.put_nowait((_STOP, None))
+        except (ValueError, OSError):
+            pass
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, process.join, self.stop_timeout_sec)
+        if process.is_alive():
+            logger.warning(f"Worker {name} did not stop in {self.stop_timeout_sec}s - terminating")
+            process.terminate()
+            await loop.run_in_executor(None, process.join, self.stop_timeout_sec)
+        logger.info(f"⏹️ Stopped worker {name}")
+
+    async def stop(self) -> None:
+        """Stop all workers and the result pump."""
+        await asyncio.gather(*(self.stop_group(name) for name in list(self._workers)))
+        self._running = False
+        if self._pump:
+            await asyncio.gather(self._pump, return_exceptions=True)
+            self._pump = None
+
+    # -------------------------------------------------------------------------
+    # Messaging
+    # -------------------------------------------------------------------------
+
+    def publish(self, topic: str, payload: Any) -> None:
+        """Fan a message out to every running worker."""
+        for name, (_, inbox) in list(self._workers.items()):
+            try:
+                inbox.put_nowait((topic, payload))
+            except (ValueError, OSError) as e:
+                logger.debug(f"Could not publish {topic} to {name}: {e}")
+
+    async def _pump_results(self) -> None:
+        """Handle worker results one at a time, in arrival order."""
+        loop = asyncio.get_running_loop()
+        while self._running:
+            try:
+                group, kind, payload = await loop.run_in_executor(
+                    None, self._outbox.get, True, _POLL_SEC
+                )
+            except queue.Empty:
+                continue
+
+            stats = self._stats.setdefault(group, WorkerStats())
+            if kind == _ERROR:
+                stats.errors += 1
+                stats.last_error = payload
+                logger.error(f"❌ Worker {group} crashed: {payload}")
+                continue
+
+            stats.messages += 1
+            handler = self._handlers.get(kind)
+            if handler is None:
+                logger.debug(f"No handler for {kind} from {group}")
+                continue
+            try:
+                result = handler(payload)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Handler for {kind} from {group} failed: {e}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "pid": s.pid,
+                "alive": name in self._workers and self._workers[name][0].is_alive(),
+                "started_at": s.started_at,
+                "starts": s.starts,
+                "messages": s.messages,
+                "errors": s.errors,
+                "last_error": s.last_error,
+            }
+            for name, s in self._stats.items()
+        }
+
+
+# =============================================================================
+# Built-in worker entrypoints
+# =============================================================================
+
+def _worker_db(user_id: Optional[str]):
+    """Scan-logging DB client opened inside the worker (clients don't pickle)."""
+    try:
+        from src.database.client import Database
+        return Database(user_id=user_id)
+    except Exception as e:
+        logger.warning(f"Worker DB unavailable, scans will not be logged: {e}")
+        return None
+
+
+async def cross_platform_scanner_worker(ctx: WorkerContext, user_id: Optional[str] = None, **kwargs) -> None:
+    """Polymarket↔Kalshi title matching and scanning; emits cross_platform_opportunity."""
+    from src.arbitrage.detector import CrossPlatformScanner
+
+    async def emit(opp):
+        ctx.emit("cross_platform_opportunity", opp)
+
+    scanner = CrossPlatformScanner(db_client=_worker_db(user_id), **kwargs)
+    try:
+        await scanner.run(callback=emit)
+    finally:
+        await scanner.close()
+
+
+async def single_platform_scanner_worker(
+    ctx: WorkerContext,
+    user_id: Optional[str] = None,
+    enable_polymarket: bool = True,
+    enable_kalshi: bool = True,
+    **kwargs,
+) -> None:
+    """Intra-market arb scanning; emits single_platform_opportunity."""
+    from src.arbitrage.single_platform_scanner import SinglePlatformScanner
+
+    async def emit(opp):
+        ctx.emit("single_platform_opportunity", opp)
+
+    scanner = SinglePlatformScanner(on_opportunity=emit, db_client=_worker_db(user_id), **kwargs)
+    # The runner publishes trades so the worker's cooldown matches execution
+    ctx.subscribe("single_platform.traded", lambda key: scanner.mark_traded(*key))
+    try:
+        await scanner.run(enable_polymarket=enable_polymarket, enable_kalshi=enable_kalshi)
+    finally:
+        await scanner.close()
@@ -3,5 +3,26 @@ Simulation module for PolyBot paper trading.
 """
 
 from .paper_trader_realistic import RealisticPaperTrader as PaperTrader, RealisticStats as PaperTradingStats, SimulatedTrade as SimulatedPosition
+from .replay import TickTape, ReplayExchange, REPLAY_EVALUATORS
+from .param_sweep import ParameterSweep, ParameterGrid, RandomSearch, SweepResult, format_sweep_table
+from .synthetic import SyntheticMarkets
+from .benchmark import BENCHMARKS, BenchmarkResult, run_benchmarks, compare_results
 
-__all__ = ["PaperTrader", "PaperTradingStats", "SimulatedPosition"]
+__all__ = [
+    "PaperTrader",
+    "PaperTradingStats",
+    "SimulatedPosition",
+    "TickTape",
+    "ReplayExchange",
+    "REPLAY_EVALUATORS",
+    "ParameterSweep",
+    "ParameterGrid",
+    "RandomSearch",
+    "SweepResult",
+    "format_sweep_table",
+    "SyntheticMarkets",
+    "BENCHMARKS",
+    "BenchmarkResult",
+    "run_benchmarks",
+    "compare_results",
+]
@@ -0,0 +1,621 @@
+"""
+Benchmark Suite for PolyBot
+
+Measures throughput and per-call latency of the hot paths on seeded
+synthetic data (see synthetic.py), so a change can be checked for
+regressions before it reaches a live bot:
+
+- find_matching_markets        CrossPlatformScanner title matching (one scan)
+- analyze_polymarket_event     SinglePlatformScanner multi-outcome analysis (one event)
+- find_all_opportunities       ArbitrageDetector over matched order books (one pass)
+- spike_update_price           SpikeHunterStrategy.update_price (one book update)
+- match_news_to_markets        NewsSentimentEngine headline matching (one batch)
+- simulate_opportunity         RealisticPaperTrader (one opportunity, no latency sleep)
+- db_insert / db_upsert_many / db_log_opportunity
+                               Database write path against an in-process
+                               Supabase stub (client proxy + metrics, no network)
+
+Logging is silenced while a benchmark runs, so log formatting that
+happens before the logger call is measured but handler I/O is not.
+
+Results are written to JSON together with the git commit they were
+measured on; --compare reports latency/throughput changes against an
+earlier results file and --fail-on-regression turns them into an exit
+code for CI.
+
+Usage:
+    results = run_benchmarks(["spike_update_price"], seed=42)
+    print(format_results_table(results))
+
+CLI:
+    python -m src.simulation.benchmark --output bench.json
+    python -m src.simulation.benchmark --only find_all_opportunities --scale 0.2
+    python -m src.simulation.benchmark --output new.json --compare bench.json \\
+        --fail-on-regression 15
+"""
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import logging
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .synthetic import SyntheticMarkets
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# SUPABASE STUB
+# =============================================================================
+
+class _StubResponse:
+    def __init__(self, data: List[Dict[str, Any]], count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class _StubQuery:
+    """Accepts any builder chain (.eq, .limit, .single, ...) and records writes."""
+
+    def __init__(self, stub: "StubSupabase", table: str, op: str, rows: List[Dict[str, Any]]):
+        self._stub = stub
+        self._table = table
+        self._op = op
+        self._rows = rows
+
+    def execute(self) -> _StubResponse:
+        if self._stub.latency_sec:
+            time.sleep(self._stub.latency_sec)
+        if self._op == "select":
+            return _StubResponse([], count=0)
+        self._stub.writes[self._table] = self._stub.writes.get(self._table, 0) + len(self._rows)
+        return _StubResponse([dict(row, id=self._stub.next_id()) for row in self._rows])
+
+    def __getattr__(self, name: str) -> Callable[..., "_StubQuery"]:
+        return lambda *args, **kwargs: self
+
+
+class _StubTable:
+    def __init__(self, stub: "StubSupabase", name: str):
+        self._stub = stub
+        self._name = name
+
+    def _write(self, op: str, data: Any) -> _StubQuery:
+        rows = data if isinstance(data, list) else [data]
+        return _StubQuery(self._stub, self._name, op, rows)
+
+    def insert(self, data: Any, **kwargs) -> _StubQuery:
+        return self._write("insert", data)
+
+    def upsert(self, data: Any, **kwargs) -> _StubQuery:
+        return self._write("upsert", data)
+
+    def update(self, data: Any, **kwargs) -> _StubQuery:
+        return self._write("update", data)
+
+    def delete(self, **kwargs) -> _StubQuery:
+        return _StubQuery(self._stub, self._name, "delete", [])
+
+    def select(self, *args, **kwargs) -> _StubQuery:
+        return _StubQuery(self._stub, self._name, "select", [])
+
+
+class StubSupabase:
+    """
+    In-process stand-in for the supabase client.
+
+    Reads return no rows; writes echo the rows back with an id. Set
+    latency_sec to emulate a database round trip (blocking, like the
+    real synchronous client).
+    """
+
+    def __init__(self, latency_sec: float = 0.0):
+        self.latency_sec = latency_sec
+        self.writes: Dict[str, int] = {}
+        self._ids = 0
+
+    def next_id(self) -> int:
+        self._ids += 1
+        return self._ids
+
+    def table(self, name: str) -> _StubTable:
+        return _StubTable(self, name)
+
+    from_ = table
+
+
+def stub_database(latency_sec: float = 0.0, user_id: Optional[str] = None):
+    """A Database whose supabase client is a StubSupabase (metrics proxy kept)."""
+    from src.database.client import Database, _TimedSupabase
+
+    # Any syntactically valid URL/key builds a client without network I/O;
+    # it is replaced right away
+    db = Database(url="http://127.0.0.1:9", key="benchmark", user_id=user_id)
+    db._client = _TimedSupabase(StubSupabase(latency_sec))
+    return db
+
+
+# =============================================================================
+# WORKLOADS
+# =============================================================================
+
+@dataclass
+class Workload:
+    """A prepared benchmark: op(i) is timed for each i (may return an awaitable)."""
+    op: Callable[[int], Any]
+    items_per_op: int = 1
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+Builder = Callable[[SyntheticMarkets, int], Workload]
+
+
+def bench_find_matching_markets(markets: SyntheticMarkets, n_ops: int) -> Workload:
+    from src.arbitrage.detector import CrossPlatformScanner
+
+    scanner = CrossPlatformScanner()
+    poly, kalshi = markets.cross_platform_markets(200, 50)
+    return Workload(
+        op=lambda i: scanner.find_matching_markets(poly, kalshi),
+        items_per_op=len(poly) * len(kalshi),
+        params={"poly_markets": len(poly), "kalshi_markets": len(kalshi)},
+    )
+
+
+def bench_analyze_polymarket_event(markets: SyntheticMarkets, n_ops: int) -> Workload:
+    from src.arbitrage.single_platform_scanner import SinglePlatformScanner
+
+    scanner = SinglePlatformScanner(db_client=stub_database())
+    events = markets.polymarket_events(min(n_ops, 1000), outcomes=(2, 8))
+    return Workload(
+        op=lambda i: scanner.analyze_polymarket_event(events[i % len(events)]),
+        params={"events": len(events), "outcomes": [2, 8]},
+    )
+
+
+def bench_find_all_opportunities(markets: SyntheticMarkets, n_ops: int) -> Workload:
+    from src.arbitrage.detector import ArbitrageDetector
+
+    # Books are built once, so don't let them age out of the freshness window
+    detector = ArbitrageDetector(max_data_age_seconds=86_400)
+    poly_books, kalshi_books, pairs = markets.order_books(500)
+    return Workload(
+        op=lambda i: detector.find_all_opportunities(poly_books, kalshi_books, pairs),
+        items_per_op=len(pairs),
+        params={"pairs": len(pairs), "levels": 10},
+    )
+
+
+def bench_spike_update_price(markets: SyntheticMarkets, n_ops: int) -> Workload:
+    from src.strategies.spike_hunter import SpikeHunterStrategy
+
+    # No position cap, so every update runs full spike detection
+    strategy = SpikeHunterStrategy(max_concurrent=1_000_000)
+    ticks = markets.book_updates(n_markets=200, n_updates=n_ops)
+    update = strategy.update_price
+
+    def op(i: int) -> Any:
+        ts, market_id, price, volume = ticks[i]
+        return update(market_id, price, volume, ts)
+
+    return Workload(op=op, params={"markets": 200, "updates": len(ticks)})
+
+
+def bench_match_news_to_markets(markets: SyntheticMarkets, n_ops: int) -> Workload:
+    from src.features.news_sentiment import NewsSentimentEngine
+
+    engine = NewsSentimentEngine()
+    news = markets.headlines(100)
+    poly, _ = markets.cross_platform_markets(500, 0)
+
+    async def op(i: int) -> Any:
+        # Matching appends to these; reset so every batch does the same work
+        engine.alerts.clear()
+        for item in news:
+            item.related_markets.clear()
+        return await engine.match_news_to_markets(news, poly)
+
+    return Workload(
+        op=op,
+        items_per_op=len(news),
+        params={"headlines": len(news), "markets": len(poly)},
+    )
+
+
+def bench_simulate_opportunity(markets: SyntheticMarkets, n_ops: int) -> Workload:
+    from src.simulation.paper_trader_realistic import RealisticPaperTrader
+
+    trader = RealisticPaperTrader(stub_database(), starting_balance=Decimal("1000000"))
+    # Measure the simulation itself, not the modelled network delay or limits
+    trader.EXECUTION_DELAY_MIN_SEC = 0.0
+    trader.EXECUTION_DELAY_MAX_SEC = 0.0
+    trader.MAX_DAILY_TRADES = sys.maxsize
+    random.seed(markets.seed)
+    opportunities = markets.paper_opportunities(n_ops)
+    return Workload(
+        op=lambda i: trader.simulate_opportunity(**opportunities[i]),
+        params={"opportunities": len(opportunities)},
+    )
+
+
+def bench_db_insert(markets: SyntheticMarkets, n_ops: int) -> Workload:
+    db = stub_database(user_id="benchmark-user")
+    poly, _ = markets.cross_platform_markets(min(n_ops, 1000), 0)
+    rows = [
+        {
+            "scanner_type": "polymarket_single",
+            "platform": "polymarket",
+            "market_id": m["id"],
+            "market_title": m["question"],
+            "yes_price": m["yes_price"],
+            "no_price": m["no_price"],
+            "qualifies_for_trade": False,
+            "raw_data": {"volume": m["volume"]},
+        }
+        for m in poly
+    ]
+    return Workload(
+        op=lambda i: db.insert("polybot_market_scans", rows[i % len(rows)]),
+        params={"table": "polybot_market_scans", "stub_latency_ms": 0},
+    )
+
+
+def bench_db_upsert_many(markets: SyntheticMarkets, n_ops: int) -> Workload:
+    db = stub_database(user_id="benchmark-user")
+    whales = [
+        {"address": f"0x{i:040x}", "alias": f"whale{i}", "win_rate": 50 + i % 50, "copy_enabled": i % 3 == 0}
+        for i in range(500)
+    ]
+    return Workload(
+        op=lambda i: db.upsert_many("polybot_tracked_whales", whales, on_conflict="address"),
+        items_per_op=len(whales),
+        params={"table": "polybot_tracked_whales", "rows_per_op": len(whales), "stub_latency_ms": 0},
+    )
+
+
+def bench_db_log_opportunity(markets: SyntheticMarkets, n_ops: int) -> Workload:
+    from src.arbitrage.detector import ArbitrageDetector
+
+    db = stub_database(user_id="benchmark-user")
+    detector = ArbitrageDetector(min_profit_percent=0.0, max_data_age_seconds=86_400)
+    poly_books, kalshi_books, pairs = markets.order_books(200, crossed_pct=1.0)
+    opportunities = [o.to_dict() for o in detector.find_all_opportunities(poly_books, kalshi_books, pairs)]
+    return Workload(
+        op=lambda i: db.log_opportunity(opportunities[i % len(opportunities)]),
+        params={"table": "polybot_opportunities", "opportunities": len(opportunities)},
+    )
+
+
+# name -> (builder, default number of timed calls)
+BENCHMARKS: Dict[str, Tuple[Builder, int]] = {
+    "find_matching_markets": (bench_find_matching_markets, 20),
+    "analyze_polymarket_event": (bench_analyze_polymarket_event, 5_000),
+    "find_all_opportunities": (bench_find_all_opportunities, 200),
+    "spike_update_price": (bench_spike_update_price, 100_000),
+    "match_news_to_markets": (bench_match_news_to_markets, 50),
+    "simulate_opportunity": (bench_simulate_opportunity, 2_000),
+    "db_insert": (bench_db_insert, 10_000),
+    "db_upsert_many": (bench_db_upsert_many, 200),
+    "db_log_opportunity": (bench_db_log_opportunity, 10_000),
+}
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+@dataclass
+class BenchmarkResult:
+    """Latency and throughput for one benchmark."""
+    name: str
+    ops: int
+    items: int
+    total_sec: float
+    latency_ms: Dict[str, float] = field(default_factory=dict)
+    params: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        """Items processed per second of measured time."""
+        return self.items / self.total_sec if self.total_sec > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "ops": self.ops,
+            "items": self.items,
+            "total_sec": round(self.total_sec, 6),
+            "throughput_per_sec": round(self.throughput, 2),
+            "latency_ms": self.latency_ms,
+            "params": self.params,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        return cls(
+            name=data["name"],
+            ops=data.get("ops", 0),
+            items=data.get("items", 0),
+            total_sec=data.get("total_sec", 0.0),
+            latency_ms=data.get("latency_ms", {}),
+            params=data.get("params", {}),
+            error=data.get("error"),
+        )
+
+
+def _latency_summary(samples: List[float]) -> Dict[str, float]:
+    """Mean and nearest-rank percentiles in milliseconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return ordered[min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))]
+
+    return {
+        "mean": round(sum(ordered) / len(ordered) * 1000, 6),
+        "p50": round(pct(50) * 1000, 6),
+        "p90": round(pct(90) * 1000, 6),
+        "p99": round(pct(99) * 1000, 6),
+        "max": round(ordered[-1] * 1000, 6),
+    }
+
+
+async def _time_ops(op: Callable[[int], Any], start: int, count: int) -> List[float]:
+    samples = []
+    perf_counter = time.perf_counter
+    for i in range(start, start + count):
+        began = perf_counter()
+        result = op(i)
+        if inspect.isawaitable(result):
+            await result
+        samples.append(perf_counter() - began)
+    return samples
+
+
+def run_benchmark(
+    name: str,
+    markets: SyntheticMarkets,
+    ops: int,
+    warmup: Optional[int] = None,
+) -> BenchmarkResult:
+    """
+    Build and time one benchmark.
+
+    Args:
+        name: Key of BENCHMARKS
+        markets: Data generator (seeded)
+        ops: Timed calls
+        warmup: Untimed calls first (default: 10% of ops, at least 1)
+    """
+    build, _ = BENCHMARKS[name]
+    warmup = max(1, ops // 10) if warmup is None else warmup
+    try:
+        workload = build(markets, warmup + ops)
+        gc.collect()
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(_time_ops(workload.op, 0, warmup))
+            samples = loop.run_until_complete(_time_ops(workload.op, warmup, ops))
+        finally:
+            loop.close()
+    except Exception as e:
+        logger.error(f"Benchmark {name} failed: {e}")
+        return BenchmarkResult(name=name, ops=0, items=0, total_sec=0.0, error=str(e))
+
+    return BenchmarkResult(
+        name=name,
+        ops=ops,
+        items=ops * workload.items_per_op,
+        total_sec=sum(samples),
+        latency_ms=_latency_summary(samples),
+        params=workload.params,
+    )
+
+
+def run_benchmarks(
+    names: Optional[Sequence[str]] = None,
+    seed: int = 42,
+    scale: float = 1.0,
+) -> List[BenchmarkResult]:
+    """
+    Run benchmarks (all by default), each on freshly seeded data.
+
+    Args:
+        names: Subset of BENCHMARKS to run
+        seed: Synthetic data seed
+        scale: Multiplier on each benchmark's default number of calls
+    """
+    unknown = [n for n in names or [] if n not in BENCHMARKS]
+    if unknown:
+        raise KeyError(f"Unknown benchmarks: {unknown} (choose from {sorted(BENCHMARKS)})")
+
+    results = []
+    previous_disable = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    try:
+        for name in names or list(BENCHMARKS):
+            ops = max(1, int(BENCHMARKS[name][1] * scale))
+            results.append(run_benchmark(name, SyntheticMarkets(seed), ops))
+    finally:
+        logging.disable(previous_disable)
+    return results
+
+
+# =============================================================================
+# RESULTS FILES
+# =============================================================================
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, timeout=5, check=True,
+        )
+        commit = out.stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip()
+        return f"{commit}-dirty" if dirty else commit
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def results_document(results: List[BenchmarkResult], seed: int, scale: float) -> Dict[str, Any]:
+    """JSON-serializable results with the environment they were measured in."""
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "scale": scale,
+        },
+        "results": [r.to_dict() for r in results],
+    }
+
+
+def load_results(path: str) -> List[BenchmarkResult]:
+    with open(path) as f:
+        data = json.load(f)
+    return [BenchmarkResult.from_dict(r) for r in data.get("results", [])]
+
+
+def compare_results(
+    baseline: List[BenchmarkResult],
+    current: List[BenchmarkResult],
+    threshold_pct: float = 10.0,
+) -> List[Dict[str, Any]]:
+    """
+    Per-benchmark change in p50 latency and throughput.
+
+    A benchmark regressed when its p50 latency rose, or its throughput
+    fell, by more than threshold_pct.
+    """
+    base = {r.name: r for r in baseline if not r.error}
+    rows = []
+    for result in current:
+        before = base.get(result.name)
+        if before is None or result.error:
+            continue
+        p50_before = before.latency_ms.get("p50", 0.0)
+        p50_after = result.latency_ms.get("p50", 0.0)
+        p50_change = (p50_after - p50_before) / p50_before * 100 if p50_before else 0.0
+        tp_change = (
+            (result.throughput - before.throughput) / before.throughput * 100
+            if before.throughput else 0.0
+        )
+        rows.append({
+            "name": result.name,
+            "p50_ms_before": p50_before,
+            "p50_ms_after": p50_after,
+            "p50_change_pct": round(p50_change, 2),
+            "throughput_change_pct": round(tp_change, 2),
+            "regressed": p50_change > threshold_pct or tp_change < -threshold_pct,
+        })
+    return rows
+
+
+def _format_table(headers: List[str], table: List[List[str]]) -> str:
+    widths = [max(len(h), *(len(row[c]) for row in table)) for c, h in enumerate(headers)]
+    lines = [
+        "  ".join(h.ljust(w) for h, w in zip(headers, widths)),
+        "  ".join("-" * w for w in widths),
+    ]
+    lines += ["  ".join(c.ljust(w) for c, w in zip(row, widths)) for row in table]
+    return "\n".join(lines)
+
+
+def format_results_table(results: List[BenchmarkResult]) -> str:
+    if not results:
+        return "(no results)"
+    headers = ["benchmark", "ops", "items/s", "mean ms", "p50 ms", "p90 ms", "p99 ms", "max ms"]
+    table = []
+    for r in results:
+        if r.error:
+            table.append([r.name, "-", f"error: {r.error}"] + [""] * 5)
+            continue
+        lat = r.latency_ms
+        table.append([r.name, str(r.ops), f"{r.throughput:,.0f}"] + [
+            f"{lat.get(k, 0.0):.4g}" for k in ("mean", "p50", "p90", "p99", "max")
+        ])
+    return _format_table(headers, table)
+
+
+def format_comparison_table(rows: List[Dict[str, Any]]) -> str:
+    if not rows:
+        return "(nothing to compare)"
+    headers = ["benchmark", "p50 before", "p50 after", "p50 change", "throughput change", ""]
+    table = [
+        [
+            row["name"],
+            f"{row['p50_ms_before']:.4g}",
+            f"{row['p50_ms_after']:.4g}",
+            f"{row['p50_change_pct']:+.1f}%",
+            f"{row['throughput_change_pct']:+.1f}%",
+            "REGRESSION" if row["regressed"] else "",
+        ]
+        for row in rows
+    ]
+    return _format_table(headers, table)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="PolyBot hot-path benchmarks")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Benchmarks to run")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiplier on calls per benchmark")
+    parser.add_argument("--output", default="benchmark_results.json", help="Results JSON file")
+    parser.add_argument("--compare", help="Earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Regression threshold (%%)")
+    parser.add_argument(
+        "--fail-on-regression", type=float, metavar="PCT",
+        help="Exit 1 if any benchmark regressed by more than PCT%% (implies --threshold PCT)",
+    )
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (_, ops) in BENCHMARKS.items():
+            print(f"{name:28s} {ops:>8,d} calls")
+        return 0
+
+    results = run_benchmarks(args.only, seed=args.seed, scale=args.scale)
+    print(format_results_table(results))
+
+    with open(args.output, "w") as f:
+        json.dump(results_document(results, args.seed, args.scale), f, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if not args.compare:
+        return 0
+    threshold = args.fail_on_regression if args.fail_on_regression is not None else args.threshold
+    rows = compare_results(load_results(args.compare), results, threshold)
+    print(f"\nCompared with {args.compare} (threshold {threshold:g}%):")
+    print(format_comparison_table(rows))
+    if args.fail_on_regression is not None and any(row["regressed"] for row in rows):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+"""
+Parameter Sweep Runner for PolyBot
+
+Evaluates strategy thresholds (spike magnitude, pairs z-score entries,
+grid spacing, ...) against a recorded tick tape instead of tuning them
+by hand in TradingConfig/Supabase and waiting days for live results.
+
+Parameter combinations come from a ParameterGrid (exhaustive) or a
+RandomSearch (seeded sampling). They are split into chunks and sharded
+across a ProcessPoolExecutor. Every worker opens the same tape with
+np.load(mmap_mode="r") once at start-up, so the tape is shared through
+the page cache and throughput scales with the number of cores.
+
+Usage:
+    sweep = ParameterSweep("spike_hunter", "/data/ticks/poly.npy")
+    results = sweep.run(ParameterGrid({
+        "min_magnitude_pct": [1.0, 2.0, 3.0],
+        "max_duration_sec": [15.0, 30.0, 60.0],
+    }))
+    print(format_sweep_table(results, top=10))
+
+CLI:
+    python -m src.simulation.param_sweep --tape ticks.npy \\
+        --strategy spike_hunter \\
+        --grid '{"min_magnitude_pct": [1, 2, 3]}'
+"""
+
+import argparse
+import importlib
+import itertools
+import json
+import logging
+import math
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .replay import REPLAY_EVALUATORS, TickTape
+
+logger = logging.getLogger(__name__)
+
+
+Evaluator = Callable[[TickTape, Dict[str, Any]], Dict[str, float]]
+
+
+class ParameterGrid:
+    """Exhaustive cartesian product of candidate values per parameter."""
+
+    def __init__(self, grid: Dict[str, Sequence[Any]]):
+        self.grid = {k: list(v) for k, v in grid.items()}
+
+    def __len__(self) -> int:
+        return math.prod(len(v) for v in self.grid.values()) if self.grid else 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        keys = list(self.grid)
+        for values in itertools.product(*(self.grid[k] for k in keys)):
+            yield dict(zip(keys, values))
+
+
+class RandomSearch:
+    """
+    Seeded random sampling from a search space.
+
+    Each parameter is either a list (sampled uniformly from its items),
+    a (low, high) tuple of ints (randint) or a (low, high) tuple of
+    floats (uniform).
+    """
+
+    def __init__(
+        self,
+        space: Dict[str, Union[Sequence[Any], Tuple[float, float]]],
+        n_samples: int,
+        seed: int = 42,
+    ):
+        self.space = space
+        self.n_samples = n_samples
+        self.seed = seed
+
+    def __len__(self) -> int:
+        return self.n_samples
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        rng = random.Random(self.seed)
+        for _ in range(self.n_samples):
+            params = {}
+            for name, spec in self.space.items():
+                if isinstance(spec, tuple) and len(spec) == 2:
+                    low, high = spec
+                    if isinstance(low, int) and isinstance(high, int):
+                        params[name] = rng.randint(low, high)
+                    else:
+                        params[name] = rng.uniform(low, high)
+                else:
+                    params[name] = rng.choice(list(spec))
+            yield params
+
+
+@dataclass
+class SweepResult:
+    """Metrics for one parameter combination."""
+    params: Dict[str, Any]
+    metrics: Dict[str, float] = field(default_factory=dict)
+    elapsed_sec: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "params": self.params,
+            "metrics": self.metrics,
+            "elapsed_sec": round(self.elapsed_sec, 4),
+            "error": self.error,
+        }
+
+
+# =============================================================================
+# WORKER SIDE
+# =============================================================================
+# Globals are per worker process, set once by _init_worker.
+
+_worker_tape: Optional[TickTape] = None
+_worker_evaluator: Optional[Evaluator] = None
+
+
+def resolve_evaluator(evaluator: Union[str, Evaluator]) -> Evaluator:
+    """Accept a callable, a REPLAY_EVALUATORS name or a 'module:function' path."""
+    if callable(evaluator):
+        return evaluator
+    if evaluator in REPLAY_EVALUATORS:
+        return REPLAY_EVALUATORS[evaluator]
+    if ":" in evaluator:
+        module_name, func_name = evaluator.split(":", 1)
+        return getattr(importlib.import_module(module_name), func_name)
+    raise ValueError(
+        f"Unknown evaluator '{evaluator}'. "
+        f"Use one of {sorted(REPLAY_EVALUATORS)} or 'module:function'"
+    )
+
+
+def _init_worker(tape_path: str, evaluator: Union[str, Evaluator]) -> None:
+    global _worker_tape, _worker_evaluator
+    # Replays are chatty at INFO; keep workers quiet
+    logging.getLogger("src").setLevel(logging.WARNING)
+    _worker_tape = TickTape.load(tape_path, mmap=True)
+    _worker_evaluator = resolve_evaluator(evaluator)
+
+
+def _evaluate(tape: TickTape, evaluator: Evaluator, params: Dict[str, Any]) -> SweepResult:
+    start = time.perf_counter()
+    try:
+        metrics = evaluator(tape, dict(params))
+        return SweepResult(params, metrics, time.perf_counter() - start)
+    except Exception as e:
+        return SweepResult(params, {}, time.perf_counter() - start, error=str(e))
+
+
+def _run_chunk(chunk: List[Dict[str, Any]]) -> List[SweepResult]:
+    return [_evaluate(_worker_tape, _worker_evaluator, params) for params in chunk]
+
+
+# =============================================================================
+# DRIVER
+# =============================================================================
+
+
+class ParameterSweep:
+    """
+    Shards parameter combinations across worker processes and ranks them.
+
+    Args:
+        evaluator: REPLAY_EVALUATORS name ("spike_hunter", "pairs_trading",
+            "grid_trading"), a 'module:function' path, or a picklable
+            module-level callable(tape, params) -> metrics dict
+        tape_path: Path to a tape written by TickTape.save()
+        objective: Metric used for ranking (higher is better)
+        max_workers: Worker processes (default: os.cpu_count())
+        chunks_per_worker: More chunks = better load balancing when
+            combinations vary in cost, at slightly more IPC
+        base_params: Fixed kwargs merged under every combination
+    """
+
+    def __init__(
+        self,
+        evaluator: Union[str, Evaluator],
+        tape_path: str,
+        objective: str = "total_pnl",
+        max_workers: Optional[int] = None,
+        chunks_per_worker: int = 4,
+        base_params: Optional[Dict[str, Any]] = None,
+    ):
+        self.evaluator = evaluator
+        self.tape_path = tape_path
+        self.objective = objective
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunks_per_worker = max(1, chunks_per_worker)
+        self.base_params = base_params or {}
+
+        # Fail fast in the parent rather than in every worker
+        resolve_evaluator(evaluator)
+
+    def _chunks(self, combos: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        n_chunks = min(len(combos), self.max_workers * self.chunks_per_worker)
+        # Round-robin so expensive neighbouring combos are spread out
+        return [combos[i::n_chunks] for i in range(n_chunks)]
+
+    def rank(self, results: List[SweepResult]) -> List[SweepResult]:
+        """Sort by objective (desc); failed or missing-metric runs go last."""
+        def key(r: SweepResult) -> Tuple[int, float]:
+            value = r.metrics.get(self.objective)
+            if r.error or value is None:
+                return (1, 0.0)
+            return (0, -float(value))
+        return sorted(results, key=key)
+
+    def run(self, space: Union[ParameterGrid, RandomSearch, List[Dict[str, Any]]]) -> List[SweepResult]:
+        """Evaluate every combination in space and return ranked results."""
+        combos = [{**self.base_params, **params} for params in space]
+        if not combos:
+            return []
+
+        start = time.perf_counter()
+        results: List[SweepResult] = []
+
+        if self.max_workers == 1:
+            # In-process path: handy for debugging and tiny sweeps
+            tape = TickTape.load(self.tape_path, mmap=True)
+            evaluator = resolve_evaluator(self.evaluator)
+            results = [_evaluate(tape, evaluator, params) for params in combos]
+        else:
+            chunks = self._chunks(combos)
+            with ProcessPoolExecutor(
+                max_workers=min(self.max_workers, len(chunks)),
+                initializer=_init_worker,
+                initargs=(self.tape_path, self.evaluator),
+            ) as pool:
+                futures = [pool.submit(_run_chunk, chunk) for chunk in chunks]
+                for future in as_completed(futures):
+                    results.extend(future.result())
+
+        elapsed = time.perf_counter() - start
+        failed = sum(1 for r in results if r.error)
+        logger.info(
+            f"📊 Sweep complete: {len(results)} combinations in {elapsed:.1f}s "
+            f"({len(results) / elapsed if elapsed > 0 else 0:.1f}/s, "
+            f"{self.max_workers} workers, {failed} failed)"
+        )
+        return self.rank(results)
+
+
+def format_sweep_table(
+    results: List[SweepResult],
+    top: Optional[int] = 20,
+    metrics: Optional[List[str]] = None,
+) -> str:
+    """Render ranked results as a fixed-width text table."""
+    rows = results[:top] if top else results
+    if not rows:
+        return "(no results)"
+
+    param_keys = sorted({k for r in rows for k in r.params})
+    metric_keys = metrics or sorted({k for r in rows for k in r.metrics}) or ["error"]
+    headers = ["rank"] + param_keys + metric_keys
+
+    def fmt(value: Any) -> str:
+        if isinstance(value, float):
+            return f"{value:.4g}"
+        return str(value)
+
+    table = []
+    for i, r in enumerate(rows, 1):
+        if r.error:
+            cells = [str(i)] + [fmt(r.params.get(k, "")) for k in param_keys]
+            cells += [f"error: {r.error}"] + [""] * (len(metric_keys) - 1)
+        else:
+            cells = [str(i)]
+            cells += [fmt(r.params.get(k, "")) for k in param_keys]
+            cells += [fmt(r.metrics.get(k, "")) for k in metric_keys]
+        table.append(cells)
+
+    widths = [
+        max(len(h), *(len(row[c]) for row in table))
+        for c, h in enumerate(headers)
+    ]
+    lines = [
+        "  ".join(h.ljust(w) for h, w in zip(headers, widths)),
+        "  ".join("-" * w for w in widths),
+    ]
+    lines += ["  ".join(c.ljust(w) for c, w in zip(row, widths)) for row in table]
+    return "\n".join(lines)
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="PolyBot parameter sweep runner")
+    parser.add_argument("--tape", required=True, help="Tick tape written by TickTape.save()")
+    parser.add_argument(
+        "--strategy", required=True,
+        help=f"One of {sorted(REPLAY_EVALUATORS)} or 'module:function'",
+    )
+    parser.add_argument("--grid", help="JSON dict of parameter -> list of values")
+    parser.add_argument("--random", help="JSON dict of parameter -> list or [low, high]")
+    parser.add_argument("--samples", type=int, default=100, help="Random search samples")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--base", help="JSON dict of fixed parameters")
+    parser.add_argument("--objective", default="total_pnl")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--output", help="Write all ranked results to this JSON file")
+    args = parser.parse_args(argv)
+
+    if bool(args.grid) == bool(args.random):
+        parser.error("Pass exactly one of --grid or --random")
+
+    if args.grid:
+        space: Union[ParameterGrid, RandomSearch] = ParameterGrid(json.loads(args.grid))
+    else:
+        raw = json.loads(args.random)
+        # JSON has no tuples: two-number lists are treated as ranges
+        spec = {
+            k: tuple(v) if len(v) == 2 and all(isinstance(x, (int, float)) for x in v) else v
+            for k, v in raw.items()
+        }
+        space = RandomSearch(spec, n_samples=args.samples, seed=args.seed)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    sweep = ParameterSweep(
+        args.strategy,
+        args.tape,
+        objective=args.objective,
+        max_workers=args.workers,
+        base_params=json.loads(args.base) if args.base else None,
+    )
+    results = sweep.run(space)
+    print(format_sweep_table(results, top=args.top))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump([r.to_dict() for r in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
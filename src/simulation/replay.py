@@ -0,0 +1,319 @@
+"""
+Tick Replay Engine for PolyBot
+
+Replays recorded tick data through the live strategy classes so their
+thresholds can be evaluated offline (see param_sweep.py for the
+multi-process sweep runner built on top of this).
+
+Tick tapes are stored as a flat NumPy structured array (.npy) plus a
+small JSON sidecar listing the symbols. The .npy file is opened with
+mmap_mode="r", so any number of worker processes can share one copy of
+the tape through the OS page cache instead of each loading its own.
+
+Evaluators:
+- spike_hunter: feeds ticks into SpikeHunterStrategy.update_price and
+  manages entries/exits in tape time
+- pairs_trading: drives PairsTradingStrategy scan cycles from tape prices
+- grid_trading: drives GridTradingStrategy (dry run fills) from tape prices
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from ..exchanges.base import MarketSnapshot, Ticker
+
+logger = logging.getLogger(__name__)
+
+
+# One row per tick. Symbols are stored as indexes into TickTape.symbols.
+TICK_DTYPE = np.dtype([
+    ("ts", "<f8"),       # Unix timestamp (seconds)
+    ("symbol", "<i4"),   # Index into TickTape.symbols
+    ("price", "<f8"),
+    ("volume", "<f8"),
+])
+
+
+class TickTape:
+    """
+    Time-ordered tick data shared by replay runs.
+
+    Usage:
+        tape = TickTape.from_records([(ts, "BTC/USDT", 97000.0, 1.2), ...])
+        tape.save("/data/ticks/btc_eth.npy")
+
+        tape = TickTape.load("/data/ticks/btc_eth.npy")  # memory-mapped
+    """
+
+    def __init__(self, symbols: List[str], ticks: np.ndarray):
+        self.symbols = list(symbols)
+        self.ticks = ticks
+
+    def __len__(self) -> int:
+        return len(self.ticks)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Tuple[float, str, float, float]],
+    ) -> "TickTape":
+        """Build a tape from (timestamp, symbol, price, volume) tuples."""
+        symbols: List[str] = []
+        index: Dict[str, int] = {}
+        rows = []
+        for ts, symbol, price, volume in records:
+            idx = index.get(symbol)
+            if idx is None:
+                idx = index[symbol] = len(symbols)
+                symbols.append(symbol)
+            rows.append((ts, idx, price, volume))
+
+        ticks = np.array(rows, dtype=TICK_DTYPE)
+        # Stable sort keeps same-timestamp ticks in arrival order
+        ticks = ticks[np.argsort(ticks["ts"], kind="stable")]
+        return cls(symbols, ticks)
+
+    @staticmethod
+    def _symbols_path(path: str) -> str:
+        return f"{path}.symbols.json"
+
+    def save(self, path: str) -> None:
+        """Write the tape as <path> (.npy) plus <path>.symbols.json."""
+        with open(path, "wb") as f:
+            np.save(f, np.ascontiguousarray(self.ticks, dtype=TICK_DTYPE))
+        with open(self._symbols_path(path), "w") as f:
+            json.dump(self.symbols, f)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "TickTape":
+        """Open a saved tape. With mmap=True the ticks are not copied."""
+        ticks = np.load(path, mmap_mode="r" if mmap else None)
+        with open(cls._symbols_path(path)) as f:
+            symbols = json.load(f)
+        return cls(symbols, ticks)
+
+    def iter_ticks(
+        self, chunk_size: int = 65536
+    ) -> Iterable[Tuple[float, str, float, float]]:
+        """Yield (timestamp, symbol, price, volume) in tape order.
+
+        Rows are converted in chunks so a memory-mapped tape is paged in
+        gradually rather than copied whole into each process.
+        """
+        symbols = self.symbols
+        for start in range(0, len(self.ticks), chunk_size):
+            for ts, idx, price, volume in self.ticks[start:start + chunk_size].tolist():
+                yield ts, symbols[idx], price, volume
+
+
+class ReplayExchange:
+    """
+    Minimal stand-in for CCXTClient that serves the latest tape price.
+
+    Only the read-only calls the replayed strategies use are provided;
+    dry_run strategies never place orders through it.
+    """
+
+    exchange_id = "replay"
+
+    def __init__(self):
+        self._last: Dict[str, float] = {}
+        self._volume: Dict[str, float] = {}
+        self.now: float = 0.0
+
+    def set_price(self, symbol: str, price: float, volume: float, ts: float) -> None:
+        self._last[symbol] = price
+        self._volume[symbol] = volume
+        self.now = ts
+
+    def has_symbol(self, symbol: str) -> bool:
+        return symbol in self._last
+
+    async def get_snapshot(
+        self, symbols: Optional[Iterable[str]] = None, max_age_sec: Optional[float] = None
+    ) -> MarketSnapshot:
+        wanted = symbols if symbols is not None else self._last
+        return MarketSnapshot(tickers={
+            s: self._ticker(s) for s in wanted if s in self._last
+        })
+
+    async def get_ticker(self, symbol: str) -> Ticker:
+        if symbol not in self._last:
+            raise ValueError(f"No replay market data for symbol {symbol}")
+        return self._ticker(symbol)
+
+    def _ticker(self, symbol: str) -> Ticker:
+        price = self._last[symbol]
+        return Ticker(
+            symbol=symbol,
+            bid=price,
+            ask=price,
+            last=price,
+            volume_24h=self._volume.get(symbol, 0.0),
+            timestamp=datetime.fromtimestamp(self.now, tz=timezone.utc),
+        )
+
+
+# =============================================================================
+# EVALUATORS
+# =============================================================================
+# Each evaluator takes (tape, params) and returns a flat dict of metrics.
+# They must be module-level functions so they can be sent to worker processes.
+
+
+def replay_spike_hunter(tape: TickTape, params: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Replay ticks through SpikeHunterStrategy.
+
+    params are SpikeHunterStrategy constructor kwargs (min_magnitude_pct,
+    max_duration_sec, take_profit_pct, stop_loss_pct, max_hold_sec, ...).
+    Entries fill at the detected entry price; exits are evaluated on every
+    subsequent tick of the same market using tape time for max_hold_sec.
+    """
+    from ..strategies.spike_hunter import SpikeHunterStrategy, SpikeType
+
+    strategy = SpikeHunterStrategy(enabled=True, **params)
+    # market_id -> [(opp, entry_ts)]
+    open_by_market: Dict[str, List[Tuple[Any, float]]] = {}
+
+    for ts, market_id, price, volume in tape.iter_ticks():
+        positions = open_by_market.get(market_id)
+        if positions:
+            still_open = []
+            for opp, entry_ts in positions:
+                side_price = 1.0 - price if opp.spike_type == SpikeType.SPIKE_UP else price
+                if ts - entry_ts >= strategy.max_hold_sec:
+                    strategy.exit_position(opp.id, side_price, "timeout")
+                elif side_price >= opp.target_price:
+                    strategy.exit_position(opp.id, side_price, "target")
+                elif side_price <= opp.stop_loss_price:
+                    strategy.exit_position(opp.id, side_price, "stop_loss")
+                else:
+                    still_open.append((opp, entry_ts))
+            open_by_market[market_id] = still_open
+
+        opp = strategy.update_price(market_id, price, volume=volume, timestamp=ts)
+        if opp and strategy.enter_position(opp):
+            open_by_market.setdefault(market_id, []).append((opp, ts))
+
+    stats = strategy.stats
+    return {
+        "total_pnl": stats.total_pnl,
+        "trades": stats.trades_exited,
+        "win_rate": stats.win_rate,
+        "spikes_detected": stats.spikes_detected,
+        "open_positions": len(strategy.active_positions),
+        "largest_loss": stats.largest_loss,
+    }
+
+
+async def _drive_cycles(
+    tape: TickTape,
+    exchange: ReplayExchange,
+    interval_sec: float,
+    on_cycle: Callable[[], Any],
+) -> None:
+    """Advance the tape, running one strategy cycle every interval_sec of tape time."""
+    next_cycle: Optional[float] = None
+    for ts, symbol, price, volume in tape.iter_ticks():
+        exchange.set_price(symbol, price, volume, ts)
+        if next_cycle is None:
+            next_cycle = ts + interval_sec
+        elif ts >= next_cycle:
+            await on_cycle()
+            next_cycle = ts + interval_sec
+    await on_cycle()
+
+
+def replay_pairs_trading(tape: TickTape, params: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Replay ticks through PairsTradingStrategy.
+
+    params are PairsTradingStrategy kwargs (entry_zscore, exit_zscore,
+    stop_loss_zscore, position_size_usd, custom_pairs, ...). One
+    update/signal/manage cycle runs per scan_interval_sec of tape time.
+    """
+    from ..strategies.pairs_trading import PairsTradingStrategy
+
+    exchange = ReplayExchange()
+    params = dict(params)
+    interval = float(params.pop("scan_interval_sec", 60))
+    strategy = PairsTradingStrategy(
+        ccxt_client=exchange,
+        dry_run=True,
+        scan_interval_sec=int(interval),
+        **params,
+    )
+
+    async def cycle() -> None:
+        await strategy._update_pairs()
+        await strategy._check_signals()
+        await strategy._manage_positions()
+
+    asyncio.run(_drive_cycles(tape, exchange, interval, cycle))
+
+    stats = strategy.stats
+    return {
+        "total_pnl": float(stats.total_pnl),
+        "trades": stats.winning_trades + stats.losing_trades,
+        "win_rate": stats.winning_trades / max(stats.winning_trades + stats.losing_trades, 1),
+        "signals": stats.total_signals,
+        "open_positions": len(strategy.positions),
+        "unrealized_pnl": float(sum(p.total_pnl for p in strategy.positions.values())),
+    }
+
+
+def replay_grid_trading(tape: TickTape, params: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Replay ticks through GridTradingStrategy in dry-run mode.
+
+    params are GridTradingStrategy kwargs (default_range_pct,
+    default_grid_levels, default_investment_usd, stop_loss_pct, ...) plus
+    an optional "symbols" list (defaults to every symbol on the tape).
+    A grid is created per symbol at its first tick.
+    """
+    from ..strategies.grid_trading import GridTradingStrategy
+
+    exchange = ReplayExchange()
+    params = dict(params)
+    interval = float(params.pop("check_interval_sec", 30))
+    symbols = params.pop("symbols", None) or tape.symbols
+    max_grids = max(len(symbols), params.pop("max_grids", 0))
+    strategy = GridTradingStrategy(
+        ccxt_client=exchange,
+        dry_run=True,
+        check_interval_sec=int(interval),
+        max_grids=max_grids,
+        **params,
+    )
+    pending = set(symbols)
+
+    async def cycle() -> None:
+        for symbol in list(pending):
+            if exchange.has_symbol(symbol):
+                await strategy.create_grid(symbol)
+                pending.discard(symbol)
+        await strategy._check_grids()
+
+    asyncio.run(_drive_cycles(tape, exchange, interval, cycle))
+
+    stats = strategy.stats
+    return {
+        "total_pnl": float(stats.net_profit),
+        "trades": stats.total_round_trips,
+        "buy_fills": stats.total_buy_fills,
+        "sell_fills": stats.total_sell_fills,
+        "grids_stopped": sum(1 for g in strategy.grids.values() if not g.is_active),
+    }
+
+
+REPLAY_EVALUATORS: Dict[str, Callable[[TickTape, Dict[str, Any]], Dict[str, float]]] = {
+    "spike_hunter": replay_spike_hunter,
+    "pairs_trading": replay_pairs_trading,
+    "grid_trading": replay_grid_trading,
+}
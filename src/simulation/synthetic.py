@@ -0,0 +1,442 @@
+"""
+Synthetic Market Data for PolyBot
+
+Seeded generators for the inputs the hot paths consume, shaped like the
+payloads the real clients produce:
+
+- Polymarket events (gamma /events) with N outcomes whose prices sum to
+  roughly $1, a fraction of them mispriced enough to qualify as arb
+- Polymarket / Kalshi market lists (CrossPlatformScanner fetch format)
+  where a share of Kalshi markets restate a Polymarket question
+- Order books for matched pairs (polymarket_client / kalshi_client
+  OrderBook), including split markets and some crossed prices
+- Order book update streams as (ts, market_id, price, volume) records,
+  a random walk with occasional decaying spikes (TickTape.from_records
+  accepts them directly)
+- News headlines (NewsItem) built from the engine's keyword lists
+- Paper trading opportunities (simulate_opportunity keyword arguments)
+
+The same seed always yields the same data, so benchmark runs on two
+commits see identical inputs.
+
+Usage:
+    markets = SyntheticMarkets(seed=42)
+    events = markets.polymarket_events(500, outcomes=(2, 8))
+    poly, kalshi = markets.cross_platform_markets(200, 50)
+    ticks = markets.book_updates(n_markets=100, n_updates=50_000)
+"""
+
+import json
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+TickRecord = Tuple[float, str, float, float]     # (ts, market_id, price, volume)
+
+# (category, subject, predicate) - subjects/predicates reuse the news
+# engine's keywords so generated headlines match generated markets
+TOPICS: List[Tuple[str, str, str]] = [
+    ("politics", "Trump", "win the {year} election"),
+    ("politics", "Biden", "endorse a Senate candidate in {month}"),
+    ("politics", "Congress", "pass the budget bill by {month} {day}"),
+    ("politics", "Republican", "win the Senate vote on {month} {day}"),
+    ("politics", "Democrat", "lead the national poll in {month}"),
+    ("crypto", "Bitcoin", "close above ${level}k on {month} {day}"),
+    ("crypto", "Ethereum", "trade above ${level}00 by {month} {day}"),
+    ("crypto", "SEC", "approve a spot crypto ETF by {month}"),
+    ("crypto", "Binance", "list a new stablecoin in {month}"),
+    ("economics", "Fed", "cut interest rates in {month}"),
+    ("economics", "Inflation", "exceed {pct}% in {month}"),
+    ("economics", "Unemployment", "rise above {pct}% in {month}"),
+    ("economics", "GDP", "grow more than {pct}% in Q{quarter}"),
+    ("ai", "OpenAI", "release a new GPT model by {month} {day}"),
+    ("ai", "Google", "top the Gemini AI leaderboard in {month}"),
+    ("ai", "Anthropic", "announce a new Claude model by {month}"),
+    ("sports", "Chiefs", "win the Super Bowl in {year}"),
+    ("sports", "Lakers", "reach the NBA playoffs in {year}"),
+    ("sports", "Yankees", "win the World Series in {year}"),
+    ("sports", "Celtics", "win the NBA finals in {year}"),
+]
+
+CONTESTS: List[str] = [
+    "the {year} presidential election", "the NBA championship", "the Super Bowl",
+    "the next Fed chair nomination", "the {month} FOMC decision", "the World Series",
+    "Best Picture at the Oscars", "the Senate majority", "the Bitcoin monthly close",
+]
+
+CANDIDATES: List[str] = [
+    "Trump", "Newsom", "Vance", "Harris", "DeSantis", "Shapiro", "Whitmer", "Ramaswamy",
+    "Chiefs", "Eagles", "Lakers", "Celtics", "Yankees", "Dodgers", "Warsh", "Hassett",
+]
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+HEADLINE_EVENTS = [
+    "the latest poll", "a surprise announcement", "overnight trading",
+    "the committee hearing", "weekend reports", "the earnings call", "a court ruling",
+]
+
+
+class SyntheticMarkets:
+    """Seeded generator for prediction market data."""
+
+    def __init__(self, seed: int = 42, now: Optional[float] = None):
+        """
+        Args:
+            seed: Random seed (same seed -> same data)
+            now: Reference unix time for timestamps (default: time.time())
+        """
+        self.seed = seed
+        self.now = time.time() if now is None else now
+        self._rng = random.Random(seed)
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    def _hex_id(self, bits: int = 64) -> str:
+        return f"0x{self._rng.getrandbits(bits):0{bits // 4}x}"
+
+    def _fill(self, template: str) -> str:
+        rng = self._rng
+        return template.format(
+            year=rng.choice([2026, 2027, 2028]),
+            month=rng.choice(MONTHS),
+            day=rng.randint(1, 28),
+            level=rng.randint(60, 150),
+            pct=round(rng.uniform(1.0, 6.0), 1),
+            quarter=rng.randint(1, 4),
+        )
+
+    def question(self) -> Tuple[str, str, str]:
+        """(category, subject, question) for a random topic."""
+        category, subject, predicate = self._rng.choice(TOPICS)
+        return category, subject, f"Will {subject} {self._fill(predicate)}?"
+
+    def _price(self, low: float = 0.02, high: float = 0.98) -> float:
+        return round(self._rng.uniform(low, high), 3)
+
+    # -------------------------------------------------------------------------
+    # Polymarket events
+    # -------------------------------------------------------------------------
+
+    def polymarket_events(
+        self,
+        n_events: int,
+        outcomes: Tuple[int, int] = (2, 8),
+        mispriced_pct: float = 0.2,
+        expires_within_days: int = 14,
+    ) -> List[Dict[str, Any]]:
+        """
+        Gamma-style multi-outcome events.
+
+        Args:
+            n_events: Number of events
+            outcomes: (min, max) outcomes per event
+            mispriced_pct: Share of events whose prices sum 2-8% away from $1
+            expires_within_days: End dates fall within this many days
+        """
+        rng = self._rng
+        events = []
+        for _ in range(n_events):
+            n = rng.randint(*outcomes)
+            weights = [rng.expovariate(1.0) for _ in range(n)]
+            total = sum(weights)
+            if rng.random() < mispriced_pct:
+                book_sum = 1.0 + rng.choice([-1, 1]) * rng.uniform(0.02, 0.08)
+            else:
+                book_sum = 1.0 + rng.uniform(-0.005, 0.005)
+            prices = [max(0.001, round(w / total * book_sum, 3)) for w in weights]
+
+            contest = self._fill(rng.choice(CONTESTS))
+            candidates = rng.sample(CANDIDATES, min(n, len(CANDIDATES)))
+            candidates += [f"Other {i}" for i in range(n - len(candidates))]
+            end = datetime.fromtimestamp(self.now, timezone.utc) + timedelta(
+                days=rng.randint(1, max(1, expires_within_days)), hours=rng.randint(0, 23),
+            )
+            event_id = str(rng.randint(10_000, 999_999))
+            events.append({
+                "id": event_id,
+                "slug": f"{contest.lower().replace(' ', '-')}-{event_id}",
+                "title": f"Who will win {contest}?",
+                "endDate": end.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "markets": [
+                    {
+                        "id": str(rng.randint(100_000, 9_999_999)),
+                        "conditionId": self._hex_id(),
+                        "question": f"Will {candidate} win {contest}?",
+                        "outcomePrices": json.dumps([f"{p:.3f}", f"{1 - p:.3f}"]),
+                        "volume": round(rng.uniform(1_000, 500_000), 2),
+                    }
+                    for candidate, p in zip(candidates, prices)
+                ],
+            })
+        return events
+
+    # -------------------------------------------------------------------------
+    # Cross-platform market lists
+    # -------------------------------------------------------------------------
+
+    def cross_platform_markets(
+        self,
+        n_poly: int,
+        n_kalshi: int,
+        overlap_pct: float = 0.3,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Market lists as returned by CrossPlatformScanner.fetch_*_markets.
+
+        Args:
+            n_poly: Polymarket markets
+            n_kalshi: Kalshi markets
+            overlap_pct: Share of Kalshi markets restating a Polymarket question
+        """
+        rng = self._rng
+        poly = []
+        for _ in range(n_poly):
+            _, _, question = self.question()
+            yes = self._price(0.05, 0.95)
+            condition_id = self._hex_id()
+            poly.append({
+                "id": condition_id,
+                "conditionId": condition_id,
+                "question": question,
+                "yes_price": yes,
+                "no_price": round(1 - yes, 3),
+                "volume": round(rng.uniform(1_000, 2_000_000), 2),
+                "platform": "polymarket",
+            })
+
+        kalshi = []
+        for i in range(n_kalshi):
+            if poly and rng.random() < overlap_pct:
+                source = rng.choice(poly)
+                # Kalshi phrases the same question without "Will ... ?"
+                question = source["question"].removeprefix("Will ").rstrip("?")
+                yes = min(0.99, max(0.01, source["yes_price"] + rng.gauss(0, 0.03)))
+            else:
+                _, _, question = self.question()
+                yes = self._price(0.05, 0.95)
+            spread = rng.choice([0.01, 0.02, 0.03])
+            kalshi.append({
+                "id": f"KX{rng.choice(['BTC', 'FED', 'PRES', 'NBA', 'CPI', 'AI'])}-{i:05d}",
+                "question": question,
+                "yes_price": round(yes, 2),
+                "no_price": round(1 - yes, 2),
+                "yes_bid": round(max(0.01, yes - spread / 2), 2),
+                "yes_ask": round(min(0.99, yes + spread / 2), 2),
+                "volume": rng.randint(100, 50_000),
+                "platform": "kalshi",
+            })
+        return poly, kalshi
+
+    # -------------------------------------------------------------------------
+    # Order books
+    # -------------------------------------------------------------------------
+
+    def _ladder(self, mid: float, levels: int) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+        """(bids high->low, asks low->high) around mid with a 1-3 cent spread."""
+        rng = self._rng
+        half = rng.choice([0.005, 0.01, 0.015])
+        bids = [
+            (round(mid - half - 0.01 * i, 3), float(rng.randint(10, 2_000)))
+            for i in range(levels) if mid - half - 0.01 * i > 0.005
+        ]
+        asks = [
+            (round(mid + half + 0.01 * i, 3), float(rng.randint(10, 2_000)))
+            for i in range(levels) if mid + half + 0.01 * i < 0.995
+        ]
+        return bids, asks
+
+    def order_books(
+        self,
+        n_pairs: int,
+        levels: int = 10,
+        crossed_pct: float = 0.1,
+        split_pct: float = 0.15,
+        last_update: Optional[float] = None,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], List[Any]]:
+        """
+        Order books and market pairs for ArbitrageDetector.find_all_opportunities.
+
+        Args:
+            n_pairs: Matched market pairs
+            levels: Price levels per side
+            crossed_pct: Share of pairs priced 3-8 cents apart across venues
+            split_pct: Share of pairs where Polymarket splits the Kalshi market
+            last_update: Book timestamp (default: now on the detector's
+                utcnow().timestamp() clock)
+
+        Returns:
+            ({token_id: OrderBook}, {ticker: OrderBook}, [MarketPair])
+        """
+        from src.arbitrage.detector import MarketPair
+        from src.clients.kalshi_client import OrderBook as KalshiOrderBook
+        from src.clients.polymarket_client import OrderBook as PolymarketOrderBook
+
+        rng = self._rng
+        if last_update is None:
+            last_update = datetime.utcnow().timestamp()
+
+        def kalshi_book(mid: float) -> KalshiOrderBook:
+            bids, asks = self._ladder(mid, levels)
+            return KalshiOrderBook(
+                yes_bids={p: int(q) for p, q in bids},
+                yes_asks={p: int(q) for p, q in asks},
+                last_update=last_update,
+            )
+
+        poly_books: Dict[str, Any] = {}
+        kalshi_books: Dict[str, Any] = {}
+        pairs = []
+        for i in range(n_pairs):
+            _, _, name = self.question()
+            ticker = f"KXSYN-{i:05d}"
+            mid = rng.uniform(0.1, 0.9)
+            shift = rng.choice([-1, 1]) * rng.uniform(0.03, 0.08) if rng.random() < crossed_pct else 0.0
+            kalshi_books[ticker] = kalshi_book(min(0.95, max(0.05, mid + shift)))
+
+            if rng.random() < split_pct:
+                # Polymarket splits the range into 2-4 buckets that sum to mid
+                parts = rng.randint(2, 4)
+                weights = [rng.uniform(0.5, 1.5) for _ in range(parts)]
+                tokens = []
+                for w in weights:
+                    yes_token, no_token = self._hex_id(), self._hex_id()
+                    bids, asks = self._ladder(max(0.02, mid * w / sum(weights)), levels)
+                    poly_books[yes_token] = PolymarketOrderBook(bids=bids, asks=asks, last_update=last_update)
+                    tokens.append((yes_token, no_token))
+                pairs.append(MarketPair(
+                    polymarket_yes_token=tokens[0][0], polymarket_no_token=tokens[0][1],
+                    kalshi_ticker=ticker, name=name, category="synthetic",
+                    polymarket_tokens=tokens, is_split_market=True,
+                ))
+            else:
+                yes_token, no_token = self._hex_id(), self._hex_id()
+                bids, asks = self._ladder(mid, levels)
+                poly_books[yes_token] = PolymarketOrderBook(bids=bids, asks=asks, last_update=last_update)
+                pairs.append(MarketPair(
+                    polymarket_yes_token=yes_token, polymarket_no_token=no_token,
+                    kalshi_ticker=ticker, name=name, category="synthetic",
+                ))
+        return poly_books, kalshi_books, pairs
+
+    def book_updates(
+        self,
+        n_markets: int,
+        n_updates: int,
+        updates_per_sec: float = 200.0,
+        volatility: float = 0.002,
+        spike_rate: float = 0.001,
+        start: Optional[float] = None,
+    ) -> List[TickRecord]:
+        """
+        Price update stream across n_markets, in time order.
+
+        Each market random-walks (gaussian steps of `volatility`); with
+        probability spike_rate an update jumps 3-10% and the jump decays
+        back over the market's next updates.
+        """
+        rng = self._rng
+        markets = [self._hex_id() for _ in range(n_markets)]
+        level = {m: rng.uniform(0.15, 0.85) for m in markets}
+        offset = {m: 0.0 for m in markets}
+        ts = self.now if start is None else start
+
+        records: List[TickRecord] = []
+        for _ in range(n_updates):
+            ts += rng.expovariate(updates_per_sec)
+            market = rng.choice(markets)
+            level[market] = min(0.95, max(0.05, level[market] + rng.gauss(0, volatility)))
+            if rng.random() < spike_rate:
+                offset[market] += rng.choice([-1, 1]) * rng.uniform(0.03, 0.10) * level[market]
+            else:
+                offset[market] *= 0.8
+            price = min(0.99, max(0.01, level[market] + offset[market]))
+            records.append((ts, market, round(price, 4), float(rng.randint(1, 500))))
+        return records
+
+    # -------------------------------------------------------------------------
+    # News
+    # -------------------------------------------------------------------------
+
+    def headlines(self, n: int) -> List[Any]:
+        """NewsItems whose keywords come from NewsSentimentEngine.MARKET_KEYWORDS."""
+        from src.features.news_sentiment import (
+            NewsItem,
+            NewsSentimentEngine,
+            NewsSource,
+            SentimentLevel,
+        )
+
+        rng = self._rng
+        keyword_lists = NewsSentimentEngine.MARKET_KEYWORDS
+        positive = sorted(NewsSentimentEngine.POSITIVE_WORDS)
+        negative = sorted(NewsSentimentEngine.NEGATIVE_WORDS)
+        published = datetime.fromtimestamp(self.now, timezone.utc).replace(tzinfo=None)
+
+        items = []
+        for i in range(n):
+            category = rng.choice(sorted(keyword_lists))
+            _, subject, predicate = rng.choice([t for t in TOPICS if t[0] == category])
+            mood = rng.choice([-1, 0, 1])
+            verb = rng.choice(positive if mood > 0 else negative if mood < 0 else ["steady", "mixed"])
+            title = f"{subject} {verb} after {rng.choice(HEADLINE_EVENTS)}: {self._fill(predicate)}"
+            text = title.lower()
+            keywords = sorted({w for words in keyword_lists.values() for w in words if w in text})
+            items.append(NewsItem(
+                id=f"synthetic-{self.seed}-{i}",
+                source=rng.choice(list(NewsSource)),
+                title=title,
+                content=title,
+                url=f"https://news.example/{i}",
+                published_at=published - timedelta(minutes=rng.randint(0, 600)),
+                sentiment={1: SentimentLevel.VERY_BULLISH, -1: SentimentLevel.VERY_BEARISH}.get(
+                    mood, SentimentLevel.NEUTRAL
+                ),
+                sentiment_score=float(mood),
+                keywords=keywords,
+            ))
+        return items
+
+    # -------------------------------------------------------------------------
+    # Paper trading
+    # -------------------------------------------------------------------------
+
+    def paper_opportunities(self, n: int) -> List[Dict[str, Any]]:
+        """Keyword arguments for RealisticPaperTrader.simulate_opportunity."""
+        rng = self._rng
+        opportunities = []
+        for _ in range(n):
+            _, _, question = self.question()
+            kind = rng.choices(["cross_platform", "polymarket_single", "kalshi_single"], [3, 2, 1])[0]
+            if kind == "cross_platform":
+                platform_a, platform_b = rng.choice([("polymarket", "kalshi"), ("kalshi", "polymarket")])
+                price_a = self._price(0.1, 0.85)
+                spread = rng.uniform(0.5, 15.0)
+                price_b = min(0.99, price_a * (1 + spread / 100))
+                market_a, market_b = self._hex_id(), self._hex_id()
+            else:
+                platform_a = platform_b = kind.split("_")[0]
+                spread = rng.uniform(0.5, 12.0)
+                price_a = round(1 - spread / 100, 4)
+                price_b = 1.0
+                market_a = self._hex_id()
+                market_b = f"{market_a}_resolution"
+            opportunities.append({
+                "market_a_id": market_a,
+                "market_a_title": question,
+                "market_b_id": market_b,
+                "market_b_title": question,
+                "platform_a": platform_a,
+                "platform_b": platform_b,
+                "price_a": Decimal(str(price_a)),
+                "price_b": Decimal(str(round(price_b, 4))),
+                "spread_pct": Decimal(str(round(spread, 3))),
+                "trade_type": f"{kind}_{platform_a}",
+                "arbitrage_type": kind,
+            })
+        return opportunities
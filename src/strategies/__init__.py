@@ -25,249 +25,231 @@ OPTIONS STRATEGIES:
 - Iron Condor: Range-bound premium collection (20-40% APY)
 - Wheel Strategy: Systematic income generation (20-35% APY)
 - Vertical Spreads: Defined-risk directional trades
+
+Strategies are exported lazily: `from src.strategies import X` only imports
+the module that defines X, so enabling one strategy does not pull in the
+SDKs of all the others.
 """
 
-from .market_maker_v2 import (
-    MarketMakerStrategy,
-    MarketMakerStatus,
-    Quote,
-    Inventory,
-    MarketMakerStats,
-)
-
-from .news_arbitrage import (
-    NewsArbitrageStrategy,
-    NewsEvent,
-    NewsSource,
-    NewsArbOpportunity,
-    NewsArbStats,
-)
-
-from .funding_rate_arb import (
-    FundingRateArbStrategy,
-    FundingArbStatus,
-    FundingPosition,
-    FundingOpportunity,
-    FundingArbStats,
-)
-
-from .grid_trading import (
-    GridTradingStrategy,
-    GridStatus,
-    Grid,
-    GridConfig,
-    GridLevel,
-    GridStats,
-    GridType,
-)
-
-from .pairs_trading import (
-    PairsTradingStrategy,
-    PairsStatus,
-    TradingPair,
-    PairsPosition,
-    PairsStats,
-)
-
-from .stock_mean_reversion import (
-    StockMeanReversionStrategy,
-    MeanReversionPosition,
-    MeanReversionStats,
-    StockSignal,
-    SignalType,
-)
-
-from .stock_momentum import (
-    StockMomentumStrategy,
-    MomentumPosition,
-    MomentumScore,
-    MomentumStats,
-    MomentumSignal,
-)
-
-# NEW: Sector Rotation Strategy
-from .sector_rotation import (
-    SectorRotationStrategy,
-    SectorStrength,
-    SectorPosition,
-    RotationStats,
-    RotationSignal,
-    SECTOR_ETFS,
-    SECTOR_ROTATION_INFO,
-)
-
-# NEW: Dividend Growth Strategy
-from .dividend_growth import (
-    DividendGrowthStrategy,
-    DividendStock,
-    DividendPosition,
-    DividendStats,
-    DividendQuality,
-    DIVIDEND_ARISTOCRATS,
-    DIVIDEND_STRATEGY_INFO,
-)
-
-# NEW: Earnings Momentum Strategy
-from .earnings_momentum import (
-    EarningsMomentumStrategy,
-    EarningsEvent,
-    EarningsPosition,
-    EarningsStats,
-    EarningsSurprise,
-    EarningsStrategy,
-    EARNINGS_STRATEGY_INFO,
-)
-
-# NEW: Options Strategies
-from .options_strategies import (
-    CoveredCallStrategy,
-    CashSecuredPutStrategy,
-    IronCondorStrategy,
-    WheelStrategy,
-    VerticalSpreadStrategy,
-    OptionContract,
-    OptionPosition,
-    OptionsStrategyStats,
-    OptionType,
-    OptionStrategy,
-    WheelPhase,
-    create_options_strategy,
-    OPTIONS_STRATEGY_INFO,
-)
-
-# ============================================
-# ADVANCED FRAMEWORK MODULES (Phase 1)
-# ============================================
-
-# Position Sizing - Kelly Criterion
-from .position_sizing import (
-    KellyCriterion,
-    KellyPositionSizer,  # Alias for backward compatibility
-    KellyResult,
-    get_kelly_sizer,
-)
-
-# Market Regime Detection
-from .regime_detection import (
-    RegimeDetector,
-    MarketRegime,
-    RegimeState,
-    RegimeConfig,
-    get_regime_detector,
-)
-
-# Circuit Breaker System
-from .circuit_breaker import (
-    CircuitBreaker,
-    CircuitBreakerState,
-    CircuitBreakerStatus,
-    DrawdownLevel,
-    get_circuit_breaker,
-    DailyLossCircuitBreaker,
-)
-
-# ============================================
-# STRATEGY ENHANCEMENT MODULES (Phase 2)
-# ============================================
-
-# Time Decay Analysis (Prediction Markets)
-from .time_decay import (
-    TimeDecayAnalyzer,
-    TimeDecayAnalysis,
-    CorrelationArbDetector,
-    CorrelationOpportunity,
-    get_time_decay_analyzer,
-)
-
-# Order Flow Imbalance
-from .order_flow import (
-    OrderFlowAnalyzer,
-    OrderBookSnapshot,
-    OrderBookLevel,
-    OFIResult,
-    OFISignal,
-    TradeFlowAnalyzer,
-    TradeFlowAnalysis,
-    get_order_flow_analyzer,
-    get_trade_flow_analyzer,
-)
-
-# Stablecoin Depeg Detection
-from .depeg_detection import (
-    DepegDetector,
-    DepegAlert,
-    DepegSeverity,
-    DepegDirection,
-    DepegTradingOpportunity,
-    StablecoinPrice,
-    get_depeg_detector,
-)
-
-# Correlation-Based Position Limits
-from .correlation_limits import (
-    CorrelationTracker,
-    CorrelationPair,
-    CorrelationRiskAssessment,
-    Position,
-    get_correlation_tracker,
-)
-
-# ============================================
-# TWITTER-DERIVED STRATEGIES (2024)
-# ============================================
-
-# BTC Bracket Arbitrage (Intra-market arb on 15-min brackets)
-from .btc_bracket_arb import (
-    BTCBracketArbStrategy,
-    BracketOpportunity as BTCBracketOpportunity,
-    BTC_BRACKET_ARB_INFO,
-)
-
-# Bracket Compression (Mean reversion on stretched brackets)
-from .bracket_compression import (
-    BracketCompressionStrategy,
-    CompressionOpportunity as BracketCompressionOpportunity,
-    BRACKET_COMPRESSION_INFO,
-)
-
-# Kalshi Mention Market Sniping (Fast execution on resolved markets)
-from .kalshi_mention_snipe import (
-    KalshiMentionSnipeStrategy,
-    SnipeOpportunity as MentionMarketOpportunity,
-    KALSHI_MENTION_SNIPE_INFO,
-)
-
-# Whale Copy Trading (Track and copy profitable wallets)
-from .whale_copy_trading import (
-    WhaleCopyTradingStrategy,
-    WhaleProfile as TrackedWallet,
-    WhaleTrade as WalletTrade,
-    WHALE_COPY_TRADING_INFO as WHALE_COPY_INFO,
-)
-
-# Macro Board Strategy (Heavy exposure to macro events)
-from .macro_board import (
-    MacroBoardStrategy,
-    MacroTheme as MacroMarket,
-    MacroOpportunity as MacroPosition,
-    MACRO_BOARD_INFO,
-)
-
-# Fear Premium Contrarian (Trade against extreme sentiment)
-from .fear_premium_contrarian import (
-    FearPremiumContrarianStrategy,
-    FearPremiumOpportunity,
-    FEAR_PREMIUM_CONTRARIAN_INFO,
-)
-
-# Keep old imports for backward compatibility
-from .market_maker import MarketMaker, NewsArbitrageTracker
+from src.utils.lazy_import import lazy_exports
+
+_EXPORTS = {
+    "MarketMakerStrategy": ".market_maker_v2",
+    "MarketMakerStatus": ".market_maker_v2",
+    "Quote": ".market_maker_v2",
+    "QuoteAction": ".market_maker_v2",
+    "QuoteDiff": ".market_maker_v2",
+    "QuoteManager": ".market_maker_v2",
+    "Inventory": ".market_maker_v2",
+    "MarketMakerStats": ".market_maker_v2",
+
+    "NewsArbitrageStrategy": ".news_arbitrage",
+    "NewsEvent": ".news_arbitrage",
+    "NewsSource": ".news_arbitrage",
+    "NewsArbOpportunity": ".news_arbitrage",
+    "NewsArbStats": ".news_arbitrage",
+
+    "FundingRateArbStrategy": ".funding_rate_arb",
+    "FundingArbStatus": ".funding_rate_arb",
+    "FundingPosition": ".funding_rate_arb",
+    "FundingOpportunity": ".funding_rate_arb",
+    "FundingArbStats": ".funding_rate_arb",
+
+    "GridTradingStrategy": ".grid_trading",
+    "GridStatus": ".grid_trading",
+    "Grid": ".grid_trading",
+    "GridConfig": ".grid_trading",
+    "GridLevel": ".grid_trading",
+    "GridStats": ".grid_trading",
+    "GridType": ".grid_trading",
+
+    "PairsTradingStrategy": ".pairs_trading",
+    "PairsStatus": ".pairs_trading",
+    "TradingPair": ".pairs_trading",
+    "PairsPosition": ".pairs_trading",
+    "PairsStats": ".pairs_trading",
+
+    # Shared vectorized indicators for the stock strategies
+    "IndicatorEngine": ".indicator_engine",
+
+    "StockMeanReversionStrategy": ".stock_mean_reversion",
+    "MeanReversionPosition": ".stock_mean_reversion",
+    "MeanReversionStats": ".stock_mean_reversion",
+    "StockSignal": ".stock_mean_reversion",
+    "SignalType": ".stock_mean_reversion",
+
+    "StockMomentumStrategy": ".stock_momentum",
+    "MomentumPosition": ".stock_momentum",
+    "MomentumScore": ".stock_momentum",
+    "MomentumStats": ".stock_momentum",
+    "MomentumSignal": ".stock_momentum",
+
+    # NEW: Sector Rotation Strategy
+    "SectorRotationStrategy": ".sector_rotation",
+    "SectorStrength": ".sector_rotation",
+    "SectorPosition": ".sector_rotation",
+    "RotationStats": ".sector_rotation",
+    "RotationSignal": ".sector_rotation",
+    "SECTOR_ETFS": ".sector_rotation",
+    "SECTOR_ROTATION_INFO": ".sector_rotation",
+
+    # NEW: Dividend Growth Strategy
+    "DividendGrowthStrategy": ".dividend_growth",
+    "DividendStock": ".dividend_growth",
+    "DividendPosition": ".dividend_growth",
+    "DividendStats": ".dividend_growth",
+    "DividendQuality": ".dividend_growth",
+    "DIVIDEND_ARISTOCRATS": ".dividend_growth",
+    "DIVIDEND_STRATEGY_INFO": ".dividend_growth",
+
+    # NEW: Earnings Momentum Strategy
+    "EarningsMomentumStrategy": ".earnings_momentum",
+    "EarningsEvent": ".earnings_momentum",
+    "EarningsPosition": ".earnings_momentum",
+    "EarningsStats": ".earnings_momentum",
+    "EarningsSurprise": ".earnings_momentum",
+    "EarningsStrategy": ".earnings_momentum",
+    "EARNINGS_STRATEGY_INFO": ".earnings_momentum",
+
+    # NEW: Options Strategies
+    "CoveredCallStrategy": ".options_strategies",
+    "CashSecuredPutStrategy": ".options_strategies",
+    "IronCondorStrategy": ".options_strategies",
+    "WheelStrategy": ".options_strategies",
+    "VerticalSpreadStrategy": ".options_strategies",
+    "OptionContract": ".options_strategies",
+    "OptionPosition": ".options_strategies",
+    "OptionsStrategyStats": ".options_strategies",
+    "OptionType": ".options_strategies",
+    "OptionStrategy": ".options_strategies",
+    "WheelPhase": ".options_strategies",
+    "create_options_strategy": ".options_strategies",
+    "OPTIONS_STRATEGY_INFO": ".options_strategies",
+
+    "OptionChain": ".options_chain",
+    "OptionChainStore": ".options_chain",
+    "black_scholes_greeks": ".options_chain",
+
+    # ============================================
+    # ADVANCED FRAMEWORK MODULES (Phase 1)
+    # ============================================
+
+    # Position Sizing - Kelly Criterion
+    "KellyCriterion": ".position_sizing",
+    "KellyPositionSizer": ".position_sizing",  # Alias for backward compatibility
+    "KellyResult": ".position_sizing",
+    "get_kelly_sizer": ".position_sizing",
+
+    # Market Regime Detection
+    "RegimeDetector": ".regime_detection",
+    "MarketRegime": ".regime_detection",
+    "RegimeState": ".regime_detection",
+    "RegimeConfig": ".regime_detection",
+    "get_regime_detector": ".regime_detection",
+
+    # Circuit Breaker System
+    "CircuitBreaker": ".circuit_breaker",
+    "CircuitBreakerState": ".circuit_breaker",
+    "CircuitBreakerStatus": ".circuit_breaker",
+    "DrawdownLevel": ".circuit_breaker",
+    "get_circuit_breaker": ".circuit_breaker",
+    "DailyLossCircuitBreaker": ".circuit_breaker",
+
+    # ============================================
+    # STRATEGY ENHANCEMENT MODULES (Phase 2)
+    # ============================================
+
+    # Time Decay Analysis (Prediction Markets)
+    "TimeDecayAnalyzer": ".time_decay",
+    "TimeDecayAnalysis": ".time_decay",
+    "CorrelationArbDetector": ".time_decay",
+    "CorrelationOpportunity": ".time_decay",
+    "get_time_decay_analyzer": ".time_decay",
+
+    # Order Flow Imbalance
+    "OrderFlowAnalyzer": ".order_flow",
+    "BookRing": ".order_flow",
+    "OrderBookSnapshot": ".order_flow",
+    "OrderBookLevel": ".order_flow",
+    "OFIResult": ".order_flow",
+    "OFISignal": ".order_flow",
+    "TradeFlowAnalyzer": ".order_flow",
+    "TradeFlowAnalysis": ".order_flow",
+    "get_order_flow_analyzer": ".order_flow",
+    "get_trade_flow_analyzer": ".order_flow",
+
+    # Stablecoin Depeg Detection
+    "DepegDetector": ".depeg_detection",
+    "DepegAlert": ".depeg_detection",
+    "DepegSeverity": ".depeg_detection",
+    "DepegDirection": ".depeg_detection",
+    "DepegTradingOpportunity": ".depeg_detection",
+    "StablecoinPrice": ".depeg_detection",
+    "get_depeg_detector": ".depeg_detection",
+
+    # Correlation-Based Position Limits
+    "CorrelationTracker": ".correlation_limits",
+    "CorrelationPair": ".correlation_limits",
+    "CorrelationRiskAssessment": ".correlation_limits",
+    "Position": ".correlation_limits",
+    "get_correlation_tracker": ".correlation_limits",
+
+    # ============================================
+    # TWITTER-DERIVED STRATEGIES (2024)
+    # ============================================
+
+    # BTC Bracket Arbitrage (Intra-market arb on 15-min brackets)
+    "BTCBracketArbStrategy": ".btc_bracket_arb",
+    "BTCBracketOpportunity": (".btc_bracket_arb", "BracketOpportunity"),
+    "BTC_BRACKET_ARB_INFO": ".btc_bracket_arb",
+
+    # Bracket Compression (Mean reversion on stretched brackets)
+    "BracketCompressionStrategy": ".bracket_compression",
+    "BracketCompressionOpportunity": (".bracket_compression", "CompressionOpportunity"),
+    "BRACKET_COMPRESSION_INFO": ".bracket_compression",
+
+    # Kalshi Mention Market Sniping (Fast execution on resolved markets)
+    "KalshiMentionSnipeStrategy": ".kalshi_mention_snipe",
+    "MentionMarketOpportunity": (".kalshi_mention_snipe", "SnipeOpportunity"),
+    "KALSHI_MENTION_SNIPE_INFO": ".kalshi_mention_snipe",
+
+    # Whale Copy Trading (Track and copy profitable wallets)
+    "WhaleCopyTradingStrategy": ".whale_copy_trading",
+    "TrackedWallet": (".whale_copy_trading", "WhaleProfile"),
+    "WalletTrade": (".whale_copy_trading", "WhaleTrade"),
+    "WHALE_COPY_INFO": (".whale_copy_trading", "WHALE_COPY_TRADING_INFO"),
+
+    # Macro Board Strategy (Heavy exposure to macro events)
+    "MacroBoardStrategy": ".macro_board",
+    "MacroMarket": (".macro_board", "MacroTheme"),
+    "MacroPosition": (".macro_board", "MacroOpportunity"),
+    "MACRO_BOARD_INFO": ".macro_board",
+
+    # Fear Premium Contrarian (Trade against extreme sentiment)
+    "FearPremiumContrarianStrategy": ".fear_premium_contrarian",
+    "FearPremiumOpportunity": ".fear_premium_contrarian",
+    "FEAR_PREMIUM_CONTRARIAN_INFO": ".fear_premium_contrarian",
+
+    # Keep old names for backward compatibility
+    "MarketMaker": ".market_maker",
+    "NewsArbitrageTracker": ".market_maker",
+
+    # On-demand construction keyed by enable_* flags
+    "StrategyRegistry": ".registry",
+    "StrategyEntry": ".registry",
+    "STRATEGIES": ".registry",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Market Making (10-20% APR)
     "MarketMakerStrategy",
     "MarketMakerStatus",
     "Quote",
+    "QuoteAction",
+    "QuoteDiff",
+    "QuoteManager",
     "Inventory",
     "MarketMakerStats",
     # News Arbitrage (5-30% per event)
@@ -296,6 +278,8 @@ __all__ = [
     "TradingPair",
     "PairsPosition",
     "PairsStats",
+    # Indicator Engine
+    "IndicatorEngine",
     # Stock Mean Reversion (15-30% APY)
     "StockMeanReversionStrategy",
     "MeanReversionPosition",
@@ -346,6 +330,9 @@ __all__ = [
     "WheelPhase",
     "create_options_strategy",
     "OPTIONS_STRATEGY_INFO",
+    "OptionChain",
+    "OptionChainStore",
+    "black_scholes_greeks",
     # ========================================
     # ADVANCED FRAMEWORK (Phase 1)
     # ========================================
@@ -378,6 +365,7 @@ __all__ = [
     "get_time_decay_analyzer",
     # Order Flow Imbalance
     "OrderFlowAnalyzer",
+    "BookRing",
     "OrderBookSnapshot",
     "OrderBookLevel",
     "OFIResult",
@@ -432,5 +420,9 @@ __all__ = [
     # Legacy (backward compatibility)
     "MarketMaker",
     "NewsArbitrageTracker",
+    # Strategy Registry
+    "StrategyRegistry",
+    "StrategyEntry",
+    "STRATEGIES",
 ]
 
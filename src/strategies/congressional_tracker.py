@@ -21,12 +21,24 @@ Key Features:
 - Size positions relative to your bankroll
 - Delay execution to avoid front-running concerns
 - Track performance per politician
+
+Disclosure Cache:
+The House/Senate feeds are full dumps of every disclosure since 2012.
+Rather than re-download and re-parse them each scan, DisclosureCache
+keeps per feed the ETag/Last-Modified of the last response (an unchanged
+feed is a bodyless 304), an index of record digests (only records not in
+the index are parsed) and the parsed trades inside the retention window.
+With a cache_path it is saved after each scan that changed it and loaded
+on start, so a scan costs about as much as the number of new filings.
 """
 
 import asyncio
+import hashlib
 import logging
+import os
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Set
@@ -164,6 +176,253 @@ class CongressionalTrackerStats:
         return (self.copy_wins / total * 100) if total > 0 else 0.0
 
 
+# =============================================================================
+# Disclosure Cache
+# =============================================================================
+
+# Raw fields that identify a filing in the official feeds (cheaper to
+# digest than the whole record). Other feeds digest the whole record.
+HOUSE_KEY_FIELDS = (
+    'representative', 'ticker', 'asset_description', 'type', 'amount',
+    'transaction_date', 'disclosure_date', 'ptr_link',
+)
+SENATE_KEY_FIELDS = (
+    'senator', 'first_name', 'last_name', 'ticker', 'asset_description',
+    'type', 'transaction_type', 'amount', 'transaction_date', 'disclosure_date', 'ptr_link',
+)
+
+CACHE_FORMAT_VERSION = 1
+
+
+def disclosure_key(raw: Dict, fields: Optional[tuple] = None) -> str:
+    """Short digest identifying a raw disclosure record"""
+    if fields:
+        text = "\x1f".join(str(raw.get(f, '')) for f in fields)
+    else:
+        text = json.dumps(raw, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def _utc_naive(dt: datetime) -> datetime:
+    # Unusual Whales dates are tz-aware, the official feeds' are naive UTC
+    return dt.astimezone(timezone.utc).replace(tzinfo=None) if dt.tzinfo else dt
+
+
+def _trade_to_row(trade: CongressionalTrade) -> list:
+    return [
+        trade.id, trade.politician_name, trade.chamber.value, trade.party.value,
+        trade.state, trade.ticker, trade.asset_name, trade.transaction_type.value,
+        trade.transaction_date.isoformat(), trade.disclosure_date.isoformat(),
+        str(trade.amount_range_low), str(trade.amount_range_high),
+        str(trade.amount_estimated), trade.source, trade.disclosure_url,
+    ]
+
+
+def _trade_from_row(row: list) -> CongressionalTrade:
+    return CongressionalTrade(
+        id=row[0],
+        politician_name=row[1],
+        chamber=Chamber(row[2]),
+        party=Party(row[3]),
+        state=row[4],
+        ticker=row[5],
+        asset_name=row[6],
+        transaction_type=TransactionType(row[7]),
+        transaction_date=datetime.fromisoformat(row[8]),
+        disclosure_date=datetime.fromisoformat(row[9]),
+        amount_range_low=Decimal(row[10]),
+        amount_range_high=Decimal(row[11]),
+        amount_estimated=Decimal(row[12]),
+        source=row[13],
+        disclosure_url=row[14],
+    )
+
+
+@dataclass
+class DisclosureFeed:
+    """Cached state of one disclosure feed"""
+    name: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: Optional[float] = None            # time.time() of the last 200
+    keys: Set[str] = field(default_factory=set)   # Digests of records in the last response
+    trades: Dict[str, CongressionalTrade] = field(default_factory=dict)
+    parsed: int = 0                               # Records parsed since start (not persisted)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+    def ingest(
+        self,
+        records: List[Dict],
+        parse: Callable[[Dict], Optional[CongressionalTrade]],
+        key_fields: Optional[tuple] = None,
+    ) -> List[CongressionalTrade]:
+        """
+        Parse the records not seen in the previous response.
+
+        The index becomes the keys of this response, so records dropped
+        from the feed stop counting as seen. Records that don't parse are
+        indexed too (they would fail again). Returns the new trades.
+        """
+        keys = set()
+        new_trades = []
+        for raw in records:
+            key = disclosure_key(raw, key_fields)
+            keys.add(key)
+            if key in self.keys:
+                continue
+            self.parsed += 1
+            trade = parse(raw)
+            if trade:
+                self.trades[trade.id] = trade
+                new_trades.append(trade)
+        self.keys = keys
+        return new_trades
+
+    def prune(self, cutoff: datetime) -> int:
+        """Drop trades disclosed before cutoff; returns how many"""
+        stale = [tid for tid, t in self.trades.items() if _utc_naive(t.disclosure_date) < cutoff]
+        for tid in stale:
+            del self.trades[tid]
+        return len(stale)
+
+
+class DisclosureCache:
+    """Per-feed conditional-request validators, record index and parsed trades"""
+
+    def __init__(self, path: Optional[str] = None, retention_days: int = 90):
+        """
+        Args:
+            path: JSON file to persist to (None: in-memory only)
+            retention_days: Parsed trades older than this (by disclosure) are dropped
+        """
+        self.path = path
+        self.retention = timedelta(days=retention_days)
+        self._feeds: Dict[str, DisclosureFeed] = {}
+        self._dirty = False
+
+        # Stats
+        self.not_modified = 0
+        self.records_seen = 0
+
+        if path:
+            self.load()
+
+    def feed(self, name: str) -> DisclosureFeed:
+        if name not in self._feeds:
+            self._feeds[name] = DisclosureFeed(name)
+        return self._feeds[name]
+
+    def update(
+        self,
+        name: str,
+        records: Optional[List[Dict]],
+        parse: Callable[[Dict], Optional[CongressionalTrade]],
+        key_fields: Optional[tuple] = None,
+    ) -> List[CongressionalTrade]:
+        """
+        Fold a feed response into the cache and return the feed's trades.
+
+        records is None when the feed was unchanged or unavailable; the
+        cached trades are returned as they are.
+        """
+        feed = self.feed(name)
+        if records is not None:
+            new_trades = feed.ingest(records, parse, key_fields)
+            feed.fetched_at = time.time()
+            self.records_seen += len(records)
+            self._dirty = True
+            logger.debug(f"Disclosures {name}: {len(new_trades)} new trades in {len(records)} records")
+        if feed.prune(datetime.utcnow() - self.retention):
+            self._dirty = True
+        return list(feed.trades.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'path': self.path,
+            'not_modified': self.not_modified,
+            'records_seen': self.records_seen,
+            'records_parsed': sum(f.parsed for f in self._feeds.values()),
+            'feeds': {
+                name: {'records': len(f.keys), 'trades': len(f.trades), 'fetched_at': f.fetched_at}
+                for name, f in self._feeds.items()
+            },
+        }
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': CACHE_FORMAT_VERSION,
+            'feeds': {
+                name: {
+                    'etag': f.etag,
+                    'last_modified': f.last_modified,
+                    'fetched_at': f.fetched_at,
+                    'keys': sorted(f.keys),
+                    'trades': [_trade_to_row(t) for t in f.trades.values()],
+                }
+                for name, f in self._feeds.items()
+            },
+        }
+
+    def load(self) -> bool:
+        """Load the store from path; a missing or unreadable file starts empty"""
+        try:
+            with open(self.path) as fh:
+                data = json.load(fh)
+            if data.get('version') != CACHE_FORMAT_VERSION:
+                logger.info(f"Ignoring disclosure cache {self.path}: format {data.get('version')}")
+                return False
+            for name, entry in data.get('feeds', {}).items():
+                self._feeds[name] = DisclosureFeed(
+                    name=name,
+                    etag=entry.get('etag'),
+                    last_modified=entry.get('last_modified'),
+                    fetched_at=entry.get('fetched_at'),
+                    keys=set(entry.get('keys', ())),
+                    trades={row[0]: _trade_from_row(row) for row in entry.get('trades', ())},
+                )
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Could not load disclosure cache {self.path}: {e}")
+            self._feeds.clear()
+            return False
+
+        logger.info(
+            f"Loaded disclosure cache: "
+            + ", ".join(f"{n} {len(f.keys)} records/{len(f.trades)} trades" for n, f in self._feeds.items())
+        )
+        return True
+
+    def save(self) -> bool:
+        """Write the store atomically if it changed since the last save"""
+        if not self.path or not self._dirty:
+            return False
+        tmp = f"{self.path}.tmp"
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp, 'w') as fh:
+                json.dump(self.to_dict(), fh, separators=(',', ':'))
+            os.replace(tmp, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save disclosure cache {self.path}: {e}")
+            return False
+        self._dirty = False
+        return True
+
+
 class CongressionalTrackerStrategy:
     """
     Congressional Tracker Strategy
@@ -265,6 +524,8 @@ class CongressionalTrackerStrategy:
         bankroll_usd: float = 10000.0,  # Your total bankroll
         on_signal: Optional[Callable] = None,
         db_client=None,
+        cache_path: Optional[str] = None,
+        cache_retention_days: int = 90,
     ):
         self.tracked_politicians = set(tracked_politicians or self.DEFAULT_WATCHLIST)
         self.chambers = chambers
@@ -292,11 +553,8 @@ class CongressionalTrackerStrategy:
         # Pending copy signals
         self._pending_signals: List[CopySignal] = []
 
-        # Cache for API responses
-        self._house_cache: Optional[List[Dict]] = None
-        self._senate_cache: Optional[List[Dict]] = None
-        self._cache_time: Optional[datetime] = None
-        self._cache_ttl = timedelta(hours=1)
+        # Feed validators, record index and parsed trades (on disk if cache_path)
+        self._disclosures = DisclosureCache(cache_path, retention_days=cache_retention_days)
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
@@ -335,57 +593,68 @@ class CongressionalTrackerStrategy:
         # Default fallback
         return Decimal("1000"), Decimal("15000"), Decimal("8000")
 
-    async def fetch_house_trades(self) -> List[Dict]:
-        """Fetch trades from House Stock Watcher"""
-        # Check cache
-        if (self._house_cache and self._cache_time and
-            datetime.utcnow() - self._cache_time < self._cache_ttl):
-            return self._house_cache
+    async def _fetch_feed(
+        self,
+        name: str,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+    ) -> Optional[Any]:
+        """
+        Conditional GET of a disclosure feed.
 
+        Sends the validators of the last response; returns the decoded JSON
+        on 200 (and stores the new validators), or None when the feed is
+        unchanged (304) or the request failed.
+        """
         session = await self._get_session()
+        feed = self._disclosures.feed(name)
+        request_headers = {**(headers or {}), **feed.conditional_headers()}
 
+        async with session.get(url, params=params, headers=request_headers) as resp:
+            if resp.status == 304:
+                self._disclosures.not_modified += 1
+                logger.debug(f"{name} feed unchanged")
+                return None
+            if resp.status != 200:
+                raise aiohttp.ClientResponseError(
+                    resp.request_info, resp.history, status=resp.status, message=resp.reason or ""
+                )
+            data = await resp.json(content_type=None)
+            feed.etag = resp.headers.get('ETag')
+            feed.last_modified = resp.headers.get('Last-Modified')
+            return data
+
+    async def fetch_house_trades(self) -> Optional[List[Dict]]:
+        """Fetch trades from House Stock Watcher (None if unchanged/unavailable)"""
         try:
-            async with session.get(self.HOUSE_API) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    self._house_cache = data
-                    self._cache_time = datetime.utcnow()
-                    logger.info(f"Fetched {len(data)} House trades")
-                    return data
-                else:
-                    logger.error(f"House API error: {resp.status}")
-                    return self._house_cache or []
+            data = await self._fetch_feed("house", self.HOUSE_API)
+            if data is not None:
+                logger.info(f"Fetched {len(data)} House trades")
+            return data
         except Exception as e:
             logger.error(f"Error fetching House trades: {e}")
-            return self._house_cache or []
-
-    async def fetch_senate_trades(self) -> List[Dict]:
-        """Fetch trades from Senate Stock Watcher"""
-        session = await self._get_session()
+            return None
 
+    async def fetch_senate_trades(self) -> Optional[List[Dict]]:
+        """Fetch trades from Senate Stock Watcher (None if unchanged/unavailable)"""
         try:
-            async with session.get(self.SENATE_API) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    self._senate_cache = data
-                    logger.info(f"Fetched {len(data)} Senate trades")
-                    return data
-                else:
-                    logger.error(f"Senate API error: {resp.status}")
-                    return self._senate_cache or []
+            data = await self._fetch_feed("senate", self.SENATE_API)
+            if data is not None:
+                logger.info(f"Fetched {len(data)} Senate trades")
+            return data
         except Exception as e:
             logger.error(f"Error fetching Senate trades: {e}")
-            return self._senate_cache or []
+            return None
 
-    async def fetch_capitol_trades(self, days_back: int = 7) -> List[Dict]:
+    async def fetch_capitol_trades(self, days_back: int = 7) -> Optional[List[Dict]]:
         """
         Fetch trades from Capitol Trades (often 24-48h faster than official).
         
         Capitol Trades scrapes directly from House/Senate filing portals
         and often processes disclosures faster than the official APIs.
+        Returns None if unchanged/unavailable.
         """
-        session = await self._get_session()
-
         try:
             # Capitol Trades may require auth or have rate limits
             # This is a best-effort integration
@@ -397,41 +666,41 @@ class CongressionalTrackerStrategy:
                 'User-Agent': 'PolyBot Congressional Tracker/1.0',
             }
 
-            async with session.get(
+            data = await self._fetch_feed(
+                "capitol_trades",
                 self.CAPITOL_TRADES_API,
                 params=params,
                 headers=headers
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    trades = data.get('trades', data) if isinstance(
-                        data, dict
-                    ) else data
-                    logger.info(
-                        f"📊 Capitol Trades: Fetched {len(trades)} trades"
-                    )
-                    return trades
-                elif resp.status == 403:
-                    logger.debug(
-                        "Capitol Trades API requires auth/subscription"
-                    )
-                    return []
-                else:
-                    logger.debug(f"Capitol Trades API: {resp.status}")
-                    return []
+            )
+            if data is None:
+                return None
+            trades = data.get('trades', data) if isinstance(
+                data, dict
+            ) else data
+            logger.info(
+                f"📊 Capitol Trades: Fetched {len(trades)} trades"
+            )
+            return trades
+        except aiohttp.ClientResponseError as e:
+            if e.status == 403:
+                logger.debug(
+                    "Capitol Trades API requires auth/subscription"
+                )
+            else:
+                logger.debug(f"Capitol Trades API: {e.status}")
+            return None
         except Exception as e:
             logger.debug(f"Capitol Trades fetch error: {e}")
-            return []
+            return None
 
-    async def fetch_unusual_whales(self, limit: int = 100) -> List[Dict]:
+    async def fetch_unusual_whales(self, limit: int = 100) -> Optional[List[Dict]]:
         """
         Fetch from Unusual Whales Congress API.
         
         Premium service but often has fastest alerts.
         Free tier available at https://docs.unusualwhales.com/
+        Returns None if unchanged/unavailable.
         """
-        session = await self._get_session()
-
         # Check if API key is available
         api_key = None
         if self.db:
@@ -441,7 +710,7 @@ class CongressionalTrackerStrategy:
             logger.debug(
                 "No UNUSUAL_WHALES_API_KEY - skipping Unusual Whales API"
             )
-            return []
+            return None
 
         try:
             headers = {
@@ -450,26 +719,27 @@ class CongressionalTrackerStrategy:
             }
             params = {'limit': limit}
 
-            async with session.get(
+            data = await self._fetch_feed(
+                "unusual_whales",
                 self.UNUSUAL_WHALES_API,
                 headers=headers,
                 params=params
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    trades = data.get('data', data) if isinstance(
-                        data, dict
-                    ) else data
-                    logger.info(
-                        f"🐋 Unusual Whales: Fetched {len(trades)} trades"
-                    )
-                    return trades
-                else:
-                    logger.debug(f"Unusual Whales API: {resp.status}")
-                    return []
+            )
+            if data is None:
+                return None
+            trades = data.get('data', data) if isinstance(
+                data, dict
+            ) else data
+            logger.info(
+                f"🐋 Unusual Whales: Fetched {len(trades)} trades"
+            )
+            return trades
+        except aiohttp.ClientResponseError as e:
+            logger.debug(f"Unusual Whales API: {e.status}")
+            return None
         except Exception as e:
             logger.debug(f"Unusual Whales fetch error: {e}")
-            return []
+            return None
 
     async def check_twitter_alerts(self) -> List[Dict]:
         """
@@ -741,30 +1011,32 @@ class CongressionalTrackerStrategy:
         trades = []
         cutoff = datetime.utcnow() - timedelta(days=days_back)
 
-        # Primary sources - official APIs
+        # Primary sources - official APIs (only records new since the
+        # last response are parsed; the cache holds the rest)
         if self.chambers in [Chamber.HOUSE, Chamber.BOTH]:
             house_raw = await self.fetch_house_trades()
-            for raw in house_raw:
-                trade = self._parse_house_trade(raw)
-                if trade and trade.disclosure_date >= cutoff:
+            for trade in self._disclosures.update(
+                "house", house_raw, self._parse_house_trade, HOUSE_KEY_FIELDS
+            ):
+                if trade.disclosure_date >= cutoff:
                     trades.append(trade)
 
         if self.chambers in [Chamber.SENATE, Chamber.BOTH]:
             senate_raw = await self.fetch_senate_trades()
-            for raw in senate_raw:
-                trade = self._parse_senate_trade(raw)
-                if trade and trade.disclosure_date >= cutoff:
+            for trade in self._disclosures.update(
+                "senate", senate_raw, self._parse_senate_trade, SENATE_KEY_FIELDS
+            ):
+                if trade.disclosure_date >= cutoff:
                     trades.append(trade)
 
         # Alternative sources - often faster
         try:
             # Capitol Trades (often faster)
             capitol_raw = await self.fetch_capitol_trades(days_back=7)
-            for raw in capitol_raw:
-                # Capitol Trades uses similar format to House API
-                trade = self._parse_house_trade(raw)
-                if trade and trade.id not in self._seen_trades:
-                    trade.source = "capitol_trades"
+            for trade in self._disclosures.update(
+                "capitol_trades", capitol_raw, self._parse_capitol_trade
+            ):
+                if trade.id not in self._seen_trades:
                     trades.append(trade)
         except Exception as e:
             logger.debug(f"Capitol Trades fetch skipped: {e}")
@@ -772,10 +1044,10 @@ class CongressionalTrackerStrategy:
         try:
             # Unusual Whales (premium, fastest)
             uw_raw = await self.fetch_unusual_whales(limit=50)
-            for raw in uw_raw:
-                # Parse Unusual Whales format
-                trade = self._parse_unusual_whales_trade(raw)
-                if trade and trade.id not in self._seen_trades:
+            for trade in self._disclosures.update(
+                "unusual_whales", uw_raw, self._parse_unusual_whales_trade
+            ):
+                if trade.id not in self._seen_trades:
                     trades.append(trade)
         except Exception as e:
             logger.debug(f"Unusual Whales fetch skipped: {e}")
@@ -793,6 +1065,9 @@ class CongressionalTrackerStrategy:
         except Exception as e:
             logger.debug(f"Twitter alerts skipped: {e}")
 
+        # Persist what changed (off the loop: the file can be a few MB)
+        await asyncio.to_thread(self._disclosures.save)
+
         # Sort by disclosure date (newest first)
         trades.sort(key=lambda t: t.disclosure_date, reverse=True)
 
@@ -801,6 +1076,13 @@ class CongressionalTrackerStrategy:
         )
         return trades
 
+    def _parse_capitol_trade(self, raw: Dict) -> Optional[CongressionalTrade]:
+        """Parse a Capitol Trades record (similar format to House API)"""
+        trade = self._parse_house_trade(raw)
+        if trade:
+            trade.source = "capitol_trades"
+        return trade
+
     def _parse_unusual_whales_trade(
         self, raw: Dict
     ) -> Optional[CongressionalTrade]:
@@ -1028,6 +1310,9 @@ class CongressionalTrackerStrategy:
             if self.on_signal:
                 await self.on_signal(signal)
 
+        # Persist after the callbacks so execution never waits on the DB
+        await self.save_signals_to_db(signals)
+
         # Update politician count
         self.stats.politicians_tracked = len(self._politicians)
 
@@ -1096,13 +1381,18 @@ class CongressionalTrackerStrategy:
 
     async def save_signal_to_db(self, signal: CopySignal):
         """Save a copy signal to the database"""
-        if not self.db:
+        await self.save_signals_to_db([signal])
+
+    async def save_signals_to_db(self, signals: List[CopySignal]):
+        """Save copy signals and their original trades (one bulk write per table)"""
+        if not self.db or not signals:
             return
 
-        try:
-            # Save the original trade
+        trade_rows = []
+        signal_rows = []
+        for signal in signals:
             trade = signal.original_trade
-            self.db.table('polybot_congressional_trades').upsert({
+            trade_rows.append({
                 'id': trade.id,
                 'politician_name': trade.politician_name,
                 'chamber': trade.chamber.value,
@@ -1119,10 +1409,8 @@ class CongressionalTrackerStrategy:
                 'source': trade.source,
                 'copied': True,
                 'copy_trade_id': signal.signal_id,
-            }).execute()
-
-            # Save the copy signal
-            self.db.table('polybot_congressional_copy_trades').insert({
+            })
+            signal_rows.append({
                 'id': signal.signal_id,
                 'politician_name': signal.politician.name,
                 'original_trade_id': trade.id,
@@ -1134,12 +1422,15 @@ class CongressionalTrackerStrategy:
                 'created_at': signal.created_at.isoformat(),
                 'execute_after': signal.execute_after.isoformat() if signal.execute_after else None,
                 'status': 'pending',
-            }).execute()
-
-            logger.info(f"Saved signal {signal.signal_id} to database")
+            })
 
-        except Exception as e:
-            logger.error(f"Error saving signal to DB: {e}")
+        # Trades first: copy trades reference them
+        await self.db.upsert_many('polybot_congressional_trades', trade_rows, on_conflict='id')
+        saved = await self.db.insert_many('polybot_congressional_copy_trades', signal_rows)
+        if saved < len(signal_rows):
+            logger.error(f"Saved {saved}/{len(signal_rows)} signals to database")
+        else:
+            logger.info(f"Saved {saved} signals to database")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get current strategy statistics"""
@@ -1164,6 +1455,7 @@ class CongressionalTrackerStrategy:
                 )[:5]
             ],
             'pending_signals': len(self._pending_signals),
+            'disclosure_cache': self._disclosures.get_stats(),
         }
 
 
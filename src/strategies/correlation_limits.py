@@ -8,15 +8,20 @@ Academic Foundation:
 
 Positions in correlated assets multiply risk exponentially.
 This module tracks correlations and enforces position limits.
+
+Returns for all tracked symbols live in one time-aligned ReturnsMatrix
+with incrementally updated cross-moments, so the full correlation
+matrix (or one row of it) is a single vectorized call and pre-trade
+checks do not recompute Pearson correlations pair by pair.
 """
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Set
-from collections import deque
-import math
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,6 +81,220 @@ class CorrelationRiskAssessment:
     blocked_assets: List[str]  # Assets that would exceed limits
 
 
+class ReturnsMatrix:
+    """
+    Time-aligned ring buffer of returns for many symbols.
+
+    Prices are bucketed into bars of bar_seconds; when a bar closes, one
+    row of simple returns (close / previous close - 1) is appended for
+    every symbol that printed in both bars. Pairwise cross-moments over
+    the rows both symbols share are updated incrementally:
+
+        n[i, j]   = # rows where i and j both have a return
+        sx[i, j]  = sum of x_i over those rows
+        sxx[i, j] = sum of x_i^2 over those rows
+        sxy[i, j] = sum of x_i * x_j
+
+    Appending (and evicting) a row is one O(k^2) vectorized update for k
+    symbols; correlations are then read without touching the history.
+    Moments are recomputed exactly from the ring once per window rows to
+    discard floating-point drift.
+    """
+
+    def __init__(
+        self,
+        window: int = 100,
+        bar_seconds: float = 60.0,
+        min_samples: int = 9,
+        initial_capacity: int = 16,
+    ):
+        self.window = window
+        self.bar_seconds = bar_seconds
+        self.min_samples = min_samples
+
+        self._index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._capacity = 0
+
+        self._head = 0
+        self._rows = 0
+        self._rows_since_resync = 0
+        self._bar: Optional[int] = None
+        self.version = 0  # Bumped whenever a row is committed
+
+        self._corr_cache: Optional[np.ndarray] = None
+        self._corr_cache_version = -1
+        self._row_cache: Dict[int, np.ndarray] = {}
+        self._row_cache_version = -1
+
+        self._returns = np.zeros((window, 0))
+        self._valid = np.zeros((window, 0))
+        self._last_close = np.zeros(0)
+        self._pending = np.zeros(0)
+        self._n = np.zeros((0, 0))
+        self._sx = np.zeros((0, 0))
+        self._sxx = np.zeros((0, 0))
+        self._sxy = np.zeros((0, 0))
+        self._grow(initial_capacity)
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def index_of(self, symbol: str) -> Optional[int]:
+        return self._index.get(symbol)
+
+    def _grow(self, capacity: int) -> None:
+        """Resize per-symbol arrays, preserving existing data."""
+        old = self._capacity
+        extra = capacity - old
+
+        def pad2(a: np.ndarray) -> np.ndarray:
+            return np.pad(a, ((0, extra), (0, extra)))
+
+        self._returns = np.pad(self._returns, ((0, 0), (0, extra)))
+        self._valid = np.pad(self._valid, ((0, 0), (0, extra)))
+        self._last_close = np.concatenate([self._last_close, np.full(extra, np.nan)])
+        self._pending = np.concatenate([self._pending, np.full(extra, np.nan)])
+        self._n = pad2(self._n)
+        self._sx = pad2(self._sx)
+        self._sxx = pad2(self._sxx)
+        self._sxy = pad2(self._sxy)
+        self._capacity = capacity
+
+    def _ensure_symbol(self, symbol: str) -> int:
+        idx = self._index.get(symbol)
+        if idx is None:
+            idx = len(self._symbols)
+            if idx >= self._capacity:
+                self._grow(max(16, self._capacity * 2))
+            self._index[symbol] = idx
+            self._symbols.append(symbol)
+        return idx
+
+    def add_price(self, symbol: str, price: float, timestamp: float) -> None:
+        """Record a price; closes the current bar when a later bar starts."""
+        bar = int(timestamp // self.bar_seconds)
+        if self._bar is None:
+            self._bar = bar
+        elif bar > self._bar:
+            self._commit_bar()
+            self._bar = bar
+        # Late prints (bar < current) fold into the open bar
+        idx = self._ensure_symbol(symbol)
+        self._pending[idx] = price
+
+    def _commit_bar(self) -> None:
+        k = len(self._symbols)
+        pending = self._pending[:k]
+        last = self._last_close[:k]
+
+        has_price = ~np.isnan(pending) & (pending > 0)
+        valid = has_price & ~np.isnan(last)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.where(valid, pending / last - 1.0, 0.0)
+        m = valid.astype(np.float64)
+
+        self._last_close[:k] = np.where(has_price, pending, last)
+        self._pending[:k] = np.nan
+
+        if not valid.any():
+            return
+
+        if self._rows == self.window:
+            self._apply_row(self._returns[self._head, :k], self._valid[self._head, :k], -1.0)
+            self._rows_since_resync += 1
+        else:
+            self._rows += 1
+
+        self._returns[self._head, :] = 0.0
+        self._valid[self._head, :] = 0.0
+        self._returns[self._head, :k] = x
+        self._valid[self._head, :k] = m
+        self._head = (self._head + 1) % self.window
+        self._apply_row(x, m, 1.0)
+
+        if self._rows_since_resync >= self.window:
+            self._resync()
+        self.version += 1
+
+    def _apply_row(self, x: np.ndarray, m: np.ndarray, sign: float) -> None:
+        k = len(x)
+        self._n[:k, :k] += sign * np.outer(m, m)
+        self._sx[:k, :k] += sign * np.outer(x, m)
+        self._sxx[:k, :k] += sign * np.outer(x * x, m)
+        self._sxy[:k, :k] += sign * np.outer(x, x)
+
+    def _resync(self) -> None:
+        k = len(self._symbols)
+        x = self._returns[:self._rows, :k]
+        m = self._valid[:self._rows, :k]
+        self._n[:k, :k] = m.T @ m
+        self._sx[:k, :k] = x.T @ m
+        self._sxx[:k, :k] = (x * x).T @ m
+        self._sxy[:k, :k] = x.T @ x
+        self._rows_since_resync = 0
+
+    def _corr_from_moments(self, rows: slice, cols: slice) -> np.ndarray:
+        """Pearson correlation over shared rows for the given index block."""
+        n = np.round(self._n[rows, cols])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_i = self._sx[rows, cols] / n
+            mean_j = self._sx[cols, rows].T / n
+            cov = self._sxy[rows, cols] / n - mean_i * mean_j
+            var_i = self._sxx[rows, cols] / n - mean_i ** 2
+            var_j = self._sxx[cols, rows].T / n - mean_j ** 2
+            denom = np.sqrt(np.clip(var_i, 0.0, None) * np.clip(var_j, 0.0, None))
+            corr = np.where(denom > 1e-18, cov / denom, 0.0)
+        corr = np.clip(corr, -1.0, 1.0)
+        # Not enough shared history -> unknown
+        corr[n < self.min_samples] = np.nan
+        return corr
+
+    def correlation_matrix(self) -> np.ndarray:
+        """Full k x k correlation matrix (NaN where history is insufficient)."""
+        if self._corr_cache_version != self.version or self._corr_cache is None:
+            k = len(self._symbols)
+            corr = self._corr_from_moments(slice(0, k), slice(0, k))
+            idx = np.arange(k)
+            corr[idx, idx] = np.where(np.isnan(corr[idx, idx]), np.nan, 1.0)
+            self._corr_cache = corr
+            self._corr_cache_version = self.version
+        return self._corr_cache
+
+    def correlation_row(self, symbol: str) -> Optional[np.ndarray]:
+        """Correlations of one symbol against every tracked symbol (O(k))."""
+        i = self._index.get(symbol)
+        if i is None:
+            return None
+        if self._corr_cache_version == self.version and self._corr_cache is not None:
+            return self._corr_cache[i]
+        if self._row_cache_version != self.version:
+            self._row_cache.clear()
+            self._row_cache_version = self.version
+        row = self._row_cache.get(i)
+        if row is None or len(row) != len(self._symbols):
+            k = len(self._symbols)
+            row = self._corr_from_moments(slice(i, i + 1), slice(0, k))[0]
+            if not np.isnan(row[i]):
+                row[i] = 1.0
+            self._row_cache[i] = row
+        return row
+
+    def sample_count(self, symbol_a: str, symbol_b: str) -> int:
+        i = self._index.get(symbol_a)
+        j = self._index.get(symbol_b)
+        if i is None or j is None:
+            return 0
+        return int(round(self._n[i, j]))
+
+
 class CorrelationTracker:
     """
     Tracks correlations between assets and enforces position limits.
@@ -110,6 +329,7 @@ class CorrelationTracker:
         max_correlated_exposure_pct: float = 50.0,
         high_correlation_threshold: float = 0.7,
         history_window: int = 100,
+        bar_seconds: float = 60.0,
     ):
         """
         Initialize correlation tracker.
@@ -118,24 +338,35 @@ class CorrelationTracker:
             max_cluster_exposure_pct: Max exposure per cluster
             max_correlated_exposure_pct: Max combined correlated exposure
             high_correlation_threshold: Correlation level considered "high"
-            history_window: Number of observations for correlation calc
+            history_window: Number of return bars for correlation calc
+            bar_seconds: Bar size used to time-align prices across symbols
         """
         self.max_cluster_pct = max_cluster_exposure_pct
         self.max_correlated_pct = max_correlated_exposure_pct
         self.high_corr_threshold = high_correlation_threshold
         self.history_window = history_window
 
-        # Price history for correlation calculation
-        self._price_history: Dict[str, deque] = {}
-
-        # Calculated correlations
-        self._correlations: Dict[Tuple[str, str], CorrelationPair] = {}
+        # Time-aligned returns for all symbols
+        self._returns = ReturnsMatrix(
+            window=history_window,
+            bar_seconds=bar_seconds,
+        )
 
         # Manual cluster assignments
         self._clusters: Dict[str, Set[str]] = {}
+        self._cluster_cache: Dict[str, str] = {}
+        self._clusters_version = 0
+        self._cluster_exposures_key: Optional[Tuple[int, int]] = None
+        self._cluster_exposures: Dict[str, float] = {}
 
         # Current positions
         self._positions: Dict[str, Position] = {}
+        self._positions_version = 0
+        # (positions_version, tracked symbols) -> (matrix indexes, values)
+        self._position_arrays_key: Optional[Tuple[int, int]] = None
+        self._position_arrays: Tuple[np.ndarray, np.ndarray] = (
+            np.zeros(0, dtype=np.intp), np.zeros(0)
+        )
 
     def add_price(
         self,
@@ -151,14 +382,7 @@ class CorrelationTracker:
             price: Current price
             timestamp: Observation timestamp
         """
-        symbol = symbol.upper()
-        if symbol not in self._price_history:
-            self._price_history[symbol] = deque(maxlen=self.history_window)
-
-        self._price_history[symbol].append({
-            "price": price,
-            "timestamp": timestamp,
-        })
+        self._returns.add_price(symbol.upper(), price, timestamp.timestamp())
 
     def add_position(self, position: Position):
         """
@@ -168,6 +392,7 @@ class CorrelationTracker:
             position: Position to add/update
         """
         self._positions[position.symbol.upper()] = position
+        self._positions_version += 1
 
     def remove_position(self, symbol: str):
         """
@@ -179,6 +404,7 @@ class CorrelationTracker:
         symbol = symbol.upper()
         if symbol in self._positions:
             del self._positions[symbol]
+            self._positions_version += 1
 
     def set_cluster(self, cluster_name: str, symbols: List[str]):
         """
@@ -189,6 +415,8 @@ class CorrelationTracker:
             symbols: List of symbols in the cluster
         """
         self._clusters[cluster_name] = set(s.upper() for s in symbols)
+        self._cluster_cache.clear()
+        self._clusters_version += 1
 
     def calculate_correlation(
         self,
@@ -208,46 +436,19 @@ class CorrelationTracker:
         symbol_a = symbol_a.upper()
         symbol_b = symbol_b.upper()
 
-        if symbol_a not in self._price_history:
-            return None
-        if symbol_b not in self._price_history:
-            return None
-
-        history_a = list(self._price_history[symbol_a])
-        history_b = list(self._price_history[symbol_b])
-
-        if len(history_a) < 10 or len(history_b) < 10:
+        row = self._returns.correlation_row(symbol_a)
+        j = self._returns.index_of(symbol_b)
+        if row is None or j is None or np.isnan(row[j]):
             return None
 
-        # Align timestamps and calculate returns
-        returns_a = self._calculate_returns(history_a)
-        returns_b = self._calculate_returns(history_b)
-
-        # Use minimum common length
-        min_len = min(len(returns_a), len(returns_b))
-        if min_len < 5:
-            return None
-
-        returns_a = returns_a[-min_len:]
-        returns_b = returns_b[-min_len:]
-
-        # Calculate Pearson correlation
-        correlation = self._pearson_correlation(returns_a, returns_b)
-
-        pair = CorrelationPair(
+        return CorrelationPair(
             asset_a=symbol_a,
             asset_b=symbol_b,
-            correlation=correlation,
-            sample_count=min_len,
+            correlation=float(row[j]),
+            sample_count=self._returns.sample_count(symbol_a, symbol_b),
             last_updated=datetime.utcnow(),
         )
 
-        # Cache result
-        key = tuple(sorted([symbol_a, symbol_b]))
-        self._correlations[key] = pair
-
-        return pair
-
     def get_correlation(
         self,
         symbol_a: str,
@@ -263,18 +464,46 @@ class CorrelationTracker:
         Returns:
             Correlation coefficient or None
         """
-        key = tuple(sorted([symbol_a.upper(), symbol_b.upper()]))
-
-        if key in self._correlations:
-            pair = self._correlations[key]
-            # Refresh if stale (>1 hour old)
-            if (datetime.utcnow() - pair.last_updated).seconds < 3600:
-                return pair.correlation
-
-        # Calculate fresh
         pair = self.calculate_correlation(symbol_a, symbol_b)
         return pair.correlation if pair else None
 
+    def correlation_matrix(
+        self,
+        symbols: Optional[List[str]] = None,
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Get the correlation matrix in one vectorized call.
+
+        Args:
+            symbols: Restrict to these symbols (default: all tracked)
+
+        Returns:
+            (symbols, matrix) - NaN where shared history is insufficient
+            or the symbol is not tracked
+        """
+        full = self._returns.correlation_matrix()
+        if symbols is None:
+            return self._returns.symbols, full
+
+        symbols = [s.upper() for s in symbols]
+        idx = np.array([self._returns.index_of(s) if s in self._returns else -1
+                        for s in symbols], dtype=np.intp)
+        known = idx >= 0
+        sub = np.full((len(symbols), len(symbols)), np.nan)
+        sub[np.ix_(known, known)] = full[np.ix_(idx[known], idx[known])]
+        return symbols, sub
+
+    def correlation_row(self, symbol: str) -> Dict[str, float]:
+        """Correlations of one symbol against every tracked symbol."""
+        row = self._returns.correlation_row(symbol.upper())
+        if row is None:
+            return {}
+        return {
+            other: float(c)
+            for other, c in zip(self._returns.symbols, row)
+            if not np.isnan(c)
+        }
+
     def assess_portfolio_risk(
         self,
         portfolio_value: float,
@@ -304,15 +533,14 @@ class CorrelationTracker:
         # Calculate total exposure
         total_exposure = sum(p.value for p in self._positions.values())
 
-        # Find highly correlated pairs
-        highly_correlated = []
-        symbols = list(self._positions.keys())
-
-        for i, sym_a in enumerate(symbols):
-            for sym_b in symbols[i + 1:]:
-                corr = self.get_correlation(sym_a, sym_b)
-                if corr is not None and abs(corr) > self.high_corr_threshold:
-                    highly_correlated.append((sym_a, sym_b, corr))
+        # Find highly correlated pairs (one matrix slice, upper triangle)
+        symbols, corr = self.correlation_matrix(list(self._positions.keys()))
+        with np.errstate(invalid="ignore"):
+            hits = np.triu(np.abs(corr) > self.high_corr_threshold, k=1)
+        highly_correlated = [
+            (symbols[i], symbols[j], float(corr[i, j]))
+            for i, j in zip(*np.nonzero(hits))
+        ]
 
         # Calculate cluster exposures
         cluster_exposures = self._calculate_cluster_exposures()
@@ -420,61 +648,32 @@ class CorrelationTracker:
 
         return True, "Position allowed"
 
-    def _calculate_returns(
-        self,
-        history: List[dict],
-    ) -> List[float]:
-        """Calculate returns from price history."""
-        returns = []
-        for i in range(1, len(history)):
-            prev_price = history[i - 1]["price"]
-            curr_price = history[i]["price"]
-            if prev_price > 0:
-                ret = (curr_price - prev_price) / prev_price
-                returns.append(ret)
-        return returns
-
-    def _pearson_correlation(
-        self,
-        x: List[float],
-        y: List[float],
-    ) -> float:
-        """Calculate Pearson correlation coefficient."""
-        n = len(x)
-        if n == 0:
-            return 0.0
-
-        mean_x = sum(x) / n
-        mean_y = sum(y) / n
-
-        numerator = sum((x[i] - mean_x) * (y[i] - mean_y) for i in range(n))
-
-        sum_sq_x = sum((xi - mean_x) ** 2 for xi in x)
-        sum_sq_y = sum((yi - mean_y) ** 2 for yi in y)
-
-        denominator = math.sqrt(sum_sq_x * sum_sq_y)
-
-        if denominator == 0:
-            return 0.0
-
-        return numerator / denominator
-
     def _calculate_cluster_exposures(self) -> Dict[str, float]:
-        """Calculate exposure per cluster."""
-        exposures: Dict[str, float] = {}
+        """Calculate exposure per cluster (cached until positions/clusters change)."""
+        key = (self._positions_version, self._clusters_version)
+        if key != self._cluster_exposures_key:
+            exposures: Dict[str, float] = {}
+
+            for symbol, position in self._positions.items():
+                cluster = self._find_cluster(symbol)
+                if cluster not in exposures:
+                    exposures[cluster] = 0
+                exposures[cluster] += position.value
 
-        for symbol, position in self._positions.items():
-            cluster = self._find_cluster(symbol)
-            if cluster not in exposures:
-                exposures[cluster] = 0
-            exposures[cluster] += position.value
+            self._cluster_exposures = exposures
+            self._cluster_exposures_key = key
 
-        return exposures
+        return dict(self._cluster_exposures)
 
     def _find_cluster(self, symbol: str) -> str:
-        """Find cluster for an asset."""
+        """Find cluster for an asset (memoized until clusters change)."""
         symbol = symbol.upper()
+        cluster = self._cluster_cache.get(symbol)
+        if cluster is None:
+            cluster = self._cluster_cache[symbol] = self._lookup_cluster(symbol)
+        return cluster
 
+    def _lookup_cluster(self, symbol: str) -> str:
         # Check manual clusters
         for cluster_name, symbols in self._clusters.items():
             if symbol in symbols:
@@ -520,17 +719,31 @@ class CorrelationTracker:
     def _get_correlated_exposure(self, symbol: str) -> float:
         """Get total exposure correlated with a symbol."""
         symbol = symbol.upper()
-        exposure = 0
-
-        for other_symbol, position in self._positions.items():
-            if other_symbol == symbol:
-                continue
-
-            corr = self.get_correlation(symbol, other_symbol)
-            if corr is not None and abs(corr) > self.high_corr_threshold:
-                exposure += position.value
-
-        return exposure
+        row = self._returns.correlation_row(symbol)
+        if row is None or not self._positions:
+            return 0
+
+        idx, values = self._get_position_arrays()
+        with np.errstate(invalid="ignore"):
+            correlated = np.abs(row[idx]) > self.high_corr_threshold
+        correlated &= idx != self._returns.index_of(symbol)
+        return float(values[correlated].sum())
+
+    def _get_position_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Matrix indexes and values of positions that have return history."""
+        key = (self._positions_version, len(self._returns))
+        if key != self._position_arrays_key:
+            pairs = [
+                (self._returns.index_of(sym), pos.value)
+                for sym, pos in self._positions.items()
+                if sym in self._returns
+            ]
+            self._position_arrays = (
+                np.array([i for i, _ in pairs], dtype=np.intp),
+                np.array([v for _, v in pairs], dtype=np.float64),
+            )
+            self._position_arrays_key = key
+        return self._position_arrays
 
     def _generate_recommendations(
         self,
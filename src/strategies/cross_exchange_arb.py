@@ -17,6 +17,7 @@ Safety:
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -25,6 +26,8 @@ from enum import Enum
 
 from src.exchanges.ccxt_client import CCXTClient
 from src.exchanges.base import OrderSide, OrderType
+from src.exchanges.market_data import QuoteBoard
+from src.utils.metrics import pipeline_latency
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,8 @@ class ArbConfig:
     min_trade_size_usd: Decimal = Decimal("50")
     scan_interval_sec: int = 5
     symbols: List[str] = field(default_factory=lambda: ["BTC/USDT", "ETH/USDT", "SOL/USDT"])
+    use_streaming: bool = True      # Check on every quote update instead of polling
+    max_quote_age_sec: float = 10.0  # Ignore streamed quotes older than this
 
 @dataclass
 class CryptoArbOpportunity:
@@ -45,6 +50,7 @@ class CryptoArbOpportunity:
     sell_price: Decimal
     spread_pct: Decimal
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    detected_at: float = field(default_factory=time.monotonic, repr=False)  # time.monotonic()
 
     @property
     def gross_profit_pct(self) -> Decimal:
@@ -81,6 +87,10 @@ class CrossExchangeArbStrategy:
         self.is_running = False
         self._loop_task: Optional[asyncio.Task] = None
 
+        # Streaming mode: best bid/ask per (exchange, symbol)
+        self.quote_board: Optional[QuoteBoard] = None
+        self._last_signal: Dict[str, tuple] = {}  # symbol -> last reported opp
+
         # Stats
         self.opportunities_found = 0
         self.trades_executed = 0
@@ -99,11 +109,20 @@ class CrossExchangeArbStrategy:
                 await client.initialize()
 
         self.is_running = True
-        self._loop_task = asyncio.create_task(self._run_loop())
+        if self.config.use_streaming:
+            self.quote_board = QuoteBoard()
+            self.quote_board.on_update(self._on_quote_update)
+            for client in self.exchanges.values():
+                self.quote_board.subscribe(client, self.config.symbols)
+        else:
+            self._loop_task = asyncio.create_task(self._run_loop())
 
     async def stop(self):
         """Stop the arbitrage loop."""
         self.is_running = False
+        if self.quote_board:
+            await self.quote_board.stop()
+            self.quote_board = None
         if self._loop_task:
             self._loop_task.cancel()
             try:
@@ -149,6 +168,17 @@ class CrossExchangeArbStrategy:
                 continue
             tickers[ex_id] = result
 
+        await self._evaluate(symbol, tickers)
+
+    async def _on_quote_update(self, exchange_id: str, symbol: str):
+        """Streaming mode: re-check a symbol whenever any venue's quote changes."""
+        if not self.is_running or not self.quote_board:
+            return
+        quotes = self.quote_board.quotes_for(symbol, self.config.max_quote_age_sec)
+        await self._evaluate(symbol, quotes, dedupe=True)
+
+    async def _evaluate(self, symbol: str, tickers: Dict, dedupe: bool = False):
+        """Find the best cross-venue spread from per-exchange bid/ask quotes."""
         if len(tickers) < 2:
             return # Need at least 2 exchanges to arb
 
@@ -179,28 +209,47 @@ class CrossExchangeArbStrategy:
         spread = (best_sell_price - best_buy_price)
         spread_pct = (spread / best_buy_price) * 100
 
-        if spread_pct > self.config.min_profit_pct:
-            opp = CryptoArbOpportunity(
-                symbol=symbol,
-                buy_exchange=best_buy_ex,
-                sell_exchange=best_sell_ex,
-                buy_price=best_buy_price,
-                sell_price=best_sell_price,
-                spread_pct=spread_pct
-            )
-
-            self.opportunities_found += 1
-            logger.info(
-                 f"🎯 ARB FOUND: {symbol} | Spread: {spread_pct:.2f}% | "
-                 f"Buy {best_buy_ex} @ {best_buy_price} -> Sell {best_sell_ex} @ {best_sell_price}"
-            )
-
-            if self.on_opportunity:
-                self.on_opportunity(opp)
+        if spread_pct <= self.config.min_profit_pct:
+            self._last_signal.pop(symbol, None)
+            return
 
-            # Execute if not dry run
-            if not self.dry_run:
-                await self._execute_arb(opp)
+        if dedupe:
+            # Streams deliver many updates per price level; report each
+            # distinct opportunity once
+            signal = (best_buy_ex, best_sell_ex, best_buy_price, best_sell_price)
+            if self._last_signal.get(symbol) == signal:
+                return
+            self._last_signal[symbol] = signal
+
+        opp = CryptoArbOpportunity(
+            symbol=symbol,
+            buy_exchange=best_buy_ex,
+            sell_exchange=best_sell_ex,
+            buy_price=best_buy_price,
+            sell_price=best_sell_price,
+            spread_pct=spread_pct
+        )
+
+        self.opportunities_found += 1
+        # Streamed quotes carry their update time; polled tickers do not
+        book_times = [
+            getattr(tickers[ex], "updated_at", None) for ex in (best_buy_ex, best_sell_ex)
+        ]
+        if None not in book_times:
+            pipeline_latency.labels(
+                strategy="cross_exchange_arb", stage="book_to_detection"
+            ).observe(opp.detected_at - max(book_times))
+        logger.info(
+             f"🎯 ARB FOUND: {symbol} | Spread: {spread_pct:.2f}% | "
+             f"Buy {best_buy_ex} @ {best_buy_price} -> Sell {best_sell_ex} @ {best_sell_price}"
+        )
+
+        if self.on_opportunity:
+            self.on_opportunity(opp)
+
+        # Execute if not dry run
+        if not self.dry_run:
+            await self._execute_arb(opp)
 
     async def _execute_arb(self, opp: CryptoArbOpportunity):
         """
@@ -231,6 +280,10 @@ class CrossExchangeArbStrategy:
                 f"Sell on {opp.sell_exchange} @ {opp.sell_price}"
             )
             
+            pipeline_latency.labels(
+                strategy="cross_exchange_arb", stage="detection_to_submission"
+            ).observe(time.monotonic() - opp.detected_at)
+
             # Execute both legs simultaneously
             buy_task = buy_client.create_order(
                 symbol=opp.symbol,
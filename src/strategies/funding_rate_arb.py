@@ -348,13 +348,18 @@ class FundingRateArbStrategy:
                 list(self.monitored_symbols)
             )
 
+            # Prices for every symbol in one snapshot fetch
+            snapshot = await self.ccxt_client.get_snapshot(list(funding_rates))
+
             opportunities = []
 
             for symbol, rate in funding_rates.items():
                 try:
                     # Get spot price for basis calculation
                     spot_symbol = symbol.replace(":USDT", "").replace("/USDT", "/USDT")
-                    ticker = await self.ccxt_client.get_ticker(symbol)
+                    ticker = snapshot.get(symbol)
+                    if ticker is None:
+                        raise ValueError("no ticker in market snapshot")
 
                     spot_price = Decimal(str(ticker.last))
                     futures_price = Decimal(str(ticker.last))  # For perps, use mark
@@ -26,11 +26,14 @@ Risks:
 """
 
 import asyncio
+import bisect
+import heapq
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_DOWN
-from typing import Dict, List, Optional, Callable, Set
+from typing import Deque, Dict, List, Optional, Callable, Set, Tuple
 from enum import Enum
 import uuid
 
@@ -163,6 +166,44 @@ class GridStats:
         }
 
 
+class LevelIndex:
+    """
+    Price-sorted index of a grid's open levels on one side.
+
+    Keys are (price, position in Grid.levels), so the levels a price move
+    crosses are found with a binary search instead of scanning the grid.
+    """
+
+    __slots__ = ("_keys",)
+
+    def __init__(self):
+        self._keys: List[Tuple[Decimal, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, price: Decimal, pos: int) -> None:
+        bisect.insort(self._keys, (price, pos))
+
+    def discard(self, price: Decimal, pos: int) -> None:
+        i = bisect.bisect_left(self._keys, (price, pos))
+        if i < len(self._keys) and self._keys[i] == (price, pos):
+            del self._keys[i]
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+    def at_or_above(self, price: Decimal) -> List[int]:
+        """Positions of levels priced >= price."""
+        i = bisect.bisect_left(self._keys, (price, -1))
+        return [pos for _, pos in self._keys[i:]]
+
+    def at_or_below(self, price: Decimal) -> List[int]:
+        """Positions of levels priced <= price."""
+        i = bisect.bisect_right(self._keys, (price, float("inf")))
+        return [pos for _, pos in self._keys[:i]]
+
+
 @dataclass
 class Grid:
     """A complete grid with all levels"""
@@ -185,6 +226,50 @@ class Grid:
     current_position: Decimal = Decimal("0")
     avg_entry_price: Decimal = Decimal("0")
 
+    # Open-order indexes (kept in sync by set_level_status)
+    _open_buys: LevelIndex = field(default_factory=LevelIndex, repr=False)
+    _open_sells: LevelIndex = field(default_factory=LevelIndex, repr=False)
+    _positions: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self):
+        self._positions = {level.id: i for i, level in enumerate(self.levels)}
+        for i, level in enumerate(self.levels):
+            if level.status == "open":
+                self._side_index(level.side).add(level.price, i)
+
+    def _side_index(self, side: str) -> LevelIndex:
+        return self._open_buys if side == "buy" else self._open_sells
+
+    def level_position(self, level: GridLevel) -> int:
+        return self._positions[level.id]
+
+    def set_level_status(self, level: GridLevel, status: str) -> None:
+        """Change a level's status, keeping the open-order indexes current."""
+        if level.status == status:
+            return
+        pos = self._positions[level.id]
+        if level.status == "open":
+            self._side_index(level.side).discard(level.price, pos)
+        if status == "open":
+            self._side_index(level.side).add(level.price, pos)
+        level.status = status
+
+    def crossed_levels(self, price: Decimal) -> List[int]:
+        """
+        Positions of open levels a price fills, in grid order.
+
+        Buys fill at or below their price, sells at or above.
+        O(log n + k) for k crossed levels.
+        """
+        crossed = self._open_buys.at_or_above(price)
+        crossed += self._open_sells.at_or_below(price)
+        crossed.sort()
+        return crossed
+
+    @property
+    def open_orders(self) -> int:
+        return len(self._open_buys) + len(self._open_sells)
+
     @property
     def round_trips(self) -> int:
         return min(self.total_buys, self.total_sells)
@@ -208,9 +293,7 @@ class Grid:
             "current_position": float(self.current_position),
             "avg_entry_price": float(self.avg_entry_price),
             "levels_count": len(self.levels),
-            "active_orders": sum(
-                1 for l in self.levels if l.status == "open"
-            ),
+            "active_orders": self.open_orders,
         }
 
 
@@ -290,8 +373,8 @@ class GridTradingStrategy:
         self._running = False
         self._monitor_task: Optional[asyncio.Task] = None
 
-        # Track pending fills for round-trip detection
-        self._pending_sells: Dict[str, List[Decimal]] = {}  # symbol -> buy prices
+        # Track pending fills for round-trip detection (FIFO)
+        self._pending_sells: Dict[str, Deque[Decimal]] = {}  # symbol -> buy prices
 
     async def start(self) -> None:
         """Start the grid trading strategy."""
@@ -466,36 +549,39 @@ class GridTradingStrategy:
         for level in grid.levels:
             if level.status != "pending":
                 continue
+            await self._place_level_order(grid, level)
+
+    async def _place_level_order(self, grid: Grid, level: GridLevel) -> None:
+        """Place the order for a single pending level."""
+        if self.dry_run:
+            # Simulate order placement
+            level.order_id = f"sim_{level.id}"
+            grid.set_level_status(level, "open")
+            logger.debug(
+                f"[DRY RUN] Placed {level.side} @ ${float(level.price):.2f}"
+            )
+        else:
+            # Live order placement
+            try:
+                from src.exchanges.base import OrderSide, OrderType
 
-            if self.dry_run:
-                # Simulate order placement
-                level.order_id = f"sim_{level.id}"
-                level.status = "open"
-                logger.debug(
-                    f"[DRY RUN] Placed {level.side} @ ${float(level.price):.2f}"
+                side = (
+                    OrderSide.BUY if level.side == "buy"
+                    else OrderSide.SELL
+                )
+                order = await self.ccxt_client.create_order(
+                    symbol=grid.config.symbol,
+                    side=side,
+                    order_type=OrderType.LIMIT,
+                    amount=float(level.size),
+                    price=float(level.price),
+                )
+                level.order_id = order.id
+                grid.set_level_status(level, "open")
+            except Exception as e:
+                logger.error(
+                    f"Failed to place {level.side} @ {level.price}: {e}"
                 )
-            else:
-                # Live order placement
-                try:
-                    from src.exchanges.base import OrderSide, OrderType
-
-                    side = (
-                        OrderSide.BUY if level.side == "buy"
-                        else OrderSide.SELL
-                    )
-                    order = await self.ccxt_client.create_order(
-                        symbol=grid.config.symbol,
-                        side=side,
-                        order_type=OrderType.LIMIT,
-                        amount=float(level.size),
-                        price=float(level.price),
-                    )
-                    level.order_id = order.id
-                    level.status = "open"
-                except Exception as e:
-                    logger.error(
-                        f"Failed to place {level.side} @ {level.price}: {e}"
-                    )
 
     async def _check_grids(self) -> None:
         """Check all active grids for fills and updates."""
@@ -572,28 +658,37 @@ class GridTradingStrategy:
         self, grid: Grid, current_price: Decimal
     ) -> None:
         """Simulate order fills based on price movement (dry run)."""
-        for level in grid.levels:
+        # Only the levels this price crosses, found via the open-order
+        # indexes; processed in grid order. Levels opened by a flip later
+        # in the grid are picked up in the same pass.
+        crossed = grid.crossed_levels(current_price)
+        heapq.heapify(crossed)
+        seen: Set[int] = set()
+
+        while crossed:
+            pos = heapq.heappop(crossed)
+            if pos in seen:
+                continue
+            seen.add(pos)
+            level = grid.levels[pos]
             if level.status != "open":
                 continue
 
-            filled = False
-
             if level.side == "buy" and current_price <= level.price:
-                filled = True
                 grid.total_buys += 1
                 self.stats.total_buy_fills += 1
                 # Track for round trip
-                if grid.config.symbol not in self._pending_sells:
-                    self._pending_sells[grid.config.symbol] = []
-                self._pending_sells[grid.config.symbol].append(level.price)
+                self._pending_sells.setdefault(
+                    grid.config.symbol, deque()
+                ).append(level.price)
 
             elif level.side == "sell" and current_price >= level.price:
-                filled = True
                 grid.total_sells += 1
                 self.stats.total_sell_fills += 1
                 # Check for round trip
-                if self._pending_sells.get(grid.config.symbol):
-                    buy_price = self._pending_sells[grid.config.symbol].pop(0)
+                pending = self._pending_sells.get(grid.config.symbol)
+                if pending:
+                    buy_price = pending.popleft()
                     profit = (level.price - buy_price) * level.size
                     grid.realized_profit += profit
                     self.stats.total_profit += profit
@@ -608,38 +703,45 @@ class GridTradingStrategy:
 
                     if self.on_round_trip:
                         self.on_round_trip(grid, profit)
+            else:
+                continue
 
-            if filled:
-                level.status = "filled"
-                level.filled_at = datetime.now(timezone.utc)
-                level.fill_price = current_price
+            grid.set_level_status(level, "filled")
+            level.filled_at = datetime.now(timezone.utc)
+            level.fill_price = current_price
 
-                if self.on_order_filled:
-                    self.on_order_filled(grid, level)
+            if self.on_order_filled:
+                self.on_order_filled(grid, level)
 
-                # Flip the order (buy -> sell at next level up)
-                await self._flip_order(grid, level)
+            # Flip the order (buy -> sell at next level up)
+            flipped = await self._flip_order(grid, level)
+            if flipped is not None and flipped > pos:
+                heapq.heappush(crossed, flipped)
 
-    async def _flip_order(self, grid: Grid, filled_level: GridLevel) -> None:
-        """After a fill, place opposite order."""
+    async def _flip_order(self, grid: Grid, filled_level: GridLevel) -> Optional[int]:
+        """After a fill, place opposite order. Returns the flipped position."""
         # Find the corresponding opposite level
-        idx = grid.levels.index(filled_level)
+        idx = grid.level_position(filled_level)
 
         if filled_level.side == "buy" and idx < len(grid.levels) - 1:
             # Place sell order at next level up
-            next_level = grid.levels[idx + 1]
-            if next_level.status == "filled":
-                next_level.side = "sell"
-                next_level.status = "pending"
-                await self._place_grid_orders(grid)
-
+            next_idx = idx + 1
+            next_side = "sell"
         elif filled_level.side == "sell" and idx > 0:
             # Place buy order at next level down
-            next_level = grid.levels[idx - 1]
-            if next_level.status == "filled":
-                next_level.side = "buy"
-                next_level.status = "pending"
-                await self._place_grid_orders(grid)
+            next_idx = idx - 1
+            next_side = "buy"
+        else:
+            return None
+
+        next_level = grid.levels[next_idx]
+        if next_level.status != "filled":
+            return None
+
+        next_level.side = next_side
+        grid.set_level_status(next_level, "pending")
+        await self._place_level_order(grid, next_level)
+        return next_idx
 
     async def _check_real_fills(self, grid: Grid) -> None:
         """Check for actual order fills (live mode)."""
@@ -652,7 +754,7 @@ class GridTradingStrategy:
                     level.order_id, grid.config.symbol
                 )
                 if order.status == "closed":
-                    level.status = "filled"
+                    grid.set_level_status(level, "filled")
                     level.filled_at = datetime.now(timezone.utc)
                     level.fill_price = Decimal(str(order.price or level.price))
 
@@ -689,7 +791,7 @@ class GridTradingStrategy:
                         )
                     except Exception:
                         pass
-                level.status = "cancelled"
+                grid.set_level_status(level, "cancelled")
 
         logger.info(
             f"🛑 Closed grid {grid_id} ({reason})\n"
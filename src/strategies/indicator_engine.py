@@ -0,0 +1,299 @@
+"""
+Batch Indicator Engine
+
+Holds a symbols x time matrix of bars (close/high/low/volume) and
+computes technical indicators for the whole watchlist in one NumPy pass,
+instead of looping symbol by symbol over Python lists with the
+statistics module.
+
+Storage is a per-symbol ring buffer inside fixed-size arrays, so a new
+bar is a column write (no list rebuilding) and every indicator is a
+vectorized reduction over the last `period` columns:
+- sma / stdev / zscore
+- rsi (simple-average RSI, as used by the stock strategies)
+- atr / atr_percent (true range; reduces to |close change| for close-only data)
+- pct_change (momentum over N bars)
+- volume_ratio (latest volume vs. trailing average)
+
+Symbols with too little history get NaN for that indicator.
+
+Usage:
+    engine = IndicatorEngine(capacity=64)
+    engine.load_history("AAPL", closes=[...], volumes=[...])
+    engine.append_bars({"AAPL": 191.2, "MSFT": 402.5})
+    symbols, rsi = engine.rsi(period=14)
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+BarInput = Union[float, Tuple[float, float, float, float]]  # close or (close, high, low, volume)
+
+
+class IndicatorEngine:
+    """Symbols x time bar matrix with vectorized indicators."""
+
+    def __init__(self, capacity: int = 128, initial_symbols: int = 32):
+        self.capacity = capacity
+        self._index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._rows = 0
+
+        self._close = np.full((0, capacity), np.nan)
+        self._high = np.full((0, capacity), np.nan)
+        self._low = np.full((0, capacity), np.nan)
+        self._volume = np.full((0, capacity), np.nan)
+        self._head = np.zeros(0, dtype=np.intp)   # Next write column per symbol
+        self._count = np.zeros(0, dtype=np.intp)  # Valid bars per symbol
+        self._grow(initial_symbols)
+
+        self.version = 0  # Bumped on every update
+
+    # =========================================================================
+    # Storage
+    # =========================================================================
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._symbols)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def bar_count(self, symbol: str) -> int:
+        idx = self._index.get(symbol)
+        return int(self._count[idx]) if idx is not None else 0
+
+    def _grow(self, rows: int) -> None:
+        extra = rows - self._rows
+        pad = np.full((extra, self.capacity), np.nan)
+        self._close = np.vstack([self._close, pad])
+        self._high = np.vstack([self._high, pad])
+        self._low = np.vstack([self._low, pad])
+        self._volume = np.vstack([self._volume, pad])
+        self._head = np.concatenate([self._head, np.zeros(extra, dtype=np.intp)])
+        self._count = np.concatenate([self._count, np.zeros(extra, dtype=np.intp)])
+        self._rows = rows
+
+    def add_symbol(self, symbol: str) -> int:
+        idx = self._index.get(symbol)
+        if idx is None:
+            idx = len(self._symbols)
+            if idx >= self._rows:
+                self._grow(max(32, self._rows * 2))
+            self._index[symbol] = idx
+            self._symbols.append(symbol)
+        return idx
+
+    def remove_history(self, symbol: str) -> None:
+        """Clear a symbol's bars (the row is kept for reuse)."""
+        idx = self._index.get(symbol)
+        if idx is None:
+            return
+        for arr in (self._close, self._high, self._low, self._volume):
+            arr[idx] = np.nan
+        self._head[idx] = 0
+        self._count[idx] = 0
+        self.version += 1
+
+    def load_history(
+        self,
+        symbol: str,
+        closes: Sequence[float],
+        highs: Optional[Sequence[float]] = None,
+        lows: Optional[Sequence[float]] = None,
+        volumes: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Replace a symbol's history with the given bars (oldest first)."""
+        idx = self.add_symbol(symbol)
+        closes = np.asarray(closes, dtype=np.float64)[-self.capacity:]
+        n = len(closes)
+
+        def fit(values: Optional[Sequence[float]], default: np.ndarray) -> np.ndarray:
+            if values is None:
+                return default
+            return np.asarray(values, dtype=np.float64)[-self.capacity:]
+
+        for arr, values in (
+            (self._close, closes),
+            (self._high, fit(highs, closes)),
+            (self._low, fit(lows, closes)),
+            (self._volume, fit(volumes, np.zeros(n))),
+        ):
+            arr[idx] = np.nan
+            arr[idx, :n] = values
+
+        self._head[idx] = n % self.capacity
+        self._count[idx] = n
+        self.version += 1
+
+    def append_bars(self, bars: Dict[str, BarInput]) -> None:
+        """
+        Append one bar per symbol in a single vectorized write.
+
+        Values are either a close price or a (close, high, low, volume) tuple.
+        """
+        if not bars:
+            return
+
+        rows = np.array([self.add_symbol(s) for s in bars], dtype=np.intp)
+        values = np.array([
+            tuple(v) if isinstance(v, (tuple, list)) else (v, v, v, 0.0)
+            for v in bars.values()
+        ], dtype=np.float64)
+
+        cols = self._head[rows]
+        self._close[rows, cols] = values[:, 0]
+        self._high[rows, cols] = values[:, 1]
+        self._low[rows, cols] = values[:, 2]
+        self._volume[rows, cols] = values[:, 3]
+
+        self._head[rows] = (cols + 1) % self.capacity
+        self._count[rows] = np.minimum(self._count[rows] + 1, self.capacity)
+        self.version += 1
+
+    def _rows_for(self, symbols: Optional[Iterable[str]]) -> Tuple[List[str], np.ndarray]:
+        if symbols is None:
+            names = self._symbols
+            return list(names), np.arange(len(names), dtype=np.intp)
+        names = list(symbols)
+        rows = np.array([self._index.get(s, -1) for s in names], dtype=np.intp)
+        return names, rows
+
+    def window(
+        self,
+        period: int,
+        symbols: Optional[Iterable[str]] = None,
+        field: str = "close",
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Last `period` bars per symbol, oldest first, right-aligned.
+
+        Returns (symbols, array of shape (len(symbols), period)); missing
+        bars (short history or unknown symbol) are NaN.
+        """
+        source = {
+            "close": self._close,
+            "high": self._high,
+            "low": self._low,
+            "volume": self._volume,
+        }[field]
+        names, rows = self._rows_for(symbols)
+        period = min(period, self.capacity)
+
+        known = rows >= 0
+        safe_rows = np.where(known, rows, 0)
+        offsets = np.arange(period) - period  # -period .. -1
+        cols = (self._head[safe_rows][:, None] + offsets[None, :]) % self.capacity
+        out = source[safe_rows[:, None], cols]
+
+        # Mask columns older than each symbol's history (or unknown symbols)
+        counts = np.where(known, self._count[safe_rows], 0)
+        missing = np.arange(period)[None, :] < (period - counts)[:, None]
+        out = np.where(missing, np.nan, out)
+        return names, out
+
+    # =========================================================================
+    # Indicators (all return (symbols, values) with NaN where undefined)
+    # =========================================================================
+
+    def last(self, symbols: Optional[Iterable[str]] = None) -> Tuple[List[str], np.ndarray]:
+        names, w = self.window(1, symbols)
+        return names, w[:, 0]
+
+    def sma(
+        self, period: int, symbols: Optional[Iterable[str]] = None, min_bars: Optional[int] = None
+    ) -> Tuple[List[str], np.ndarray]:
+        """Mean of the last `period` bars (requires min_bars, default period)."""
+        names, w = self.window(period, symbols)
+        n = (~np.isnan(w)).sum(axis=1)
+        required = period if min_bars is None else min_bars
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nansum(w, axis=1) / np.maximum(n, 1)
+        return names, np.where(n >= max(required, 1), mean, np.nan)
+
+    def stdev(
+        self, period: int, symbols: Optional[Iterable[str]] = None, min_bars: Optional[int] = None
+    ) -> Tuple[List[str], np.ndarray]:
+        """Sample standard deviation over the last `period` bars."""
+        names, w = self.window(period, symbols)
+        n = (~np.isnan(w)).sum(axis=1)
+        required = period if min_bars is None else min_bars
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.nanstd(w, axis=1, ddof=1) if w.size else np.zeros(len(names))
+        return names, np.where((n >= max(required, 2)), std, np.nan)
+
+    def zscore(
+        self,
+        period: int,
+        prices: Optional[np.ndarray] = None,
+        symbols: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[str], np.ndarray]:
+        """Z-score of prices (default: latest close) against the SMA/stdev window."""
+        names, mean = self.sma(period, symbols)
+        _, std = self.stdev(period, names)
+        if prices is None:
+            _, prices = self.last(names)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            z = np.where(std > 0, (prices - mean) / std, np.nan)
+        return names, z
+
+    def rsi(self, period: int = 14, symbols: Optional[Iterable[str]] = None) -> Tuple[List[str], np.ndarray]:
+        """Simple-average RSI over the last `period` close-to-close changes."""
+        names, w = self.window(period + 1, symbols)
+        changes = np.diff(w, axis=1)
+        full = ~np.isnan(changes).any(axis=1)
+        avg_gain = np.clip(changes, 0, None).sum(axis=1) / period
+        avg_loss = np.clip(-changes, 0, None).sum(axis=1) / period
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+        return names, np.where(full, rsi, np.nan)
+
+    def atr(self, period: int = 14, symbols: Optional[Iterable[str]] = None) -> Tuple[List[str], np.ndarray]:
+        """
+        Average true range over up to `period` bars.
+
+        Uses as many bars as are available (at least two), matching the
+        close-only approximation RegimeDetector used before.
+        """
+        names, close = self.window(period + 1, symbols)
+        _, high = self.window(period + 1, names, field="high")
+        _, low = self.window(period + 1, names, field="low")
+        prev_close = close[:, :-1]
+        high, low = high[:, 1:], low[:, 1:]
+        with np.errstate(invalid="ignore"):
+            tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+            tr = np.where(np.isnan(prev_close), np.nan, tr)
+            n = (~np.isnan(tr)).sum(axis=1)
+            atr = np.where(n > 0, np.nansum(tr, axis=1) / np.maximum(n, 1), np.nan)
+        return names, atr
+
+    def atr_percent(self, period: int = 14, symbols: Optional[Iterable[str]] = None) -> Tuple[List[str], np.ndarray]:
+        names, atr = self.atr(period, symbols)
+        _, last = self.last(names)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            pct = np.where(last != 0, atr / last * 100, 0.0)
+        return names, pct
+
+    def pct_change(self, lag: int, symbols: Optional[Iterable[str]] = None) -> Tuple[List[str], np.ndarray]:
+        """Fractional change from lag bars ago to the latest close."""
+        names, w = self.window(lag + 1, symbols)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            change = np.where(w[:, 0] != 0, w[:, -1] / w[:, 0] - 1, np.nan)
+        return names, change
+
+    def volume_ratio(self, period: int = 20, symbols: Optional[Iterable[str]] = None) -> Tuple[List[str], np.ndarray]:
+        """Latest volume / average volume over up to `period` bars (1.0 if no volume)."""
+        names, w = self.window(period, symbols, field="volume")
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg = np.nanmean(w, axis=1) if w.size else np.zeros(len(names))
+            ratio = np.where(avg > 0, w[:, -1] / avg, 1.0)
+        return names, np.where(np.isnan(ratio), 1.0, ratio)
@@ -56,6 +56,161 @@ class Quote:
         return int(spread * 10000)
 
 
+class QuoteAction(Enum):
+    """What to do with one side of a working quote"""
+    KEEP = "keep"        # Working order is close enough - leave it
+    PLACE = "place"      # No working order on this side
+    REPLACE = "replace"  # Cancel and repost at the new price/size
+    CANCEL = "cancel"    # Pull the order (e.g. inventory limit)
+
+
+@dataclass
+class QuoteDiff:
+    """Per-side actions needed to move a working quote to the desired one"""
+    token_id: str
+    bid: QuoteAction = QuoteAction.KEEP
+    ask: QuoteAction = QuoteAction.KEEP
+
+    @property
+    def changed(self) -> bool:
+        return self.bid != QuoteAction.KEEP or self.ask != QuoteAction.KEEP
+
+
+class QuoteManager:
+    """
+    Tracks desired vs. working quotes per token and diffs them.
+
+    A side is only cancelled/replaced when its price moves by more than
+    price_tolerance_ticks ticks or its size changes by more than
+    size_tolerance_pct of the working size. Everything else is left
+    resting, which keeps order-API traffic (and quote logging) down to
+    the quotes that actually change.
+    """
+
+    def __init__(
+        self,
+        tick_size: Decimal = Decimal("0.01"),
+        price_tolerance_ticks: int = 1,
+        size_tolerance_pct: float = 0.10,
+    ):
+        self.tick_size = tick_size
+        self.price_tolerance = tick_size * price_tolerance_ticks
+        self.size_tolerance_pct = Decimal(str(size_tolerance_pct))
+        self.desired: Dict[str, Quote] = {}  # key: token_id
+        self.working: Dict[str, Quote] = {}  # key: token_id
+
+        # Counters
+        self.evaluations = 0
+        self.unchanged = 0
+        self.placed = 0
+        self.replaced = 0
+        self.cancelled = 0
+
+    def _side_action(
+        self,
+        working_price: Optional[Decimal],
+        working_size: Decimal,
+        desired_price: Decimal,
+        desired_size: Decimal,
+    ) -> QuoteAction:
+        if working_price is None or working_size <= 0:
+            return QuoteAction.PLACE if desired_size > 0 else QuoteAction.KEEP
+        if desired_size <= 0:
+            return QuoteAction.CANCEL
+        if abs(desired_price - working_price) > self.price_tolerance:
+            return QuoteAction.REPLACE
+        if abs(desired_size - working_size) > working_size * self.size_tolerance_pct:
+            return QuoteAction.REPLACE
+        return QuoteAction.KEEP
+
+    def diff(self, token_id: str, desired: Quote) -> QuoteDiff:
+        """Record the desired quote and compute the actions to reach it."""
+        self.desired[token_id] = desired
+        self.evaluations += 1
+        working = self.working.get(token_id)
+
+        diff = QuoteDiff(
+            token_id=token_id,
+            bid=self._side_action(
+                working.bid_price if working else None,
+                working.bid_size if working else Decimal("0"),
+                desired.bid_price,
+                desired.bid_size,
+            ),
+            ask=self._side_action(
+                working.ask_price if working else None,
+                working.ask_size if working else Decimal("0"),
+                desired.ask_price,
+                desired.ask_size,
+            ),
+        )
+        if not diff.changed:
+            self.unchanged += 1
+        return diff
+
+    def apply(self, diff: QuoteDiff) -> Quote:
+        """Mark the diff as executed; returns the new working quote."""
+        desired = self.desired[diff.token_id]
+        working = self.working.get(diff.token_id)
+
+        def side(action: QuoteAction, old_price, old_size, new_price, new_size):
+            if action in (QuoteAction.PLACE, QuoteAction.REPLACE):
+                return new_price, new_size
+            if action == QuoteAction.CANCEL:
+                return old_price, Decimal("0")
+            return old_price, old_size
+
+        bid_price, bid_size = side(
+            diff.bid,
+            working.bid_price if working else desired.bid_price,
+            working.bid_size if working else Decimal("0"),
+            desired.bid_price,
+            desired.bid_size,
+        )
+        ask_price, ask_size = side(
+            diff.ask,
+            working.ask_price if working else desired.ask_price,
+            working.ask_size if working else Decimal("0"),
+            desired.ask_price,
+            desired.ask_size,
+        )
+
+        for action in (diff.bid, diff.ask):
+            if action == QuoteAction.PLACE:
+                self.placed += 1
+            elif action == QuoteAction.REPLACE:
+                self.replaced += 1
+            elif action == QuoteAction.CANCEL:
+                self.cancelled += 1
+
+        quote = Quote(
+            bid_price=bid_price,
+            bid_size=bid_size,
+            ask_price=ask_price,
+            ask_size=ask_size,
+            market_id=desired.market_id,
+            token_id=diff.token_id,
+            outcome=desired.outcome,
+        )
+        self.working[diff.token_id] = quote
+        return quote
+
+    def clear(self, token_id: str) -> Optional[Quote]:
+        """Forget a token's quotes (e.g. after cancelling everything)."""
+        self.desired.pop(token_id, None)
+        return self.working.pop(token_id, None)
+
+    def to_dict(self) -> Dict:
+        return {
+            "evaluations": self.evaluations,
+            "unchanged": self.unchanged,
+            "placed": self.placed,
+            "replaced": self.replaced,
+            "cancelled": self.cancelled,
+            "working_quotes": len(self.working),
+        }
+
+
 @dataclass
 class Inventory:
     """Current position in a market outcome"""
@@ -85,6 +240,7 @@ class MarketMakerStats:
     """Performance tracking for market making"""
     total_quotes_posted: int = 0
     total_quotes_cancelled: int = 0
+    total_quotes_unchanged: int = 0
     bids_filled: int = 0
     asks_filled: int = 0
     total_spread_earned: Decimal = Decimal("0")
@@ -121,6 +277,7 @@ class MarketMakerStats:
             "duration_hours": round(duration / 3600, 2),
             "quotes_posted": self.total_quotes_posted,
             "quotes_cancelled": self.total_quotes_cancelled,
+            "quotes_unchanged": self.total_quotes_unchanged,
             "bids_filled": self.bids_filled,
             "asks_filled": self.asks_filled,
             "round_trips": self.round_trips,
@@ -160,6 +317,9 @@ class MarketMakerStrategy:
         max_inventory_usd: float = 500.0,
         inventory_skew_factor: float = 0.1,
         quote_refresh_sec: int = 5,
+        requote_interval_sec: float = 1.0,
+        price_tolerance_ticks: int = 1,
+        size_tolerance_pct: float = 0.10,
         min_volume_24h: float = 10000.0,
         max_markets: int = 5,
         paper_trading: bool = True,
@@ -178,6 +338,9 @@ class MarketMakerStrategy:
         self.max_inventory_usd = Decimal(str(max_inventory_usd))
         self.inventory_skew_factor = Decimal(str(inventory_skew_factor))
         self.quote_refresh_sec = quote_refresh_sec
+        # Quotes are re-evaluated this often; fills/summary keep the
+        # quote_refresh_sec cadence
+        self.requote_interval_sec = min(requote_interval_sec, quote_refresh_sec)
         self.min_volume_24h = min_volume_24h
         self.max_markets = max_markets
 
@@ -190,7 +353,12 @@ class MarketMakerStrategy:
         self._running = False
         self._markets: Dict[str, MarketInfo] = {}
         self._inventories: Dict[str, Inventory] = {}  # key: token_id
-        self._active_quotes: Dict[str, Quote] = {}   # key: token_id
+        self._active_quotes: Dict[str, Quote] = {}   # key: token_id (working quotes)
+        self.quote_manager = QuoteManager(
+            price_tolerance_ticks=price_tolerance_ticks,
+            size_tolerance_pct=size_tolerance_pct,
+        )
+        self._book_stream_started = False
         self._active_orders: Dict[str, str] = {}     # key: order_id -> token_id
         self.stats = MarketMakerStats()
 
@@ -365,7 +533,7 @@ class MarketMakerStrategy:
 
             token_id = yes_token.get("token_id", "")
 
-            # Get current order book to find mid price
+            # Mid price from the streamed order book
             order_book = await self._get_order_book(token_id)
             if not order_book:
                 return False
@@ -379,30 +547,45 @@ class MarketMakerStrategy:
             else:
                 mid_price = Decimal(str((best_bid + best_ask) / 2))
 
-            # Calculate quotes
+            # Calculate desired quotes
             quote = self.calculate_quotes(token_id, mid_price, "YES")
             quote.market_id = market.market_id
 
-            if quote.bid_size <= 0 and quote.ask_size <= 0:
+            if (
+                quote.bid_size <= 0 and quote.ask_size <= 0
+                and token_id not in self._active_quotes
+            ):
                 logger.debug(f"Skipping {market.question[:30]}... (at inventory limit)")
                 return False
 
+            # Only touch sides that moved beyond tolerance
+            diff = self.quote_manager.diff(token_id, quote)
+            if not diff.changed:
+                self.stats.total_quotes_unchanged += 1
+                return True
+
+            quote = self.quote_manager.apply(diff)
+            self._active_quotes[token_id] = quote
+
+            for action in (diff.bid, diff.ask):
+                if action in (QuoteAction.PLACE, QuoteAction.REPLACE):
+                    self.stats.total_quotes_posted += 1
+                if action in (QuoteAction.REPLACE, QuoteAction.CANCEL):
+                    self.stats.total_quotes_cancelled += 1
+
             # In simulation mode, just log the quote
             logger.info(
                 f"📊 Quote {market.question[:40]}...: "
-                f"BID ${quote.bid_price} x {quote.bid_size} | "
-                f"ASK ${quote.ask_price} x {quote.ask_size} | "
+                f"BID ${quote.bid_price} x {quote.bid_size} ({diff.bid.value}) | "
+                f"ASK ${quote.ask_price} x {quote.ask_size} ({diff.ask.value}) | "
                 f"Spread: {quote.spread_bps}bps"
             )
 
-            self._active_quotes[token_id] = quote
-            self.stats.total_quotes_posted += 1
-
             # Callback
             if self.on_quote:
                 await self.on_quote(quote)
 
-            # Log to database
+            # Log to database (changed quotes only)
             if self.db:
                 try:
                     self.db.log_opportunity({
@@ -428,10 +611,35 @@ class MarketMakerStrategy:
             logger.error(f"Error posting quotes for {market.question[:30]}: {e}")
             return False
 
+    async def _ensure_book_stream(self, token_ids: List[str]) -> None:
+        """Subscribe our tokens on the client's WebSocket order book stream."""
+        if not self.client or not hasattr(self.client, "subscribe"):
+            return
+        try:
+            self.client.subscribe(token_ids, replace=False)
+            if not self.client.is_connected and not self._book_stream_started:
+                self._book_stream_started = True
+                # start() blocks until connected; keep it off the event loop
+                await asyncio.to_thread(self.client.start)
+        except Exception as e:
+            logger.warning(f"Order book stream unavailable, using fallback books: {e}")
+
     async def _get_order_book(self, token_id: str) -> Optional[Dict]:
-        """Get order book for a token"""
-        # Simplified - return mock data for simulation
-        # In production, connect to Polymarket CLOB API
+        """Get order book for a token (streamed book when available)"""
+        get_book = getattr(self.client, "get_order_book", None)
+        if get_book:
+            book = get_book(token_id)
+            if book and book.last_update > 0:
+                best_bid = book.best_bid()
+                best_ask = book.best_ask()
+                return {
+                    "best_bid": best_bid[0] if best_bid else 0,
+                    "best_ask": best_ask[0] if best_ask else 1,
+                    "bids": book.bids,
+                    "asks": book.asks,
+                }
+
+        # No streamed data yet - mock book for simulation
         return {
             "best_bid": 0.48,
             "best_ask": 0.52,
@@ -531,16 +739,24 @@ class MarketMakerStrategy:
         for m in markets:
             self._markets[m.market_id] = m
 
-        # Main loop
+        # Mids come from the WebSocket books instead of per-cycle fetches
+        await self._ensure_book_stream([
+            t.get("token_id", "")
+            for m in markets for t in m.tokens
+            if t.get("outcome", "").upper() == "YES" and t.get("token_id")
+        ])
+
+        # Main loop: re-quote every requote_interval_sec (cheap - unchanged
+        # quotes are not reposted), check fills every quote_refresh_sec
         iteration = 0
+        last_fill_check = 0.0
+        loop = asyncio.get_running_loop()
         while self._running:
             elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
             if elapsed >= duration_seconds:
                 logger.info(f"Duration reached ({duration_seconds}s)")
                 break
 
-            iteration += 1
-
             try:
                 # Update quotes for all markets
                 for market in self._markets.values():
@@ -548,21 +764,25 @@ class MarketMakerStrategy:
                         break
                     await self.post_quotes(market)
 
-                # Check for fills - use real WebSocket monitoring if available, else simulate for paper trading
-                if self._paper_trading:
-                    await self._check_fills_simulation()
-                else:
-                    await self._check_fills_real()
+                if loop.time() - last_fill_check >= self.quote_refresh_sec:
+                    last_fill_check = loop.time()
+                    iteration += 1
+
+                    # Check for fills - use real WebSocket monitoring if available, else simulate for paper trading
+                    if self._paper_trading:
+                        await self._check_fills_simulation()
+                    else:
+                        await self._check_fills_real()
 
-                # Log periodic summary
-                if iteration % 12 == 0:  # Every minute (at 5s interval)
-                    self._log_summary()
+                    # Log periodic summary
+                    if iteration % 12 == 0:  # Every minute (at 5s interval)
+                        self._log_summary()
 
             except Exception as e:
                 logger.error(f"Market making error: {e}")
                 self.status = MarketMakerStatus.ERROR
 
-            await asyncio.sleep(self.quote_refresh_sec)
+            await asyncio.sleep(self.requote_interval_sec)
 
         self._running = False
         self.status = MarketMakerStatus.IDLE
@@ -648,7 +868,8 @@ class MarketMakerStrategy:
         stats = self.stats.to_dict()
         logger.info(
             f"📊 MM Summary | "
-            f"Quotes: {stats['quotes_posted']} | "
+            f"Quotes: {stats['quotes_posted']} "
+            f"({stats['quotes_unchanged']} unchanged) | "
             f"Fills: {stats['bids_filled']}B/{stats['asks_filled']}A | "
             f"Round trips: {stats['round_trips']} | "
             f"Net P&L: ${stats['net_pnl']:.4f}"
@@ -666,6 +887,7 @@ class MarketMakerStrategy:
             "status": self.status.value,
             "markets_quoted": len(self._markets),
             "active_quotes": len(self._active_quotes),
+            "quote_manager": self.quote_manager.to_dict(),
             "inventories": {
                 k: float(v.position)
                 for k, v in self._inventories.items()
@@ -0,0 +1,332 @@
+"""
+Option Chain Store
+
+Caches option chains per (underlying, expiry) with a TTL and exposes them
+as columnar NumPy arrays, so the options strategies screen a whole
+watchlist with array masks instead of building and filtering
+OptionContract lists symbol by symbol on every call.
+
+- OptionChain: strikes, bids, asks, IV and Greeks as arrays (row i is
+  contracts[i]); chains for many underlyings concatenate into one
+- OptionChainStore: TTL cache of chains and underlying spot prices,
+  fetched concurrently (one in-flight fetch per underlying)
+- black_scholes_greeks: vectorized Greeks, used to fill contracts the
+  data feed returned without Greeks
+- annualized_return: vectorized premium yield
+
+Usage:
+    store = OptionChainStore(fetch_chain, fetch_spot, ttl_sec=60)
+    chain = await store.load_watchlist(["AAPL", "MSFT"], max_dte=45)
+    calls = chain.is_call & (chain.strike > chain.spot) & chain.dte_between(25, 45)
+"""
+
+import asyncio
+import logging
+import math
+import time
+from datetime import timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400.0
+
+ChainFetcher = Callable[[str, int], Awaitable[list]]   # (underlying, max_dte) -> contracts
+SpotFetcher = Callable[[str], Awaitable[float]]         # underlying -> mid price
+
+
+# =============================================================================
+# Vectorized pricing helpers
+# =============================================================================
+
+def _norm_cdf(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF (Abramowitz & Stegun 7.1.26, |error| < 1.5e-7)."""
+    z = np.abs(x) / math.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741
+                + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-z * z)
+    return 0.5 * (1.0 + np.sign(x) * erf)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+
+def black_scholes_greeks(
+    spot: np.ndarray,
+    strike: np.ndarray,
+    years: np.ndarray,
+    iv: np.ndarray,
+    is_call: np.ndarray,
+    rate: float = 0.0,
+) -> Dict[str, np.ndarray]:
+    """
+    Black-Scholes Greeks for arrays of European options.
+
+    Theta is per calendar day and vega per 1 vol point, matching how
+    brokers quote them. Rows with no time or no IV get NaN.
+    """
+    spot, strike, years, iv = (np.asarray(a, dtype=np.float64) for a in (spot, strike, years, iv))
+    is_call = np.asarray(is_call, dtype=bool)
+
+    valid = (spot > 0) & (strike > 0) & (years > 0) & (iv > 0)
+    s = np.where(valid, spot, 1.0)
+    k = np.where(valid, strike, 1.0)
+    t = np.where(valid, years, 1.0)
+    v = np.where(valid, iv, 1.0)
+
+    sqrt_t = np.sqrt(t)
+    d1 = (np.log(s / k) + (rate + 0.5 * v * v) * t) / (v * sqrt_t)
+    d2 = d1 - v * sqrt_t
+    pdf_d1 = _norm_pdf(d1)
+    discount = np.exp(-rate * t)
+
+    delta = np.where(is_call, _norm_cdf(d1), _norm_cdf(d1) - 1.0)
+    gamma = pdf_d1 / (s * v * sqrt_t)
+    vega = s * pdf_d1 * sqrt_t / 100.0
+    carry = np.where(
+        is_call,
+        -rate * k * discount * _norm_cdf(d2),
+        rate * k * discount * _norm_cdf(-d2),
+    )
+    theta = (-s * pdf_d1 * v / (2.0 * sqrt_t) + carry) / 365.0
+
+    return {
+        name: np.where(valid, values, np.nan)
+        for name, values in (("delta", delta), ("gamma", gamma), ("theta", theta), ("vega", vega))
+    }
+
+
+def annualized_return(premium: np.ndarray, base: np.ndarray, dte: np.ndarray) -> np.ndarray:
+    """(premium / base) * (365 / dte); 0 where base or dte is 0."""
+    premium, base, dte = (np.asarray(a, dtype=np.float64) for a in (premium, base, dte))
+    ok = (base != 0) & (dte != 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(ok, premium / np.where(ok, base, 1.0) * 365.0 / np.where(ok, dte, 1.0), 0.0)
+
+
+# =============================================================================
+# Columnar chain
+# =============================================================================
+
+class OptionChain:
+    """Option contracts as columns; row i describes contracts[i]."""
+
+    _COLUMNS = ("strike", "bid", "ask", "iv", "delta", "gamma", "theta", "vega", "expiry_ts")
+
+    def __init__(self, contracts: Sequence, underlyings: Optional[List[str]] = None):
+        self.contracts = list(contracts)
+        n = len(self.contracts)
+
+        self.underlyings = underlyings or sorted({c.underlying for c in self.contracts})
+        index = {u: i for i, u in enumerate(self.underlyings)}
+        self.underlying_idx = np.fromiter(
+            (index[c.underlying] for c in self.contracts), dtype=np.intp, count=n
+        )
+        self.is_call = np.fromiter(
+            (c.option_type.value == "call" for c in self.contracts), dtype=bool, count=n
+        )
+        self.strike = np.fromiter((c.strike for c in self.contracts), dtype=np.float64, count=n)
+        self.bid = np.fromiter((c.bid for c in self.contracts), dtype=np.float64, count=n)
+        self.ask = np.fromiter((c.ask for c in self.contracts), dtype=np.float64, count=n)
+        self.iv = np.fromiter((c.implied_volatility for c in self.contracts), dtype=np.float64, count=n)
+        self.delta = np.fromiter((c.delta for c in self.contracts), dtype=np.float64, count=n)
+        self.gamma = np.fromiter((c.gamma for c in self.contracts), dtype=np.float64, count=n)
+        self.theta = np.fromiter((c.theta for c in self.contracts), dtype=np.float64, count=n)
+        self.vega = np.fromiter((c.vega for c in self.contracts), dtype=np.float64, count=n)
+        self.expiry_ts = np.fromiter(
+            (_utc(c.expiration).timestamp() for c in self.contracts), dtype=np.float64, count=n
+        )
+        self.spot = np.full(n, np.nan)  # Set by OptionChainStore.load_watchlist()
+
+    def __len__(self) -> int:
+        return len(self.contracts)
+
+    @classmethod
+    def concat(cls, chains: Sequence["OptionChain"]) -> "OptionChain":
+        """Combine chains (e.g. one per expiry or underlying) into one."""
+        contracts = [c for chain in chains for c in chain.contracts]
+        return cls(contracts)
+
+    @property
+    def mid(self) -> np.ndarray:
+        return (self.bid + self.ask) / 2
+
+    @property
+    def dte(self) -> np.ndarray:
+        """Whole days to expiry, as OptionContract.days_to_expiry."""
+        return np.floor((self.expiry_ts - time.time()) / SECONDS_PER_DAY).astype(np.int64)
+
+    def dte_between(self, low: int, high: int) -> np.ndarray:
+        dte = self.dte
+        return (dte >= low) & (dte <= high)
+
+    def fill_greeks(self, rate: float = 0.0) -> int:
+        """
+        Compute Black-Scholes Greeks for rows that came back without them.
+
+        Needs spot set and IV > 0; returns the number of rows filled.
+        """
+        missing = (
+            (self.delta == 0) & (self.gamma == 0) & (self.vega == 0)
+            & (self.iv > 0) & ~np.isnan(self.spot)
+        )
+        if not missing.any():
+            return 0
+        years = np.maximum(self.expiry_ts[missing] - time.time(), 0.0) / (365.0 * SECONDS_PER_DAY)
+        greeks = black_scholes_greeks(
+            self.spot[missing], self.strike[missing], years,
+            self.iv[missing], self.is_call[missing], rate,
+        )
+        for name, values in greeks.items():
+            getattr(self, name)[missing] = np.nan_to_num(values)
+        return int(missing.sum())
+
+    def nearest(self, mask: np.ndarray, targets: np.ndarray) -> Dict[str, int]:
+        """
+        Row whose strike is closest to each underlying's target.
+
+        targets is indexed by underlying_idx; only rows in mask qualify.
+        Ties go to the first row in chain order. Returns {underlying: row}.
+        """
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            return {}
+        groups = self.underlying_idx[rows]
+        distance = np.abs(self.strike[rows] - np.asarray(targets)[groups])
+        order = rows[np.lexsort((distance, groups))]
+        first_groups, first = np.unique(self.underlying_idx[order], return_index=True)
+        return {self.underlyings[g]: int(order[i]) for g, i in zip(first_groups, first)}
+
+
+def _utc(dt):
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+# =============================================================================
+# Store
+# =============================================================================
+
+class OptionChainStore:
+    """TTL cache of option chains keyed by underlying and expiry."""
+
+    def __init__(
+        self,
+        fetch_chain: ChainFetcher,
+        fetch_spot: SpotFetcher,
+        ttl_sec: float = 60.0,
+        spot_ttl_sec: float = 5.0,
+        max_concurrency: int = 8,
+        risk_free_rate: float = 0.04,
+    ):
+        self._fetch_chain = fetch_chain
+        self._fetch_spot = fetch_spot
+        self.ttl_sec = ttl_sec
+        self.spot_ttl_sec = spot_ttl_sec
+        self.risk_free_rate = risk_free_rate
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # underlying -> expiry (YYYY-MM-DD) -> chain
+        self._chains: Dict[str, Dict[str, OptionChain]] = {}
+        # underlying -> (fetched_at monotonic, horizon in DTE)
+        self._coverage: Dict[str, Tuple[float, int]] = {}
+        self._spots: Dict[str, Tuple[float, float]] = {}  # symbol -> (fetched_at, price)
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        self.fetches = 0
+        self.hits = 0
+
+    def invalidate(self, underlying: Optional[str] = None) -> None:
+        if underlying is None:
+            self._chains.clear()
+            self._coverage.clear()
+            self._spots.clear()
+        else:
+            self._chains.pop(underlying, None)
+            self._coverage.pop(underlying, None)
+            self._spots.pop(underlying, None)
+
+    def _is_fresh(self, underlying: str, max_dte: int) -> bool:
+        coverage = self._coverage.get(underlying)
+        if coverage is None:
+            return False
+        fetched_at, horizon = coverage
+        return horizon >= max_dte and time.monotonic() - fetched_at <= self.ttl_sec
+
+    def _cached(self, underlying: str, max_dte: int) -> OptionChain:
+        cutoff = time.time() + (max_dte + 1) * SECONDS_PER_DAY
+        chains = [
+            chain for chain in self._chains.get(underlying, {}).values()
+            if len(chain) and chain.expiry_ts[0] < cutoff
+        ]
+        return OptionChain.concat(chains) if len(chains) != 1 else chains[0]
+
+    async def get_chain(self, underlying: str, max_dte: int = 45) -> OptionChain:
+        """Chain for an underlying with expiries up to max_dte days out."""
+        if self._is_fresh(underlying, max_dte):
+            self.hits += 1
+            return self._cached(underlying, max_dte)
+
+        lock = self._locks.setdefault(underlying, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed it while we waited
+            if not self._is_fresh(underlying, max_dte):
+                async with self._semaphore:
+                    contracts = await self._fetch_chain(underlying, max_dte)
+                self.fetches += 1
+
+                by_expiry: Dict[str, list] = {}
+                for contract in contracts:
+                    by_expiry.setdefault(_utc(contract.expiration).strftime("%Y-%m-%d"), []).append(contract)
+                self._chains[underlying] = {
+                    expiry: OptionChain(group) for expiry, group in by_expiry.items()
+                }
+                self._coverage[underlying] = (time.monotonic(), max_dte)
+
+        return self._cached(underlying, max_dte)
+
+    async def get_spot(self, symbol: str) -> float:
+        cached = self._spots.get(symbol)
+        if cached and time.monotonic() - cached[0] <= self.spot_ttl_sec:
+            return cached[1]
+        async with self._semaphore:
+            price = float(await self._fetch_spot(symbol))
+        self._spots[symbol] = (time.monotonic(), price)
+        return price
+
+    async def load_watchlist(self, symbols: Sequence[str], max_dte: int = 45) -> OptionChain:
+        """
+        One combined chain for every symbol, with spot filled per row.
+
+        Symbols whose chain or quote fails are logged and left out.
+        Greeks missing from the feed are filled with Black-Scholes.
+        """
+        symbols = list(dict.fromkeys(symbols))
+
+        async def load(symbol: str):
+            spot, chain = await asyncio.gather(
+                self.get_spot(symbol), self.get_chain(symbol, max_dte)
+            )
+            return spot, chain
+
+        results = await asyncio.gather(*(load(s) for s in symbols), return_exceptions=True)
+
+        chains: List[OptionChain] = []
+        spots: Dict[str, float] = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error loading option chain for {symbol}: {result}")
+                continue
+            spot, chain = result
+            if spot > 0 and len(chain):
+                spots[symbol] = spot
+                chains.append(chain)
+
+        combined = OptionChain.concat(chains)
+        if len(combined):
+            combined.spot = np.array([spots[u] for u in combined.underlyings])[combined.underlying_idx]
+            combined.fill_greeks(self.risk_free_rate)
+        return combined
@@ -15,6 +15,10 @@ Confidence: 70% (options provide defined risk)
 Risk: Low-High (varies by strategy)
 
 Note: Requires Alpaca options trading enabled
+
+Chains and quotes come from a shared OptionChainStore (TTL cache with
+columnar arrays), so each strategy screens its whole watchlist in one
+vectorized pass per cycle.
 """
 
 import asyncio
@@ -25,6 +29,10 @@ from typing import Optional, Dict, List, Tuple
 from enum import Enum
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from .options_chain import OptionChainStore, annualized_return
+
 logger = logging.getLogger(__name__)
 
 
@@ -118,12 +126,14 @@ class BaseOptionsStrategy(ABC):
         alpaca_client,
         min_premium: float = 0.05,  # Min 5% annualized premium
         max_position_size: float = 0.1,  # Max 10% of portfolio per position
+        chain_store: Optional[OptionChainStore] = None,
     ):
         self.alpaca = alpaca_client
         self.min_premium = min_premium
         self.max_position_size = max_position_size
         self.positions: Dict[str, OptionPosition] = {}
         self.stats = OptionsStrategyStats()
+        self.chains = chain_store or OptionChainStore(self._fetch_option_chain, self._fetch_spot_price)
 
     @abstractmethod
     async def find_opportunities(self, symbols: List[str]) -> List[dict]:
@@ -136,42 +146,51 @@ class BaseOptionsStrategy(ABC):
         pass
 
     async def get_option_chain(self, symbol: str, expiry_range_days: int = 45) -> List[OptionContract]:
-        """Fetch option chain for a symbol."""
+        """Option chain for a symbol (served from the chain store cache)."""
         try:
-            # Get options contracts from Alpaca
-            expiry_date = datetime.now(timezone.utc) + timedelta(days=expiry_range_days)
-
-            response = await self.alpaca.get_options_contracts(
-                symbol,
-                expiration_date_gte=datetime.now(timezone.utc).strftime('%Y-%m-%d'),
-                expiration_date_lte=expiry_date.strftime('%Y-%m-%d'),
-            )
-
-            contracts = []
-            for contract in response:
-                contracts.append(OptionContract(
-                    symbol=contract.symbol,
-                    underlying=symbol,
-                    option_type=OptionType.CALL if contract.type == 'call' else OptionType.PUT,
-                    strike=float(contract.strike_price),
-                    expiration=datetime.fromisoformat(contract.expiration_date),
-                    bid=float(contract.bid or 0),
-                    ask=float(contract.ask or 0),
-                    last_price=float(contract.last_trade_price or 0),
-                    volume=int(contract.volume or 0),
-                    open_interest=int(contract.open_interest or 0),
-                    implied_volatility=float(contract.implied_volatility or 0),
-                    delta=float(contract.delta or 0),
-                    gamma=float(contract.gamma or 0),
-                    theta=float(contract.theta or 0),
-                    vega=float(contract.vega or 0),
-                ))
-
-            return contracts
+            chain = await self.chains.get_chain(symbol, expiry_range_days)
+            return chain.contracts
         except Exception as e:
             logger.error(f"Error fetching option chain for {symbol}: {e}")
             return []
 
+    async def _fetch_option_chain(self, symbol: str, expiry_range_days: int = 45) -> List[OptionContract]:
+        """Fetch option chain for a symbol from Alpaca."""
+        # Get options contracts from Alpaca
+        expiry_date = datetime.now(timezone.utc) + timedelta(days=expiry_range_days)
+
+        response = await self.alpaca.get_options_contracts(
+            symbol,
+            expiration_date_gte=datetime.now(timezone.utc).strftime('%Y-%m-%d'),
+            expiration_date_lte=expiry_date.strftime('%Y-%m-%d'),
+        )
+
+        contracts = []
+        for contract in response:
+            contracts.append(OptionContract(
+                symbol=contract.symbol,
+                underlying=symbol,
+                option_type=OptionType.CALL if contract.type == 'call' else OptionType.PUT,
+                strike=float(contract.strike_price),
+                expiration=datetime.fromisoformat(str(contract.expiration_date)).replace(tzinfo=timezone.utc),
+                bid=float(contract.bid or 0),
+                ask=float(contract.ask or 0),
+                last_price=float(contract.last_trade_price or 0),
+                volume=int(contract.volume or 0),
+                open_interest=int(contract.open_interest or 0),
+                implied_volatility=float(contract.implied_volatility or 0),
+                delta=float(contract.delta or 0),
+                gamma=float(contract.gamma or 0),
+                theta=float(contract.theta or 0),
+                vega=float(contract.vega or 0),
+            ))
+
+        return contracts
+
+    async def _fetch_spot_price(self, symbol: str) -> float:
+        quote = await self.alpaca.get_quote(symbol)
+        return float(quote.bid_price + quote.ask_price) / 2
+
     def calculate_annualized_return(self, premium: float, strike: float, days_to_expiry: int) -> float:
         """Calculate annualized return from premium."""
         if strike == 0 or days_to_expiry == 0:
@@ -197,54 +216,44 @@ class CoveredCallStrategy(BaseOptionsStrategy):
         delta_target: float = 0.30,  # Sell 30 delta calls
         min_premium_pct: float = 0.01,  # Min 1% premium per month
         days_to_expiry: Tuple[int, int] = (25, 45),  # 25-45 DTE
+        chain_store: Optional[OptionChainStore] = None,
     ):
-        super().__init__(alpaca_client)
+        super().__init__(alpaca_client, chain_store=chain_store)
         self.delta_target = delta_target
         self.min_premium_pct = min_premium_pct
         self.dte_range = days_to_expiry
 
     async def find_opportunities(self, symbols: List[str]) -> List[dict]:
         """Find covered call opportunities for owned stocks."""
-        opportunities = []
+        chain = await self.chains.load_watchlist(symbols, self.dte_range[1])
+        if not len(chain):
+            return []
 
-        for symbol in symbols:
-            try:
-                # Get current stock price
-                quote = await self.alpaca.get_quote(symbol)
-                stock_price = float(quote.bid_price + quote.ask_price) / 2
-
-                # Get option chain
-                chain = await self.get_option_chain(symbol, self.dte_range[1])
-
-                # Filter for OTM calls in DTE range
-                calls = [
-                    c for c in chain
-                    if c.option_type == OptionType.CALL
-                    and c.strike > stock_price  # OTM
-                    and self.dte_range[0] <= c.days_to_expiry <= self.dte_range[1]
-                    and abs(c.delta - self.delta_target) < 0.10  # Near target delta
-                ]
-
-                for call in calls:
-                    premium_pct = call.mid_price / stock_price
-                    annualized = self.calculate_annualized_return(
-                        call.mid_price, stock_price, call.days_to_expiry
-                    )
-
-                    if premium_pct >= self.min_premium_pct and annualized >= self.min_premium:
-                        opportunities.append({
-                            'symbol': symbol,
-                            'contract': call,
-                            'stock_price': stock_price,
-                            'premium_pct': premium_pct,
-                            'annualized_return': annualized,
-                            'upside_potential': (call.strike - stock_price) / stock_price,
-                            'strategy': OptionStrategy.COVERED_CALL,
-                        })
-
-            except Exception as e:
-                logger.error(f"Error analyzing {symbol}: {e}")
-                continue
+        # OTM calls in DTE range near target delta
+        mid, spot, dte = chain.mid, chain.spot, chain.dte
+        premium_pct = mid / spot
+        annualized = annualized_return(mid, spot, dte)
+        mask = (
+            chain.is_call
+            & (chain.strike > spot)
+            & chain.dte_between(*self.dte_range)
+            & (np.abs(chain.delta - self.delta_target) < 0.10)
+            & (premium_pct >= self.min_premium_pct)
+            & (annualized >= self.min_premium)
+        )
+
+        opportunities = []
+        for i in np.flatnonzero(mask):
+            call = chain.contracts[i]
+            opportunities.append({
+                'symbol': call.underlying,
+                'contract': call,
+                'stock_price': float(spot[i]),
+                'premium_pct': float(premium_pct[i]),
+                'annualized_return': float(annualized[i]),
+                'upside_potential': float((chain.strike[i] - spot[i]) / spot[i]),
+                'strategy': OptionStrategy.COVERED_CALL,
+            })
 
         # Sort by annualized return
         return sorted(opportunities, key=lambda x: x['annualized_return'], reverse=True)
@@ -305,57 +314,48 @@ class CashSecuredPutStrategy(BaseOptionsStrategy):
         delta_target: float = -0.30,  # Sell 30 delta puts
         min_premium_pct: float = 0.015,  # Min 1.5% premium
         days_to_expiry: Tuple[int, int] = (25, 45),
+        chain_store: Optional[OptionChainStore] = None,
     ):
-        super().__init__(alpaca_client)
+        super().__init__(alpaca_client, chain_store=chain_store)
         self.delta_target = delta_target
         self.min_premium_pct = min_premium_pct
         self.dte_range = days_to_expiry
 
     async def find_opportunities(self, symbols: List[str]) -> List[dict]:
         """Find cash-secured put opportunities."""
-        opportunities = []
+        chain = await self.chains.load_watchlist(symbols, self.dte_range[1])
+        if not len(chain):
+            return []
 
-        for symbol in symbols:
-            try:
-                quote = await self.alpaca.get_quote(symbol)
-                stock_price = float(quote.bid_price + quote.ask_price) / 2
-
-                chain = await self.get_option_chain(symbol, self.dte_range[1])
-
-                # Filter for OTM puts
-                puts = [
-                    p for p in chain
-                    if p.option_type == OptionType.PUT
-                    and p.strike < stock_price  # OTM
-                    and self.dte_range[0] <= p.days_to_expiry <= self.dte_range[1]
-                    and abs(p.delta - self.delta_target) < 0.10
-                ]
-
-                for put in puts:
-                    premium_pct = put.mid_price / put.strike
-                    annualized = self.calculate_annualized_return(
-                        put.mid_price, put.strike, put.days_to_expiry
-                    )
-
-                    if premium_pct >= self.min_premium_pct:
-                        # Calculate break-even price
-                        break_even = put.strike - put.mid_price
-                        discount = (stock_price - break_even) / stock_price
-
-                        opportunities.append({
-                            'symbol': symbol,
-                            'contract': put,
-                            'stock_price': stock_price,
-                            'premium_pct': premium_pct,
-                            'annualized_return': annualized,
-                            'break_even': break_even,
-                            'effective_discount': discount,
-                            'strategy': OptionStrategy.CASH_SECURED_PUT,
-                        })
-
-            except Exception as e:
-                logger.error(f"Error analyzing {symbol}: {e}")
-                continue
+        # OTM puts in DTE range near target delta
+        mid, spot, strike = chain.mid, chain.spot, chain.strike
+        with np.errstate(invalid="ignore", divide="ignore"):
+            premium_pct = np.where(strike > 0, mid / strike, 0.0)
+        annualized = annualized_return(mid, strike, chain.dte)
+        mask = (
+            ~chain.is_call
+            & (strike < spot)
+            & chain.dte_between(*self.dte_range)
+            & (np.abs(chain.delta - self.delta_target) < 0.10)
+            & (premium_pct >= self.min_premium_pct)
+        )
+        # Break-even price and discount to the current stock price
+        break_even = strike - mid
+        discount = (spot - break_even) / spot
+
+        opportunities = []
+        for i in np.flatnonzero(mask):
+            put = chain.contracts[i]
+            opportunities.append({
+                'symbol': put.underlying,
+                'contract': put,
+                'stock_price': float(spot[i]),
+                'premium_pct': float(premium_pct[i]),
+                'annualized_return': float(annualized[i]),
+                'break_even': float(break_even[i]),
+                'effective_discount': float(discount[i]),
+                'strategy': OptionStrategy.CASH_SECURED_PUT,
+            })
 
         return sorted(opportunities, key=lambda x: x['annualized_return'], reverse=True)
 
@@ -418,83 +418,69 @@ class IronCondorStrategy(BaseOptionsStrategy):
         wing_width: float = 0.05,  # 5% width for spreads
         target_credit: float = 0.30,  # Target 30% of spread width
         days_to_expiry: Tuple[int, int] = (30, 45),
+        chain_store: Optional[OptionChainStore] = None,
     ):
-        super().__init__(alpaca_client)
+        super().__init__(alpaca_client, chain_store=chain_store)
         self.wing_width = wing_width
         self.target_credit = target_credit
         self.dte_range = days_to_expiry
 
     async def find_opportunities(self, symbols: List[str]) -> List[dict]:
         """Find iron condor opportunities."""
+        chain = await self.chains.load_watchlist(symbols, self.dte_range[1])
+        if not len(chain):
+            return []
+
+        # Strike levels per underlying
+        spots = np.zeros(len(chain.underlyings))
+        spots[chain.underlying_idx] = chain.spot
+        put_short_strike = spots * (1 - self.wing_width)
+        put_long_strike = put_short_strike * (1 - self.wing_width)
+        call_short_strike = spots * (1 + self.wing_width)
+        call_long_strike = call_short_strike * (1 + self.wing_width)
+
+        # Nearest contracts for all underlyings at once
+        in_range = chain.dte_between(*self.dte_range)
+        puts, calls = in_range & ~chain.is_call, in_range & chain.is_call
+        put_short = chain.nearest(puts, put_short_strike)
+        put_long = chain.nearest(puts, put_long_strike)
+        call_short = chain.nearest(calls, call_short_strike)
+        call_long = chain.nearest(calls, call_long_strike)
+
+        mid = chain.mid
         opportunities = []
+        for symbol in chain.underlyings:
+            legs = (put_short.get(symbol), put_long.get(symbol),
+                    call_short.get(symbol), call_long.get(symbol))
+            if any(leg is None for leg in legs):
+                continue
+            ps, pl, cs, cl = legs
+
+            # Calculate net credit
+            credit = mid[ps] - mid[pl] + mid[cs] - mid[cl]
 
-        for symbol in symbols:
-            try:
-                quote = await self.alpaca.get_quote(symbol)
-                stock_price = float(quote.bid_price + quote.ask_price) / 2
-
-                chain = await self.get_option_chain(symbol, self.dte_range[1])
-
-                # Calculate strike levels
-                put_short_strike = stock_price * (1 - self.wing_width)
-                put_long_strike = put_short_strike * (1 - self.wing_width)
-                call_short_strike = stock_price * (1 + self.wing_width)
-                call_long_strike = call_short_strike * (1 + self.wing_width)
-
-                # Find matching contracts
-                put_short = self._find_nearest_strike(chain, OptionType.PUT, put_short_strike, self.dte_range)
-                put_long = self._find_nearest_strike(chain, OptionType.PUT, put_long_strike, self.dte_range)
-                call_short = self._find_nearest_strike(chain, OptionType.CALL, call_short_strike, self.dte_range)
-                call_long = self._find_nearest_strike(chain, OptionType.CALL, call_long_strike, self.dte_range)
-
-                if all([put_short, put_long, call_short, call_long]):
-                    # Calculate net credit
-                    credit = (put_short.mid_price - put_long.mid_price +
-                             call_short.mid_price - call_long.mid_price)
-
-                    # Max loss is spread width minus credit
-                    spread_width = put_short.strike - put_long.strike
-                    max_loss = spread_width - credit
-
-                    if credit / spread_width >= self.target_credit:
-                        opportunities.append({
-                            'symbol': symbol,
-                            'stock_price': stock_price,
-                            'put_short': put_short,
-                            'put_long': put_long,
-                            'call_short': call_short,
-                            'call_long': call_long,
-                            'net_credit': credit,
-                            'max_loss': max_loss,
-                            'return_on_risk': credit / max_loss,
-                            'prob_profit': 1 - abs(put_short.delta) - abs(call_short.delta),
-                            'strategy': OptionStrategy.IRON_CONDOR,
-                        })
-
-            except Exception as e:
-                logger.error(f"Error analyzing {symbol}: {e}")
+            # Max loss is spread width minus credit
+            spread_width = chain.strike[ps] - chain.strike[pl]
+            max_loss = spread_width - credit
+            if spread_width <= 0 or max_loss <= 0:
                 continue
 
-        return sorted(opportunities, key=lambda x: x['return_on_risk'], reverse=True)
+            if credit / spread_width >= self.target_credit:
+                opportunities.append({
+                    'symbol': symbol,
+                    'stock_price': float(spots[chain.underlying_idx[ps]]),
+                    'put_short': chain.contracts[ps],
+                    'put_long': chain.contracts[pl],
+                    'call_short': chain.contracts[cs],
+                    'call_long': chain.contracts[cl],
+                    'net_credit': float(credit),
+                    'max_loss': float(max_loss),
+                    'return_on_risk': float(credit / max_loss),
+                    'prob_profit': float(1 - abs(chain.delta[ps]) - abs(chain.delta[cs])),
+                    'strategy': OptionStrategy.IRON_CONDOR,
+                })
 
-    def _find_nearest_strike(
-        self,
-        chain: List[OptionContract],
-        opt_type: OptionType,
-        target_strike: float,
-        dte_range: Tuple[int, int]
-    ) -> Optional[OptionContract]:
-        """Find contract nearest to target strike."""
-        matching = [
-            c for c in chain
-            if c.option_type == opt_type
-            and dte_range[0] <= c.days_to_expiry <= dte_range[1]
-        ]
-
-        if not matching:
-            return None
-
-        return min(matching, key=lambda c: abs(c.strike - target_strike))
+        return sorted(opportunities, key=lambda x: x['return_on_risk'], reverse=True)
 
     async def execute_strategy(self, opportunity: dict) -> Optional[OptionPosition]:
         """Execute iron condor by placing all 4 legs."""
@@ -522,33 +508,47 @@ class WheelStrategy(BaseOptionsStrategy):
     Risk: Getting stuck in a falling stock
     """
 
-    def __init__(self, alpaca_client, symbols: List[str]):
-        super().__init__(alpaca_client)
+    def __init__(self, alpaca_client, symbols: List[str], chain_store: Optional[OptionChainStore] = None):
+        super().__init__(alpaca_client, chain_store=chain_store)
         self.target_symbols = symbols
         self.wheel_positions: Dict[str, WheelPhase] = {s: WheelPhase.SELLING_PUTS for s in symbols}
-        self.csp_strategy = CashSecuredPutStrategy(alpaca_client)
-        self.cc_strategy = CoveredCallStrategy(alpaca_client)
+        self.csp_strategy = CashSecuredPutStrategy(alpaca_client, chain_store=self.chains)
+        self.cc_strategy = CoveredCallStrategy(alpaca_client, chain_store=self.chains)
+
+    async def find_opportunities(self, symbols: List[str]) -> List[dict]:
+        """Screen each symbol for its current phase: CSPs or covered calls."""
+        put_symbols = [s for s in symbols if self.wheel_positions.get(s) == WheelPhase.SELLING_PUTS]
+        call_symbols = [s for s in symbols if self.wheel_positions.get(s) == WheelPhase.SELLING_CALLS]
+
+        # One screen per phase across all symbols in that phase
+        opportunities = []
+        if put_symbols:
+            opportunities += await self.csp_strategy.find_opportunities(put_symbols)
+        if call_symbols:
+            opportunities += await self.cc_strategy.find_opportunities(call_symbols)
+        return sorted(opportunities, key=lambda x: x['annualized_return'], reverse=True)
+
+    async def execute_strategy(self, opportunity: dict) -> Optional[OptionPosition]:
+        if opportunity['strategy'] == OptionStrategy.CASH_SECURED_PUT:
+            return await self.csp_strategy.execute_strategy(opportunity)
+        return await self.cc_strategy.execute_strategy(opportunity)
 
     async def run_wheel(self) -> Dict[str, any]:
         """Run one iteration of the wheel strategy."""
         results = {}
+        opportunities = await self.find_opportunities(self.target_symbols)
+
+        # Best opportunity per symbol (list is sorted best first)
+        best: Dict[str, dict] = {}
+        for opp in opportunities:
+            best.setdefault(opp['symbol'], opp)
 
         for symbol in self.target_symbols:
-            phase = self.wheel_positions[symbol]
-
-            if phase == WheelPhase.SELLING_PUTS:
-                # Find and execute CSP
-                opportunities = await self.csp_strategy.find_opportunities([symbol])
-                if opportunities:
-                    position = await self.csp_strategy.execute_strategy(opportunities[0])
-                    results[symbol] = {'phase': 'csp', 'position': position}
-
-            elif phase == WheelPhase.SELLING_CALLS:
-                # Find and execute covered call
-                opportunities = await self.cc_strategy.find_opportunities([symbol])
-                if opportunities:
-                    position = await self.cc_strategy.execute_strategy(opportunities[0])
-                    results[symbol] = {'phase': 'cc', 'position': position}
+            opp = best.get(symbol)
+            if opp:
+                position = await self.execute_strategy(opp)
+                phase = 'csp' if opp['strategy'] == OptionStrategy.CASH_SECURED_PUT else 'cc'
+                results[symbol] = {'phase': phase, 'position': position}
 
         return results
 
@@ -583,74 +583,57 @@ class VerticalSpreadStrategy(BaseOptionsStrategy):
         spread_width_pct: float = 0.05,  # 5% spread width
         max_debit_pct: float = 0.50,  # Max debit = 50% of spread width
         days_to_expiry: Tuple[int, int] = (30, 60),
+        chain_store: Optional[OptionChainStore] = None,
     ):
-        super().__init__(alpaca_client)
+        super().__init__(alpaca_client, chain_store=chain_store)
         self.spread_width_pct = spread_width_pct
         self.max_debit_pct = max_debit_pct
         self.dte_range = days_to_expiry
 
     async def find_bull_call_spreads(self, symbols: List[str]) -> List[dict]:
         """Find bull call spread opportunities."""
-        opportunities = []
+        chain = await self.chains.load_watchlist(symbols, self.dte_range[1])
+        if not len(chain):
+            return []
+
+        # Look for ATM/OTM call spreads
+        spots = np.zeros(len(chain.underlyings))
+        spots[chain.underlying_idx] = chain.spot
+        lower_strike = spots * 0.98  # Slightly ITM
+        upper_strike = lower_strike * (1 + self.spread_width_pct)
 
-        for symbol in symbols:
-            try:
-                quote = await self.alpaca.get_quote(symbol)
-                stock_price = float(quote.bid_price + quote.ask_price) / 2
-
-                chain = await self.get_option_chain(symbol, self.dte_range[1])
-
-                # Look for ATM/OTM call spreads
-                lower_strike = stock_price * 0.98  # Slightly ITM
-                upper_strike = lower_strike * (1 + self.spread_width_pct)
-
-                long_call = self._find_nearest_strike(chain, OptionType.CALL, lower_strike, self.dte_range)
-                short_call = self._find_nearest_strike(chain, OptionType.CALL, upper_strike, self.dte_range)
-
-                if long_call and short_call:
-                    debit = long_call.mid_price - short_call.mid_price
-                    spread_width = short_call.strike - long_call.strike
-                    max_profit = spread_width - debit
-
-                    if debit / spread_width <= self.max_debit_pct:
-                        opportunities.append({
-                            'symbol': symbol,
-                            'stock_price': stock_price,
-                            'long_call': long_call,
-                            'short_call': short_call,
-                            'debit': debit,
-                            'max_profit': max_profit,
-                            'max_loss': debit,
-                            'risk_reward': max_profit / debit,
-                            'break_even': long_call.strike + debit,
-                            'strategy': OptionStrategy.BULL_CALL_SPREAD,
-                        })
-
-            except Exception as e:
-                logger.error(f"Error analyzing {symbol}: {e}")
+        calls = chain.is_call & chain.dte_between(*self.dte_range)
+        long_calls = chain.nearest(calls, lower_strike)
+        short_calls = chain.nearest(calls, upper_strike)
+
+        mid = chain.mid
+        opportunities = []
+        for symbol, lc in long_calls.items():
+            sc = short_calls.get(symbol)
+            if sc is None:
+                continue
+            debit = mid[lc] - mid[sc]
+            spread_width = chain.strike[sc] - chain.strike[lc]
+            if spread_width <= 0 or debit <= 0:
                 continue
+            max_profit = spread_width - debit
+
+            if debit / spread_width <= self.max_debit_pct:
+                opportunities.append({
+                    'symbol': symbol,
+                    'stock_price': float(spots[chain.underlying_idx[lc]]),
+                    'long_call': chain.contracts[lc],
+                    'short_call': chain.contracts[sc],
+                    'debit': float(debit),
+                    'max_profit': float(max_profit),
+                    'max_loss': float(debit),
+                    'risk_reward': float(max_profit / debit),
+                    'break_even': float(chain.strike[lc] + debit),
+                    'strategy': OptionStrategy.BULL_CALL_SPREAD,
+                })
 
         return sorted(opportunities, key=lambda x: x['risk_reward'], reverse=True)
 
-    def _find_nearest_strike(
-        self,
-        chain: List[OptionContract],
-        opt_type: OptionType,
-        target_strike: float,
-        dte_range: Tuple[int, int]
-    ) -> Optional[OptionContract]:
-        """Find contract nearest to target strike."""
-        matching = [
-            c for c in chain
-            if c.option_type == opt_type
-            and dte_range[0] <= c.days_to_expiry <= dte_range[1]
-        ]
-
-        if not matching:
-            return None
-
-        return min(matching, key=lambda c: abs(c.strike - target_strike))
-
 
 # Strategy factory
 def create_options_strategy(
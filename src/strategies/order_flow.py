@@ -8,14 +8,23 @@ Academic Foundation:
 
 Order flow imbalance (OFI) is one of the strongest short-term predictors
 of price direction in liquid markets.
+
+Book history is kept per symbol in a fixed-size ring of float32
+(time x depth) arrays, so OFI, multi-level OFI, depth-weighted imbalance
+and momentum are vectorized over the ring and can be recomputed on every
+WebSocket book update for many symbols.
 """
 
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Dict, Optional, Sequence, Tuple
 from collections import deque
 from enum import Enum
 import logging
+import threading
+import time
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +109,122 @@ class OFIResult:
     suggested_action: str
     confidence: float
 
+    # Level-weighted (bid - ask) / (bid + ask), -1 to 1
+    depth_weighted_imbalance: float = 0.0
+
+
+def _epoch(timestamp: datetime) -> float:
+    """Naive datetimes are UTC (datetime.utcnow())."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+
+class BookRing:
+    """
+    Fixed-size ring of order book snapshots for one symbol.
+
+    Prices and sizes are float32 arrays of shape (capacity, depth); missing
+    levels have NaN price and zero size. Timestamps are epoch seconds.
+    """
+
+    def __init__(self, capacity: int = 100, depth: int = 10):
+        self.capacity = capacity
+        self.depth = depth
+        self.bid_px = np.full((capacity, depth), np.nan, dtype=np.float32)
+        self.bid_sz = np.zeros((capacity, depth), dtype=np.float32)
+        self.ask_px = np.full((capacity, depth), np.nan, dtype=np.float32)
+        self.ask_sz = np.zeros((capacity, depth), dtype=np.float32)
+        self.ts = np.zeros(capacity, dtype=np.float64)
+        self._head = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def push(
+        self,
+        timestamp: float,
+        bids: Sequence[Tuple[float, float]],
+        asks: Sequence[Tuple[float, float]],
+    ) -> None:
+        """Add a snapshot; bids best-first (descending), asks best-first (ascending)."""
+        i = self._head
+        for px, sz, levels in ((self.bid_px, self.bid_sz, bids), (self.ask_px, self.ask_sz, asks)):
+            n = min(len(levels), self.depth)
+            px[i] = np.nan
+            sz[i] = 0.0
+            if n:
+                arr = np.asarray(levels[:n], dtype=np.float32).reshape(n, -1)
+                px[i, :n] = arr[:, 0]
+                sz[i, :n] = arr[:, 1]
+        self.ts[i] = timestamp
+        self._head = (i + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def _order(self) -> np.ndarray:
+        """Ring row indices, oldest first."""
+        start = (self._head - self.count) % self.capacity
+        return (start + np.arange(self.count)) % self.capacity
+
+    def window(self, since: Optional[float] = None, levels: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Snapshots (oldest first) with timestamp >= since, top `levels` only."""
+        rows = self._order()
+        if since is not None:
+            rows = rows[self.ts[rows] >= since]
+        levels = self.depth if levels is None else min(levels, self.depth)
+        return {
+            "ts": self.ts[rows],
+            "bid_px": self.bid_px[rows, :levels],
+            "bid_sz": self.bid_sz[rows, :levels],
+            "ask_px": self.ask_px[rows, :levels],
+            "ask_sz": self.ask_sz[rows, :levels],
+        }
+
+    def latest(self, levels: Optional[int] = None) -> Dict[str, np.ndarray]:
+        if not self.count:
+            return {}
+        i = (self._head - 1) % self.capacity
+        levels = self.depth if levels is None else min(levels, self.depth)
+        return {
+            "bid_px": self.bid_px[i, :levels], "bid_sz": self.bid_sz[i, :levels],
+            "ask_px": self.ask_px[i, :levels], "ask_sz": self.ask_sz[i, :levels],
+        }
+
+
+def _matched_delta(px: np.ndarray, sz: np.ndarray) -> np.ndarray:
+    """
+    Per-step size change at each current price level.
+
+    For snapshots t-1 -> t: sum over current levels of
+    (size_t - size_{t-1} at the same price, 0 if that price was absent).
+    """
+    curr_px, curr_sz = px[1:], sz[1:]
+    prev_px, prev_sz = px[:-1], sz[:-1]
+    same = curr_px[:, :, None] == prev_px[:, None, :]  # (T-1, L, L); NaN never matches
+    prev_at_price = (same * prev_sz[:, None, :]).sum(axis=2)
+    valid = ~np.isnan(curr_px)
+    return np.where(valid, curr_sz - prev_at_price, 0.0).sum(axis=1, dtype=np.float64)
+
+
+def _level_ofi(w: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Multi-level OFI per step and level (Cont, Kukanov & Stoikov; Xu et al.).
+
+    Returns an array of shape (T-1, levels); positive = buying pressure.
+    """
+    bp, bq, ap, aq = w["bid_px"], w["bid_sz"], w["ask_px"], w["ask_sz"]
+    with np.errstate(invalid="ignore"):
+        bid = (
+            np.where(bp[1:] >= bp[:-1], bq[1:], 0.0)
+            - np.where(bp[1:] <= bp[:-1], bq[:-1], 0.0)
+        )
+        ask = (
+            np.where(ap[1:] <= ap[:-1], aq[1:], 0.0)
+            - np.where(ap[1:] >= ap[:-1], aq[:-1], 0.0)
+        )
+    return (bid - ask).astype(np.float64)
+
 
 class OrderFlowAnalyzer:
     """
@@ -120,6 +245,7 @@ class OrderFlowAnalyzer:
         signal_threshold: float = 0.3,
         strong_signal_threshold: float = 0.6,
         lookback_seconds: int = 300,
+        depth: int = 10,
     ):
         """
         Initialize order flow analyzer.
@@ -129,15 +255,23 @@ class OrderFlowAnalyzer:
             signal_threshold: OFI level for weak signal
             strong_signal_threshold: OFI level for strong signal
             lookback_seconds: Seconds to consider for analysis
+            depth: Book levels stored per snapshot
         """
         self.window_size = window_size
         self.signal_threshold = signal_threshold
         self.strong_threshold = strong_signal_threshold
         self.lookback_seconds = lookback_seconds
+        self.depth = depth
+
+        # Per-symbol book history (WebSocket callbacks run on other threads)
+        self._rings: Dict[str, BookRing] = {}
+        self._lock = threading.Lock()
 
-        # Per-symbol history
-        self._snapshots: Dict[str, deque] = {}
-        self._ofi_history: Dict[str, deque] = {}
+    def _ring(self, symbol: str) -> BookRing:
+        ring = self._rings.get(symbol)
+        if ring is None:
+            ring = self._rings[symbol] = BookRing(self.window_size, self.depth)
+        return ring
 
     def add_snapshot(self, symbol: str, snapshot: OrderBookSnapshot):
         """
@@ -147,10 +281,56 @@ class OrderFlowAnalyzer:
             symbol: Trading symbol
             snapshot: Order book snapshot
         """
-        if symbol not in self._snapshots:
-            self._snapshots[symbol] = deque(maxlen=self.window_size)
+        self.add_book(
+            symbol,
+            [(b.price, b.size) for b in snapshot.bids[:self.depth]],
+            [(a.price, a.size) for a in snapshot.asks[:self.depth]],
+            _epoch(snapshot.timestamp),
+        )
+
+    def add_book(
+        self,
+        symbol: str,
+        bids: Sequence[Tuple[float, float]],
+        asks: Sequence[Tuple[float, float]],
+        timestamp: Optional[float] = None,
+    ):
+        """
+        Add a book as (price, size) levels, best first.
+
+        Args:
+            symbol: Trading symbol
+            bids: Bid levels, price descending
+            asks: Ask levels, price ascending
+            timestamp: Epoch seconds (default: now)
+        """
+        with self._lock:
+            self._ring(symbol).push(timestamp or time.time(), bids, asks)
+
+    def on_book_update(self, symbol: str, book: Any):
+        """
+        WebSocket book callback, e.g. PolymarketClient.start(on_update=...).
+
+        Accepts Polymarket books (sorted bids/asks lists) and Kalshi books
+        (price -> quantity dicts, YES side).
+        """
+        if hasattr(book, "get_sorted_bids"):
+            bids, asks = book.get_sorted_bids(), book.get_sorted_asks()
+        else:
+            bids, asks = book.bids, book.asks
+        self.add_book(symbol, bids, asks, getattr(book, "last_update", None))
 
-        self._snapshots[symbol].append(snapshot)
+    def ingest_books(self, books: Dict[str, Any]):
+        """Add the current book for every symbol, e.g. KalshiClient.get_all_order_books()."""
+        for symbol, book in books.items():
+            self.on_book_update(symbol, book)
+
+    def _window(self, symbol: str, levels: int) -> Optional[Dict[str, np.ndarray]]:
+        ring = self._rings.get(symbol)
+        if ring is None:
+            return None
+        with self._lock:
+            return ring.window(time.time() - self.lookback_seconds, levels)
 
     def calculate_ofi(
         self,
@@ -167,30 +347,15 @@ class OrderFlowAnalyzer:
         Returns:
             OFIResult with signals and recommendations
         """
-        if symbol not in self._snapshots:
-            return None
-
-        snapshots = list(self._snapshots[symbol])
-        if len(snapshots) < 2:
-            return None
-
-        # Filter to lookback window
-        cutoff = datetime.utcnow() - timedelta(seconds=self.lookback_seconds)
-        recent = [s for s in snapshots if s.timestamp >= cutoff]
-
-        if len(recent) < 2:
+        w = self._window(symbol, levels)
+        if w is None or len(w["ts"]) < 2:
             return None
 
-        # Calculate OFI between consecutive snapshots
-        ofi_values = []
-        for i in range(1, len(recent)):
-            prev = recent[i - 1]
-            curr = recent[i]
-            ofi = self._calculate_delta_ofi(prev, curr, levels)
-            ofi_values.append(ofi)
+        # OFI between consecutive snapshots: bid adds minus ask adds
+        ofi_values = _matched_delta(w["bid_px"], w["bid_sz"]) - _matched_delta(w["ask_px"], w["ask_sz"])
 
         # Aggregate
-        ofi_raw = sum(ofi_values)
+        ofi_raw = float(ofi_values.sum())
         ofi_cumulative = ofi_raw
 
         # Normalize to -1 to 1
@@ -198,13 +363,8 @@ class OrderFlowAnalyzer:
         ofi_normalized = max(-1.0, min(1.0, ofi_raw / max_possible))
 
         # Calculate depth metrics from latest snapshot
-        latest = recent[-1]
-        bid_depth = sum(
-            b.size for b in latest.bids[:levels]
-        ) if latest.bids else 0
-        ask_depth = sum(
-            a.size for a in latest.asks[:levels]
-        ) if latest.asks else 0
+        bid_depth = float(w["bid_sz"][-1].sum())
+        ask_depth = float(w["ask_sz"][-1].sum())
 
         depth_imbalance = (
             bid_depth / ask_depth if ask_depth > 0 else 1.0
@@ -219,7 +379,7 @@ class OrderFlowAnalyzer:
 
         # Calculate confidence
         confidence = self._calculate_confidence(
-            len(recent), signal_strength, depth_imbalance
+            len(w["ts"]), signal_strength, depth_imbalance
         )
 
         result = OFIResult(
@@ -235,43 +395,43 @@ class OrderFlowAnalyzer:
             signal_strength=signal_strength,
             suggested_action=suggested_action,
             confidence=confidence,
+            depth_weighted_imbalance=self._weighted_imbalance(w["bid_sz"][-1], w["ask_sz"][-1]),
         )
 
-        # Track history
-        if symbol not in self._ofi_history:
-            self._ofi_history[symbol] = deque(maxlen=self.window_size)
-        self._ofi_history[symbol].append(result)
-
         return result
 
-    def _calculate_delta_ofi(
-        self,
-        prev: OrderBookSnapshot,
-        curr: OrderBookSnapshot,
-        levels: int,
-    ) -> float:
-        """Calculate OFI change between two snapshots."""
-        ofi = 0.0
-
-        # Calculate bid changes
-        prev_bids = {b.price: b.size for b in prev.bids[:levels]}
-        curr_bids = {b.price: b.size for b in curr.bids[:levels]}
+    def multi_level_ofi(self, symbol: str, levels: int = 5) -> Optional[np.ndarray]:
+        """
+        Multi-level OFI summed over the lookback window.
 
-        # Bid increases = buying pressure
-        for price, size in curr_bids.items():
-            prev_size = prev_bids.get(price, 0)
-            ofi += (size - prev_size)
+        Returns one value per book level (level 0 = best); positive values
+        mean net buying pressure at that level.
+        """
+        w = self._window(symbol, levels)
+        if w is None or len(w["ts"]) < 2:
+            return None
+        return _level_ofi(w).sum(axis=0)
 
-        # Calculate ask changes
-        prev_asks = {a.price: a.size for a in prev.asks[:levels]}
-        curr_asks = {a.price: a.size for a in curr.asks[:levels]}
+    @staticmethod
+    def _weighted_imbalance(bid_sz: np.ndarray, ask_sz: np.ndarray, decay: float = 0.5) -> float:
+        weights = decay ** np.arange(len(bid_sz), dtype=np.float64)
+        bid = float(weights @ bid_sz)
+        ask = float(weights @ ask_sz)
+        total = bid + ask
+        return (bid - ask) / total if total > 0 else 0.0
 
-        # Ask increases = selling pressure (subtract)
-        for price, size in curr_asks.items():
-            prev_size = prev_asks.get(price, 0)
-            ofi -= (size - prev_size)
+    def depth_weighted_imbalance(self, symbol: str, levels: int = 5, decay: float = 0.5) -> Optional[float]:
+        """
+        Latest book imbalance with level n weighted by decay**n.
 
-        return ofi
+        Returns (bid - ask) / (bid + ask) in [-1, 1].
+        """
+        ring = self._rings.get(symbol)
+        if ring is None or not len(ring):
+            return None
+        with self._lock:
+            latest = ring.latest(levels)
+        return self._weighted_imbalance(latest["bid_sz"], latest["ask_sz"], decay)
 
     def _determine_signal(self, ofi_normalized: float) -> OFISignal:
         """Determine signal from normalized OFI."""
@@ -330,29 +490,41 @@ class OrderFlowAnalyzer:
         self,
         symbol: str,
         periods: int = 5,
+        levels: int = 5,
     ) -> Optional[float]:
         """
         Get OFI momentum (rate of change).
 
+        Normalized OFI over the lookback window is evaluated at each of
+        the last periods + 1 snapshots in the ring.
+
         Args:
             symbol: Trading symbol
             periods: Number of periods for momentum
+            levels: Number of book levels to consider
 
         Returns:
             Momentum value (positive = increasing buy pressure)
         """
-        if symbol not in self._ofi_history:
+        ring = self._rings.get(symbol)
+        if ring is None:
             return None
-
-        history = list(self._ofi_history[symbol])
-        if len(history) < periods + 1:
+        with self._lock:
+            w = ring.window(levels=levels)
+        ts = w["ts"]
+        if len(ts) < periods + 2:
             return None
 
-        recent = history[-periods:]
-        older = history[-periods - 1]
+        steps = _matched_delta(w["bid_px"], w["bid_sz"]) - _matched_delta(w["ask_px"], w["ask_sz"])
+        cumulative = np.concatenate([[0.0], np.cumsum(steps)])
+
+        # Window OFI ending at each snapshot = cum[t] - cum[first snapshot in lookback]
+        ends = np.arange(len(ts) - periods - 1, len(ts))
+        starts = np.searchsorted(ts, ts[ends] - self.lookback_seconds, side="left")
+        window_ofi = cumulative[ends] - cumulative[np.minimum(starts, ends)]
+        normalized = np.clip(window_ofi / (levels * 1000), -1.0, 1.0)
 
-        avg_recent = sum(r.ofi_normalized for r in recent) / len(recent)
-        return avg_recent - older.ofi_normalized
+        return float(normalized[1:].mean() - normalized[0])
 
 
 @dataclass
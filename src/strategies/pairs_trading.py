@@ -37,7 +37,8 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Dict, List, Optional, Callable, Tuple
 from enum import Enum
-import statistics
+
+from src.utils.rolling_stats import RollingStats
 
 logger = logging.getLogger(__name__)
 
@@ -73,9 +74,19 @@ class TradingPair:
     price_b: float = 0.0
 
     # Historical data for calculations
-    spread_history: List[float] = field(default_factory=list)
     lookback_periods: int = 30  # Days of data for statistics
 
+    # Rolling spread window (hourly points over lookback_periods days)
+    _spread_stats: RollingStats = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._spread_stats = RollingStats(self.lookback_periods * 24)
+
+    @property
+    def spread_history(self) -> List[float]:
+        """Spread window, oldest first."""
+        return self._spread_stats.values()
+
     @property
     def is_signal_long_a(self) -> bool:
         """Z-score < -2: A is cheap relative to B"""
@@ -98,24 +109,15 @@ class TradingPair:
         # Calculate spread: A - beta * B
         self.current_spread = price_a - (self.beta * price_b)
 
-        # Add to history
-        self.spread_history.append(self.current_spread)
-
-        # Keep only lookback_periods
-        if len(self.spread_history) > self.lookback_periods * 24:  # hourly
-            self.spread_history = self.spread_history[-self.lookback_periods * 24:]
+        # Add to rolling window (O(1): oldest point is evicted automatically)
+        stats = self._spread_stats
+        stats.push(self.current_spread)
 
         # Update statistics
-        if len(self.spread_history) >= 10:
-            self.spread_mean = statistics.mean(self.spread_history)
-            self.spread_std = statistics.stdev(self.spread_history)
-
-            if self.spread_std > 0:
-                self.current_zscore = (
-                    self.current_spread - self.spread_mean
-                ) / self.spread_std
-            else:
-                self.current_zscore = 0.0
+        if stats.count >= 10:
+            self.spread_mean = stats.mean
+            self.spread_std = stats.std
+            self.current_zscore = stats.zscore(self.current_spread)
 
     def to_dict(self) -> Dict:
         return {
@@ -136,7 +138,7 @@ class TradingPair:
                 else "short_a" if self.is_signal_short_a
                 else "none"
             ),
-            "history_length": len(self.spread_history),
+            "history_length": len(self._spread_stats),
         }
 
 
@@ -392,6 +394,14 @@ class PairsTradingStrategy:
 
     async def _update_pairs(self) -> None:
         """Update prices and statistics for all pairs."""
+        # One snapshot for every pair leg instead of two get_ticker calls per pair
+        symbols = {s for pair in self.pairs.values() for s in (pair.symbol_a, pair.symbol_b)}
+        try:
+            snapshot = await self.ccxt_client.get_snapshot(symbols)
+        except Exception as e:
+            logger.warning(f"Failed to fetch market snapshot: {e}")
+            return
+
         for pair in self.pairs.values():
             try:
                 # Verify symbols are still valid on exchange
@@ -407,9 +417,12 @@ class PairsTradingStrategy:
                         )
                         continue
 
-                # Fetch current prices
-                ticker_a = await self.ccxt_client.get_ticker(pair.symbol_a)
-                ticker_b = await self.ccxt_client.get_ticker(pair.symbol_b)
+                # Current prices from the cycle snapshot
+                ticker_a = snapshot.get(pair.symbol_a)
+                ticker_b = snapshot.get(pair.symbol_b)
+                if ticker_a is None or ticker_b is None:
+                    logger.debug(f"Pair {pair.name}: no market data in snapshot")
+                    continue
 
                 price_a = ticker_a.last
                 price_b = ticker_b.last
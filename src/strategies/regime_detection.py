@@ -14,7 +14,8 @@ from enum import Enum
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import logging
-import statistics
+
+from .indicator_engine import IndicatorEngine
 
 logger = logging.getLogger(__name__)
 
@@ -174,6 +175,8 @@ class RegimeDetector:
     - Correlation breakdown detection
     """
 
+    _BENCHMARK = "market"
+
     def __init__(
         self,
         vix_low_threshold: float = 15.0,
@@ -206,6 +209,8 @@ class RegimeDetector:
 
         self._current_state: Optional[RegimeState] = None
         self._price_history: List[float] = []
+        # Benchmark series as a one-row indicator matrix
+        self._indicators = IndicatorEngine(capacity=max(100, lookback_periods + 1), initial_symbols=1)
         self._regime_history: List[RegimeState] = []
 
         # Config mapping
@@ -363,32 +368,24 @@ class RegimeDetector:
         if len(prices) < 2:
             return 0.0
 
-        # Simple ATR approximation using price changes
-        changes = [
-            abs(prices[i] - prices[i-1])
-            for i in range(1, len(prices))
-        ]
-
-        atr = statistics.mean(changes[-self.lookback:])
-        current_price = prices[-1]
-
-        if current_price == 0:
-            return 0.0
-
-        return (atr / current_price) * 100
+        # Simple ATR approximation using price changes (close-only true range)
+        self._indicators.load_history(self._BENCHMARK, prices)
+        _, atr_pct = self._indicators.atr_percent(self.lookback, [self._BENCHMARK])
+        return float(atr_pct[0])
 
     def _calculate_price_vs_sma(self, prices: List[float]) -> float:
         """Calculate price relative to SMA."""
         if len(prices) < self.lookback:
             return 1.0
 
-        sma = statistics.mean(prices[-self.lookback:])
-        current_price = prices[-1]
+        self._indicators.load_history(self._BENCHMARK, prices)
+        _, sma = self._indicators.sma(self.lookback, [self._BENCHMARK])
+        _, last = self._indicators.last([self._BENCHMARK])
 
-        if sma == 0:
+        if not sma[0]:
             return 1.0
 
-        return current_price / sma
+        return float(last[0] / sma[0])
 
     def get_config(self, regime: Optional[MarketRegime] = None) -> RegimeConfig:
         """Get configuration for a regime."""
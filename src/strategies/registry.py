@@ -0,0 +1,162 @@
+"""
+Strategy Registry - import and construct strategies only when enabled.
+
+Maps each PolybotRunner strategy attribute to the class (or factory) that
+builds it and the TradingConfig enable_* flag that turns it on. The
+module is imported the first time an enabled strategy is created, so a
+tenant running three strategies no longer pays for importing forty, and
+the import cost shows up in lazy_import's startup report.
+
+Usage:
+    registry = StrategyRegistry(config)
+    if registry.is_enabled("grid_trading") and ccxt_client:
+        grid = registry.create("grid_trading", ccxt_client=ccxt_client, ...)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from src.utils.lazy_import import import_object
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class StrategyEntry:
+    """Where a strategy lives and which config flag(s) enable it."""
+    path: str                              # "src.strategies.module:ClassOrFactory"
+    flags: Union[str, Tuple[str, ...]]     # Enabled if ANY flag is on
+    default: bool = False                  # Used when the flag is missing from config
+
+    @property
+    def flag_names(self) -> Tuple[str, ...]:
+        return (self.flags,) if isinstance(self.flags, str) else tuple(self.flags)
+
+
+_S = "src.strategies"
+
+# Keyed by the PolybotRunner attribute the strategy is stored on
+STRATEGIES: Dict[str, StrategyEntry] = {
+    # Prediction market arbitrage
+    "cross_platform_scanner": StrategyEntry(
+        "src.arbitrage.detector:CrossPlatformScanner", "enable_cross_platform_arb", True
+    ),
+    "single_platform_scanner": StrategyEntry(
+        "src.arbitrage.single_platform_scanner:SinglePlatformScanner",
+        ("enable_polymarket_single_arb", "enable_kalshi_single_arb"), True,
+    ),
+    "market_maker": StrategyEntry(f"{_S}.market_maker_v2:MarketMakerStrategy", "enable_market_making"),
+    "news_arbitrage": StrategyEntry(f"{_S}.news_arbitrage:NewsArbitrageStrategy", "enable_news_arbitrage"),
+    # Crypto
+    "funding_rate_arb": StrategyEntry(f"{_S}.funding_rate_arb:FundingRateArbStrategy", "enable_funding_rate_arb"),
+    "grid_trading": StrategyEntry(f"{_S}.grid_trading:GridTradingStrategy", "enable_grid_trading"),
+    "pairs_trading": StrategyEntry(f"{_S}.pairs_trading:PairsTradingStrategy", "enable_pairs_trading"),
+    "crypto_15min_scalping": StrategyEntry(
+        f"{_S}.crypto_15min_scalping:Crypto15MinScalpingStrategy", "enable_15min_crypto_scalping"
+    ),
+    "cross_exchange_arb": StrategyEntry(
+        f"{_S}.cross_exchange_arb:CrossExchangeArbStrategy", "enable_cross_exchange_arb"
+    ),
+    # Stocks (Alpaca)
+    "stock_mean_reversion": StrategyEntry(
+        f"{_S}.stock_mean_reversion:StockMeanReversionStrategy", "enable_stock_mean_reversion"
+    ),
+    "stock_momentum": StrategyEntry(f"{_S}.stock_momentum:StockMomentumStrategy", "enable_stock_momentum"),
+    "sector_rotation": StrategyEntry(f"{_S}.sector_rotation:SectorRotationStrategy", "enable_sector_rotation"),
+    "dividend_growth": StrategyEntry(f"{_S}.dividend_growth:DividendGrowthStrategy", "enable_dividend_growth"),
+    "earnings_momentum": StrategyEntry(
+        f"{_S}.earnings_momentum:EarningsMomentumStrategy", "enable_earnings_momentum"
+    ),
+    "congressional_tracker": StrategyEntry(
+        f"{_S}.congressional_tracker:CongressionalTrackerStrategy", "enable_congressional_tracker"
+    ),
+    # Options / futures (IBKR)
+    "covered_call": StrategyEntry(f"{_S}.options_strategies:CoveredCallStrategy", "enable_covered_calls"),
+    "cash_secured_put": StrategyEntry(
+        f"{_S}.options_strategies:CashSecuredPutStrategy", "enable_cash_secured_puts"
+    ),
+    "iron_condor": StrategyEntry(f"{_S}.options_strategies:IronCondorStrategy", "enable_iron_condor"),
+    "wheel_strategy": StrategyEntry(f"{_S}.options_strategies:WheelStrategy", "enable_wheel_strategy"),
+    "ibkr_futures_momentum": StrategyEntry(
+        f"{_S}.ibkr_futures_momentum:IBKRFuturesMomentumStrategy", "enable_ibkr_futures_momentum"
+    ),
+    # Twitter-derived (2024)
+    "btc_bracket_arb": StrategyEntry(f"{_S}.btc_bracket_arb:BTCBracketArbStrategy", "enable_btc_bracket_arb"),
+    "bracket_compression": StrategyEntry(
+        f"{_S}.bracket_compression:BracketCompressionStrategy", "enable_bracket_compression"
+    ),
+    "kalshi_mention_sniper": StrategyEntry(
+        f"{_S}.kalshi_mention_snipe:KalshiMentionSnipeStrategy", "enable_kalshi_mention_snipe"
+    ),
+    "whale_copy_trading": StrategyEntry(
+        f"{_S}.whale_copy_trading:WhaleCopyTradingStrategy", "enable_whale_copy_trading"
+    ),
+    "macro_board": StrategyEntry(f"{_S}.macro_board:MacroBoardStrategy", "enable_macro_board"),
+    "fear_premium_contrarian": StrategyEntry(
+        f"{_S}.fear_premium_contrarian:FearPremiumContrarianStrategy", "enable_fear_premium_contrarian"
+    ),
+    # 2025
+    "political_event_strategy": StrategyEntry(
+        f"{_S}.political_event:PoliticalEventStrategy", "enable_political_event_strategy"
+    ),
+    "high_conviction_strategy": StrategyEntry(
+        f"{_S}.high_conviction:HighConvictionStrategy", "enable_high_conviction_strategy"
+    ),
+    "selective_whale_copy": StrategyEntry(
+        f"{_S}.selective_whale_copy:SelectiveWhaleCopyStrategy", "enable_selective_whale_copy"
+    ),
+    "ai_superforecasting": StrategyEntry(
+        f"{_S}.ai_superforecasting:AISuperforecastingStrategy", "enable_ai_superforecasting"
+    ),
+    "polymarket_liquidation": StrategyEntry(
+        f"{_S}.liquidation:PolymarketLiquidationStrategy", "enable_polymarket_liquidation"
+    ),
+    # Async factory: create() returns a coroutine
+    "spike_hunter": StrategyEntry(
+        f"{_S}.spike_hunter:create_spike_hunter_from_config", "enable_spike_hunter", True
+    ),
+}
+
+
+class StrategyRegistry:
+    """Resolves enable flags against a Config and builds enabled strategies."""
+
+    def __init__(self, config, entries: Optional[Dict[str, StrategyEntry]] = None):
+        """
+        Args:
+            config: Config (flags are read from config.trading on every call,
+                so reloaded settings are picked up)
+            entries: Override the default STRATEGIES table
+        """
+        self.config = config
+        self.entries = entries if entries is not None else STRATEGIES
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def _entry(self, name: str) -> StrategyEntry:
+        try:
+            return self.entries[name]
+        except KeyError:
+            raise KeyError(f"Unknown strategy: {name}") from None
+
+    def is_enabled(self, name: str) -> bool:
+        entry = self._entry(name)
+        trading = self.config.trading
+        return any(bool(getattr(trading, flag, entry.default)) for flag in entry.flag_names)
+
+    def enabled(self) -> List[str]:
+        """Names of all strategies whose flags are on."""
+        return [name for name in self.entries if self.is_enabled(name)]
+
+    def load(self, name: str) -> Any:
+        """Import and return the strategy class/factory (regardless of flags)."""
+        return import_object(self._entry(name).path)
+
+    def create(self, name: str, *args, **kwargs) -> Optional[Any]:
+        """Construct the strategy, or return None without importing it if disabled."""
+        if not self.is_enabled(name):
+            logger.debug(f"Strategy {name} disabled - not imported")
+            return None
+        return self.load(name)(*args, **kwargs)
@@ -21,6 +21,10 @@ from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, List
 from enum import Enum
 
+import numpy as np
+
+from .indicator_engine import IndicatorEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -118,6 +122,8 @@ class SectorRotationStrategy:
         self.stats = RotationStats()
         self.last_rebalance: Optional[datetime] = None
         self.sector_history: Dict[str, List[SectorStrength]] = {}
+        # Daily closes for SPY + sector ETFs (~90 days each)
+        self.indicators = IndicatorEngine(capacity=128)
 
     async def analyze_sectors(self) -> List[SectorStrength]:
         """Analyze relative strength of all sectors."""
@@ -127,17 +133,24 @@ class SectorRotationStrategy:
         spy_data = await self._get_price_history('SPY', days=90)
         if not spy_data:
             return []
-
-        spy_returns = self._calculate_returns(spy_data)
-
-        for symbol, info in SECTOR_ETFS.items():
+        self.indicators.load_history('SPY', spy_data)
+
+        loaded = []
+        for symbol in SECTOR_ETFS:
+            # Get sector price history
+            prices = await self._get_price_history(symbol, days=90)
+            if prices:
+                self.indicators.load_history(symbol, prices)
+                loaded.append(symbol)
+
+        # Returns for the benchmark and every sector in one pass
+        all_returns = self._calculate_returns(['SPY'] + loaded)
+        spy_returns = all_returns['SPY']
+
+        for symbol in loaded:
+            info = SECTOR_ETFS[symbol]
             try:
-                # Get sector price history
-                prices = await self._get_price_history(symbol, days=90)
-                if not prices:
-                    continue
-
-                returns = self._calculate_returns(prices)
+                returns = all_returns[symbol]
 
                 # Calculate relative strength
                 rs_1m = returns['1m'] - spy_returns['1m']
@@ -157,7 +170,7 @@ class SectorRotationStrategy:
                 sector = SectorStrength(
                     symbol=symbol,
                     name=info['name'],
-                    current_price=prices[-1],
+                    current_price=returns['price'],
                     return_1w=returns['1w'],
                     return_1m=returns['1m'],
                     return_3m=returns['3m'],
@@ -197,23 +210,38 @@ class SectorRotationStrategy:
             return None
 
     def _calculate_returns(
-        self, prices: List[float]
-    ) -> Dict[str, float]:
-        """Calculate returns over different periods."""
-        if len(prices) < 90:
-            return {'1w': 0, '1m': 0, '3m': 0}
-
-        current = prices[-1]
-        week_ago = prices[-6] if len(prices) >= 6 else prices[0]
-        month_ago = prices[-22] if len(prices) >= 22 else prices[0]
-        quarter_ago = prices[0]
-
-        return {
-            '1w': (current - week_ago) / week_ago if week_ago else 0,
-            '1m': (current - month_ago) / month_ago if month_ago else 0,
-            '3m': (current - quarter_ago) / quarter_ago if quarter_ago else 0,
+        self, symbols: List[str], min_bars: int = 90
+    ) -> Dict[str, Dict[str, float]]:
+        """Calculate returns over different periods for each loaded symbol."""
+        names, window = self.indicators.window(self.indicators.capacity, symbols)
+        width = window.shape[1]
+        counts = (~np.isnan(window)).sum(axis=1)
+        rows = np.arange(len(names))
+        first_col = np.minimum(width - counts, width - 1)
+
+        def price_ago(lag: int) -> np.ndarray:
+            # prices[-1 - lag], falling back to the oldest price
+            return window[rows, np.maximum(width - 1 - lag, first_col)]
+
+        current = window[:, -1]
+        periods = {
+            '1w': price_ago(5),
+            '1m': price_ago(21),
+            '3m': window[rows, first_col],
         }
 
+        results: Dict[str, Dict[str, float]] = {}
+        for i, symbol in enumerate(names):
+            returns = {'price': float(current[i])}
+            for period, past in periods.items():
+                base = float(past[i])
+                if counts[i] < min_bars or not base:
+                    returns[period] = 0
+                else:
+                    returns[period] = (float(current[i]) - base) / base
+            results[symbol] = returns
+        return results
+
     def _get_signal(
         self, momentum: float, rs: float
     ) -> RotationSignal:
@@ -488,24 +488,23 @@ class SelectiveWhaleCopyStrategy:
 
     async def sync_to_database(self):
         """Sync whale selection status to database"""
-        if not self.db:
+        if not self.db or not self.tracked_whales:
             return
 
-        try:
-            for address, whale in self.tracked_whales.items():
-                await self.db.from_("polybot_tracked_whales").upsert({
-                    "address": address,
-                    "name": whale.username,
-                    "copy_enabled": whale.is_selected,
-                    "copy_multiplier": whale.copy_scale_pct / 100,
-                    "max_copy_size_usd": float(whale.max_copy_usd),
-                }).execute()
+        rows = [{
+            "address": address,
+            "alias": whale.username,
+            "copy_enabled": whale.is_selected,
+            "copy_multiplier": whale.copy_scale_pct / 100,
+            "max_copy_size_usd": float(whale.max_copy_usd),
+        } for address, whale in self.tracked_whales.items()]
 
-            logger.info(
-                f"Synced {len(self.tracked_whales)} whales to database"
-            )
-        except Exception as e:
-            logger.error(f"Failed to sync whales: {e}")
+        written = await self.db.upsert_many(
+            "polybot_tracked_whales", rows, on_conflict="address"
+        )
+        if written < len(rows):
+            logger.error(f"Failed to sync {len(rows) - written} whales")
+        logger.info(f"Synced {written} whales to database")
 
     def get_selected_whales(self) -> List[SelectableWhale]:
         """Get all selected whales"""
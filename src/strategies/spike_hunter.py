@@ -28,6 +28,7 @@ import asyncio
 import logging
 import time
 import uuid
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
@@ -54,6 +55,101 @@ class PricePoint:
     volume: float = 0.0
 
 
+class PriceWindow:
+    """
+    Compact per-market price history with O(1) amortized window extremes.
+
+    Ticks live in fixed-size array('d') ring buffers (no object per tick).
+    Two monotonic deques of tick sequence numbers track the min and max
+    price among ticks aged between min_age_sec and max_age_sec, so the
+    largest up or down move into the current price is available without
+    rescanning the history.
+    """
+
+    __slots__ = (
+        "capacity", "_ts", "_px", "_vol", "_next", "_start", "_admitted",
+        "_min_q", "_max_q",
+    )
+
+    def __init__(self, capacity: int):
+        self.capacity = max(2, capacity)
+        self._ts = array("d", bytes(8 * self.capacity))
+        self._px = array("d", bytes(8 * self.capacity))
+        self._vol = array("d", bytes(8 * self.capacity))
+        self._next = 0      # Sequence number of the next tick
+        self._start = 0     # Oldest sequence number still stored
+        self._admitted = 0  # Next sequence number to enter the deques
+        self._min_q: deque = deque()
+        self._max_q: deque = deque()
+
+    def __len__(self) -> int:
+        return self._next - self._start
+
+    def append(self, price: float, timestamp: float, volume: float = 0.0) -> None:
+        i = self._next % self.capacity
+        self._ts[i] = timestamp
+        self._px[i] = price
+        self._vol[i] = volume
+        self._next += 1
+        self._start = max(self._start, self._next - self.capacity)
+        self._admitted = max(self._admitted, self._start)
+
+    @property
+    def last_price(self) -> float:
+        return self._px[(self._next - 1) % self.capacity]
+
+    @property
+    def last_timestamp(self) -> float:
+        return self._ts[(self._next - 1) % self.capacity]
+
+    @property
+    def oldest_timestamp(self) -> Optional[float]:
+        return self._ts[self._start % self.capacity] if len(self) else None
+
+    def drop_before(self, cutoff: float) -> None:
+        """Forget ticks older than cutoff (timestamps are non-decreasing)."""
+        while self._start < self._next and self._ts[self._start % self.capacity] < cutoff:
+            self._start += 1
+        self._admitted = max(self._admitted, self._start)
+
+    def extremes(
+        self, now: float, max_age_sec: float, min_age_sec: float
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Min and max price among earlier ticks aged [min_age_sec, max_age_sec].
+
+        Returns (min_price, min_ts, max_price, max_ts) or None if no tick
+        qualifies. The latest tick is never compared with itself.
+        """
+        cap = self.capacity
+        ts, px = self._ts, self._px
+        min_q, max_q = self._min_q, self._max_q
+
+        # Admit ticks that are now old enough (excluding the latest tick)
+        newest_allowed = now - min_age_sec
+        while self._admitted < self._next - 1 and ts[self._admitted % cap] <= newest_allowed:
+            seq = self._admitted
+            price = px[seq % cap]
+            while min_q and px[min_q[-1] % cap] >= price:
+                min_q.pop()
+            min_q.append(seq)
+            while max_q and px[max_q[-1] % cap] <= price:
+                max_q.pop()
+            max_q.append(seq)
+            self._admitted += 1
+
+        # Expire ticks that fell out of the window or the ring buffer
+        oldest_allowed = now - max_age_sec
+        for q in (min_q, max_q):
+            while q and (q[0] < self._start or ts[q[0] % cap] < oldest_allowed):
+                q.popleft()
+
+        if not min_q:
+            return None
+        lo, hi = min_q[0] % cap, max_q[0] % cap
+        return px[lo], ts[lo], px[hi], ts[hi]
+
+
 @dataclass
 class SpikeOpportunity:
     """A spike trading opportunity"""
@@ -163,6 +259,9 @@ class SpikeHunterStrategy:
     - spike_max_concurrent: Max concurrent positions (default: 3)
     """
 
+    # Ignore moves spanning less than this (a single noisy print)
+    MIN_SPIKE_SPAN_SEC = 1.0
+
     def __init__(
         self,
         enabled: bool = True,
@@ -189,14 +288,14 @@ class SpikeHunterStrategy:
         # Callback for opportunity notification
         self._on_opportunity = on_opportunity
 
-        # Price history per market: market_id -> deque of PricePoints
-        self._price_history: Dict[str, deque] = {}
+        # Price history per market: market_id -> PriceWindow
+        self._price_history: Dict[str, PriceWindow] = {}
 
         # Active positions
         self._active_positions: Dict[str, SpikeOpportunity] = {}
 
-        # Recent spikes (to avoid re-trading same spike)
-        self._recent_spikes: Dict[str, datetime] = {}
+        # Recent spikes (to avoid re-trading same spike): market_id -> tick timestamp
+        self._recent_spikes: Dict[str, float] = {}
         self._spike_cooldown_sec: float = 60.0  # Don't retrade same market for 60s
 
         # Statistics
@@ -233,15 +332,12 @@ class SpikeHunterStrategy:
         ts = timestamp or time.time()
 
         # Initialize price history for new markets
-        if market_id not in self._price_history:
-            self._price_history[market_id] = deque(maxlen=self.lookback_window * 10)
+        history = self._price_history.get(market_id)
+        if history is None:
+            history = self._price_history[market_id] = PriceWindow(self.lookback_window * 10)
 
         # Add new price point
-        self._price_history[market_id].append(PricePoint(
-            price=price,
-            timestamp=ts,
-            volume=volume,
-        ))
+        history.append(price, ts, volume)
 
         # Check for spike
         return self._detect_spike(market_id)
@@ -261,60 +357,62 @@ class SpikeHunterStrategy:
         self.stats.total_scans += 1
 
         # Get current price
-        current = history[-1]
-        current_price = current.price
-        current_time = current.timestamp
+        current_price = history.last_price
+        current_time = history.last_timestamp
 
-        # Check if we're in cooldown for this market
+        # Check if we're in cooldown for this market (tick time, so replays behave like live)
         if market_id in self._recent_spikes:
-            cooldown_end = self._recent_spikes[market_id] + timedelta(seconds=self._spike_cooldown_sec)
-            if datetime.now(timezone.utc) < cooldown_end:
+            if current_time < self._recent_spikes[market_id] + self._spike_cooldown_sec:
                 return None
 
         # Check if we already have too many positions
         if len(self._active_positions) >= self.max_concurrent:
             return None
 
-        # Look back through price history for spike detection
-        for point in reversed(list(history)[:-1]):
-            time_diff = current_time - point.timestamp
+        # Lowest / highest price within the detection window. Ticks less than
+        # MIN_SPIKE_SPAN_SEC old are excluded (need some time delta).
+        extremes = history.extremes(
+            current_time, self.max_duration_sec, self.MIN_SPIKE_SPAN_SEC
+        )
+        if extremes is None:
+            return None
+        low, low_ts, high, high_ts = extremes
 
-            # Only look at prices within our detection window
-            if time_diff > self.max_duration_sec:
-                break
+        # Largest rise comes from the window low, largest drop from the high
+        rise_pct = ((current_price - low) / low) * 100 if low > 0 else 0
+        drop_pct = ((current_price - high) / high) * 100 if high > 0 else 0
 
-            # Skip very recent prices (need some time delta)
-            if time_diff < 1.0:
-                continue
+        if rise_pct >= abs(drop_pct):
+            price_change_pct, old_price, old_time = rise_pct, low, low_ts
+        else:
+            price_change_pct, old_price, old_time = drop_pct, high, high_ts
 
-            # Calculate price change
-            old_price = point.price
-            price_change_pct = ((current_price - old_price) / old_price) * 100 if old_price > 0 else 0
+        # Check for spike (up or down)
+        if abs(price_change_pct) < self.min_magnitude_pct:
+            return None
 
-            # Check for spike (up or down)
-            if abs(price_change_pct) >= self.min_magnitude_pct:
-                spike_type = SpikeType.SPIKE_UP if price_change_pct > 0 else SpikeType.SPIKE_DOWN
+        spike_type = SpikeType.SPIKE_UP if price_change_pct > 0 else SpikeType.SPIKE_DOWN
 
-                # Create opportunity
-                opp = self._create_opportunity(
-                    market_id=market_id,
-                    spike_type=spike_type,
-                    spike_start_price=old_price,
-                    spike_end_price=current_price,
-                    spike_magnitude_pct=abs(price_change_pct),
-                    spike_duration_sec=time_diff,
-                )
+        # Create opportunity
+        opp = self._create_opportunity(
+            market_id=market_id,
+            spike_type=spike_type,
+            spike_start_price=old_price,
+            spike_end_price=current_price,
+            spike_magnitude_pct=abs(price_change_pct),
+            spike_duration_sec=current_time - old_time,
+        )
 
-                if opp:
-                    self.stats.spikes_detected += 1
-                    self._recent_spikes[market_id] = datetime.now(timezone.utc)
+        if opp:
+            self.stats.spikes_detected += 1
+            self._recent_spikes[market_id] = current_time
 
-                    # Notify callback
-                    if self._on_opportunity:
-                        self._on_opportunity(opp)
+            # Notify callback
+            if self._on_opportunity:
+                self._on_opportunity(opp)
 
-                    logger.info(f"🎯 SPIKE DETECTED: {opp}")
-                    return opp
+            logger.info(f"🎯 SPIKE DETECTED: {opp}")
+            return opp
 
         return None
 
@@ -489,10 +587,11 @@ class SpikeHunterStrategy:
         now = time.time()
         cutoff = now - max_age_sec
 
-        for market_id, history in self._price_history.items():
-            # Remove old entries
-            while history and history[0].timestamp < cutoff:
-                history.popleft()
+        for market_id, history in list(self._price_history.items()):
+            # Remove old entries; drop markets that have gone quiet entirely
+            history.drop_before(cutoff)
+            if not len(history):
+                del self._price_history[market_id]
 
     def get_stats(self) -> Dict[str, Any]:
         """Get strategy statistics."""
@@ -23,7 +23,8 @@ from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, List, Any
 from enum import Enum
 from decimal import Decimal
-import statistics
+
+from .indicator_engine import IndicatorEngine
 
 logger = logging.getLogger(__name__)
 
@@ -132,7 +133,8 @@ class StockMeanReversionStrategy:
 
         # State
         self.positions: Dict[str, MeanReversionPosition] = {}
-        self.price_history: Dict[str, List[float]] = {}
+        # Daily closes for the watchlist (symbols x lookback_period)
+        self.indicators = IndicatorEngine(capacity=lookback_period)
         self.stats = MeanReversionStats()
         self._running = False
 
@@ -165,55 +167,65 @@ class StockMeanReversionStrategy:
                     )
                     # Extract close prices
                     closes = [candle[4] for candle in ohlcv]  # [ts, o, h, l, c, v]
-                    self.price_history[symbol] = closes[-self.lookback_period:]
+                    self.indicators.load_history(symbol, closes)
                     logger.debug(f"  {symbol}: {len(closes)} days loaded")
                 except Exception as e:
                     logger.warning(f"Failed to load history for {symbol}: {e}")
 
-            logger.info(f"✅ Loaded history for {len(self.price_history)}/{len(self.watchlist)} stocks")
+            logger.info(f"✅ Loaded history for {len(self.indicators)}/{len(self.watchlist)} stocks")
             return True
 
         except Exception as e:
             logger.error(f"Failed to initialize strategy: {e}")
             return False
 
-    def _calculate_signal(self, symbol: str, current_price: float) -> Optional[StockSignal]:
-        """Calculate mean reversion signal for a symbol."""
-        history = self.price_history.get(symbol, [])
-
-        if len(history) < self.lookback_period:
-            return None
-
-        # Calculate SMA and standard deviation
-        sma = statistics.mean(history)
-        std_dev = statistics.stdev(history)
-
-        if std_dev == 0:
-            return None
+    def _calculate_signals(self, prices: Dict[str, float]) -> Dict[str, StockSignal]:
+        """Calculate mean reversion signals for many symbols in one pass."""
+        symbols = list(prices)
+        if not symbols:
+            return {}
+
+        # SMA and standard deviation over the full lookback window
+        _, sma = self.indicators.sma(self.lookback_period, symbols)
+        _, std = self.indicators.stdev(self.lookback_period, symbols)
+
+        signals: Dict[str, StockSignal] = {}
+        for i, symbol in enumerate(symbols):
+            mean, std_dev = float(sma[i]), float(std[i])
+            # NaN = not enough history yet
+            if mean != mean or std_dev != std_dev or std_dev == 0:
+                continue
+
+            current_price = prices[symbol]
+            # Calculate z-score (number of std devs from mean)
+            z_score = (current_price - mean) / std_dev
+
+            # Determine signal
+            if z_score <= -self.entry_threshold:
+                signal = SignalType.BUY
+                strength = min(1.0, abs(z_score) / 3.0)  # Stronger signal further from mean
+            elif z_score >= self.entry_threshold:
+                signal = SignalType.SELL
+                strength = min(1.0, abs(z_score) / 3.0)
+            else:
+                signal = SignalType.HOLD
+                strength = 0.0
+
+            signals[symbol] = StockSignal(
+                symbol=symbol,
+                signal=signal,
+                current_price=current_price,
+                sma_20=mean,
+                std_dev=std_dev,
+                z_score=z_score,
+                strength=strength,
+            )
 
-        # Calculate z-score (number of std devs from mean)
-        z_score = (current_price - sma) / std_dev
+        return signals
 
-        # Determine signal
-        if z_score <= -self.entry_threshold:
-            signal = SignalType.BUY
-            strength = min(1.0, abs(z_score) / 3.0)  # Stronger signal further from mean
-        elif z_score >= self.entry_threshold:
-            signal = SignalType.SELL
-            strength = min(1.0, abs(z_score) / 3.0)
-        else:
-            signal = SignalType.HOLD
-            strength = 0.0
-
-        return StockSignal(
-            symbol=symbol,
-            signal=signal,
-            current_price=current_price,
-            sma_20=sma,
-            std_dev=std_dev,
-            z_score=z_score,
-            strength=strength,
-        )
+    def _calculate_signal(self, symbol: str, current_price: float) -> Optional[StockSignal]:
+        """Calculate mean reversion signal for a symbol."""
+        return self._calculate_signals({symbol: current_price}).get(symbol)
 
     async def _enter_position(self, signal: StockSignal) -> Optional[MeanReversionPosition]:
         """Enter a new position based on signal."""
@@ -283,12 +295,14 @@ class StockMeanReversionStrategy:
 
     async def _check_exit(self, position: MeanReversionPosition, current_price: float) -> bool:
         """Check if position should be exited."""
-        history = self.price_history.get(position.symbol, [])
-        if not history:
+        symbols = [position.symbol]
+        if not self.indicators.bar_count(position.symbol):
             return False
 
-        sma = statistics.mean(history)
-        std_dev = statistics.stdev(history) if len(history) > 1 else 1.0
+        sma = float(self.indicators.sma(self.lookback_period, symbols, min_bars=1)[1][0])
+        std_dev = float(self.indicators.stdev(self.lookback_period, symbols, min_bars=2)[1][0])
+        if std_dev != std_dev:  # Single bar
+            std_dev = 1.0
         z_score = (current_price - sma) / std_dev if std_dev > 0 else 0
 
         should_exit = False
@@ -367,22 +381,21 @@ class StockMeanReversionStrategy:
             # Get current prices
             tickers = await self.alpaca.get_tickers(self.watchlist)
 
-            for symbol in self.watchlist:
-                ticker = tickers.get(symbol)
-                if not ticker:
-                    continue
-
-                current_price = ticker.last
-
-                # Update price history
-                if symbol in self.price_history:
-                    self.price_history[symbol].append(current_price)
-                    # Keep only lookback_period days
-                    self.price_history[symbol] = self.price_history[symbol][-self.lookback_period:]
-
-                # Calculate signal
-                signal = self._calculate_signal(symbol, current_price)
-                if signal and signal.signal != SignalType.HOLD:
+            prices = {
+                symbol: tickers[symbol].last
+                for symbol in self.watchlist
+                if tickers.get(symbol)
+            }
+
+            # Update price history (ring buffer keeps lookback_period days)
+            self.indicators.append_bars({
+                symbol: price for symbol, price in prices.items()
+                if symbol in self.indicators
+            })
+
+            # Calculate signals for the whole watchlist at once
+            for signal in self._calculate_signals(prices).values():
+                if signal.signal != SignalType.HOLD:
                     signals.append(signal)
                     self.stats.total_signals += 1
 
@@ -21,7 +21,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, List
 from enum import Enum
-import statistics
+
+import numpy as np
+
+from .indicator_engine import IndicatorEngine
 
 logger = logging.getLogger(__name__)
 
@@ -138,7 +141,8 @@ class StockMomentumStrategy:
 
         # State
         self.positions: Dict[str, MomentumPosition] = {}
-        self.price_data: Dict[str, List[Dict]] = {}  # OHLCV data
+        # Daily OHLCV bars for the whole universe (symbols x time)
+        self.indicators = IndicatorEngine(capacity=25)
         self.stats = MomentumStats()
         self._running = False
 
@@ -165,21 +169,17 @@ class StockMomentumStrategy:
                     ohlcv = await self.alpaca.get_ohlcv(
                         symbol, timeframe='1Day', limit=25
                     )
-                    self.price_data[symbol] = [
-                        {
-                            'timestamp': c[0],
-                            'open': c[1],
-                            'high': c[2],
-                            'low': c[3],
-                            'close': c[4],
-                            'volume': c[5]
-                        }
-                        for c in ohlcv
-                    ]
+                    self.indicators.load_history(
+                        symbol,
+                        closes=[c[4] for c in ohlcv],
+                        highs=[c[2] for c in ohlcv],
+                        lows=[c[3] for c in ohlcv],
+                        volumes=[c[5] for c in ohlcv],
+                    )
                 except Exception as e:
                     logger.warning(f"Failed to load data for {symbol}: {e}")
 
-            loaded = len(self.price_data)
+            loaded = len(self.indicators)
             logger.info(f"✅ Loaded data for {loaded}/{len(self.universe)} stocks")
             return loaded > 0
 
@@ -187,51 +187,29 @@ class StockMomentumStrategy:
             logger.error(f"Failed to initialize strategy: {e}")
             return False
 
-    def _calculate_rsi(self, prices: List[float], period: int = 14) -> float:
-        """Calculate RSI indicator."""
-        if len(prices) < period + 1:
-            return 50.0  # Neutral
-
-        # Calculate price changes
-        changes = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-
-        # Separate gains and losses
-        gains = [max(0, c) for c in changes[-period:]]
-        losses = [abs(min(0, c)) for c in changes[-period:]]
-
-        avg_gain = sum(gains) / period
-        avg_loss = sum(losses) / period
-
-        if avg_loss == 0:
-            return 100.0
-
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-
-        return rsi
-
-    def _calculate_momentum_score(self, symbol: str) -> Optional[MomentumScore]:
-        """Calculate momentum score for a symbol."""
-        data = self.price_data.get(symbol, [])
-
-        if len(data) < 20:
-            return None
-
-        closes = [d['close'] for d in data]
-        volumes = [d['volume'] for d in data]
-        current_price = closes[-1]
-
-        # Price changes
-        price_1d = ((current_price / closes[-2]) - 1) * 100 if len(closes) >= 2 else 0
-        price_5d = ((current_price / closes[-5]) - 1) * 100 if len(closes) >= 5 else 0
-        price_20d = ((current_price / closes[-20]) - 1) * 100 if len(closes) >= 20 else 0
-
-        # RSI
-        rsi = self._calculate_rsi(closes)
+    def _calculate_momentum_scores(
+        self, symbols: Optional[List[str]] = None
+    ) -> Dict[str, MomentumScore]:
+        """Calculate momentum scores for many symbols in one vectorized pass."""
+        engine = self.indicators
+        names = [
+            s for s in (symbols if symbols is not None else engine.symbols)
+            if engine.bar_count(s) >= 20
+        ]
+        if not names:
+            return {}
+
+        _, prices = engine.last(names)
+        # Price changes (closes[-2], closes[-5], closes[-20])
+        price_1d = engine.pct_change(1, names)[1] * 100
+        price_5d = engine.pct_change(4, names)[1] * 100
+        price_20d = engine.pct_change(19, names)[1] * 100
+
+        # RSI (neutral if undefined)
+        rsi = np.nan_to_num(engine.rsi(14, names)[1], nan=50.0)
 
         # Volume surge (current vs 20-day average)
-        avg_volume = statistics.mean(volumes[-20:]) if volumes else 1
-        vol_ratio = volumes[-1] / avg_volume if avg_volume > 0 else 1
+        vol_ratio = engine.volume_ratio(20, names)[1]
 
         # Calculate momentum score (0-100)
         # Components:
@@ -242,13 +220,13 @@ class StockMomentumStrategy:
         # - Volume confirmation: 15%
 
         # Normalize each component to 0-100
-        short_score = min(100, max(0, 50 + price_1d * 10))
-        medium_score = min(100, max(0, 50 + price_5d * 5))
-        long_score = min(100, max(0, 50 + price_20d * 2))
+        short_score = np.clip(50 + price_1d * 10, 0, 100)
+        medium_score = np.clip(50 + price_5d * 5, 0, 100)
+        long_score = np.clip(50 + price_20d * 2, 0, 100)
         rsi_score = rsi  # Already 0-100
-        volume_score = min(100, vol_ratio * 50)  # 2x volume = 100
+        volume_score = np.minimum(100, vol_ratio * 50)  # 2x volume = 100
 
-        momentum_score = (
+        momentum = (
             short_score * 0.20 +
             medium_score * 0.30 +
             long_score * 0.20 +
@@ -256,29 +234,40 @@ class StockMomentumStrategy:
             volume_score * 0.15
         )
 
-        # Determine signal
-        if momentum_score >= 80 and rsi < 70:
-            signal = MomentumSignal.STRONG_BUY
-        elif momentum_score >= 65 and rsi < 75:
-            signal = MomentumSignal.BUY
-        elif momentum_score <= 20 or rsi > 80:
-            signal = MomentumSignal.STRONG_SELL
-        elif momentum_score <= 35:
-            signal = MomentumSignal.SELL
-        else:
-            signal = MomentumSignal.HOLD
-
-        return MomentumScore(
-            symbol=symbol,
-            price=current_price,
-            price_change_1d=price_1d,
-            price_change_5d=price_5d,
-            price_change_20d=price_20d,
-            rsi_14=rsi,
-            volume_ratio=vol_ratio,
-            momentum_score=momentum_score,
-            signal=signal,
-        )
+        scores: Dict[str, MomentumScore] = {}
+        for i, symbol in enumerate(names):
+            momentum_score = float(momentum[i])
+            symbol_rsi = float(rsi[i])
+
+            # Determine signal
+            if momentum_score >= 80 and symbol_rsi < 70:
+                signal = MomentumSignal.STRONG_BUY
+            elif momentum_score >= 65 and symbol_rsi < 75:
+                signal = MomentumSignal.BUY
+            elif momentum_score <= 20 or symbol_rsi > 80:
+                signal = MomentumSignal.STRONG_SELL
+            elif momentum_score <= 35:
+                signal = MomentumSignal.SELL
+            else:
+                signal = MomentumSignal.HOLD
+
+            scores[symbol] = MomentumScore(
+                symbol=symbol,
+                price=float(prices[i]),
+                price_change_1d=float(price_1d[i]),
+                price_change_5d=float(price_5d[i]),
+                price_change_20d=float(price_20d[i]),
+                rsi_14=symbol_rsi,
+                volume_ratio=float(vol_ratio[i]),
+                momentum_score=momentum_score,
+                signal=signal,
+            )
+
+        return scores
+
+    def _calculate_momentum_score(self, symbol: str) -> Optional[MomentumScore]:
+        """Calculate momentum score for a symbol."""
+        return self._calculate_momentum_scores([symbol]).get(symbol)
 
     async def _enter_position(
         self, score: MomentumScore
@@ -418,26 +407,17 @@ class StockMomentumStrategy:
             # Get current prices and update data
             tickers = await self.alpaca.get_tickers(self.universe)
 
-            for symbol in self.universe:
-                ticker = tickers.get(symbol)
-                if not ticker:
-                    continue
-
-                # Update price data
-                if symbol in self.price_data:
-                    self.price_data[symbol].append({
-                        'timestamp': int(datetime.now().timestamp() * 1000),
-                        'open': ticker.last,
-                        'high': ticker.last,
-                        'low': ticker.last,
-                        'close': ticker.last,
-                        'volume': 0,  # Intraday volume not available
-                    })
-                    # Keep only recent data
-                    self.price_data[symbol] = self.price_data[symbol][-25:]
-
-                score = self._calculate_momentum_score(symbol)
-                if score and score.signal in (
+            # Append the latest price as a bar for every loaded symbol
+            # (intraday volume not available)
+            self.indicators.append_bars({
+                symbol: (ticker.last, ticker.last, ticker.last, 0.0)
+                for symbol, ticker in tickers.items()
+                if ticker and symbol in self.indicators
+            })
+
+            scored = [s for s in self.universe if tickers.get(s)]
+            for score in self._calculate_momentum_scores(scored).values():
+                if score.signal in (
                     MomentumSignal.STRONG_BUY, MomentumSignal.BUY
                 ):
                     if score.momentum_score >= self.min_momentum_score:
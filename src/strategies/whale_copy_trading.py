@@ -19,10 +19,17 @@ Criteria for "whale" status:
 - Total volume > $10,000
 - Number of predictions > 50
 - Recent activity (last 7 days)
+
+Polling: every whale's activity is fetched concurrently (bounded by
+activity_concurrency), and each whale keeps a high-water mark of the
+newest activity already seen. Requests ask only for activity since the
+mark and older entries are skipped before parsing, so a cycle costs
+about one round trip regardless of how many whales are tracked.
 """
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
@@ -175,6 +182,29 @@ class CopySignal:
         }
 
 
+@dataclass
+class ActivityCursor:
+    """High-water mark of a whale's activity already seen"""
+    timestamp: Optional[float] = None   # Newest activity time (unix seconds)
+    ids: Set[str] = field(default_factory=set)  # Activity ids at exactly that time
+
+
+def _activity_timestamp(entry: Dict) -> Optional[float]:
+    """Activity time in unix seconds (accepts seconds, milliseconds or ISO 8601)."""
+    value = entry.get("timestamp") or entry.get("created_at") or entry.get("createdAt")
+    if value is None:
+        return None
+    try:
+        ts = float(value)
+        return ts / 1000 if ts > 1e12 else ts
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
 @dataclass
 class CopyTradingStats:
     """Statistics for copy trading"""
@@ -185,6 +215,7 @@ class CopyTradingStats:
     trades_lost: int = 0
     total_pnl: Decimal = Decimal("0")
     best_whale_pnl: Decimal = Decimal("0")
+    last_poll_sec: float = 0.0  # Wall time of the last activity poll (all whales)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -196,6 +227,7 @@ class CopyTradingStats:
             ),
             "total_pnl": float(self.total_pnl),
             "best_whale_pnl": float(self.best_whale_pnl),
+            "last_poll_sec": round(self.last_poll_sec, 3),
         }
 
 
@@ -250,6 +282,7 @@ class WhaleCopyTradingStrategy:
         max_slippage_pct: float = 5.0,
         balance_proportional: bool = True,
         max_balance_pct: float = 10.0,
+        activity_concurrency: int = 16,
     ):
         self.whale_addresses = whale_addresses or self.DEFAULT_WHALES
         self.min_win_rate = min_win_rate
@@ -269,6 +302,10 @@ class WhaleCopyTradingStrategy:
         self.balance_proportional = balance_proportional
         self.max_balance_pct = max_balance_pct
 
+        # Activity polling: requests in flight, per-whale high-water marks
+        self.activity_concurrency = max(1, activity_concurrency)
+        self._cursors: Dict[str, ActivityCursor] = {}
+
         self._running = False
         self._session: Optional[aiohttp.ClientSession] = None
         self.stats = CopyTradingStats()
@@ -276,7 +313,7 @@ class WhaleCopyTradingStrategy:
         # Tracked whales
         self._whales: Dict[str, WhaleProfile] = {}
 
-        # Recent trades (to avoid duplicates)
+        # Recent trade ids, oldest first (dedup for activity without timestamps)
         self._recent_trades: Dict[str, datetime] = {}
 
         # Pending copy signals
@@ -285,6 +322,9 @@ class WhaleCopyTradingStrategy:
         # Snapshot tracking
         self._last_daily_snapshot: Optional[datetime] = None
 
+        # Background bulk writes (kept so close() can flush them)
+        self._db_writes: Set[asyncio.Task] = set()
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session"""
         if self._session is None or self._session.closed:
@@ -294,7 +334,9 @@ class WhaleCopyTradingStrategy:
         return self._session
 
     async def close(self):
-        """Close the session"""
+        """Flush pending DB writes and close the session"""
+        if self._db_writes:
+            await asyncio.gather(*self._db_writes, return_exceptions=True)
         if self._session and not self._session.closed:
             await self._session.close()
 
@@ -337,8 +379,13 @@ class WhaleCopyTradingStrategy:
 
         return None
 
-    async def fetch_trader_activity(self, address: str, limit: int = 20) -> List[Dict]:
-        """Fetch recent trading activity for an address"""
+    async def fetch_trader_activity(
+        self,
+        address: str,
+        limit: int = 20,
+        since: Optional[float] = None,
+    ) -> List[Dict]:
+        """Fetch recent trading activity for an address (since: unix seconds, inclusive)"""
         session = await self._get_session()
         activity = []
 
@@ -348,6 +395,8 @@ class WhaleCopyTradingStrategy:
                 "user": address,
                 "limit": limit,
             }
+            if since is not None:
+                params["start"] = int(since)
 
             async with session.get(url, params=params) as resp:
                 if resp.status == 200:
@@ -435,10 +484,14 @@ class WhaleCopyTradingStrategy:
             price = Decimal(str(activity.get("price", 0.5)))
             size = Decimal(str(activity.get("size_usd", 0) or activity.get("amount", 0)))
 
+            ts = _activity_timestamp(activity)
             trade = WhaleTrade(
                 id=activity.get("id", f"trade-{datetime.utcnow().timestamp()}"),
                 whale_address=whale.address,
-                timestamp=datetime.now(timezone.utc),
+                timestamp=(
+                    datetime.fromtimestamp(ts, timezone.utc) if ts is not None
+                    else datetime.now(timezone.utc)
+                ),
                 market_id=activity.get("market_id", ""),
                 market_title=activity.get("title", activity.get("question", "Unknown")),
                 direction=direction,
@@ -454,17 +507,75 @@ class WhaleCopyTradingStrategy:
             logger.debug(f"Error parsing trade: {e}")
             return None
 
+    def _new_activity(self, address: str, activity: List[Dict]) -> List[Dict]:
+        """
+        Entries newer than the whale's high-water mark, oldest first.
+
+        Advances the mark. Entries without a timestamp fall back to the
+        recent trade id check.
+        """
+        cursor = self._cursors.setdefault(address, ActivityCursor())
+        stamped, unstamped = [], []
+        for entry in activity:
+            ts = _activity_timestamp(entry)
+            trade_id = entry.get("id", "")
+            if ts is None:
+                if trade_id not in self._recent_trades:
+                    unstamped.append(entry)
+            elif (
+                cursor.timestamp is None
+                or ts > cursor.timestamp
+                or (ts == cursor.timestamp and trade_id not in cursor.ids)
+            ):
+                stamped.append((ts, entry))
+
+        stamped.sort(key=lambda item: item[0])
+        for ts, entry in stamped:
+            if cursor.timestamp is None or ts > cursor.timestamp:
+                cursor.timestamp = ts
+                cursor.ids = set()
+            cursor.ids.add(entry.get("id", ""))
+
+        return unstamped + [entry for _, entry in stamped]
+
+    async def _poll_whale(self, address: str, semaphore: asyncio.Semaphore) -> List[Dict]:
+        """Fetch one whale's activity since its high-water mark"""
+        cursor = self._cursors.get(address)
+        async with semaphore:
+            activity = await self.fetch_trader_activity(
+                address, since=cursor.timestamp if cursor else None
+            )
+        return self._new_activity(address, activity)
+
+    def _prune_recent_trades(self) -> None:
+        """Drop trade ids older than 24h (dict is in insertion = time order)"""
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
+        while self._recent_trades:
+            trade_id, seen_at = next(iter(self._recent_trades.items()))
+            if seen_at > cutoff:
+                break
+            del self._recent_trades[trade_id]
+
     async def detect_whale_trades(self) -> List[WhaleTrade]:
         """Detect new trades from tracked whales and save to DB"""
         new_trades = []
+        trade_rows = []
+        whales = [(a, w) for a, w in self._whales.items() if w.copy_enabled]
+
+        # Fetch every whale at once (bounded), so a cycle is ~one round trip
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.activity_concurrency)
+        results = await asyncio.gather(
+            *(self._poll_whale(address, semaphore) for address, _ in whales),
+            return_exceptions=True,
+        )
+        self.stats.last_poll_sec = time.monotonic() - started
 
-        for address, whale in self._whales.items():
-            if not whale.copy_enabled:
+        for (address, whale), activity in zip(whales, results):
+            if isinstance(activity, BaseException):
+                logger.debug(f"Error polling activity for {address}: {activity}")
                 continue
 
-            # Fetch recent activity
-            activity = await self.fetch_trader_activity(address)
-
             for entry in activity:
                 trade_id = entry.get("id", "")
 
@@ -482,8 +593,7 @@ class WhaleCopyTradingStrategy:
                     # Update whale's last_trade_at
                     whale.last_trade_at = datetime.now(timezone.utc)
 
-                    # Save trade to database
-                    await self.save_whale_trade_to_db(trade)
+                    trade_rows.append(self._whale_trade_row(trade))
 
                     logger.info(
                         f"🐋 Whale trade detected: {whale.alias or address[:10]}... | "
@@ -491,12 +601,15 @@ class WhaleCopyTradingStrategy:
                         f"${trade.size_usd:.0f} @ {trade.price:.0%}"
                     )
 
-        # Cleanup old trade IDs
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
-        self._recent_trades = {
-            k: v for k, v in self._recent_trades.items()
-            if v > cutoff
-        }
+        self._prune_recent_trades()
+
+        # Save trades in one bulk write, off the signal path
+        if trade_rows and self.db and getattr(self.db, '_client', None):
+            task = asyncio.create_task(
+                self.db.upsert_many("polybot_whale_trades", trade_rows, on_conflict="id")
+            )
+            self._db_writes.add(task)
+            task.add_done_callback(self._db_writes.discard)
 
         return new_trades
 
@@ -674,8 +787,6 @@ class WhaleCopyTradingStrategy:
             for whale in discovered:
                 if whale.address not in self._whales:
                     self._whales[whale.address] = whale
-                    # Save discovered whale to DB
-                    await self.save_whale_to_db(whale)
 
         self.stats.whales_tracked = len(self._whales)
         logger.info(f"Tracking {self.stats.whales_tracked} whales")
@@ -683,7 +794,7 @@ class WhaleCopyTradingStrategy:
         # Update profiles from API
         await self.update_whale_profiles()
 
-        # Sync updated profiles back to DB
+        # Save discovered and updated profiles to DB
         await self.sync_whales_to_db()
 
     async def load_whales_from_db(self):
@@ -739,40 +850,73 @@ class WhaleCopyTradingStrategy:
         except Exception as e:
             logger.error(f"Error loading whales from DB: {e}")
 
+    @staticmethod
+    def _whale_row(whale: WhaleProfile) -> Dict[str, Any]:
+        """polybot_tracked_whales row for a whale profile"""
+        return {
+            "address": whale.address,
+            "alias": whale.alias,
+            "total_volume_usd": float(whale.total_volume_usd),
+            "win_rate": whale.win_rate,
+            "total_predictions": whale.total_predictions,
+            "winning_predictions": whale.winning_predictions,
+            "tier": whale.tier.value,
+            "last_trade_at": whale.last_trade_at.isoformat() if whale.last_trade_at else None,
+            "active_positions": whale.active_positions,
+            "copy_enabled": whale.copy_enabled,
+            "copy_multiplier": whale.copy_multiplier,
+            "max_copy_size_usd": float(whale.max_copy_size_usd),
+            "copy_trades": whale.copy_trades,
+            "copy_wins": whale.copy_wins,
+            "copy_pnl": float(whale.copy_pnl),
+            "discovery_source": "leaderboard",
+        }
+
+    @staticmethod
+    def _whale_trade_row(
+        trade: WhaleTrade, copied: bool = False, copy_trade_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """polybot_whale_trades row for a detected trade"""
+        return {
+            "id": trade.id,
+            "whale_address": trade.whale_address,
+            "detected_at": datetime.now(timezone.utc).isoformat(),
+            "trade_timestamp": trade.timestamp.isoformat() if trade.timestamp else None,
+            "market_id": trade.market_id,
+            "market_title": trade.market_title[:200] if trade.market_title else None,
+            "platform": "polymarket",
+            "direction": trade.direction.value,
+            "side": trade.side,
+            "price": float(trade.price),
+            "size_usd": float(trade.size_usd),
+            "tx_hash": trade.tx_hash,
+            "copied": copied,
+            "copy_trade_id": copy_trade_id,
+        }
+
     async def save_whale_to_db(self, whale: WhaleProfile):
         """Save a single whale profile to Supabase"""
         if not self.db or not hasattr(self.db, '_client') or not self.db._client:
             return
 
         try:
-            self.db._client.table("polybot_tracked_whales").upsert({
-                "address": whale.address,
-                "alias": whale.alias,
-                "total_volume_usd": float(whale.total_volume_usd),
-                "win_rate": whale.win_rate,
-                "total_predictions": whale.total_predictions,
-                "winning_predictions": whale.winning_predictions,
-                "tier": whale.tier.value,
-                "last_trade_at": whale.last_trade_at.isoformat() if whale.last_trade_at else None,
-                "active_positions": whale.active_positions,
-                "copy_enabled": whale.copy_enabled,
-                "copy_multiplier": whale.copy_multiplier,
-                "max_copy_size_usd": float(whale.max_copy_size_usd),
-                "copy_trades": whale.copy_trades,
-                "copy_wins": whale.copy_wins,
-                "copy_pnl": float(whale.copy_pnl),
-                "discovery_source": "leaderboard",
-            }, on_conflict="address").execute()
+            self.db._client.table("polybot_tracked_whales").upsert(
+                self._whale_row(whale), on_conflict="address"
+            ).execute()
         except Exception as e:
             logger.error(f"Error saving whale {whale.address[:10]}... to DB: {e}")
 
     async def sync_whales_to_db(self):
-        """Sync all tracked whales to Supabase"""
+        """Sync all tracked whales to Supabase (chunked bulk upsert)"""
         if not self.db or not hasattr(self.db, '_client') or not self.db._client:
             return
+        if not self._whales:
+            return
 
-        for whale in self._whales.values():
-            await self.save_whale_to_db(whale)
+        rows = [self._whale_row(whale) for whale in self._whales.values()]
+        written = await self.db.upsert_many("polybot_tracked_whales", rows, on_conflict="address")
+        if written < len(rows):
+            logger.warning(f"Synced {written}/{len(rows)} whales to DB")
 
     async def save_whale_trade_to_db(self, trade: WhaleTrade, copied: bool = False, copy_trade_id: Optional[str] = None):
         """Save a detected whale trade to Supabase"""
@@ -780,22 +924,9 @@ class WhaleCopyTradingStrategy:
             return
 
         try:
-            self.db._client.table("polybot_whale_trades").upsert({
-                "id": trade.id,
-                "whale_address": trade.whale_address,
-                "detected_at": datetime.now(timezone.utc).isoformat(),
-                "trade_timestamp": trade.timestamp.isoformat() if trade.timestamp else None,
-                "market_id": trade.market_id,
-                "market_title": trade.market_title[:200] if trade.market_title else None,
-                "platform": "polymarket",
-                "direction": trade.direction.value,
-                "side": trade.side,
-                "price": float(trade.price),
-                "size_usd": float(trade.size_usd),
-                "tx_hash": trade.tx_hash,
-                "copied": copied,
-                "copy_trade_id": copy_trade_id,
-            }, on_conflict="id").execute()
+            self.db._client.table("polybot_whale_trades").upsert(
+                self._whale_trade_row(trade, copied, copy_trade_id), on_conflict="id"
+            ).execute()
         except Exception as e:
             logger.error(f"Error saving whale trade to DB: {e}")
 
@@ -842,27 +973,28 @@ class WhaleCopyTradingStrategy:
             if self._last_daily_snapshot.date() == now.date():
                 return  # Already snapshotted today
 
-        try:
-            for whale in self._whales.values():
-                self.db._client.table("polybot_whale_performance_history").insert({
-                    "whale_address": whale.address,
-                    "snapshot_at": now.isoformat(),
-                    "snapshot_period": "daily",
-                    "total_volume_usd": float(whale.total_volume_usd),
-                    "win_rate": whale.win_rate,
-                    "total_predictions": whale.total_predictions,
-                    "winning_predictions": whale.winning_predictions,
-                    "tier": whale.tier.value,
-                    "period_trades": 0,  # Would need to calculate
-                    "period_wins": 0,
-                    "period_volume_usd": 0,
-                    "period_pnl_usd": 0,
-                }).execute()
-
-            self._last_daily_snapshot = now
-            logger.info(f"Created daily snapshot for {len(self._whales)} whales")
-        except Exception as e:
-            logger.error(f"Error creating performance snapshot: {e}")
+        rows = [{
+            "whale_address": whale.address,
+            "snapshot_at": now.isoformat(),
+            "snapshot_period": "daily",
+            "total_volume_usd": float(whale.total_volume_usd),
+            "win_rate": whale.win_rate,
+            "total_predictions": whale.total_predictions,
+            "winning_predictions": whale.winning_predictions,
+            "tier": whale.tier.value,
+            "period_trades": 0,  # Would need to calculate
+            "period_wins": 0,
+            "period_volume_usd": 0,
+            "period_pnl_usd": 0,
+        } for whale in self._whales.values()]
+
+        written = await self.db.insert_many("polybot_whale_performance_history", rows)
+        if written < len(rows):
+            logger.error(f"Performance snapshot incomplete: {written}/{len(rows)} whales")
+            return
+
+        self._last_daily_snapshot = now
+        logger.info(f"Created daily snapshot for {len(self._whales)} whales")
 
     async def run(self):
         """Run continuous monitoring with database integration"""
@@ -931,6 +1063,7 @@ class WhaleCopyTradingStrategy:
         """Remove a whale from tracking"""
         if address in self._whales:
             del self._whales[address]
+            self._cursors.pop(address, None)
             self.stats.whales_tracked = len(self._whales)
 
 
@@ -1,11 +1,35 @@
-"""Utility modules for PolyBot."""
+"""Utility modules for PolyBot (exported lazily, see lazy_import)."""
 
-from .twitter_api import TwitterAPI, fetch_thread, search_prediction_markets
-from .rate_limiter import RateLimiter
+from .lazy_import import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "TwitterAPI": ".twitter_api",
+    "fetch_thread": ".twitter_api",
+    "search_prediction_markets": ".twitter_api",
+    "RateLimiter": ".rate_limiter",
+    "RollingStats": ".rolling_stats",
+    "Scheduler": ".scheduler",
+    "JobPriority": ".scheduler",
+    "MetricsRegistry": ".metrics",
+    "get_metrics": ".metrics",
+    "StallWatchdog": ".stall_watchdog",
+    "get_stall_watchdog": ".stall_watchdog",
+    "SamplingProfiler": ".profiling",
+    "memory_diff": ".profiling",
+})
 
 __all__ = [
     "TwitterAPI",
     "fetch_thread",
     "search_prediction_markets",
     "RateLimiter",
+    "RollingStats",
+    "Scheduler",
+    "JobPriority",
+    "MetricsRegistry",
+    "get_metrics",
+    "StallWatchdog",
+    "get_stall_watchdog",
+    "SamplingProfiler",
+    "memory_diff",
 ]
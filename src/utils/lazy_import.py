@@ -0,0 +1,97 @@
+"""
+Lazy Import - defer heavy modules until first use and time them.
+
+Importing every strategy and SDK up front (ccxt, alpaca, IBKR,
+py-clob-client, Gemini, aiohttp, ...) cost seconds per process before the
+bot did any work. Packages now export their names lazily and the runner
+imports strategies only when they are enabled; every first import goes
+through timed_import() so startup can report where the time went.
+
+Usage:
+    # Package __init__.py (PEP 562 lazy re-exports)
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        "GridTradingStrategy": ".grid_trading",
+        "TrackedWallet": (".whale_copy_trading", "WhaleProfile"),
+    })
+
+    # Anywhere
+    cls = import_object("src.strategies.grid_trading:GridTradingStrategy")
+    logger.info(format_import_report())
+"""
+
+import importlib
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+_import_times: Dict[str, float] = {}
+_lock = threading.Lock()
+
+ExportTarget = Union[str, Tuple[str, str]]  # ".module" or (".module", "attr")
+
+
+def timed_import(module_name: str, package: Optional[str] = None):
+    """importlib.import_module that records how long the first import took."""
+    name = importlib.util.resolve_name(module_name, package) if module_name.startswith(".") else module_name
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    elapsed = time.perf_counter() - start
+    with _lock:
+        _import_times.setdefault(name, elapsed)
+    return module
+
+
+def import_object(path: str) -> Any:
+    """Resolve "package.module:attr" (timed)."""
+    module_name, _, attr = path.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Import path must look like 'module:attr', got {path!r}")
+    return getattr(timed_import(module_name), attr)
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, ExportTarget]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level __getattr__/__dir__ that import exports on first access.
+
+    exports maps public name -> ".submodule" (same attribute name) or
+    (".submodule", "attribute") for renamed re-exports.
+    """
+    module = sys.modules[package]
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        submodule, attr = (target, name) if isinstance(target, str) else target
+        value = getattr(timed_import(submodule, package), attr)
+        setattr(module, name, value)  # Later lookups skip __getattr__
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(module)) | set(exports))
+
+    return __getattr__, __dir__
+
+
+def import_times() -> Dict[str, float]:
+    """Seconds spent on each module's first timed import, slowest first."""
+    with _lock:
+        return dict(sorted(_import_times.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def format_import_report(top: int = 10) -> str:
+    """One line per slow import, for the startup log."""
+    times = import_times()
+    if not times:
+        return "No lazy imports yet"
+    lines = [f"Lazy imports: {len(times)} modules in {sum(times.values()):.2f}s"]
+    for name, seconds in list(times.items())[:top]:
+        lines.append(f"  {seconds * 1000:8.1f}ms  {name}")
+    return "\n".join(lines)
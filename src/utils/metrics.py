@@ -0,0 +1,394 @@
+"""
+Metrics - latency histograms for the bot's hot paths.
+
+A small, dependency-free registry rendered in the Prometheus text format
+(served at /metrics by the health server). Heartbeat counters only say
+the bot is alive; these say where the time goes:
+
+- polybot_scan_duration_seconds{scanner}
+- polybot_pipeline_latency_seconds{strategy,stage}
+    stage = book_to_detection | detection_to_submission
+- polybot_leg_skew_seconds{strategy}, polybot_trade_latency_seconds{strategy}
+- polybot_db_write_seconds{table,op}
+- polybot_http_request_seconds{host,method}
+- polybot_rate_limit_wait_seconds{api}
+- polybot_event_loop_lag_seconds
+- polybot_opportunity_queue_depth, polybot_opportunity_queue_wait_seconds{kind},
+  polybot_opportunities_total{kind,outcome}
+
+Usage:
+    from src.utils.metrics import scan_duration, pipeline_latency
+
+    with scan_duration.labels(scanner="kalshi_single").time():
+        opportunities = await scanner.scan_kalshi()
+
+    pipeline_latency.labels(strategy="cross_exchange_arb",
+                            stage="detection_to_submission").observe(seconds)
+
+    text = get_metrics().render()
+"""
+
+import asyncio
+import bisect
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Sub-millisecond to a minute: HTTP, DB, order round trips
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+# Full market scans take seconds to minutes
+SCAN_BUCKETS: Tuple[float, ...] = (0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value))
+
+
+def _format_labels(pairs: Sequence[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    escaped = (
+        (k, str(v).replace("\\", r"\\").replace("\n", r"\n").replace('"', r'\"'))
+        for k, v in pairs
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+class _HistogramChild:
+    """One labelled series: cumulative-at-render bucket counts, sum and count."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)  # Last slot is +Inf
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """(cumulative bucket counts incl. +Inf, sum, count)"""
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative, running = [], 0
+        for c in counts:
+            running += c
+            cumulative.append(running)
+        return cumulative, total, running
+
+
+class _GaugeChild:
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+
+class _CounterChild:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, **labels: str):
+        """Series for one label combination (created on first use)."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _default(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} requires labels {self.labelnames}")
+        return self.labels()
+
+    def _series(self) -> List[Tuple[Tuple[Tuple[str, str], ...], object]]:
+        with self._lock:
+            items = sorted(self._children.items())
+        return [(tuple(zip(self.labelnames, key)), child) for key, child in items]
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._render_series())
+        return lines
+
+    def _render_series(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Histogram(_Metric):
+    """Latency histogram with fixed upper-bound buckets (seconds)."""
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def time(self):
+        return self._default().time()
+
+    def _render_series(self) -> List[str]:
+        lines = []
+        bounds = self.buckets + (math.inf,)
+        for pairs, child in self._series():
+            cumulative, total, count = child.snapshot()
+            for bound, c in zip(bounds, cumulative):
+                le = _format_labels(pairs + (("le", _format_value(bound)),))
+                lines.append(f"{self.name}_bucket{le} {c}")
+            labels = _format_labels(pairs)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Last-value metric."""
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def _render_series(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(pairs)} {_format_value(child.value)}"
+            for pairs, child in self._series()
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def _render_series(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(pairs)} {_format_value(child.value)}"
+            for pairs, child in self._series()
+        ]
+
+
+class MetricsRegistry:
+    """Named metrics, rendered together for a scrape."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"Metric {metric.name} already registered differently")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+_registry = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get the global metrics registry."""
+    return _registry
+
+
+# =============================================================================
+# Hot-path metrics
+# =============================================================================
+
+scan_duration = _registry.histogram(
+    "polybot_scan_duration_seconds", "Duration of one full market scan.",
+    ("scanner",), SCAN_BUCKETS,
+)
+pipeline_latency = _registry.histogram(
+    "polybot_pipeline_latency_seconds",
+    "Time from book update to detection, and from detection to order submission.",
+    ("strategy", "stage"),
+)
+leg_skew = _registry.histogram(
+    "polybot_leg_skew_seconds",
+    "Spread between acknowledgement times of the legs of one arbitrage trade.",
+    ("strategy",),
+)
+trade_latency = _registry.histogram(
+    "polybot_trade_latency_seconds",
+    "Multi-leg trade latency from first submission to reconciled fills.",
+    ("strategy",),
+)
+db_write_latency = _registry.histogram(
+    "polybot_db_write_seconds", "Supabase write latency.", ("table", "op"),
+)
+http_latency = _registry.histogram(
+    "polybot_http_request_seconds", "Outbound HTTP request latency.", ("host", "method"),
+)
+rate_limit_wait = _registry.histogram(
+    "polybot_rate_limit_wait_seconds", "Time spent waiting in the rate limiter.", ("api",),
+)
+event_loop_lag = _registry.histogram(
+    "polybot_event_loop_lag_seconds", "Delay of the asyncio event loop behind schedule.",
+)
+event_loop_lag_last = _registry.gauge(
+    "polybot_event_loop_lag_last_seconds", "Most recent event loop lag sample.",
+)
+opportunity_queue_depth = _registry.gauge(
+    "polybot_opportunity_queue_depth", "Opportunities waiting for an executor.",
+)
+opportunity_queue_wait = _registry.histogram(
+    "polybot_opportunity_queue_wait_seconds",
+    "Time an opportunity waited in the bus before execution started.",
+    ("kind",),
+)
+opportunities_total = _registry.counter(
+    "polybot_opportunities_total",
+    "Opportunities published to the bus, by outcome "
+    "(executed, failed, deduplicated, expired, dropped).",
+    ("kind", "outcome"),
+)
+
+
+def observe_http(url, method: str, seconds: float) -> None:
+    host = urlsplit(str(url)).hostname or "unknown"
+    http_latency.labels(host=host, method=method.upper()).observe(seconds)
+
+
+def aiohttp_trace_config():
+    """aiohttp TraceConfig recording per-host request latency."""
+    import aiohttp
+
+    async def on_start(session, ctx, params):
+        ctx.start = time.perf_counter()
+
+    async def on_end(session, ctx, params):
+        observe_http(params.url, params.method, time.perf_counter() - ctx.start)
+
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(on_start)
+    trace.on_request_end.append(on_end)
+    trace.on_request_exception.append(on_end)
+    return trace
+
+
+def httpx_event_hooks() -> Dict[str, list]:
+    """httpx event_hooks recording per-host request latency (AsyncClient)."""
+
+    async def on_request(request):
+        request.extensions["polybot_start"] = time.perf_counter()
+
+    async def on_response(response):
+        start = response.request.extensions.get("polybot_start")
+        if start is not None:
+            observe_http(response.request.url, response.request.method, time.perf_counter() - start)
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def _requests_response_hook(response, *args, **kwargs):
+    observe_http(response.url, response.request.method, response.elapsed.total_seconds())
+
+
+# Pass as hooks=REQUESTS_HOOKS to requests.get/post/...
+REQUESTS_HOOKS = {"response": [_requests_response_hook]}
+
+
+async def monitor_event_loop_lag(interval_sec: float = 0.5) -> None:
+    """Sample how late the loop wakes from a fixed sleep, until cancelled."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval_sec)
+        lag = max(0.0, loop.time() - start - interval_sec)
+        event_loop_lag.observe(lag)
+        event_loop_lag_last.set(lag)
@@ -0,0 +1,281 @@
+"""
+Profiling - on-demand CPU and memory profiles of the live process.
+
+Served by the health server so a misbehaving production bot can be
+profiled without restarting it or attaching tools:
+
+- SamplingProfiler samples the event-loop thread's stack from a
+  background thread (sys._current_frames, ~200 Hz by default) for N
+  seconds and returns collapsed stacks ("a;b;c 42" lines) ready for
+  flamegraph.pl / speedscope. Nothing is installed on the loop, so the
+  cost is one stack walk per sample on the sampler thread.
+- memory_diff() diffs two tracemalloc snapshots taken N seconds apart
+  and returns the allocation sites that grew most. Tracing is started
+  only for the window (1 frame deep) unless it was already on.
+
+Only one profile runs at a time; a second request gets ProfilerBusy.
+
+In BotManager mode several tenants' runners share one loop. Tasks
+created while current_tenant is set are tagged with that tenant (via a
+task factory), and each CPU sample is prefixed with "tenant:<id>" so a
+flame graph splits by tenant. tracemalloc cannot attribute allocations
+to tasks, so memory diffs are process-wide.
+
+Usage:
+    install_tenant_tracking()                    # once, on the loop
+    token = current_tenant.set(user_id)          # tasks created now are tagged
+    text = await SamplingProfiler().profile(10)
+    report = await memory_diff(30, top=25)
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_DURATION_SEC = 120.0
+
+current_tenant: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "polybot_tenant", default=None
+)
+_task_tenants: "weakref.WeakKeyDictionary[asyncio.Task, str]" = weakref.WeakKeyDictionary()
+
+_busy = threading.Lock()
+_SRC_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class ProfilerBusy(RuntimeError):
+    """Another profile is already running."""
+
+
+# =============================================================================
+# Tenant attribution
+# =============================================================================
+
+def install_tenant_tracking(loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Tag new tasks with current_tenant (wraps any existing task factory)."""
+    loop = loop or asyncio.get_running_loop()
+    previous = loop.get_task_factory()
+    if getattr(previous, "_tenant_tracking", False):
+        return
+
+    def factory(loop, coro, **kwargs):
+        if previous is not None:
+            task = previous(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        context = kwargs.get("context")
+        tenant = context.get(current_tenant) if context is not None else current_tenant.get()
+        if tenant:
+            _task_tenants[task] = tenant
+        return task
+
+    factory._tenant_tracking = True
+    loop.set_task_factory(factory)
+
+
+def tenant_of(task: Optional[asyncio.Task]) -> Optional[str]:
+    return _task_tenants.get(task) if task is not None else None
+
+
+# =============================================================================
+# CPU sampling
+# =============================================================================
+
+def _frame_name(code) -> str:
+    filename = code.co_filename
+    if filename.startswith(_SRC_ROOT + os.sep) and "site-packages" not in filename:
+        filename = os.path.relpath(filename, _SRC_ROOT)
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_name} ({filename})"
+
+
+def _collapse(frame) -> List[str]:
+    """Root-first frame names (semicolons would split a frame)."""
+    names = []
+    while frame is not None:
+        names.append(_frame_name(frame.f_code).replace(";", ","))
+        frame = frame.f_back
+    names.reverse()
+    return names
+
+
+@dataclass
+class ProfileResult:
+    """Collapsed-stack profile."""
+    stacks: Counter
+    samples: int
+    duration_sec: float
+    interval_sec: float
+    tenants: Dict[str, int] = field(default_factory=dict)
+
+    def collapsed(self) -> str:
+        """Brendan Gregg collapsed format: "frame;frame;frame count" per line."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "duration_sec": round(self.duration_sec, 2),
+            "interval_ms": round(self.interval_sec * 1000, 2),
+            "tenants": dict(self.tenants),
+        }
+
+
+class SamplingProfiler:
+    """Samples the event-loop thread from a background thread."""
+
+    def __init__(self, interval_sec: float = 0.005):
+        """
+        Args:
+            interval_sec: Time between samples (floor 1ms)
+        """
+        self.interval_sec = max(interval_sec, 0.001)
+
+    async def profile(
+        self,
+        duration_sec: float,
+        tenant: Optional[str] = None,
+        all_threads: bool = False,
+    ) -> ProfileResult:
+        """
+        Sample for duration_sec (capped at MAX_DURATION_SEC).
+
+        Args:
+            duration_sec: How long to sample
+            tenant: Keep only samples taken while this tenant's task ran
+            all_threads: Also sample worker threads (prefixed "thread:<name>")
+        """
+        if not _busy.acquire(blocking=False):
+            raise ProfilerBusy("A profile is already running")
+        try:
+            loop = asyncio.get_running_loop()
+            return await asyncio.to_thread(
+                self._sample, loop, threading.get_ident(),
+                min(max(duration_sec, 0.1), MAX_DURATION_SEC), tenant, all_threads,
+            )
+        finally:
+            _busy.release()
+
+    def _sample(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        loop_thread: int,
+        duration_sec: float,
+        tenant: Optional[str],
+        all_threads: bool,
+    ) -> ProfileResult:
+        me = threading.get_ident()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        stacks: Counter = Counter()
+        tenants: Counter = Counter()
+        samples = 0
+        started = time.monotonic()
+        deadline = started + duration_sec
+
+        while time.monotonic() < deadline:
+            frames = sys._current_frames()
+            for ident, frame in frames.items():
+                if ident == me or (ident != loop_thread and not all_threads):
+                    continue
+                if ident == loop_thread:
+                    try:
+                        task = asyncio.current_task(loop)
+                    except RuntimeError:
+                        task = None
+                    owner = tenant_of(task)
+                    if tenant is not None and owner != tenant:
+                        continue
+                    prefix = [f"tenant:{owner}"] if owner else []
+                    tenants[owner or "-"] += 1
+                else:
+                    prefix = [f"thread:{names.get(ident, ident)}"]
+                stacks[";".join(prefix + _collapse(frame))] += 1
+            del frames
+            samples += 1
+            time.sleep(self.interval_sec)
+
+        return ProfileResult(
+            stacks=stacks,
+            samples=samples,
+            duration_sec=time.monotonic() - started,
+            interval_sec=self.interval_sec,
+            tenants=dict(tenants),
+        )
+
+
+# =============================================================================
+# Memory growth
+# =============================================================================
+
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+
+async def memory_diff(
+    duration_sec: float = 30.0,
+    top: int = 25,
+    group_by: str = "lineno",
+) -> Dict[str, Any]:
+    """
+    Allocation sites that grew most over duration_sec.
+
+    Args:
+        duration_sec: Time between the two snapshots (capped at MAX_DURATION_SEC)
+        top: Number of sites to return
+        group_by: "lineno", "filename" or "traceback"
+    """
+    if group_by not in ("lineno", "filename", "traceback"):
+        raise ValueError(f"group_by must be lineno, filename or traceback, got {group_by!r}")
+    if not _busy.acquire(blocking=False):
+        raise ProfilerBusy("A profile is already running")
+
+    started_tracing = not tracemalloc.is_tracing()
+    try:
+        if started_tracing:
+            tracemalloc.start(1)
+        before = await asyncio.to_thread(_snapshot)
+        await asyncio.sleep(min(max(duration_sec, 0.1), MAX_DURATION_SEC))
+        after = await asyncio.to_thread(_snapshot)
+        current, peak = tracemalloc.get_traced_memory()
+        stats = after.compare_to(before, group_by)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+        _busy.release()
+
+    return {
+        "duration_sec": duration_sec,
+        "tracing_started_for_window": started_tracing,
+        "traced_kb": round(current / 1024, 1),
+        "peak_kb": round(peak / 1024, 1),
+        "growth_kb": round(sum(s.size_diff for s in stats) / 1024, 1),
+        "top": [
+            {
+                "site": str(stat.traceback[0]) if stat.traceback else "unknown",
+                "size_diff_kb": round(stat.size_diff / 1024, 1),
+                "count_diff": stat.count_diff,
+                "size_kb": round(stat.size / 1024, 1),
+            }
+            for stat in stats[:top]
+        ],
+    }
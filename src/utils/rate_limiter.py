@@ -17,6 +17,8 @@ from functools import wraps
 import threading
 from collections import defaultdict
 
+from src.utils.metrics import rate_limit_wait
+
 logger = logging.getLogger(__name__)
 
 
@@ -147,6 +149,7 @@ class RateLimiter:
         config = self.get_config(api_name)
         state = self._states[api_name]
         async_lock = self._get_async_lock(api_name)
+        started = time.perf_counter()  # Includes queueing on the lock
 
         async with async_lock:
             now = time.time()
@@ -195,6 +198,7 @@ class RateLimiter:
                     f"requests in current minute"
                 )
 
+            rate_limit_wait.labels(api=api_name).observe(time.perf_counter() - started)
             return wait_time
 
     def record_rate_limit(self, api_name: str, response_code: int = 429):
@@ -233,6 +237,26 @@ class RateLimiter:
             state.consecutive_429s = 0
             state.current_backoff = 0.0
 
+    def available_in(self, api_name: str, reserve_pct: float = 0.0) -> float:
+        """
+        Seconds until the API has request budget again (0.0 if it has now).
+
+        reserve_pct holds back that share of the per-minute limit, so
+        background work can yield to latency-sensitive callers.
+        """
+        config = self.get_config(api_name)
+        state = self._states[api_name]
+        now = time.time()
+
+        if now < state.backoff_until:
+            return state.backoff_until - now
+
+        window_end = state.minute_window_start + 60
+        budget = config.requests_per_minute * (1.0 - reserve_pct)
+        if now < window_end and state.request_count_minute >= budget:
+            return window_end - now
+        return 0.0
+
     def get_stats(self, api_name: str) -> Dict[str, Any]:
         """Get rate limiting stats for an API."""
         config = self.get_config(api_name)
@@ -0,0 +1,165 @@
+"""
+Rolling Statistics - O(1) sliding-window mean/variance/z-score/min/max.
+
+Strategies that keep a bounded price or spread history (pairs z-scores,
+mean reversion bands, spike windows) used to re-run statistics.mean /
+statistics.stdev over the whole list on every tick. RollingStats keeps
+the window in a fixed ring buffer and maintains:
+- mean and variance with a sliding Welford update
+- min and max with monotonic deques (amortized O(1))
+
+Floating-point drift from the add/remove updates is bounded by an exact
+resync (math.fsum) once every `window` evictions, which keeps the cost
+amortized O(1) per update.
+
+Usage:
+    stats = RollingStats(window=720)
+    for spread in spreads:
+        stats.push(spread)
+        if stats.count >= 10:
+            z = stats.zscore()
+"""
+
+import math
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+
+class RollingStats:
+    """Fixed-size sliding window with O(1) summary statistics."""
+
+    __slots__ = (
+        "window", "_buf", "_head", "_count", "_seq",
+        "_mean", "_m2", "_since_resync",
+        "_min_q", "_max_q",
+    )
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self.window = window
+        self._buf: List[float] = [0.0] * window
+        self._head = 0          # Next write position
+        self._count = 0         # Values currently in the window
+        self._seq = 0           # Total values ever pushed
+        self._mean = 0.0
+        self._m2 = 0.0          # Sum of squared deviations from the mean
+        self._since_resync = 0
+        # (seq, value) pairs; values increasing (min) / decreasing (max)
+        self._min_q: Deque[Tuple[int, float]] = deque()
+        self._max_q: Deque[Tuple[int, float]] = deque()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push(self, value: float) -> Optional[float]:
+        """Add a value; returns the value evicted from the window, if any."""
+        value = float(value)
+        evicted: Optional[float] = None
+
+        if self._count < self.window:
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+        else:
+            evicted = self._buf[self._head]
+            old_mean = self._mean
+            self._mean += (value - evicted) / self._count
+            self._m2 += (value - evicted) * (value - self._mean + evicted - old_mean)
+            self._since_resync += 1
+
+        self._buf[self._head] = value
+        self._head = (self._head + 1) % self.window
+
+        seq = self._seq
+        self._seq += 1
+        oldest = self._seq - self._count
+
+        while self._min_q and self._min_q[-1][1] >= value:
+            self._min_q.pop()
+        self._min_q.append((seq, value))
+        while self._min_q[0][0] < oldest:
+            self._min_q.popleft()
+
+        while self._max_q and self._max_q[-1][1] <= value:
+            self._max_q.pop()
+        self._max_q.append((seq, value))
+        while self._max_q[0][0] < oldest:
+            self._max_q.popleft()
+
+        if self._since_resync >= self.window:
+            self._resync()
+
+        return evicted
+
+    def _resync(self) -> None:
+        """Recompute mean/M2 exactly to discard accumulated rounding error."""
+        values = self.values()
+        n = len(values)
+        self._mean = math.fsum(values) / n if n else 0.0
+        self._m2 = math.fsum((v - self._mean) ** 2 for v in values)
+        self._since_resync = 0
+
+    def clear(self) -> None:
+        self._head = 0
+        self._count = 0
+        self._seq = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._since_resync = 0
+        self._min_q.clear()
+        self._max_q.clear()
+
+    def values(self) -> List[float]:
+        """Window contents, oldest first (O(window) - for reporting only)."""
+        if self._count < self.window:
+            return self._buf[:self._count]
+        return self._buf[self._head:] + self._buf[:self._head]
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def is_full(self) -> bool:
+        return self._count == self.window
+
+    @property
+    def last(self) -> Optional[float]:
+        if not self._count:
+            return None
+        return self._buf[(self._head - 1) % self.window]
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1), matching statistics.variance."""
+        if self._count < 2:
+            return 0.0
+        return max(self._m2, 0.0) / (self._count - 1)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation, matching statistics.stdev."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._min_q[0][1] if self._min_q else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._max_q[0][1] if self._max_q else None
+
+    def zscore(self, value: Optional[float] = None) -> float:
+        """Z-score of value (default: latest value) against the window."""
+        if value is None:
+            value = self.last
+        std = self.std
+        if value is None or std <= 0:
+            return 0.0
+        return (value - self._mean) / std
@@ -0,0 +1,349 @@
+"""
+Scheduler - one cooperative owner for all periodic bot jobs.
+
+Instead of every strategy running its own `while running: ...; sleep(N)`
+task (which fire in uncoordinated bursts and collide on shared rate
+limits), jobs are registered here and dispatched from a single timer heap.
+
+Provides:
+- Priorities with separate lanes: CRITICAL/HIGH jobs start as soon as they
+  are due; NORMAL and BULK jobs share bounded lanes, so latency-critical
+  work never queues behind bulk scans
+- Jittered intervals (and a jittered first run) to spread load
+- Per-API budgets: at most `api_concurrency` non-critical jobs per API at
+  once, and jobs are deferred while the RateLimiter reports the API as
+  backing off or near its per-minute limit
+- Deadline-miss tracking: a job that starts later than its deadline, or
+  runs past its next slot, counts a miss (overrun slots are skipped)
+- Adaptive backoff: consecutive failures retry after an exponentially
+  growing delay; a success resets it
+
+Usage:
+    scheduler = Scheduler(rate_limiter=get_rate_limiter())
+    scheduler.add_job("heartbeat", send_heartbeat, interval_sec=60, priority=JobPriority.HIGH)
+    scheduler.add_job("momentum_scan", strategy.run_cycle, interval_sec=300,
+                      priority=JobPriority.BULK, apis=("alpaca",))
+    await scheduler.run()
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class JobPriority(IntEnum):
+    """Lower value runs first."""
+    CRITICAL = 0  # Latency-critical (own lane, ignores API budgets)
+    HIGH = 1      # Safety/ops (own lane)
+    NORMAL = 2
+    BULK = 3      # Large scans
+
+
+@dataclass
+class JobStats:
+    """Execution statistics for a scheduled job."""
+    runs: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    deadline_misses: int = 0
+    skipped_overruns: int = 0
+    deferrals: int = 0            # Postponed for API budget
+    last_run: float = 0.0         # time.time() of last start
+    last_duration_sec: float = 0.0
+    avg_duration_sec: float = 0.0
+    max_lateness_sec: float = 0.0
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "deadline_misses": self.deadline_misses,
+            "skipped_overruns": self.skipped_overruns,
+            "deferrals": self.deferrals,
+            "last_run": self.last_run,
+            "last_duration_sec": round(self.last_duration_sec, 3),
+            "avg_duration_sec": round(self.avg_duration_sec, 3),
+            "max_lateness_sec": round(self.max_lateness_sec, 3),
+            "last_error": self.last_error,
+        }
+
+
+@dataclass
+class Job:
+    """A periodic coroutine registered with the Scheduler."""
+    name: str
+    func: Callable[[], Awaitable[Any]]
+    interval_sec: float
+    priority: JobPriority = JobPriority.NORMAL
+    apis: Tuple[str, ...] = ()
+    jitter_pct: float = 0.1            # +/- share of interval
+    deadline_sec: Optional[float] = None  # Allowed start lateness (default: interval / 2)
+    timeout_sec: Optional[float] = None
+    retry_delay_sec: float = 30.0      # First retry after a failure
+    max_retry_delay_sec: float = 300.0
+    stats: JobStats = field(default_factory=JobStats)
+
+    # Scheduler state
+    due_at: float = 0.0                # time.monotonic()
+    slot_at: float = 0.0               # Original due time (before deferrals)
+    running: bool = False
+    removed: bool = False
+
+    @property
+    def deadline(self) -> float:
+        return self.deadline_sec if self.deadline_sec is not None else self.interval_sec / 2
+
+    def next_delay(self) -> float:
+        """Delay until the next run: jittered interval, or backoff after failures."""
+        if self.stats.consecutive_failures:
+            return min(
+                self.retry_delay_sec * 2 ** (self.stats.consecutive_failures - 1),
+                self.max_retry_delay_sec,
+            )
+        jitter = self.interval_sec * self.jitter_pct
+        return max(0.0, self.interval_sec + random.uniform(-jitter, jitter))
+
+
+class Scheduler:
+    """Single timer heap dispatching periodic jobs into priority lanes."""
+
+    def __init__(
+        self,
+        rate_limiter=None,
+        normal_concurrency: int = 4,
+        bulk_concurrency: int = 2,
+        api_concurrency: int = 1,
+        api_reserve_pct: float = 0.2,
+    ):
+        """
+        Args:
+            rate_limiter: Optional RateLimiter consulted for API budgets
+            normal_concurrency: NORMAL jobs allowed to run at once
+            bulk_concurrency: BULK jobs allowed to run at once
+            api_concurrency: Non-critical jobs allowed per API at once
+            api_reserve_pct: Share of each API's per-minute budget kept
+                free for CRITICAL/HIGH jobs
+        """
+        self.rate_limiter = rate_limiter
+        self.api_concurrency = api_concurrency
+        self.api_reserve_pct = api_reserve_pct
+
+        self._jobs: Dict[str, Job] = {}
+        self._heap: List[Tuple[float, int, int, Job]] = []
+        self._seq = itertools.count()
+        self._lanes = {
+            JobPriority.NORMAL: asyncio.Semaphore(normal_concurrency),
+            JobPriority.BULK: asyncio.Semaphore(bulk_concurrency),
+        }
+        self._api_slots: Dict[str, asyncio.Semaphore] = {}
+        self._running_tasks: Dict[str, asyncio.Task] = {}
+        self._wake = asyncio.Event()
+        self._running = False
+
+    # =========================================================================
+    # Registration
+    # =========================================================================
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[Any]],
+        interval_sec: float,
+        priority: JobPriority = JobPriority.NORMAL,
+        apis: Tuple[str, ...] = (),
+        jitter_pct: float = 0.1,
+        initial_delay_sec: Optional[float] = None,
+        **kwargs,
+    ) -> Job:
+        """
+        Register (or replace) a periodic job.
+
+        The first run is after initial_delay_sec, or a random offset up to
+        jitter_pct of the interval so jobs added together do not fire together.
+        Extra kwargs set Job fields (deadline_sec, timeout_sec, retry_delay_sec, ...).
+        """
+        self.remove_job(name)
+        job = Job(
+            name=name,
+            func=func,
+            interval_sec=interval_sec,
+            priority=JobPriority(priority),
+            apis=tuple(apis),
+            jitter_pct=jitter_pct,
+            **kwargs,
+        )
+        if initial_delay_sec is None:
+            initial_delay_sec = random.uniform(0, interval_sec * jitter_pct)
+        self._jobs[name] = job
+        self._push(job, time.monotonic() + initial_delay_sec)
+        logger.debug(f"Scheduled {name} every {interval_sec}s ({job.priority.name})")
+        return job
+
+    def remove_job(self, name: str) -> None:
+        job = self._jobs.pop(name, None)
+        if job:
+            job.removed = True  # Lazily dropped from the heap
+
+    def get_job(self, name: str) -> Optional[Job]:
+        return self._jobs.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._jobs
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def _push(self, job: Job, due_at: float, deferred: bool = False) -> None:
+        job.due_at = due_at
+        if not deferred:
+            job.slot_at = due_at
+        heapq.heappush(self._heap, (due_at, int(job.priority), next(self._seq), job))
+        self._wake.set()
+
+    # =========================================================================
+    # Dispatch
+    # =========================================================================
+
+    async def run(self) -> None:
+        """Dispatch jobs until stop() is called."""
+        self._running = True
+        logger.info(f"⏱️ Scheduler started with {len(self._jobs)} jobs")
+        try:
+            while self._running:
+                self._wake.clear()
+                now = time.monotonic()
+
+                due: List[Job] = []
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, _, job = heapq.heappop(self._heap)
+                    if not job.removed and self._jobs.get(job.name) is job:
+                        due.append(job)
+
+                # Already sorted by (due_at, priority); start higher priority first
+                for job in sorted(due, key=lambda j: j.priority):
+                    self._dispatch(job, now)
+
+                timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                if timeout is None or timeout > 0:
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+        finally:
+            self._running = False
+
+    def _dispatch(self, job: Job, now: float) -> None:
+        if job.priority > JobPriority.HIGH:
+            wait = self._api_wait(job)
+            if wait > 0:
+                job.stats.deferrals += 1
+                logger.debug(f"⏱️ Deferring {job.name} {wait:.1f}s for API budget")
+                self._push(job, now + wait, deferred=True)
+                return
+
+        job.running = True
+        self._running_tasks[job.name] = asyncio.create_task(
+            self._execute(job, job.slot_at), name=f"job:{job.name}"
+        )
+
+    def _api_wait(self, job: Job) -> float:
+        """Seconds to wait before any of the job's APIs has budget."""
+        if not self.rate_limiter or not job.apis:
+            return 0.0
+        return max(
+            self.rate_limiter.available_in(api, self.api_reserve_pct) for api in job.apis
+        )
+
+    def _api_slot(self, api: str) -> asyncio.Semaphore:
+        slot = self._api_slots.get(api)
+        if slot is None:
+            slot = self._api_slots[api] = asyncio.Semaphore(self.api_concurrency)
+        return slot
+
+    async def _execute(self, job: Job, scheduled_at: float) -> None:
+        lane = self._lanes.get(job.priority)
+        slots = [] if job.priority <= JobPriority.HIGH else [self._api_slot(a) for a in sorted(job.apis)]
+        acquired: List[asyncio.Semaphore] = []
+        try:
+            # Queue for the lane, then for each API (sorted to avoid deadlock)
+            for sem in ([lane] if lane else []) + slots:
+                await sem.acquire()
+                acquired.append(sem)
+
+            start = time.monotonic()
+            lateness = start - scheduled_at
+            stats = job.stats
+            stats.max_lateness_sec = max(stats.max_lateness_sec, lateness)
+            if lateness > job.deadline:
+                stats.deadline_misses += 1
+                logger.debug(f"⏱️ {job.name} started {lateness:.1f}s late")
+
+            stats.last_run = time.time()
+            try:
+                if job.timeout_sec:
+                    await asyncio.wait_for(job.func(), job.timeout_sec)
+                else:
+                    await job.func()
+                stats.consecutive_failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stats.failures += 1
+                stats.consecutive_failures += 1
+                stats.last_error = str(e) or type(e).__name__
+                logger.error(f"❌ Job {job.name} failed: {stats.last_error}")
+            finally:
+                stats.runs += 1
+                stats.last_duration_sec = time.monotonic() - start
+                stats.avg_duration_sec += (stats.last_duration_sec - stats.avg_duration_sec) / stats.runs
+                # The next run is only queued once this one finishes, so slots
+                # that passed while it ran are skipped rather than piled up
+                overruns = int(stats.last_duration_sec // job.interval_sec) if job.interval_sec > 0 else 0
+                if overruns:
+                    stats.skipped_overruns += overruns
+                    stats.deadline_misses += 1
+                    logger.debug(f"⏱️ {job.name} overran {overruns} slot(s)")
+        finally:
+            for sem in reversed(acquired):
+                sem.release()
+            job.running = False
+            self._running_tasks.pop(job.name, None)
+            if self._jobs.get(job.name) is job and self._running:
+                self._push(job, time.monotonic() + job.next_delay())
+
+    async def stop(self) -> None:
+        """Stop dispatching and cancel running jobs."""
+        self._running = False
+        self._wake.set()
+        tasks = list(self._running_tasks.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    # =========================================================================
+    # Reporting
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-job stats plus totals."""
+        jobs = {
+            name: {"priority": job.priority.name, "interval_sec": job.interval_sec, **job.stats.to_dict()}
+            for name, job in self._jobs.items()
+        }
+        return {
+            "jobs": jobs,
+            "running": sorted(self._running_tasks),
+            "deadline_misses": sum(j.stats.deadline_misses for j in self._jobs.values()),
+            "failures": sum(j.stats.failures for j in self._jobs.values()),
+        }
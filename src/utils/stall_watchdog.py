@@ -0,0 +1,278 @@
+"""
+Stall Watchdog - find what blocks the event loop.
+
+The lag histogram says the loop stalls; it can't say why. The usual
+suspects are blocking `requests` calls in the Kalshi/Polymarket clients,
+`time.sleep` in rate limiting, synchronous supabase calls and CPU-heavy
+matching, but in production one only sees "everything was late".
+
+A coroutine on the loop beats every interval_sec. A daemon thread checks
+the beat; when it is more than threshold_sec late, the thread grabs the
+loop thread's stack (sys._current_frames) and the task that is running,
+and attributes the stall to:
+
+- the task (coroutine name), and
+- the innermost frame in our own code (the call site that blocked), plus
+  the innermost frame overall (usually the library call that blocked)
+
+When the loop recovers, the whole stall duration is charged to that
+offender and logged. The worst offenders are available from top() for
+the health server and are logged in a periodic summary.
+
+Usage:
+    watchdog = get_stall_watchdog()
+    task = watchdog.start()          # On the loop to watch
+    watchdog.top(10)                 # [{"call_site": ..., "total_sec": ...}, ...]
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.metrics import event_loop_lag, event_loop_lag_last, get_metrics
+from src.utils.profiling import tenant_of
+
+logger = logging.getLogger(__name__)
+
+event_loop_stalls = get_metrics().counter(
+    "polybot_event_loop_stalls_total", "Event loop stalls longer than the watchdog threshold.",
+)
+
+# Frames under the repo (but not a virtualenv inside it) are "our" code
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_THIS_FILE = os.path.abspath(__file__)
+_STACK_LIMIT = 12
+
+
+@dataclass
+class Offender:
+    """Stalls attributed to one task/call site."""
+    task: str
+    call_site: str
+    blocking_call: str
+    count: int = 0
+    total_sec: float = 0.0
+    max_sec: float = 0.0
+    last_seen: float = 0.0          # time.time()
+    stack: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "task": self.task,
+            "call_site": self.call_site,
+            "blocking_call": self.blocking_call,
+            "count": self.count,
+            "total_sec": round(self.total_sec, 3),
+            "max_sec": round(self.max_sec, 3),
+            "last_seen": self.last_seen,
+            "stack": list(self.stack),
+        }
+
+
+def _is_project(filename: str) -> bool:
+    path = os.path.abspath(filename)
+    return path.startswith(_PROJECT_ROOT + os.sep) and "site-packages" not in path
+
+
+def _frame_label(frame: traceback.FrameSummary) -> str:
+    if _is_project(frame.filename):
+        path = os.path.relpath(os.path.abspath(frame.filename), _PROJECT_ROOT)
+    else:
+        path = os.path.basename(frame.filename)
+    return f"{path}:{frame.lineno} in {frame.name}"
+
+
+def attribute_stack(stack: traceback.StackSummary) -> Tuple[str, str]:
+    """(innermost project call site, innermost frame) for a captured stack."""
+    frames = [f for f in stack if os.path.abspath(f.filename) != _THIS_FILE]
+    if not frames:
+        return "unknown", "unknown"
+    project = [f for f in frames if _is_project(f.filename)]
+    call_site = _frame_label(project[-1]) if project else "outside project"
+    return call_site, _frame_label(frames[-1])
+
+
+def _task_label(task: Optional[asyncio.Task]) -> str:
+    if task is None:
+        return "loop callback"
+    coro = task.get_coro()
+    name = getattr(coro, "__qualname__", None) or repr(coro)
+    tenant = tenant_of(task)
+    return f"{task.get_name()} ({name})" + (f" [tenant {tenant}]" if tenant else "")
+
+
+class StallWatchdog:
+    """Heartbeat coroutine + watcher thread that samples the blocked stack."""
+
+    def __init__(
+        self,
+        threshold_sec: float = 0.25,
+        interval_sec: float = 0.1,
+        report_interval_sec: float = 300.0,
+        max_offenders: int = 200,
+    ):
+        """
+        Args:
+            threshold_sec: Lag beyond which the loop counts as stalled
+            interval_sec: Heartbeat period (also the lag sampling period)
+            report_interval_sec: How often to log the top offenders
+            max_offenders: Distinct call sites kept (least recent dropped)
+        """
+        self.threshold_sec = threshold_sec
+        self.interval_sec = interval_sec
+        self.report_interval_sec = report_interval_sec
+        self.max_offenders = max_offenders
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._stall: Optional[Tuple[Offender, float]] = None    # (offender, started)
+        self._offenders: Dict[Tuple[str, str], Offender] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Stats
+        self.stalls = 0
+        self.stalled_sec = 0.0
+
+    # -------------------------------------------------------------------------
+    # Loop side
+    # -------------------------------------------------------------------------
+
+    def start(self) -> asyncio.Task:
+        """Start watching the running loop; returns the heartbeat task."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+            self._thread.start()
+        return asyncio.create_task(self._heartbeat(), name="stall_watchdog")
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def _heartbeat(self) -> None:
+        last_report = time.monotonic()
+        reported_stalls = 0
+        try:
+            while True:
+                start = time.monotonic()
+                self._last_beat = start
+                await asyncio.sleep(self.interval_sec)
+                now = time.monotonic()
+                lag = max(0.0, now - start - self.interval_sec)
+                event_loop_lag.observe(lag)
+                event_loop_lag_last.set(lag)
+                self._last_beat = now
+                self._finish_stall(now)
+
+                if now - last_report >= self.report_interval_sec:
+                    if self.stalls > reported_stalls:
+                        logger.warning(self.format_report())
+                        reported_stalls = self.stalls
+                    last_report = now
+        finally:
+            self.stop()
+
+    # -------------------------------------------------------------------------
+    # Watcher thread
+    # -------------------------------------------------------------------------
+
+    def _watch(self) -> None:
+        poll = min(self.interval_sec, self.threshold_sec) / 2
+        while not self._stop.wait(poll):
+            lag = time.monotonic() - self._last_beat - self.interval_sec
+            if lag > self.threshold_sec and self._stall is None:
+                self._capture()
+
+    def _capture(self) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        stack = traceback.extract_stack(frame)
+        call_site, blocking_call = attribute_stack(stack)
+        try:
+            task = asyncio.current_task(self._loop)
+        except RuntimeError:
+            task = None
+        task_name = _task_label(task)
+
+        key = (task_name, call_site)
+        with self._lock:
+            offender = self._offenders.get(key)
+            if offender is None:
+                if len(self._offenders) >= self.max_offenders:
+                    oldest = min(self._offenders, key=lambda k: self._offenders[k].last_seen)
+                    del self._offenders[oldest]
+                offender = self._offenders[key] = Offender(task_name, call_site, blocking_call)
+            offender.blocking_call = blocking_call
+            offender.stack = [_frame_label(f) for f in stack[-_STACK_LIMIT:]]
+            self._stall = (offender, self._last_beat + self.interval_sec)
+
+    def _finish_stall(self, now: float) -> None:
+        stall = self._stall
+        if stall is None:
+            return
+        self._stall = None
+        offender, started = stall
+        duration = now - started
+        with self._lock:
+            offender.count += 1
+            offender.total_sec += duration
+            offender.max_sec = max(offender.max_sec, duration)
+            offender.last_seen = time.time()
+            self.stalls += 1
+            self.stalled_sec += duration
+        event_loop_stalls.inc()
+        logger.warning(
+            f"🐢 Event loop stalled {duration * 1000:.0f}ms in {offender.task} at "
+            f"{offender.call_site} (blocked in {offender.blocking_call})"
+        )
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+
+    def top(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Worst offenders by total stalled time."""
+        with self._lock:
+            offenders = sorted(self._offenders.values(), key=lambda o: o.total_sec, reverse=True)
+            return [o.to_dict() for o in offenders[:n] if o.count]
+
+    def format_report(self, n: int = 5) -> str:
+        lines = [f"Event loop stalls: {self.stalls} totalling {self.stalled_sec:.1f}s - top offenders:"]
+        for o in self.top(n):
+            lines.append(
+                f"  {o['total_sec']:7.2f}s  {o['count']:4d}x  max {o['max_sec'] * 1000:.0f}ms  "
+                f"{o['call_site']} ({o['task']}) -> {o['blocking_call']}"
+            )
+        return "\n".join(lines)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "threshold_ms": round(self.threshold_sec * 1000),
+            "stalls": self.stalls,
+            "stalled_sec": round(self.stalled_sec, 3),
+            "top": self.top(10),
+        }
+
+
+_watchdog: Optional[StallWatchdog] = None
+
+
+def get_stall_watchdog() -> StallWatchdog:
+    """Process-wide watchdog (threshold from STALL_THRESHOLD_MS, default 250)."""
+    global _watchdog
+    if _watchdog is None:
+        threshold_ms = float(os.getenv("STALL_THRESHOLD_MS", "250"))
+        _watchdog = StallWatchdog(threshold_sec=threshold_ms / 1000)
+    return _watchdog
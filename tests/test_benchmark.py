@@ -0,0 +1,88 @@
+"""
+Tests for the synthetic data generators and the benchmark harness.
+
+Run with: python -m pytest tests/test_benchmark.py -v
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.simulation.benchmark import (
+    BENCHMARKS,
+    BenchmarkResult,
+    compare_results,
+    main,
+    run_benchmarks,
+)
+from src.simulation.synthetic import SyntheticMarkets
+
+
+class TestSyntheticMarkets:
+    def test_same_seed_same_data(self):
+        a = SyntheticMarkets(seed=7, now=1_700_000_000)
+        b = SyntheticMarkets(seed=7, now=1_700_000_000)
+        assert a.polymarket_events(20) == b.polymarket_events(20)
+        assert a.book_updates(10, 500) == b.book_updates(10, 500)
+
+    def test_events_price_near_one_dollar(self):
+        events = SyntheticMarkets(seed=1).polymarket_events(200, outcomes=(3, 5), mispriced_pct=0.0)
+        for event in events:
+            assert 3 <= len(event["markets"]) <= 5
+            total = sum(float(json.loads(m["outcomePrices"])[0]) for m in event["markets"])
+            assert abs(total - 1.0) < 0.02
+
+    def test_cross_platform_overlap_and_headline_keywords(self):
+        markets = SyntheticMarkets(seed=3)
+        poly, kalshi = markets.cross_platform_markets(50, 50, overlap_pct=1.0)
+        restated = {m["question"].removeprefix("Will ").rstrip("?") for m in poly}
+        assert all(k["question"] in restated for k in kalshi)
+        assert all(item.keywords for item in markets.headlines(30))
+
+    def test_book_updates_are_time_ordered(self):
+        ticks = SyntheticMarkets(seed=5).book_updates(20, 2_000, spike_rate=0.05)
+        timestamps = [t[0] for t in ticks]
+        assert timestamps == sorted(timestamps)
+        assert all(0.0 < t[2] < 1.0 for t in ticks)
+
+
+class TestBenchmarkHarness:
+    def test_every_benchmark_runs(self):
+        results = run_benchmarks(seed=11, scale=0.002)
+        assert [r.name for r in results] == list(BENCHMARKS)
+        for result in results:
+            assert result.error is None, f"{result.name}: {result.error}"
+            assert result.ops >= 1 and result.throughput > 0
+            assert result.latency_ms["p50"] <= result.latency_ms["max"]
+
+    def test_compare_flags_regressions(self):
+        def result(name, p50, total_sec):
+            return BenchmarkResult(name, ops=100, items=100, total_sec=total_sec, latency_ms={"p50": p50})
+
+        baseline = [result("fast", 1.0, 1.0), result("steady", 1.0, 1.0)]
+        current = [result("fast", 1.5, 1.5), result("steady", 1.02, 1.02)]
+        rows = {r["name"]: r for r in compare_results(baseline, current, threshold_pct=10)}
+        assert rows["fast"]["regressed"] and rows["fast"]["p50_change_pct"] == 50.0
+        assert not rows["steady"]["regressed"]
+
+    def test_cli_writes_json_and_fails_on_regression(self, tmp_path):
+        output = str(tmp_path / "bench.json")
+        assert main(["--only", "spike_update_price", "--scale", "0.01", "--output", output]) == 0
+        with open(output) as f:
+            document = json.load(f)
+        assert document["meta"]["seed"] == 42
+        assert document["results"][0]["name"] == "spike_update_price"
+
+        # A baseline 1000x faster than anything achievable must fail the gate
+        for entry in document["results"]:
+            entry["latency_ms"]["p50"] /= 1000
+            entry["total_sec"] /= 1000
+        baseline = str(tmp_path / "baseline.json")
+        with open(baseline, "w") as f:
+            json.dump(document, f)
+        assert main([
+            "--only", "spike_update_price", "--scale", "0.01", "--output", output,
+            "--compare", baseline, "--fail-on-regression", "20",
+        ]) == 1
@@ -158,5 +158,796 @@ class TestNotifications:
         assert "embeds" in call_args.kwargs.get("json", {})
 
 
+class TestScheduler:
+    """Tests for the cooperative job scheduler."""
+
+    @staticmethod
+    def _run(scheduler, seconds):
+        import asyncio
+
+        async def main():
+            task = asyncio.create_task(scheduler.run())
+            await asyncio.sleep(seconds)
+            await scheduler.stop()
+            await task
+
+        asyncio.run(main())
+
+    def test_critical_job_not_blocked_by_bulk_lane(self):
+        """CRITICAL jobs run on time while the BULK lane is saturated."""
+        import asyncio
+        from src.utils.scheduler import Scheduler, JobPriority
+
+        scheduler = Scheduler(bulk_concurrency=1)
+        critical_runs = []
+        scans_started = []
+
+        async def slow_scan():
+            scans_started.append(1)
+            await asyncio.sleep(1.0)
+
+        async def critical():
+            critical_runs.append(1)
+
+        scheduler.add_job("scan_a", slow_scan, 0.01, JobPriority.BULK, initial_delay_sec=0)
+        scheduler.add_job("scan_b", slow_scan, 0.01, JobPriority.BULK, initial_delay_sec=0)
+        scheduler.add_job("spike", critical, 0.02, JobPriority.CRITICAL, jitter_pct=0)
+        self._run(scheduler, 0.2)
+
+        assert len(critical_runs) >= 5
+        # Only one bulk scan can hold the lane
+        assert len(scans_started) == 1
+
+    def test_overrun_counts_deadline_miss(self):
+        """A run longer than the interval skips the missed slots."""
+        import asyncio
+        from src.utils.scheduler import Scheduler, JobPriority
+
+        scheduler = Scheduler()
+        starts = []
+
+        async def slow():
+            starts.append(1)
+            await asyncio.sleep(0.05)
+
+        scheduler.add_job("slow", slow, 0.02, JobPriority.HIGH, jitter_pct=0, initial_delay_sec=0)
+        self._run(scheduler, 0.08)
+
+        stats = scheduler.get_stats()["jobs"]["slow"]
+        assert len(starts) == 2  # Not one per 20ms slot
+        assert stats["skipped_overruns"] >= 2
+        assert stats["deadline_misses"] >= 1
+
+    def test_jobs_deferred_while_api_has_no_budget(self):
+        """Non-critical jobs wait for RateLimiter budget; critical ones don't."""
+        from src.utils.rate_limiter import RateLimiter
+        from src.utils.scheduler import Scheduler, JobPriority
+
+        limiter = RateLimiter()
+        limiter.record_rate_limit("gamma")  # Backs off gamma
+        scheduler = Scheduler(rate_limiter=limiter)
+        runs = {"bulk": 0, "critical": 0}
+
+        async def bulk():
+            runs["bulk"] += 1
+
+        async def critical():
+            runs["critical"] += 1
+
+        scheduler.add_job("bulk", bulk, 0.01, JobPriority.BULK, apis=("gamma",), initial_delay_sec=0)
+        scheduler.add_job("critical", critical, 0.01, JobPriority.CRITICAL, apis=("gamma",), initial_delay_sec=0)
+        self._run(scheduler, 0.05)
+
+        assert runs["bulk"] == 0
+        assert runs["critical"] > 0
+        assert scheduler.get_job("bulk").stats.deferrals == 1
+
+    def test_failures_back_off_and_success_resets(self):
+        """Consecutive failures grow the retry delay exponentially."""
+        from src.utils.scheduler import Job
+
+        async def noop():
+            pass
+
+        job = Job("j", noop, interval_sec=60, jitter_pct=0, retry_delay_sec=10, max_retry_delay_sec=35)
+        assert job.next_delay() == 60
+        delays = []
+        for failures in (1, 2, 3):
+            job.stats.consecutive_failures = failures
+            delays.append(job.next_delay())
+        assert delays == [10, 20, 35]
+
+    def test_failing_job_is_counted_and_retried(self):
+        """A raising job is recorded and rescheduled after its retry delay."""
+        from src.utils.scheduler import Scheduler, JobPriority
+
+        scheduler = Scheduler()
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        scheduler.add_job("broken", broken, 0.01, JobPriority.NORMAL,
+                          initial_delay_sec=0, retry_delay_sec=0.01)
+        self._run(scheduler, 0.1)
+
+        stats = scheduler.get_stats()
+        assert stats["failures"] >= 2
+        assert stats["jobs"]["broken"]["last_error"] == "boom"
+
+    def test_first_run_is_jittered(self):
+        """Jobs added together get spread-out first runs."""
+        from src.utils.scheduler import Scheduler
+
+        scheduler = Scheduler()
+
+        async def noop():
+            pass
+
+        for i in range(10):
+            scheduler.add_job(f"job{i}", noop, interval_sec=100, jitter_pct=0.5)
+        due = [scheduler.get_job(f"job{i}").due_at for i in range(10)]
+        assert len(set(due)) == 10
+        assert max(due) - min(due) < 50
+
+
+async def _doubling_worker(ctx, factor=2):
+    """Worker entrypoint for TestStrategyWorkers (imported in the child)."""
+    import asyncio
+    import os
+
+    ctx.subscribe("numbers", lambda n: ctx.emit("doubled", (os.getpid(), n * factor)))
+    await asyncio.Event().wait()
+
+
+async def _crashing_worker(ctx):
+    raise RuntimeError("worker boom")
+
+
+class TestStrategyWorkers:
+    """Tests for process-sharded strategy groups."""
+
+    def test_bus_fanout_and_serialized_results(self):
+        """Published data reaches the worker; results are handled in the runner."""
+        import asyncio
+        import os
+        from src.services.strategy_workers import StrategyWorkerPool, WorkerGroup
+
+        results = []
+        in_handler = []
+
+        async def handler(payload):
+            # Results are handled one at a time
+            in_handler.append(1)
+            assert len(in_handler) == 1
+            await asyncio.sleep(0.01)
+            results.append(payload)
+            in_handler.pop()
+
+        async def main():
+            pool = StrategyWorkerPool()
+            pool.on("doubled", handler)
+            await pool.start()
+            run = asyncio.create_task(pool.run_group(WorkerGroup(
+                "doubler", "tests.test_core:_doubling_worker", {"factor": 3}
+            )))
+            await asyncio.sleep(0)  # Let run_group spawn the worker
+            for n in (1, 2, 3):
+                pool.publish("numbers", n)
+            for _ in range(200):
+                if len(results) == 3:
+                    break
+                await asyncio.sleep(0.05)
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+            await pool.stop()
+            return pool
+
+        pool = asyncio.run(main())
+        assert [n for _, n in results] == [3, 6, 9]
+        assert all(pid != os.getpid() for pid, _ in results)
+        stats = pool.get_stats()["doubler"]
+        assert stats["messages"] == 3 and not stats["alive"]
+
+    def test_crashed_worker_raises_for_restart(self):
+        """A worker that dies surfaces an error so _resilient_task restarts it."""
+        import asyncio
+        from src.services.strategy_workers import StrategyWorkerPool, WorkerGroup
+
+        async def main():
+            pool = StrategyWorkerPool()
+            await pool.start()
+            try:
+                with pytest.raises(RuntimeError, match="exited with code 1"):
+                    await pool.run_group(WorkerGroup("bad", "tests.test_core:_crashing_worker"))
+                await asyncio.sleep(0.6)  # Let the pump read the crash report
+            finally:
+                await pool.stop()
+            return pool.get_stats()["bad"]
+
+        stats = asyncio.run(main())
+        assert stats["errors"] == 1
+        assert stats["last_error"] == "worker boom"
+
+    def test_entrypoint_must_be_async(self):
+        from src.services.strategy_workers import resolve_entrypoint
+
+        with pytest.raises(TypeError):
+            resolve_entrypoint("os.path:join")
+        with pytest.raises(ValueError):
+            resolve_entrypoint("no_colon")
+
+
+class TestMetrics:
+    """Tests for the hot-path latency metrics registry."""
+
+    def test_histogram_renders_cumulative_buckets(self):
+        from src.utils.metrics import MetricsRegistry
+
+        registry = MetricsRegistry()
+        hist = registry.histogram("t_seconds", "Test.", ("api",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            hist.labels(api="kalshi").observe(value)
+
+        text = registry.render()
+        assert "# TYPE t_seconds histogram" in text
+        assert 't_seconds_bucket{api="kalshi",le="0.1"} 2' in text
+        assert 't_seconds_bucket{api="kalshi",le="1.0"} 3' in text
+        assert 't_seconds_bucket{api="kalshi",le="+Inf"} 4' in text
+        assert 't_seconds_count{api="kalshi"} 4' in text
+        assert 't_seconds_sum{api="kalshi"} 3.65' in text
+
+    def test_labels_are_validated(self):
+        from src.utils.metrics import MetricsRegistry
+
+        registry = MetricsRegistry()
+        hist = registry.histogram("t_seconds", "Test.", ("api",))
+        with pytest.raises(ValueError):
+            hist.labels(host="x")
+        with pytest.raises(ValueError):
+            hist.observe(1.0)
+        assert registry.histogram("t_seconds", "Test.", ("api",)) is hist
+        with pytest.raises(ValueError):
+            registry.gauge("t_seconds", "Test.")
+
+    def test_counter_renders_totals(self):
+        from src.utils.metrics import MetricsRegistry
+
+        registry = MetricsRegistry()
+        counter = registry.counter("t_total", "Test.", ("outcome",))
+        counter.labels(outcome="executed").inc()
+        counter.labels(outcome="executed").inc(2)
+
+        text = registry.render()
+        assert "# TYPE t_total counter" in text
+        assert 't_total{outcome="executed"} 3.0' in text
+
+    def test_db_writes_timed_per_table(self):
+        from src.database.client import _TimedSupabase
+        from src.utils.metrics import db_write_latency
+
+        client = MagicMock()
+        timed = _TimedSupabase(client)
+        before = db_write_latency.labels(table="t_core", op="update").snapshot()[2]
+
+        timed.table("t_core").update({"a": 1}).eq("id", 1).execute()
+        timed.table("t_core").select("*").execute()  # Reads are not recorded
+
+        assert db_write_latency.labels(table="t_core", op="update").snapshot()[2] == before + 1
+        client.table.return_value.update.return_value.eq.return_value.execute.assert_called_once()
+
+    def test_rate_limiter_wait_recorded(self):
+        import asyncio
+        from src.utils.metrics import rate_limit_wait
+        from src.utils.rate_limiter import RateLimiter
+
+        series = rate_limit_wait.labels(api="t_core_api")
+        asyncio.run(RateLimiter().wait("t_core_api"))
+        assert series.snapshot()[2] == 1
+
+    def test_event_loop_lag_sampled(self):
+        import asyncio
+        import time
+        from src.utils.metrics import event_loop_lag, event_loop_lag_last, monitor_event_loop_lag
+
+        async def main():
+            task = asyncio.create_task(monitor_event_loop_lag(interval_sec=0.01))
+            await asyncio.sleep(0)
+            time.sleep(0.05)  # Block the loop
+            await asyncio.sleep(0.03)
+            task.cancel()
+
+        before = event_loop_lag.labels().snapshot()[2]
+        asyncio.run(main())
+        assert event_loop_lag.labels().snapshot()[2] > before
+        assert event_loop_lag_last.labels().value >= 0.0
+
+
+class TestLegCoordinator:
+    """Tests for concurrent two-leg submission and reconciliation."""
+
+    @staticmethod
+    def _leg(name, fill, delay=0.0, blocking=False, unwinds=None):
+        import asyncio
+        import time
+        from src.arbitrage.leg_coordinator import LegOrder
+
+        async def submit(leg, tif):
+            if blocking:
+                time.sleep(delay)
+            else:
+                await asyncio.sleep(delay)
+            return {"success": True, "order_id": f"{name}-1", "filled_count": fill}
+
+        async def unwind(leg, quantity):
+            unwinds.append((leg.name, quantity))
+            return {"success": True, "filled_count": quantity}
+
+        return LegOrder(name, "kalshi", "T", name, 0.5, 100, submit=submit,
+                        unwind=unwind if unwinds is not None else None, blocking=blocking)
+
+    def test_legs_submitted_concurrently(self):
+        import asyncio
+        from src.arbitrage.leg_coordinator import LegCoordinator
+
+        for blocking in (False, True):
+            legs = [self._leg("buy", 100, 0.2, blocking), self._leg("sell", 100, 0.2, blocking)]
+            execution = asyncio.run(LegCoordinator().execute(legs))
+            assert execution.status == "filled"
+            assert execution.matched == 100
+            assert execution.latency_sec < 0.35
+            assert execution.skew_sec < 0.1
+
+    def test_partial_ioc_fill_unwinds_excess(self):
+        import asyncio
+        from src.arbitrage.leg_coordinator import LegCoordinator
+
+        unwinds = []
+        legs = [self._leg("buy", 100, unwinds=unwinds), self._leg("sell", 60, unwinds=unwinds)]
+        execution = asyncio.run(LegCoordinator(time_in_force="IOC").execute(legs))
+        assert execution.status == "partial"
+        assert execution.matched == 60
+        assert unwinds == [("buy", 40)]
+        assert execution.leg("buy").unwound == 40
+
+    def test_fok_partial_counts_as_unfilled(self):
+        import asyncio
+        from src.arbitrage.leg_coordinator import LegCoordinator
+
+        unwinds = []
+        legs = [self._leg("buy", 100, unwinds=unwinds), self._leg("sell", 60, unwinds=unwinds)]
+        execution = asyncio.run(LegCoordinator(time_in_force="FOK").execute(legs))
+        assert not execution.success
+        assert execution.leg("sell").status == "unfilled"
+        assert unwinds == [("buy", 100)]
+
+    def test_missing_unwind_path_reported(self):
+        import asyncio
+        from src.arbitrage.leg_coordinator import LegCoordinator
+
+        legs = [self._leg("buy", 100), self._leg("sell", 0)]
+        execution = asyncio.run(LegCoordinator().execute(legs))
+        assert execution.status == "failed"
+        assert execution.unwind_errors
+
+    def test_late_fill_after_deadline_is_unwound(self):
+        import asyncio
+        from src.arbitrage.leg_coordinator import LegCoordinator
+
+        unwinds = []
+
+        async def main():
+            coordinator = LegCoordinator(leg_deadline_sec=0.05)
+            legs = [self._leg("buy", 100, unwinds=unwinds),
+                    self._leg("sell", 100, delay=0.2, unwinds=unwinds)]
+            execution = await coordinator.execute(legs)
+            assert execution.leg("sell").status == "timeout"
+            assert execution.skew_sec is None
+            await coordinator.drain()
+            return execution, coordinator.get_stats()
+
+        execution, stats = asyncio.run(main())
+        assert not execution.success
+        assert ("buy", 100) in unwinds and ("sell", 100) in unwinds
+        assert stats["late_fills"] == 1
+
+
+class TestBalanceLedger:
+    """Tests for the in-memory balance ledger."""
+
+    def test_unknown_until_reconciled(self):
+        from src.services.balance_ledger import BalanceLedger
+
+        ledger = BalanceLedger()
+        assert ledger.available("kalshi") is None
+        ledger.reconcile("Kalshi", cash=100.0)
+        assert ledger.available("kalshi") == 100.0
+        ledger.invalidate("kalshi")
+        assert ledger.available("kalshi") is None
+
+    def test_stale_balance_is_unknown(self):
+        from src.services.balance_ledger import BalanceLedger
+
+        ledger = BalanceLedger(max_age_sec=0.0)
+        ledger.reconcile("kalshi", cash=100.0)
+        assert ledger.available("kalshi") is None
+        assert ledger.get_stats()["misses"] == 1
+
+    def test_reservations_and_fills(self):
+        from src.services.balance_ledger import BalanceLedger
+
+        ledger = BalanceLedger()
+        ledger.reconcile("kalshi", cash=100.0)
+        ledger.reserve("kalshi", "opp-1", 30.0)
+        assert ledger.available("kalshi") == 70.0
+
+        ledger.record_fill("kalshi", "MKT", "buy", 50, 0.4, key="opp-1")
+        assert ledger.available("kalshi") == pytest.approx(80.0)
+        assert ledger.position("kalshi", "MKT") == 50
+
+        ledger.record_fill("kalshi", "MKT", "sell", 50, 0.5)
+        assert ledger.available("kalshi") == pytest.approx(105.0)
+        assert ledger.position("kalshi", "MKT") == 0
+
+    def test_selling_unheld_contracts_costs_collateral(self):
+        from src.services.balance_ledger import BalanceLedger
+
+        ledger = BalanceLedger()
+        ledger.reconcile("kalshi", cash=100.0)
+        ledger.record_fill("kalshi", "MKT", "sell", 10, 0.6)
+        assert ledger.available("kalshi") == pytest.approx(96.0)
+        assert ledger.position("kalshi", "MKT") == -10
+
+    def test_reconcile_reports_drift(self):
+        from src.services.balance_ledger import BalanceLedger
+
+        ledger = BalanceLedger()
+        assert ledger.reconcile("polymarket", cash=50.0) == 0.0
+        ledger.debit("polymarket", 20.0)
+        assert ledger.reconcile("polymarket", cash=29.0, positions={"tok": 5}) == pytest.approx(-1.0)
+        assert ledger.available("polymarket") == 29.0
+        assert ledger.position("polymarket", "tok") == 5
+
+
+class TestClobClientPool:
+    """Tests for the warm Polymarket CLOB client pool."""
+
+    class FakeClob:
+        def __init__(self, healthy=True):
+            self.healthy = healthy
+            self.signed = []
+            self.posted = []
+            self.metadata_calls = 0
+
+        def get_address(self):
+            return "0xABCDEF0123456789"
+
+        def get_ok(self):
+            if not self.healthy:
+                raise ConnectionError("down")
+            return "OK"
+
+        def get_tick_size(self, token_id):
+            self.metadata_calls += 1
+            return "0.01"
+
+        def get_neg_risk(self, token_id):
+            return False
+
+        def create_order(self, order_args, options):
+            self.signed.append((order_args.token_id, order_args.price, options.tick_size))
+            return {"signed": len(self.signed)}
+
+        def post_order(self, order, order_type):
+            self.posted.append((order, order_type))
+            return {"success": True, "orderID": "o1"}
+
+    def _pool(self, clob, **kwargs):
+        from src.clients.clob_pool import ClobClientPool
+
+        polymarket = MagicMock()
+        polymarket.create_clob_client.return_value = clob
+        return ClobClientPool(polymarket, **kwargs)
+
+    def test_add_wallet_health_checks(self):
+        clob = self.FakeClob(healthy=False)
+        pool = self._pool(clob)
+        assert pool.add_wallet("0xkey") is clob
+        assert pool.client() is clob
+        assert pool.client("0xabcdef0123456789") is clob
+        assert pool.ping() == {"0xabcdef0123456789": False}
+        clob.healthy = True
+        assert pool.ping() == {"0xabcdef0123456789": True}
+
+    def test_metadata_cached_per_token(self):
+        clob = self.FakeClob()
+        pool = self._pool(clob)
+        pool.submit(clob, "tok", "BUY", 0.45, 10)
+        pool.submit(clob, "tok", "BUY", 0.46, 10)
+        assert clob.metadata_calls == 1
+        assert pool.get_stats()["metadata_hits"] == 1
+
+    def test_presigned_order_is_posted(self):
+        clob = self.FakeClob()
+        pool = self._pool(clob)
+        assert pool.presign(clob, "tok", "buy", 0.45, 10)
+        assert len(clob.signed) == 1
+
+        response = pool.submit(clob, "tok", "BUY", 0.45, 10, "IOC")
+        assert response["success"]
+        assert len(clob.signed) == 1  # No signing on the trade path
+        assert clob.posted[0] == ({"signed": 1}, "FAK")
+        assert pool.presigned_hits == 1
+
+        pool.submit(clob, "tok", "BUY", 0.45, 10)  # Presigned orders are single-use
+        assert len(clob.signed) == 2
+
+    def test_expired_presign_is_resigned(self):
+        clob = self.FakeClob()
+        pool = self._pool(clob, presign_ttl_sec=0.0)
+        pool.presign(clob, "tok", "SELL", 0.55, 5)
+        pool.submit(clob, "tok", "SELL", 0.55, 5)
+        assert len(clob.signed) == 2
+        assert pool.presigned_hits == 0
+
+
+class TestOpportunityBus:
+    """Tests for the opportunity bus."""
+
+    def _bus(self, handled, **kwargs):
+        from src.services.opportunity_bus import OpportunityBus
+
+        bus = OpportunityBus(**kwargs)
+
+        async def handler(opp):
+            handled.append(opp["id"])
+
+        bus.on(
+            "arb", handler,
+            markets=lambda o: [(o["venue"], o["market"])],
+            edge=lambda o: o["edge"],
+        )
+        return bus
+
+    def test_executes_highest_edge_first(self):
+        import asyncio
+
+        handled = []
+
+        async def main():
+            bus = self._bus(handled, workers=1)
+            publish = bus.publisher("arb")
+            for i, edge in enumerate([1.0, 5.0, 3.0]):
+                await publish({"id": i, "venue": "kalshi", "market": f"M{i}", "edge": edge})
+            assert bus.depth == 3
+            await bus.start()
+            while bus.depth or len(handled) < 3:
+                await asyncio.sleep(0.01)
+            await bus.stop()
+            return bus.get_stats()
+
+        stats = asyncio.run(main())
+        assert handled == [1, 2, 0]
+        assert stats["counts"]["arb"]["executed"] == 3
+
+    def test_dedups_same_market(self):
+        handled = []
+        bus = self._bus(handled)
+        assert bus.publish("arb", {"id": 1, "venue": "Kalshi", "market": "M", "edge": 1.0})
+        assert not bus.publish("arb", {"id": 2, "venue": "kalshi", "market": "M", "edge": 9.0})
+        assert bus.publish("arb", {"id": 3, "venue": "polymarket", "market": "M", "edge": 1.0})
+        assert bus.counts["arb"]["deduplicated"] == 1
+
+    def test_full_queue_evicts_lowest_priority(self):
+        handled = []
+        bus = self._bus(handled, max_size=2)
+        bus.publish("arb", {"id": 1, "venue": "k", "market": "A", "edge": 1.0})
+        bus.publish("arb", {"id": 2, "venue": "k", "market": "B", "edge": 2.0})
+        assert not bus.publish("arb", {"id": 3, "venue": "k", "market": "C", "edge": 0.5})
+        assert bus.publish("arb", {"id": 4, "venue": "k", "market": "D", "edge": 3.0})
+        assert sorted(item.payload["id"] for item in bus._heap) == [2, 4]
+        assert bus.counts["arb"]["dropped"] == 2
+
+    def test_stale_items_expire(self):
+        import asyncio
+
+        handled = []
+
+        async def main():
+            bus = self._bus(handled, ttl_sec=0.0)
+            bus.publish("arb", {"id": 1, "venue": "k", "market": "A", "edge": 1.0})
+            await asyncio.sleep(0.01)
+            await bus.start()
+            await asyncio.sleep(0.02)
+            await bus.stop()
+            return bus
+
+        bus = asyncio.run(main())
+        assert handled == []
+        assert bus.counts["arb"]["expired"] == 1
+
+
+class TestStallWatchdog:
+    """Tests for the event-loop stall watchdog."""
+
+    def test_blocking_call_is_attributed(self):
+        import asyncio
+        import time
+        from src.utils.stall_watchdog import StallWatchdog
+
+        def blocking_helper():
+            time.sleep(0.3)
+
+        async def blocker():
+            await asyncio.sleep(0.05)
+            blocking_helper()
+
+        async def main():
+            watchdog = StallWatchdog(threshold_sec=0.1, interval_sec=0.02)
+            heartbeat = watchdog.start()
+            await asyncio.create_task(blocker(), name="blocker")
+            await asyncio.sleep(0.1)
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            return watchdog
+
+        watchdog = asyncio.run(main())
+        assert watchdog.stalls == 1
+        worst = watchdog.top(1)[0]
+        assert "blocker" in worst["task"]
+        assert worst["call_site"].endswith("in blocking_helper")
+        assert "sleep" in worst["blocking_call"] or "blocking_helper" in worst["blocking_call"]
+        assert worst["total_sec"] >= 0.2
+        assert "blocking_helper" in watchdog.format_report()
+
+    def test_attribute_stack_prefers_project_frames(self):
+        import traceback
+        from src.utils.stall_watchdog import attribute_stack
+
+        stack = traceback.StackSummary.from_list([
+            ("/usr/lib/python3/asyncio/events.py", 80, "_run", None),
+            (os.path.abspath("src/clients/kalshi_client.py"), 540, "get_balance", None),
+            ("/usr/lib/python3/site-packages/requests/api.py", 73, "get", None),
+        ])
+        call_site, blocking = attribute_stack(stack)
+        assert call_site == "src/clients/kalshi_client.py:540 in get_balance"
+        assert blocking == "api.py:73 in get"
+
+
+class TestProfiling:
+    """Tests for the on-demand CPU and memory profilers."""
+
+    def test_samples_are_tagged_by_tenant(self):
+        import asyncio
+        import time
+        from src.utils.profiling import SamplingProfiler, current_tenant, install_tenant_tracking
+
+        def busy_tenant_work():
+            end = time.monotonic() + 0.3
+            while time.monotonic() < end:
+                pass
+
+        async def tenant_job():
+            await asyncio.sleep(0.05)
+            busy_tenant_work()
+
+        async def main():
+            install_tenant_tracking()
+            token = current_tenant.set("user-a")
+            job = asyncio.create_task(tenant_job())
+            current_tenant.reset(token)
+            result = await SamplingProfiler(interval_sec=0.005).profile(0.5)
+            await job
+            return result
+
+        result = asyncio.run(main())
+        text = result.collapsed()
+        assert result.samples > 0
+        assert result.tenants.get("user-a", 0) > 0
+        tenant_lines = [line for line in text.splitlines() if line.startswith("tenant:user-a;")]
+        assert any("busy_tenant_work" in line for line in tenant_lines)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in text.splitlines())
+
+    def test_one_profile_at_a_time(self):
+        import asyncio
+        from src.utils.profiling import ProfilerBusy, SamplingProfiler, memory_diff
+
+        async def main():
+            running = asyncio.create_task(SamplingProfiler().profile(0.2))
+            await asyncio.sleep(0.05)
+            with pytest.raises(ProfilerBusy):
+                await memory_diff(0.1)
+            await running
+
+        asyncio.run(main())
+
+    def test_memory_diff_reports_growth_site(self):
+        import asyncio
+        import tracemalloc
+        from src.utils.profiling import memory_diff
+
+        hoard = []
+
+        async def grow():
+            await asyncio.sleep(0.05)
+            hoard.extend(bytearray(1024) for _ in range(2000))
+
+        async def main():
+            task = asyncio.create_task(grow())
+            report = await memory_diff(0.2, top=5)
+            await task
+            return report
+
+        report = asyncio.run(main())
+        assert not tracemalloc.is_tracing()
+        assert report["tracing_started_for_window"]
+        assert report["growth_kb"] > 1000
+        assert "test_core.py" in report["top"][0]["site"]
+
+
+class TestBulkWrites:
+    """Test chunked, retried multi-row writes on Database."""
+
+    def _database(self, failures=0):
+        from src.database.client import Database
+
+        db = Database(url="http://127.0.0.1:9", key="test", user_id="tenant-1")
+        db._client = MagicMock()
+        builder = db._client.table.return_value
+        attempts = []
+
+        def execute():
+            attempts.append(1)
+            if len(attempts) <= failures:
+                raise ConnectionError("transient")
+
+        for op in (builder.insert, builder.upsert):
+            op.return_value.execute.side_effect = execute
+        return db, builder
+
+    def test_upsert_many_chunks_and_dedupes(self):
+        import asyncio
+
+        db, builder = self._database()
+        rows = [{"address": f"0x{i % 1200}", "n": i} for i in range(1250)]
+        written = asyncio.run(db.upsert_many("polybot_tracked_whales", rows, on_conflict="address", chunk_size=500))
+
+        assert written == 1200
+        chunks = [c.args[0] for c in builder.upsert.call_args_list]
+        assert [len(c) for c in chunks] == [500, 500, 200]
+        assert builder.upsert.call_args.kwargs == {"on_conflict": "address"}
+        assert {"address": "0x0", "n": 1200} in chunks[0]  # Last row per key wins
+
+    def test_insert_many_retries_and_tags_tenant(self, monkeypatch):
+        import asyncio
+
+        async def no_sleep(_):
+            return None
+
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        db, builder = self._database(failures=2)
+        rows = [{"market_id": str(i)} for i in range(3)]
+
+        assert asyncio.run(db.insert_many("polybot_opportunities", rows, retries=2)) == 3
+        assert builder.insert.call_count == 3
+        assert all(row["user_id"] == "tenant-1" for row in builder.insert.call_args.args[0])
+        assert "user_id" not in rows[0]  # Caller's rows are not mutated
+
+        db, builder = self._database(failures=10)
+        assert asyncio.run(db.insert_many("polybot_opportunities", rows, retries=1)) == 0
+        assert builder.insert.call_count == 2
+
+    def test_whale_sync_is_one_request(self):
+        import asyncio
+        from src.strategies.whale_copy_trading import WhaleCopyTradingStrategy
+
+        db, builder = self._database()
+        strategy = WhaleCopyTradingStrategy(auto_discover_whales=False, db_client=db)
+        for i in range(300):
+            strategy.add_whale(f"0xwhale{i}")
+
+        asyncio.run(strategy.sync_whales_to_db())
+        assert builder.upsert.call_count == 1
+        assert len(builder.upsert.call_args.args[0]) == 300
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,222 @@
+"""
+Tests for the exchange layer market data helpers.
+
+Run with: python -m pytest tests/test_exchanges.py -v
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.exchanges.base import BaseExchange, Ticker
+from src.exchanges.ccxt_client import CCXTClient
+from src.exchanges.market_data import QuoteBoard
+
+
+def _raw_ticker(price):
+    return {"bid": price - 1, "ask": price + 1, "last": price, "quoteVolume": 1e6}
+
+
+def _client(has_bulk=True):
+    client = CCXTClient("binance")
+    client._initialized = True
+    client.exchange = MagicMock()
+    client.exchange.markets = {"BTC/USDT": {}, "ETH/USDT": {}, "SOL/USDT": {}}
+    client.exchange.has = {"fetchTickers": has_bulk}
+    client.exchange.fetch_tickers = AsyncMock(side_effect=lambda symbols: {
+        s: _raw_ticker(100.0 + i) for i, s in enumerate(sorted(symbols))
+    })
+    client.exchange.fetch_ticker = AsyncMock(side_effect=lambda s: _raw_ticker(50.0))
+    return client
+
+
+class TestMarketSnapshot:
+    def test_one_bulk_call_serves_all_strategies(self):
+        client = _client()
+
+        async def cycle():
+            pairs = await client.get_snapshot(["BTC/USDT", "ETH/USDT"])
+            funding = await client.get_snapshot(["SOL/USDT"])
+            again = await client.get_snapshot(["BTC/USDT"])
+            return pairs, funding, again
+
+        pairs, funding, again = asyncio.run(cycle())
+        # Second request adds a symbol -> one refetch; third is served from cache
+        assert client.exchange.fetch_tickers.await_count == 2
+        assert again is funding
+        assert funding.covers(["BTC/USDT", "ETH/USDT", "SOL/USDT"])
+        client.exchange.fetch_ticker.assert_not_awaited()
+
+    def test_concurrent_callers_share_one_fetch(self):
+        client = _client()
+        client.watch_symbols(["BTC/USDT", "ETH/USDT", "XRP/USDT"])
+
+        async def burst():
+            return await asyncio.gather(*(client.get_snapshot() for _ in range(5)))
+
+        snapshots = asyncio.run(burst())
+        assert client.exchange.fetch_tickers.await_count == 1
+        assert all(s is snapshots[0] for s in snapshots)
+        # Symbols not listed on the exchange are skipped
+        assert snapshots[0].get("XRP/USDT") is None
+
+    def test_falls_back_to_parallel_single_fetches(self):
+        client = _client(has_bulk=False)
+        snapshot = asyncio.run(client.get_snapshot(["BTC/USDT", "ETH/USDT"]))
+        assert client.exchange.fetch_ticker.await_count == 2
+        assert snapshot.get("ETH/USDT").last == pytest.approx(50.0)
+
+    def test_stale_snapshot_is_refetched(self):
+        client = _client()
+        client.snapshot_max_age_sec = 0.0
+
+        async def two_cycles():
+            first = await client.get_snapshot(["BTC/USDT"])
+            await asyncio.sleep(0.001)
+            return first, await client.get_snapshot(["BTC/USDT"])
+
+        first, second = asyncio.run(two_cycles())
+        assert first is not second
+        assert client.exchange.fetch_tickers.await_count == 2
+
+
+def _ticker(symbol, bid, ask):
+    return Ticker(symbol, bid, ask, (bid + ask) / 2, 0.0, datetime.now())
+
+
+class FeedExchange(BaseExchange):
+    """Exchange double whose tickers come from an in-process feed."""
+
+    poll_interval_sec = 0.0
+
+    def __init__(self, exchange_id, pushed=True):
+        super().__init__()
+        self.exchange_id = exchange_id
+        self.pushed = pushed
+        self.feed = asyncio.Queue()
+        self.polls = 0
+        self._initialized = True
+
+    async def stream_tickers(self, symbols):
+        if not self.pushed:
+            async for ticker in super().stream_tickers(symbols):
+                yield ticker
+            return
+        while True:
+            ticker = await self.feed.get()
+            if ticker is None:
+                return
+            yield ticker
+
+    async def get_tickers(self, symbols=None):
+        self.polls += 1
+        ticker = self.feed.get_nowait() if not self.feed.empty() else None
+        return {ticker.symbol: ticker} if ticker else {}
+
+    async def initialize(self): pass
+    async def close(self): pass
+    async def get_ticker(self, symbol): raise NotImplementedError
+    async def get_orderbook(self, symbol, limit=20): raise NotImplementedError
+    async def get_ohlcv(self, symbol, timeframe="1h", limit=100): return []
+    async def get_balance(self, asset=None): return {}
+    async def get_positions(self, symbol=None): return []
+    async def create_order(self, *args, **kwargs): raise NotImplementedError
+    async def cancel_order(self, order_id, symbol): return False
+    async def get_order(self, order_id, symbol): raise NotImplementedError
+    async def get_open_orders(self, symbol=None): return []
+    async def get_funding_rate(self, symbol): return None
+    async def get_funding_rates(self, symbols=None): return {}
+    async def get_funding_rate_history(self, symbol, limit=100): return []
+    async def set_leverage(self, symbol, leverage): return False
+
+
+async def _drain(*exchanges):
+    """Let the board consume everything queued on the feeds."""
+    for _ in range(50):
+        if all(ex.feed.empty() for ex in exchanges):
+            break
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+class TestQuoteBoard:
+    def test_only_changes_notify_listeners(self):
+        board = QuoteBoard()
+        seen = []
+        board.on_update(lambda ex, sym: seen.append((ex, sym)))
+        feed = FeedExchange("binance")
+
+        async def run():
+            board.subscribe(feed, ["BTC/USDT"])
+            for bid in (100.0, 100.0, 101.0):
+                feed.feed.put_nowait(_ticker("BTC/USDT", bid, bid + 1))
+            await _drain(feed)
+            await board.stop()
+
+        asyncio.run(run())
+        assert seen == [("binance", "BTC/USDT")] * 2
+        assert board.get("binance", "BTC/USDT").bid == 101.0
+        assert board.updates == 2
+
+    def test_default_stream_polls_and_skips_unchanged(self):
+        feed = FeedExchange("kraken", pushed=False)
+        for bid in (10.0, 10.0, 11.0):
+            feed.feed.put_nowait(_ticker("ETH/USDT", bid, bid + 1))
+
+        async def take(n):
+            out = []
+            async for ticker in feed.stream_tickers(["ETH/USDT"]):
+                out.append(ticker.bid)
+                if len(out) == n:
+                    return out
+
+        assert asyncio.run(take(2)) == [10.0, 11.0]
+        assert feed.polls == 3
+
+    def test_stale_quotes_are_filtered(self):
+        board = QuoteBoard()
+        board.update("binance", _ticker("BTC/USDT", 100.0, 101.0))
+        board.update("kraken", _ticker("BTC/USDT", 100.5, 101.5))
+        board.get("kraken", "BTC/USDT").updated_at -= 60
+        assert set(board.quotes_for("BTC/USDT")) == {"binance", "kraken"}
+        assert set(board.quotes_for("BTC/USDT", max_age_sec=10)) == {"binance"}
+
+
+class TestStreamingCrossExchangeArb:
+    def test_reacts_to_each_quote_update_once(self):
+        from decimal import Decimal
+        from src.strategies.cross_exchange_arb import ArbConfig, CrossExchangeArbStrategy
+
+        a, b = FeedExchange("binance"), FeedExchange("kraken")
+        found = []
+        strategy = CrossExchangeArbStrategy(
+            [a, b],
+            config=ArbConfig(min_profit_pct=Decimal("0.5"), symbols=["BTC/USDT"]),
+            on_opportunity=found.append,
+        )
+
+        async def run():
+            await strategy.start()
+            a.feed.put_nowait(_ticker("BTC/USDT", 99.0, 100.0))
+            b.feed.put_nowait(_ticker("BTC/USDT", 100.0, 100.5))
+            await _drain(a, b)
+            assert found == []  # 0% spread
+
+            b.feed.put_nowait(_ticker("BTC/USDT", 101.0, 101.5))
+            await _drain(a, b)
+            # A quote change that leaves the best buy/sell unchanged is not re-reported
+            a.feed.put_nowait(_ticker("BTC/USDT", 98.9, 100.0))
+            await _drain(a, b)
+            await strategy.stop()
+
+        asyncio.run(run())
+        assert len(found) == 1
+        opp = found[0]
+        assert (opp.buy_exchange, opp.sell_exchange) == ("binance", "kraken")
+        assert opp.spread_pct == Decimal("1")
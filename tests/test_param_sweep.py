@@ -0,0 +1,109 @@
+"""
+Tests for the tick replay engine and multi-process parameter sweep runner.
+
+Run with: python -m pytest tests/test_param_sweep.py -v
+"""
+
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.simulation.replay import TickTape, replay_spike_hunter
+from src.simulation.param_sweep import (
+    ParameterGrid,
+    ParameterSweep,
+    RandomSearch,
+    format_sweep_table,
+)
+
+
+def _spiky_records():
+    """Two markets drifting around 0.50 with a sharp spike on each."""
+    records = []
+    for i in range(600):
+        ts = 1_700_000_000 + i
+        base = 0.50 + 0.002 * math.sin(i / 7)
+        mkt_a = base + (0.05 if 200 <= i < 210 else 0.0)
+        mkt_b = base - (0.04 if 400 <= i < 405 else 0.0)
+        records.append((ts, "mkt-a", mkt_a, 10.0))
+        records.append((ts + 0.5, "mkt-b", mkt_b, 5.0))
+    return records
+
+
+@pytest.fixture
+def tape_path(tmp_path):
+    path = str(tmp_path / "ticks.npy")
+    TickTape.from_records(_spiky_records()).save(path)
+    return path
+
+
+class TestTickTape:
+    def test_roundtrip_memory_mapped(self, tape_path):
+        tape = TickTape.load(tape_path, mmap=True)
+        assert tape.symbols == ["mkt-a", "mkt-b"]
+        assert len(tape) == 1200
+        ts, symbol, price, volume = next(iter(tape.iter_ticks()))
+        assert symbol == "mkt-a"
+        assert price == pytest.approx(0.50)
+
+    def test_from_records_sorts_by_time(self):
+        tape = TickTape.from_records([(2.0, "b", 0.4, 0), (1.0, "a", 0.5, 0)])
+        assert [t[1] for t in tape.iter_ticks()] == ["a", "b"]
+
+
+class TestParameterSpaces:
+    def test_grid_is_cartesian_product(self):
+        grid = ParameterGrid({"a": [1, 2], "b": [0.1, 0.2, 0.3]})
+        combos = list(grid)
+        assert len(grid) == 6 == len(combos)
+        assert {"a": 2, "b": 0.3} in combos
+
+    def test_random_search_is_seeded(self):
+        space = {"x": (1.0, 5.0), "n": (1, 3), "mode": ["fast", "slow"]}
+        first = list(RandomSearch(space, n_samples=5, seed=7))
+        second = list(RandomSearch(space, n_samples=5, seed=7))
+        assert first == second
+        assert all(1.0 <= p["x"] <= 5.0 and p["n"] in (1, 2, 3) for p in first)
+
+
+class TestParameterSweep:
+    def test_spike_replay_detects_spikes(self, tape_path):
+        tape = TickTape.load(tape_path)
+        metrics = replay_spike_hunter(tape, {"min_magnitude_pct": 2.0})
+        assert metrics["spikes_detected"] >= 2
+        assert metrics["trades"] >= 1
+
+    def test_multiprocess_matches_in_process(self, tape_path):
+        grid = ParameterGrid({
+            "min_magnitude_pct": [1.0, 2.0, 20.0],
+            "take_profit_pct": [1.0, 3.0],
+        })
+        serial = ParameterSweep("spike_hunter", tape_path, max_workers=1).run(grid)
+        parallel = ParameterSweep("spike_hunter", tape_path, max_workers=2).run(grid)
+
+        assert len(parallel) == 6
+        assert not any(r.error for r in parallel)
+        by_params = {tuple(sorted(r.params.items())): r.metrics for r in serial}
+        for r in parallel:
+            assert r.metrics == by_params[tuple(sorted(r.params.items()))]
+
+        # Ranked best-first by objective
+        pnls = [r.metrics["total_pnl"] for r in parallel]
+        assert pnls == sorted(pnls, reverse=True)
+        assert "min_magnitude_pct" in format_sweep_table(parallel)
+
+    def test_failed_combinations_rank_last(self, tape_path):
+        results = ParameterSweep("spike_hunter", tape_path, max_workers=1).run([
+            {"min_magnitude_pct": 2.0},
+            {"not_a_parameter": 1},
+        ])
+        assert results[0].error is None
+        assert results[-1].error is not None
+
+    def test_unknown_evaluator_rejected(self, tape_path):
+        with pytest.raises(ValueError):
+            ParameterSweep("no_such_strategy", tape_path)
@@ -567,6 +567,49 @@ class TestOrderFlow:
         result = analyzer.calculate_ofi("BTC")
         assert result is None, "Should return None without snapshots"
     
+    def test_ofi_from_book_ring(self):
+        """Test vectorized OFI over streamed books."""
+        import time
+        from src.strategies.order_flow import OrderFlowAnalyzer, OFISignal
+        from src.clients.polymarket_client import OrderBook
+
+        analyzer = OrderFlowAnalyzer(window_size=10, depth=3)
+        now = time.time()
+        books = [
+            ([(0.50, 100), (0.49, 200)], [(0.52, 100), (0.53, 200)]),
+            ([(0.50, 400), (0.49, 200)], [(0.52, 100), (0.53, 200)]),   # bid +300
+            ([(0.51, 300), (0.50, 400)], [(0.52, 50), (0.53, 200)]),    # new bid +300, ask -50
+        ]
+        for k, (bids, asks) in enumerate(books):
+            analyzer.on_book_update("tok", OrderBook(bids=bids, asks=asks, last_update=now + k))
+
+        result = analyzer.calculate_ofi("tok", levels=2)
+        # Same-price size changes: +300, then +300 (new 0.51 bid) and +50 (ask shrank)
+        assert result.ofi_raw == pytest.approx(650.0)
+        assert result.bid_depth == pytest.approx(700.0)
+        assert result.ask_depth == pytest.approx(250.0)
+        assert result.signal == OFISignal.WEAK_BUY  # 650 / (2 * 1000)
+
+        ml = analyzer.multi_level_ofi("tok", levels=2)
+        # Best level: +300 (bid grew), then bid up-tick (+300) and ask shrink (+50)
+        assert ml[0] == pytest.approx(650.0)
+        assert analyzer.depth_weighted_imbalance("tok", levels=2) == pytest.approx(
+            (300 + 0.5 * 400 - 50 - 0.5 * 200) / (300 + 0.5 * 400 + 50 + 0.5 * 200)
+        )
+
+    def test_ofi_momentum_from_ring(self):
+        """Test momentum is computed at tick rate from the ring."""
+        import time
+        from src.strategies.order_flow import OrderFlowAnalyzer
+
+        analyzer = OrderFlowAnalyzer(window_size=50, depth=1)
+        now = time.time()
+        assert analyzer.get_momentum("tok") is None
+        for k in range(10):
+            analyzer.add_book("tok", [(0.50, 100 + 100 * k)], [(0.52, 100)], now + k)
+        # Steady bid growth -> rising cumulative OFI -> positive momentum
+        assert analyzer.get_momentum("tok", periods=3, levels=1) > 0
+
     def test_ofi_signal_levels(self):
         """Test OFI signal enum values."""
         from src.strategies.order_flow import OFISignal
@@ -750,6 +793,602 @@ class TestCorrelationLimits:
         assert tracker.max_cluster_pct == 30.0
         assert tracker.high_corr_threshold == 0.7
 
+    def test_correlation_matrix_matches_numpy(self):
+        """Incremental cross-moments should match np.corrcoef on aligned bars."""
+        import numpy as np
+        from datetime import timezone
+        from src.strategies.correlation_limits import CorrelationTracker
+
+        rng = np.random.default_rng(7)
+        common = rng.normal(size=80)
+        noise = rng.normal(size=(80, 3))
+        prices = 100 * np.cumprod(
+            1 + 0.01 * np.column_stack([common + 0.3 * noise[:, 0],
+                                        common + 0.3 * noise[:, 1],
+                                        noise[:, 2]]),
+            axis=0,
+        )
+
+        tracker = CorrelationTracker(history_window=40, bar_seconds=60)
+        for t in range(80):
+            ts = datetime.fromtimestamp(1_700_000_000 + 60 * t, tz=timezone.utc)
+            for sym, price in zip(("BTC", "ETH", "GOLD"), prices[t]):
+                tracker.add_price(sym, float(price), ts)
+
+        # The last bar is still open; committed returns end one bar earlier
+        returns = prices[1:79] / prices[:78] - 1
+        expected = np.corrcoef(returns[-40:].T)
+
+        symbols, matrix = tracker.correlation_matrix()
+        assert symbols == ["BTC", "ETH", "GOLD"]
+        assert np.allclose(matrix, expected, atol=1e-9)
+
+        row = tracker.correlation_row("ETH")
+        assert row["BTC"] == pytest.approx(expected[1, 0], abs=1e-9)
+        assert tracker.get_correlation("btc", "eth") > 0.7
+
+        pair = tracker.calculate_correlation("BTC", "GOLD")
+        assert pair.sample_count == 40
+        assert pair.correlation == pytest.approx(expected[0, 2], abs=1e-9)
+
+
+# ============================================================================
+# Rolling Statistics (O(1) windows)
+# ============================================================================
+
+
+class TestRollingStats:
+    """Test the sliding-window statistics primitive and its pairs usage."""
+
+    def test_matches_statistics_module(self):
+        """Mean/stdev/min/max should match a full recompute over the window."""
+        import random
+        import statistics
+        from src.utils.rolling_stats import RollingStats
+
+        rng = random.Random(1)
+        stats = RollingStats(window=50)
+        history = []
+        for _ in range(500):
+            value = rng.gauss(100.0, 5.0)
+            stats.push(value)
+            history = (history + [value])[-50:]
+
+            assert stats.mean == pytest.approx(statistics.mean(history), rel=1e-9)
+            assert stats.min == min(history)
+            assert stats.max == max(history)
+            if len(history) >= 2:
+                assert stats.std == pytest.approx(statistics.stdev(history), rel=1e-6)
+
+    def test_push_returns_evicted_value(self):
+        """Once full, each push evicts the oldest value."""
+        from src.utils.rolling_stats import RollingStats
+
+        stats = RollingStats(window=3)
+        assert [stats.push(v) for v in (1, 2, 3, 4, 5)] == [None, None, None, 1.0, 2.0]
+        assert stats.values() == [3.0, 4.0, 5.0]
+        assert stats.zscore() == pytest.approx(1.0)
+
+    def test_pair_zscore_uses_bounded_window(self):
+        """TradingPair keeps lookback_periods * 24 spread points."""
+        import statistics
+        from src.strategies.pairs_trading import TradingPair
+
+        pair = TradingPair("A", "B", "A-B", beta=1.0, lookback_periods=1)
+        for i in range(100):
+            pair.update_prices(100.0 + (i % 7), 50.0)
+
+        history = pair.spread_history
+        assert len(history) == 24
+        expected = (history[-1] - statistics.mean(history)) / statistics.stdev(history)
+        assert pair.current_zscore == pytest.approx(expected, rel=1e-6)
+        assert pair.to_dict()["history_length"] == 24
+
+
+# ============================================================================
+# Spike Hunter (monotonic window detection)
+# ============================================================================
+
+
+class TestSpikeHunter:
+    """Test spike detection over the compact price window."""
+
+    def test_price_window_extremes_match_bruteforce(self):
+        """Window min/max should equal a full rescan of eligible ticks."""
+        import random
+        from src.strategies.spike_hunter import PriceWindow
+
+        rng = random.Random(3)
+        window = PriceWindow(capacity=50)
+        history = []
+        now = 0.0
+        for _ in range(2000):
+            now += rng.uniform(0.1, 3.0)
+            price = rng.uniform(0.2, 0.8)
+            window.append(price, now)
+            history = (history + [(now, price)])[-50:]
+
+            eligible = [p for t, p in history[:-1] if 1.0 <= now - t <= 30.0]
+            result = window.extremes(now, max_age_sec=30.0, min_age_sec=1.0)
+            if not eligible:
+                assert result is None
+            else:
+                assert result[0] == min(eligible)
+                assert result[2] == max(eligible)
+
+    def test_detects_largest_move_in_window(self):
+        """A spike is measured from the window extreme, not the latest tick."""
+        from src.strategies.spike_hunter import SpikeHunterStrategy, SpikeType
+
+        strategy = SpikeHunterStrategy(min_magnitude_pct=5.0, max_duration_sec=30.0)
+        base = 1_700_000_000.0
+        for i, price in enumerate([0.50, 0.48, 0.49, 0.50]):
+            assert strategy.update_price("m1", price, timestamp=base + i * 5) is None
+
+        opp = strategy.update_price("m1", 0.53, timestamp=base + 20)
+        assert opp is not None
+        assert opp.spike_type == SpikeType.SPIKE_UP
+        assert opp.spike_start_price == pytest.approx(0.48)
+        assert opp.spike_duration_sec == pytest.approx(15.0)
+
+    def test_ignores_moves_outside_window(self):
+        """Prices older than max_duration_sec do not count toward a spike."""
+        from src.strategies.spike_hunter import SpikeHunterStrategy
+
+        strategy = SpikeHunterStrategy(min_magnitude_pct=5.0, max_duration_sec=10.0)
+        base = 1_700_000_000.0
+        strategy.update_price("m1", 0.40, timestamp=base)
+        strategy.update_price("m1", 0.50, timestamp=base + 30)
+        assert strategy.update_price("m1", 0.505, timestamp=base + 35) is None
+
+        strategy.clear_stale_history(max_age_sec=0.0)
+        assert "m1" not in strategy._price_history
+
+
+# ============================================================================
+# Indicator Engine (vectorized stock indicators)
+# ============================================================================
+
+
+class TestIndicatorEngine:
+    """Test batch indicators against the per-symbol list implementations."""
+
+    def _series(self, seed, n):
+        import random
+        rng = random.Random(seed)
+        price = 100.0
+        closes, volumes = [], []
+        for _ in range(n):
+            price *= 1 + rng.gauss(0, 0.02)
+            closes.append(price)
+            volumes.append(rng.uniform(1e5, 5e5))
+        return closes, volumes
+
+    def test_indicators_match_reference(self):
+        """SMA/stdev/RSI/momentum/volume ratio match the old list math."""
+        import statistics
+        from src.strategies.indicator_engine import IndicatorEngine
+
+        engine = IndicatorEngine(capacity=25)
+        series = {}
+        for i, symbol in enumerate(["AAPL", "MSFT", "NVDA"]):
+            closes, volumes = self._series(i, 40)
+            # Load part of the history, stream the rest through the ring buffer
+            engine.load_history(symbol, closes[:30], volumes=volumes[:30])
+            series[symbol] = (closes, volumes)
+        for t in range(30, 40):
+            engine.append_bars({
+                s: (c[t], c[t], c[t], v[t]) for s, (c, v) in series.items()
+            })
+
+        names, sma = engine.sma(20)
+        _, std = engine.stdev(20)
+        _, rsi = engine.rsi(14)
+        _, mom = engine.pct_change(4)
+        _, vol = engine.volume_ratio(20)
+        for i, symbol in enumerate(names):
+            closes, volumes = series[symbol]
+            closes, volumes = closes[-25:], volumes[-25:]
+            changes = [b - a for a, b in zip(closes, closes[1:])][-14:]
+            gain = sum(max(0, c) for c in changes) / 14
+            loss = sum(max(0, -c) for c in changes) / 14
+
+            assert sma[i] == pytest.approx(statistics.mean(closes[-20:]))
+            assert std[i] == pytest.approx(statistics.stdev(closes[-20:]))
+            assert rsi[i] == pytest.approx(100 - 100 / (1 + gain / loss))
+            assert mom[i] == pytest.approx(closes[-1] / closes[-5] - 1)
+            assert vol[i] == pytest.approx(volumes[-1] / statistics.mean(volumes[-20:]))
+
+    def test_short_history_is_nan(self):
+        """Symbols without enough bars (or unknown ones) get NaN."""
+        import math
+        from src.strategies.indicator_engine import IndicatorEngine
+
+        engine = IndicatorEngine(capacity=10)
+        engine.load_history("A", [1.0, 2.0, 3.0])
+        _, sma = engine.sma(5, ["A", "missing"])
+        assert math.isnan(sma[0]) and math.isnan(sma[1])
+        assert engine.sma(5, ["A"], min_bars=1)[1][0] == pytest.approx(2.0)
+
+    def test_atr_matches_regime_close_only(self):
+        """Close-only ATR% equals the mean absolute change over the lookback."""
+        from src.strategies.regime_detection import RegimeDetector
+
+        closes, _ = self._series(7, 60)
+        detector = RegimeDetector(lookback_periods=20)
+        changes = [abs(b - a) for a, b in zip(closes, closes[1:])][-20:]
+        expected = sum(changes) / 20 / closes[-1] * 100
+        assert detector._calculate_atr_percent(closes) == pytest.approx(expected)
+
+    def test_mean_reversion_signals_batch(self):
+        """StockMeanReversionStrategy signals come from the shared matrix."""
+        from src.strategies.stock_mean_reversion import (
+            StockMeanReversionStrategy, SignalType,
+        )
+
+        strategy = StockMeanReversionStrategy(alpaca_client=MagicMock(), lookback_period=20)
+        strategy.indicators.load_history("KO", [60.0 + (i % 2) for i in range(20)])
+        strategy.indicators.load_history("PG", [150.0] * 10)  # Too short
+
+        signals = strategy._calculate_signals({"KO": 58.0, "PG": 140.0})
+        assert list(signals) == ["KO"]
+        assert signals["KO"].signal == SignalType.BUY
+        assert signals["KO"].sma_20 == pytest.approx(60.5)
+
+
+# ============================================================================
+# Grid Trading (price-indexed level lookup)
+# ============================================================================
+
+
+class TestGridTrading:
+    """Test the open-level indexes used for dry-run fills."""
+
+    def _grid(self, levels=101):
+        from src.strategies.grid_trading import GridTradingStrategy
+
+        exchange = MagicMock()
+        exchange.get_ticker = AsyncMock(return_value=MagicMock(last=100.0))
+        strategy = GridTradingStrategy(
+            ccxt_client=exchange, dry_run=True, default_grid_levels=levels,
+        )
+        grid = asyncio.run(strategy.create_grid("BTC/USDT"))
+        return strategy, grid
+
+    def test_crossed_levels_match_full_scan(self):
+        """Binary-search lookup returns the same levels as a full scan."""
+        _, grid = self._grid()
+        for price in ("85", "92.5", "100", "107.25", "130"):
+            price = Decimal(price)
+            expected = [
+                i for i, level in enumerate(grid.levels)
+                if level.status == "open" and (
+                    (level.side == "buy" and price <= level.price)
+                    or (level.side == "sell" and price >= level.price)
+                )
+            ]
+            assert grid.crossed_levels(price) == expected
+
+    def test_round_trip_through_indexes(self):
+        """A dip then recovery fills a buy, flips it, and completes a round trip."""
+        strategy, grid = self._grid(levels=21)
+        open_before = grid.open_orders
+
+        asyncio.run(strategy._simulate_fills(grid, Decimal("98.9")))
+        assert strategy.stats.total_buy_fills == 1
+        assert len(strategy._pending_sells["BTC/USDT"]) == 1
+
+        asyncio.run(strategy._simulate_fills(grid, Decimal("100.5")))
+        assert strategy.stats.total_round_trips == 1
+        assert not strategy._pending_sells["BTC/USDT"]
+        assert grid.open_orders == open_before - 1
+        assert grid.to_dict()["active_orders"] == grid.open_orders
+
+
+# ============================================================================
+# Market Maker (quote diffing)
+# ============================================================================
+
+
+class TestQuoteManager:
+    """Test that only quotes moving beyond tolerance are reposted."""
+
+    def _quote(self, bid, ask, size="50"):
+        from src.strategies.market_maker_v2 import Quote
+
+        return Quote(
+            bid_price=Decimal(bid), bid_size=Decimal(size),
+            ask_price=Decimal(ask), ask_size=Decimal(size),
+            market_id="m1", token_id="t1", outcome="YES",
+        )
+
+    def test_diff_respects_tolerances(self):
+        from src.strategies.market_maker_v2 import QuoteManager, QuoteAction
+
+        qm = QuoteManager(price_tolerance_ticks=1, size_tolerance_pct=0.10)
+        diff = qm.diff("t1", self._quote("0.48", "0.52"))
+        assert (diff.bid, diff.ask) == (QuoteAction.PLACE, QuoteAction.PLACE)
+        qm.apply(diff)
+
+        # One tick and a small size change: leave the working orders alone
+        assert not qm.diff("t1", self._quote("0.49", "0.52", size="52")).changed
+
+        # Bid moves two ticks -> replace bid only
+        diff = qm.diff("t1", self._quote("0.46", "0.52"))
+        assert (diff.bid, diff.ask) == (QuoteAction.REPLACE, QuoteAction.KEEP)
+        working = qm.apply(diff)
+        assert working.bid_price == Decimal("0.46")
+
+        # Inventory limit -> cancel both sides
+        diff = qm.diff("t1", self._quote("0.46", "0.52", size="0"))
+        assert (diff.bid, diff.ask) == (QuoteAction.CANCEL, QuoteAction.CANCEL)
+        assert qm.apply(diff).bid_size == 0
+        assert qm.to_dict()["placed"] == 2 and qm.to_dict()["cancelled"] == 2
+
+    def test_post_quotes_skips_unchanged_and_db_writes(self):
+        from src.strategies.market_maker_v2 import MarketMakerStrategy, MarketInfo
+        from src.clients.polymarket_client import OrderBook
+
+        book = OrderBook(bids=[(0.48, 100.0)], asks=[(0.52, 100.0)], last_update=1.0)
+        client = MagicMock()
+        client.get_order_book = MagicMock(return_value=book)
+        db = MagicMock()
+        mm = MarketMakerStrategy(polymarket_client=client, db_client=db)
+        market = MarketInfo(
+            market_id="m1", condition_id="c1", question="Will it rain?",
+            tokens=[{"outcome": "Yes", "token_id": "t1"}],
+            volume_24h=50000, end_date=None, active=True,
+        )
+
+        for _ in range(10):
+            assert asyncio.run(mm.post_quotes(market))
+        assert db.log_opportunity.call_count == 1
+        assert mm.stats.total_quotes_unchanged == 9
+
+        # Streamed mid moves 3 ticks -> requote
+        book.bids, book.asks = [(0.51, 100.0)], [(0.55, 100.0)]
+        asyncio.run(mm.post_quotes(market))
+        assert db.log_opportunity.call_count == 2
+        assert mm._active_quotes["t1"].bid_price == Decimal("0.52")
+
+
+class TestOptionChainStore:
+    """Test the cached columnar option chain and vectorized screens."""
+
+    def _contract(self, underlying, opt_type, strike, days, bid, ask, delta=0.0, iv=0.0):
+        """Raw contract as returned by the Alpaca options API."""
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            symbol=f"{underlying}{opt_type}{strike}", type="call" if opt_type == "C" else "put",
+            strike_price=strike, expiration_date=(datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d"),
+            bid=bid, ask=ask, last_trade_price=None, volume=None, open_interest=None,
+            implied_volatility=iv, delta=delta, gamma=None, theta=None, vega=None,
+        )
+
+    def _client(self, chains, spots):
+        client = MagicMock()
+
+        async def get_options_contracts(symbol, **kwargs):
+            client.chain_calls += 1
+            return chains[symbol]
+
+        client.chain_calls = 0
+        client.get_quote = AsyncMock(side_effect=lambda s: MagicMock(bid_price=spots[s], ask_price=spots[s]))
+        return client, get_options_contracts
+
+    def test_black_scholes_greeks(self):
+        import numpy as np
+        from src.strategies.options_chain import black_scholes_greeks
+
+        g = black_scholes_greeks(
+            spot=[100.0, 100.0, 100.0], strike=[100.0, 100.0, 0.0],
+            years=[1.0, 1.0, 1.0], iv=[0.2, 0.2, 0.2], is_call=[True, False, True], rate=0.05,
+        )
+        # Reference values for S=K=100, T=1, sigma=20%, r=5%
+        assert g["delta"][0] == pytest.approx(0.6368, abs=1e-4)
+        assert g["delta"][1] == pytest.approx(-0.3632, abs=1e-4)
+        assert g["gamma"][0] == pytest.approx(0.018762, abs=1e-5)
+        assert g["vega"][0] == pytest.approx(0.37524, abs=1e-4)
+        assert g["theta"][0] * 365 == pytest.approx(-6.414, abs=1e-2)
+        assert np.isnan(g["delta"][2])
+
+    def test_cached_screen_across_watchlist(self):
+        from src.strategies.options_strategies import (
+            CoveredCallStrategy, CashSecuredPutStrategy, WheelStrategy, WheelPhase,
+        )
+
+        chains = {
+            "AAA": [
+                self._contract("AAA", "C", 105.0, 30, 2.0, 2.2, delta=0.30),
+                self._contract("AAA", "C", 120.0, 30, 0.1, 0.2, delta=0.05),
+                self._contract("AAA", "P", 95.0, 30, 2.0, 2.2, delta=-0.28),
+            ],
+            # No Greeks from the feed -> filled with Black-Scholes from IV
+            "BBB": [self._contract("BBB", "C", 53.0, 35, 1.0, 1.2, iv=0.45)],
+        }
+        client, fetch = self._client(chains, {"AAA": 100.0, "BBB": 50.0})
+        client.get_options_contracts = fetch
+
+        cc = CoveredCallStrategy(client)
+        opps = asyncio.run(cc.find_opportunities(["AAA", "BBB"]))
+        assert [o["contract"].strike for o in opps] == [105.0, 53.0]
+        dte = opps[0]["contract"].days_to_expiry
+        assert opps[0]["annualized_return"] == pytest.approx(2.1 / 100 * 365 / dte)
+
+        # Second cycle within the TTL reuses cached chains and quotes
+        asyncio.run(cc.find_opportunities(["AAA", "BBB"]))
+        assert client.chain_calls == 2
+        assert client.get_quote.await_count == 2
+
+        csp = CashSecuredPutStrategy(client, chain_store=cc.chains)
+        puts = asyncio.run(csp.find_opportunities(["AAA", "BBB"]))
+        assert [p["contract"].strike for p in puts] == [95.0]
+        assert puts[0]["break_even"] == pytest.approx(92.9)
+        assert client.chain_calls == 2
+
+        wheel = WheelStrategy(client, ["AAA", "BBB"], chain_store=cc.chains)
+        wheel.wheel_positions["BBB"] = WheelPhase.SELLING_CALLS
+        wheel.csp_strategy.execute_strategy = AsyncMock(return_value="put")
+        wheel.cc_strategy.execute_strategy = AsyncMock(return_value="call")
+        results = asyncio.run(wheel.run_wheel())
+        assert results == {
+            "AAA": {"phase": "csp", "position": "put"},
+            "BBB": {"phase": "cc", "position": "call"},
+        }
+        assert client.chain_calls == 2
+
+    def test_iron_condor_nearest_strikes(self):
+        from src.strategies.options_strategies import IronCondorStrategy
+
+        strikes = [85.0, 90.0, 95.0, 105.0, 110.0, 115.0]
+        legs = [
+            self._contract("AAA", "P" if k < 100 else "C", k, 35, *prices)
+            for k, prices in zip(strikes, [(0.4, 0.6), (1.0, 1.2), (3.0, 3.2),
+                                           (3.0, 3.2), (1.0, 1.2), (0.4, 0.6)])
+        ]
+        client, fetch = self._client({"AAA": legs}, {"AAA": 100.0})
+        client.get_options_contracts = fetch
+
+        opps = asyncio.run(IronCondorStrategy(client).find_opportunities(["AAA"]))
+        assert len(opps) == 1
+        opp = opps[0]
+        assert (opp["put_long"].strike, opp["put_short"].strike) == (90.0, 95.0)
+        assert (opp["call_short"].strike, opp["call_long"].strike) == (105.0, 110.0)
+        assert opp["net_credit"] == pytest.approx(4.0)
+
+
+class TestWhaleActivityPolling:
+    """Test concurrent, incremental whale activity polling."""
+
+    def _strategy(self, n_whales, activity, delay=0.0):
+        from src.strategies.whale_copy_trading import WhaleCopyTradingStrategy
+
+        strategy = WhaleCopyTradingStrategy(auto_discover_whales=False, activity_concurrency=50)
+        for i in range(n_whales):
+            strategy.add_whale(f"0xwhale{i}")
+        strategy.calls = []
+
+        async def fetch(address, limit=20, since=None):
+            strategy.calls.append((address, since))
+            await asyncio.sleep(delay)
+            return [e for e in activity.get(address, []) if since is None or e["timestamp"] >= since]
+
+        strategy.fetch_trader_activity = fetch
+        return strategy
+
+    def _entry(self, trade_id, ts, kind="buy"):
+        return {"id": trade_id, "timestamp": ts, "type": kind, "side": "YES",
+                "price": 0.4, "size_usd": 50, "market_id": "m1", "title": "Test"}
+
+    def test_cycle_costs_one_round_trip(self):
+        import time
+
+        strategy = self._strategy(40, {}, delay=0.05)
+        started = time.monotonic()
+        asyncio.run(strategy.detect_whale_trades())
+        assert time.monotonic() - started < 0.5
+        assert len(strategy.calls) == 40
+
+    def test_high_water_mark_skips_seen_activity(self):
+        activity = {"0xwhale0": [self._entry("a", 1_700_000_000), self._entry("b", 1_700_000_005)]}
+        strategy = self._strategy(1, activity)
+
+        first = asyncio.run(strategy.detect_whale_trades())
+        assert [t.id for t in first] == ["a", "b"]
+        assert first[1].timestamp.timestamp() == 1_700_000_005
+
+        # Same second as the mark, but a new id -> still reported once
+        activity["0xwhale0"].append(self._entry("c", 1_700_000_005))
+        second = asyncio.run(strategy.detect_whale_trades())
+        assert [t.id for t in second] == ["c"]
+        assert strategy.calls[-1] == ("0xwhale0", 1_700_000_005)
+
+        assert asyncio.run(strategy.detect_whale_trades()) == []
+        assert strategy._cursors["0xwhale0"].ids == {"b", "c"}
+
+
+class TestDisclosureCache:
+    """Test conditional, incremental congressional feed fetching."""
+
+    class _Response:
+        def __init__(self, status, body=None, etag=None):
+            self.status = status
+            self.reason = ""
+            self.request_info = self.history = None
+            self.headers = {"ETag": etag} if etag else {}
+            self._body = body
+
+        async def json(self, content_type=None):
+            return self._body
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class _FeedServer:
+        """House feed with an ETag; every other URL is forbidden."""
+
+        def __init__(self, records):
+            self.records = records
+            self.closed = False
+            self.bodies_sent = 0
+
+        def get(self, url, params=None, headers=None):
+            if "house" not in url:
+                return TestDisclosureCache._Response(403)
+            etag = f'"v{len(self.records)}"'
+            if (headers or {}).get("If-None-Match") == etag:
+                return TestDisclosureCache._Response(304)
+            self.bodies_sent += 1
+            return TestDisclosureCache._Response(200, list(self.records), etag)
+
+    def _record(self, i):
+        from datetime import datetime, timedelta
+
+        day = (datetime.utcnow() - timedelta(days=i % 5)).strftime("%Y-%m-%d")
+        return {"representative": f"Rep {i}", "ticker": "NVDA", "type": "purchase",
+                "amount": "$15,001 - $50,000", "transaction_date": day, "disclosure_date": day}
+
+    def _tracker(self, server, cache_path=None):
+        from src.strategies.congressional_tracker import Chamber, CongressionalTrackerStrategy
+
+        tracker = CongressionalTrackerStrategy(chambers=Chamber.HOUSE, cache_path=cache_path)
+        tracker._session = server
+        return tracker
+
+    def test_only_new_filings_are_parsed(self):
+        server = self._FeedServer([self._record(i) for i in range(50)])
+        tracker = self._tracker(server)
+
+        assert len(asyncio.run(tracker.fetch_all_trades())) == 50
+        stats = tracker.get_stats()["disclosure_cache"]
+        assert stats["records_parsed"] == 50
+
+        # Unchanged feed: 304, nothing downloaded or parsed
+        assert len(asyncio.run(tracker.fetch_all_trades())) == 50
+        assert server.bodies_sent == 1
+
+        server.records += [self._record(i) for i in range(50, 53)]
+        assert len(asyncio.run(tracker.fetch_all_trades())) == 53
+        stats = tracker.get_stats()["disclosure_cache"]
+        assert stats["records_parsed"] == 53 and stats["not_modified"] == 1
+
+    def test_store_survives_restart(self, tmp_path):
+        path = str(tmp_path / "cache" / "congress.json")
+        server = self._FeedServer([self._record(i) for i in range(20)])
+        first = asyncio.run(self._tracker(server, path).fetch_all_trades())
+
+        restarted = self._tracker(server, path)
+        again = asyncio.run(restarted.fetch_all_trades())
+        assert server.bodies_sent == 1
+        assert restarted.get_stats()["disclosure_cache"]["records_parsed"] == 0
+        assert [(t.id, t.amount_estimated, t.disclosure_date) for t in again] == [
+            (t.id, t.amount_estimated, t.disclosure_date) for t in first
+        ]
+
 
 # ============================================================================
 # INTEGRATION: Mathematical Accuracy Tests
@@ -949,6 +1588,62 @@ class TestModuleImports:
         ])
 
 
+# ============================================================================
+# Strategy Registry (lazy imports)
+# ============================================================================
+
+
+class TestStrategyRegistry:
+    """Strategies are imported and built only when their flag is on."""
+
+    def _registry(self, **flags):
+        from src.strategies.registry import StrategyEntry, StrategyRegistry
+        config = MagicMock()
+        config.trading = MagicMock(spec=list(flags))
+        for name, value in flags.items():
+            setattr(config.trading, name, value)
+        entries = {
+            "missing": StrategyEntry("src.strategies._not_a_module:Nope", "enable_missing"),
+            "ordered": StrategyEntry("collections:OrderedDict", ("enable_a", "enable_b")),
+            "defaulted": StrategyEntry("collections:Counter", "enable_unset", True),
+        }
+        return StrategyRegistry(config, entries)
+
+    def test_disabled_strategy_is_never_imported(self):
+        registry = self._registry(enable_missing=False, enable_a=False, enable_b=False)
+        assert registry.create("missing") is None
+        assert registry.create("ordered") is None
+        assert "src.strategies._not_a_module" not in sys.modules
+
+    def test_enabled_strategy_is_constructed(self):
+        from collections import Counter, OrderedDict
+        registry = self._registry(enable_missing=False, enable_a=False, enable_b=True)
+        assert registry.create("ordered", [("x", 1)]) == OrderedDict(x=1)
+        # Missing flag falls back to the entry default
+        assert isinstance(registry.create("defaulted"), Counter)
+        assert registry.enabled() == ["ordered", "defaulted"]
+
+    def test_unknown_strategy_raises(self):
+        with pytest.raises(KeyError):
+            self._registry().is_enabled("nope")
+
+    def test_default_table_points_at_real_modules(self):
+        import importlib.util
+        from src.strategies.registry import STRATEGIES
+        for name, entry in STRATEGIES.items():
+            module_name, _, attr = entry.path.partition(":")
+            assert attr and importlib.util.find_spec(module_name), name
+
+    def test_lazy_package_exports(self):
+        import src.strategies as strategies
+        from src.strategies.whale_copy_trading import WhaleProfile
+
+        assert "TrackedWallet" in dir(strategies)
+        assert strategies.TrackedWallet is WhaleProfile
+        with pytest.raises(AttributeError):
+            strategies.NotAStrategy
+
+
 # ============================================================================
 # Run Tests
 # ============================================================================